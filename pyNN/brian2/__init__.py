@@ -32,25 +32,40 @@ def setup(timestep=DEFAULT_TIMESTEP, min_delay=DEFAULT_MIN_DELAY,
     Should be called at the very beginning of a script.
     extra_params contains any keyword arguments that are required by a given
     simulator but not by others.
+
+    Brian2-specific extra parameters:
+        `brian2_device`:
+            "runtime" (default) or the name of a Brian2 standalone device,
+            e.g. "cpp_standalone", which compiles the whole network to a
+            single program.
+        `build_dir`:
+            the directory in which the standalone project is built.
     """
 
     max_delay = extra_params.get('max_delay', DEFAULT_MAX_DELAY)
     common.setup(timestep, min_delay, **extra_params)
+    simulator.state.set_device(extra_params.get('brian2_device', 'runtime'),
+                               extra_params.get('build_dir', None))
     simulator.state.clear()
     simulator.state.dt = timestep  # move to common.setup?
     simulator.state.min_delay = min_delay
     simulator.state.max_delay = max_delay
     simulator.state.mpi_rank = 0
     simulator.state.num_processes = 1
-
-    simulator.state.network.add(
-        NetworkOperation(update_currents, when="start", clock=simulator.state.network.clock)
-    )
+    simulator.state.connection_processes = extra_params.get('connection_processes', 1)
+    simulator.state.segments_in_memory = extra_params.get('segments_in_memory', None)
+
+    if not simulator.state.standalone:
+        # Python code cannot be run during a standalone simulation
+        simulator.state.network.add(
+            NetworkOperation(update_currents, when="start", clock=simulator.state.network.clock)
+        )
     return rank()
 
 
 def end(compatible_output=True):
     """Do any necessary cleaning up before exiting."""
+    simulator.state.build()
     for (population, variables, filename) in simulator.state.write_on_end:
         io = get_io(filename)
         population.write_data(io, variables)
@@ -9,7 +9,7 @@ Definition of cell classes for the brian2 module.
 
 import numpy as np
 import brian2
-from pyNN.parameters import Sequence, simplify
+from pyNN.parameters import Sequence, SequenceArray, simplify
 from pyNN.core import is_listlike
 from pyNN import errors
 from pyNN.brian2 import simulator
@@ -67,7 +67,8 @@ class BaseNeuronGroup(brian2.NeuronGroup):
                                     reset=reset,
                                     refractory=refractory,
                                     method=method,
-                                    clock=simulator.state.network.clock)
+                                    clock=simulator.state.network.clock,
+                                    name=simulator.state.object_name("neurongroup"))
         for name, value in parameters.items():
 
             if not hasattr(self, name):
@@ -306,7 +307,8 @@ class PoissonGroup(brian2.PoissonGroup):
 
         brian2.PoissonGroup.__init__(self, n,
                                      rates=self.firing_rate,
-                                     clock=simulator.state.network.clock)
+                                     clock=simulator.state.network.clock,
+                                     name=simulator.state.object_name("poissongroup"))
         if is_listlike(self.start_time):
             self.variables.add_array('start_time', size=n, dimensions=second.dim)
         else:
@@ -334,9 +336,16 @@ class SpikeGeneratorGroup(brian2.SpikeGeneratorGroup):
         assert spike_time_sequences.size == n
         self._check_spike_times(spike_time_sequences)
         indices, times = self._convert_sequences_to_arrays(spike_time_sequences)
-        brian2.SpikeGeneratorGroup.__init__(self, n, indices=indices, times=times)
+        brian2.SpikeGeneratorGroup.__init__(self, n, indices=indices, times=times,
+                                            name=simulator.state.object_name("spikegeneratorgroup"))
 
     def _convert_sequences_to_arrays(self, spike_time_sequences):
+        if isinstance(spike_time_sequences, SequenceArray):
+            lengths = spike_time_sequences.lengths()
+            start, stop = spike_time_sequences.offsets[[0, -1]]
+            times = spike_time_sequences.values[start:stop]
+            indices = np.repeat(np.arange(lengths.size), lengths)
+            return indices, times * second
         times = np.concatenate([seq.value for seq in spike_time_sequences])
         indices = np.concatenate([i * np.ones(seq.value.size)
                                      for i, seq in enumerate(spike_time_sequences)])
@@ -352,16 +361,28 @@ class SpikeGeneratorGroup(brian2.SpikeGeneratorGroup):
         return np.array([Sequence(times) for times in values], dtype=Sequence)
 
     def _set_spike_time_sequences(self, spike_time_sequences, mask=None):
-        if mask is not None:
-            existing_times = self._get_spike_time_sequences()
-            existing_times[mask] = spike_time_sequences
-            spike_time_sequences = existing_times
+        targets = np.arange(self.N)[mask] if mask is not None else np.arange(self.N)
+        if isinstance(spike_time_sequences, Sequence):
+            spike_time_sequences = SequenceArray.from_sequences(
+                [spike_time_sequences] * targets.size)
         self._check_spike_times(spike_time_sequences)
         indices, times = self._convert_sequences_to_arrays(spike_time_sequences)
+        if mask is not None:
+            # replace the spikes of the masked neurons, keep those of all the others
+            existing_indices = np.asarray(self.neuron_index[:])
+            keep = ~np.isin(existing_indices, targets)
+            indices = np.concatenate((existing_indices[keep], targets[indices.astype(int)]))
+            times = np.concatenate((np.asarray(self.spike_time[:])[keep],
+                                    np.asarray(times))) * second
         self.set_spikes(indices, times)
     spike_time_sequences = property(fget=_get_spike_time_sequences, fset=_set_spike_time_sequences)
 
     def _check_spike_times(self, spike_time_sequences):
+        if isinstance(spike_time_sequences, SequenceArray):
+            if not spike_time_sequences.is_sorted():
+                raise errors.InvalidParameterValueError(
+                    "Spike times given to SpikeSourceArray must be in increasing order")
+            return
         for seq in spike_time_sequences:
             if np.any(seq.value[:-1] > seq.value[1:]):
                 raise errors.InvalidParameterValueError(
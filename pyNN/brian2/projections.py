@@ -94,6 +94,9 @@ class Projection(common.Projection):
                                    connector, synapse_type, source, receptor_type,
                                    space, label)
         self._n_connections = 0
+        # number of synapses in each Synapses object, tracked here since in standalone
+        # mode Brian2 cannot report it before the simulation has been run
+        self._synapse_counts = defaultdict(int)
         # create one Synapses object per pre-post population pair
         # there will be multiple such pairs if either `presynaptic_population`
         # or `postsynaptic_population` is an Assembly.
@@ -132,7 +135,8 @@ class Projection(common.Projection):
                                           model=model, on_pre=pre_eqns,
                                           on_post=post_eqns,
                                           clock=simulator.state.network.clock,
-                                          multisynaptic_index='synapse_number')
+                                          multisynaptic_index='synapse_number',
+                                          name=simulator.state.object_name("synapses"))
                 # code_namespace={"exp": np.exp})
                 self._brian2_synapses[i][j] = syn_obj
                 simulator.state.network.add(syn_obj)
@@ -154,7 +158,7 @@ class Projection(common.Projection):
         return (Connection(self, i_group, j_group, i)
                 for i_group in range(len(self._brian2_synapses))
                 for j_group in range(len(self._brian2_synapses[i_group]))
-                for i in range(len(self._brian2_synapses[i_group][j_group]))
+                for i in range(self._synapse_counts[i_group, j_group])
                 )
 
     def _partition(self, indices):
@@ -164,8 +168,9 @@ class Projection(common.Projection):
         if isinstance(self.pre, common.Assembly):
             boundaries = np.cumsum([0] + [p.size for p in self.pre.populations])
             assert indices.max() < boundaries[-1]
-            partitions = np.split(indices, np.searchsorted(
-                indices, boundaries[1:-1])) - boundaries[:-1]
+            partitions = [part - offset
+                          for part, offset in zip(np.split(indices, np.searchsorted(
+                              indices, boundaries[1:-1])), boundaries[:-1])]
             for i_group, local_indices in enumerate(partitions):
                 if isinstance(self.pre.populations[i_group], common.PopulationView):
                     partitions[i_group] = self.pre.populations[i_group].index_in_grandparent(
@@ -196,45 +201,128 @@ class Projection(common.Projection):
         connection_parameters.pop("dendritic_delay_fraction", None)  # TODO: need to to handle this
         presynaptic_index_partitions = self._partition(presynaptic_indices)
         j_group, j = self._localize_index(postsynaptic_index)
-        # specify which connections exist
+        offset = 0
         for i_group, i in enumerate(presynaptic_index_partitions):
             if i.size > 0:
-                self._brian2_synapses[i_group][j_group].connect(i=i, j=j)  # "[i, j]
-                self._n_connections += i.size
-        # set connection parameters
+                # array-valued parameters are split in the same way as the indices
+                params = dict((name, value[offset:offset + i.size] if is_listlike(value) else value)
+                              for name, value in connection_parameters.items())
+                self._create_synapses(i_group, j_group, i, j, params)
+                offset += i.size
 
+    def _bulk_connect(self, presynaptic_indices, postsynaptic_indices, **connection_parameters):
+        """
+        Create many connections with a single call to `Synapses.connect()`,
+        then set their parameters by synapse index.
+        """
+        if isinstance(self.post, common.Assembly) or isinstance(self.pre, common.Assembly):
+            return super(Projection, self)._bulk_connect(presynaptic_indices, postsynaptic_indices,
+                                                         **connection_parameters)
+        presynaptic_indices = np.asarray(presynaptic_indices, dtype=int)
+        if presynaptic_indices.size == 0:
+            return
+        connection_parameters.pop("dendritic_delay_fraction", None)
+        i = self._partition(presynaptic_indices)[0]
+        _, j = self._localize_index(np.asarray(postsynaptic_indices, dtype=int))
+        self._create_synapses(0, 0, i, j, connection_parameters)
+
+    def _create_synapses(self, i_group, j_group, i, j, connection_parameters):
+        """
+        Connect pre-synaptic neurons `i` to post-synaptic neurons `j` in the
+        Brian2 Synapses object for the given pair of groups, and set the
+        parameters and initial values of the new synapses.
+
+        Brian2 appends new synapses in the order given, so they can be
+        addressed with a slice of synapse indices. This also works for multiple
+        connections between the same pair of neurons, which `brian2_var[i, j]`
+        does not.
+        """
+        syn_obj = self._brian2_synapses[i_group][j_group]
+        n = np.broadcast(i, j).size
+        start = self._synapse_counts[i_group, j_group]
+        syn_obj.connect(i=i, j=j)
+        new_synapses = slice(start, start + n)
+        self._synapse_counts[i_group, j_group] += n
+        self._n_connections += n
         for name, value in chain(connection_parameters.items(),
                                  self.synapse_type.initial_conditions.items()):
             if name == 'delay':
                 scale = self._simulator.state.dt * ms
-                value /= scale                         # ensure delays are rounded to the
-                value = np.round(value) * scale     # nearest time step, rather than truncated
-            for i_group, i in enumerate(presynaptic_index_partitions):
-                if i.size > 0:
-                    brian2_var = getattr(self._brian2_synapses[i_group][j_group], name)
-                    if is_listlike(value):
-                        for ii, v in zip(i, value):
-                            brian2_var[ii, j] = v
-                    else:
-                        for ii in i:
-                            try:
-                                brian2_var[ii, j] = value
-                            except TypeError as err:
-                                if "read-only" in str(err):
-                                    logger.info(
-                                        "Cannot set synaptic initial value for variable {}".format(name))
-                                else:
-                                    raise
-                    # brian2_var[i, j] = value  # doesn't work with multiple connections between a given neuron pair. Need to understand the internals of Synapses and SynapticVariable better
-
-    def _set_attributes(self, connection_parameters):
-        if isinstance(self.post, common.Assembly) or isinstance(self.pre, common.Assembly):
-            raise NotImplementedError
-        syn_obj = self._brian2_synapses[0][0]
-        connection_parameters.evaluate()  # inefficient: would be better to evaluate using mask
-        for name, value in connection_parameters.items():
-            creation_order_sorted_value = value[syn_obj.i[:], syn_obj.j[:]]
-            setattr(syn_obj, name, creation_order_sorted_value)
+                # ensure delays are rounded to the nearest time step, rather than truncated
+                value = np.round(value / scale) * scale
+            try:
+                getattr(syn_obj, name)[new_synapses] = value
+            except TypeError as err:
+                if "read-only" in str(err):
+                    logger.info("Cannot set synaptic initial value for variable {}".format(name))
+                else:
+                    raise
+
+    def _synapse_groups(self):
+        """
+        Return a list of (syn_obj, presynaptic_indices, postsynaptic_indices)
+        tuples, one per Brian2 Synapses object, in the order used by
+        `self.connections`. The indices are those of the pre- and post-synaptic
+        neurons in this projection's pre and post populations (or Assemblies),
+        rather than in the underlying Brian2 groups.
+        """
+        def index_maps(population):
+            if isinstance(population, common.Assembly):
+                members = population.populations
+            else:
+                members = [population]
+            offset = 0
+            maps = []
+            for member in members:
+                if isinstance(member, common.PopulationView):
+                    lookup = np.zeros(member.grandparent.size, dtype=int)
+                    lookup[member.index_in_grandparent(np.arange(member.size))] = np.arange(member.size)
+                    maps.append((lookup, offset))
+                else:
+                    maps.append((None, offset))
+                offset += member.size
+            return maps
+
+        def to_projection_index(indices, index_map):
+            lookup, offset = index_map
+            if lookup is not None:
+                indices = lookup[indices]
+            return indices + offset
+
+        pre_maps = index_maps(self.pre)
+        post_maps = index_maps(self.post)
+        groups = []
+        for i_group in range(len(self._brian2_synapses)):
+            for j_group in range(len(self._brian2_synapses[i_group])):
+                syn_obj = self._brian2_synapses[i_group][j_group]
+                groups.append((syn_obj,
+                               to_projection_index(np.asarray(syn_obj.i[:]), pre_maps[i_group]),
+                               to_projection_index(np.asarray(syn_obj.j[:]), post_maps[j_group])))
+        return groups
+
+    def _connection_addresses(self):
+        groups = self._synapse_groups()
+        return (np.hstack([pre for _, pre, _ in groups]).astype(int),
+                np.hstack([post for _, _, post in groups]).astype(int))
+
+    def _set_attributes(self, parameter_space):
+        # evaluate the parameters only for the connections that exist, in creation order
+        pre, post = self._connection_addresses()
+        parameter_space.evaluate_at(pre, post)
+        self._set_attribute_vectors(parameter_space.as_dict())
+
+    def _set_attribute_vectors(self, attributes):
+        # values are in creation order, the same order as syn_obj.i, syn_obj.j
+        # for each Synapses object in turn
+        start = 0
+        for i_group in range(len(self._brian2_synapses)):
+            for j_group in range(len(self._brian2_synapses[i_group])):
+                syn_obj = self._brian2_synapses[i_group][j_group]
+                n = self._synapse_counts[i_group, j_group]
+                if n > 0:
+                    for name, value in attributes.items():
+                        setattr(syn_obj, name, value[start:start + n])
+                    start += n
 
     def _get_attributes_as_arrays(self, attribute_names, multiple_synapses='sum'):
         if isinstance(self.post, common.Assembly) or isinstance(self.pre, common.Assembly):
@@ -30,25 +30,92 @@ class Recorder(recording.Recorder):
         __doc__ = recording.Recorder.__doc__
         recording.Recorder.__init__(self, population, file)
         self._devices = {}  # defer creation until first call of run()
+        self._spike_count_offset = None
+        self._drained = set()  # in standalone mode, variables whose data have been reduced
+        self._pending_samples = {}  # time of the last value taken from the group, not the monitor
+
+    @property
+    def _incremental_reductions(self):
+        # in standalone mode, no data are available until the end of the simulation
+        return not simulator.state.standalone
 
     def _create_device(self, group, variable):
         """Create a Brian2 recording device."""
-        # Brian2 records in the 'start' scheduling slot by default
+        # Brian2 records in the 'start' scheduling slot by default, so the value
+        # recorded at a tick of the monitor's clock is that at the tick time
         if variable == 'spikes':
-            self._devices[variable] = brian2.SpikeMonitor(group, record=self.recorded)
+            self._devices[variable] = brian2.SpikeMonitor(
+                group, record=self.recorded,
+                name=simulator.state.object_name("spikemonitor"))
         else:
             varname = self.population.celltype.state_variable_translations[variable]['translated_name']
             neurons_to_record = np.sort(np.fromiter(
                 self.recorded[variable], dtype=int)) - self.population.first_id
+            clock = brian2.Clock(self.sampling_intervals[variable] * ms,
+                                 name=simulator.state.object_name("clock"))
             self._devices[variable] = brian2.StateMonitor(group, varname,
                                                           record=neurons_to_record,
-                                                          when='end',
-                                                          dt=self.sampling_interval * ms)
+                                                          clock=clock,
+                                                          name=simulator.state.object_name("statemonitor"))
         simulator.state.network.add(self._devices[variable])
 
     def _record(self, variable, new_ids, sampling_interval=None):
         """Add the cells in `new_ids` to the set of recorded cells."""
-        self.sampling_interval = sampling_interval or self._simulator.state.dt
+        pass
+
+    def _activation_window(self, variable):
+        """
+        Return the times between which the monitor for `variable` should be
+        active to record its recording window. The monitor records at the ticks
+        of its own clock, i.e. at multiples of the sampling interval, so it is
+        switched on at the start of the window and off one time step after the
+        tick at the end of the window.
+        """
+        start, stop = self.recording_windows[variable]
+        on = start if start else None
+        off = stop + simulator.state.dt if stop is not None else None
+        return on, off
+
+    def _pending_sample(self, variable, sample_times):
+        """
+        Return True if the current time is a sample time for `variable` which
+        has not been recorded by the monitor, given the times (in ms) of the
+        samples recorded by the monitor. A monitor records at the start of a
+        time step, so the value at the end of a run is only recorded at the
+        start of the following run.
+        """
+        t = simulator.state.t
+        interval = self.sampling_intervals[variable]
+        start, stop = self.recording_windows.get(variable, (None, None))
+        if (start is not None and t < start - 1e-9) or (stop is not None and t > stop + 1e-9):
+            return False
+        if abs(t / interval - round(t / interval)) > 1e-9:
+            return False
+        return sample_times.size == 0 or sample_times[-1] < t - 1e-9
+
+    def _current_values(self, variable, indices):
+        """
+        Return the current values of `variable`, in native units, for the
+        neurons with the given indices in the Brian2 group.
+        """
+        translations = self.population.celltype.state_variable_translations[variable]
+        group_var = self.population.brian2_group.variables[translations['translated_name']]
+        return group_var.get_value()[indices]
+
+    def _switch_times(self):
+        """Return the times at which monitors must be switched on or off."""
+        times = set()
+        for variable in self.recording_windows:
+            times.update(t for t in self._activation_window(variable) if t is not None)
+        return times
+
+    def _update_active(self, t):
+        """Switch monitors on or off at time `t`, according to their recording windows."""
+        for variable in self.recording_windows:
+            if variable in self._devices:
+                on, off = self._activation_window(variable)
+                self._devices[variable].active = ((on is None or t >= on - 1e-9)
+                                                  and (off is None or t < off - 1e-9))
 
     def _finalize(self):
         for variable in self.recorded:
@@ -59,56 +126,118 @@ class Recorder(recording.Recorder):
     def _reset(self):
         """Clear the list of cells to record."""
         self._devices = {}
-        for device in self._devices.values():
-            del device
+        self._spike_count_offset = None
+        self._drained = set()
+        self._pending_samples = {}
 
     def _clear_simulator(self):
         """Delete all recorded data, but retain the list of cells to record from."""
-        # for variable, device in self._devices.items():
-        #     group = device.source
-        #     self._create_device(group, variable)
-        #     del device
-        for device in self._devices.values():
+        if simulator.state.standalone:
+            return  # the simulation cannot be continued, so there is no need to clear the data
+        for variable, device in self._devices.items():
             device.resize(0)
+            if variable == 'spikes':
+                # SpikeMonitor.resize() resets neither the number of stored spikes
+                # nor the spike counters
+                device.variables['N'].set_value(0)
+                self._spike_count_offset = np.array(device.count[:])
 
     def _get_spiketimes(self, requested_ids, clear=False):
-        id_array = self._devices["spikes"].i + self.population.first_id
-        times_array = self._devices["spikes"].t / ms
-        mask = np.in1d(id_array, requested_ids)
-        return id_array[mask], times_array[mask]
+        simulator.state.build()
+        device = self._devices["spikes"]
+        index_array = np.asarray(device.i[:])
+        times_array = np.asarray(device.t / ms)
+        if len(requested_ids) < self.population.size:
+            requested = np.zeros(self.population.size, dtype=bool)
+            requested[self.population.id_to_index(np.asarray(requested_ids, dtype=int))] = True
+            mask = requested[index_array]
+            index_array = index_array[mask]
+            times_array = times_array[mask]
+        return index_array + self.population.first_id, times_array
 
     def _get_all_signals(self, variable, ids, clear=False):
-        # need to filter according to ids
-
+        simulator.state.build()
         # check that the requested ids have indeed been recorded
         if not set(ids).issubset(self.recorded[variable]):
             raise Exception("You are requesting data from neurons that have not been recorded")
         device = self._devices[variable]
-        varname = self.population.celltype.state_variable_translations[variable]['translated_name']
-        if len(ids) == len(self.recorded[variable]):
-            values = getattr(device, varname).T
-        else:
-            raise NotImplementedError  # todo - construct a mask to get only the desired signals
-        values = self.population.celltype.state_variable_translations[variable]['reverse_transform'](
-            values)
-        # because we use `when='end'`, need to add the value at the beginning of the run
-        tmp = np.empty((values.shape[0] + 1, values.shape[1]))
-        tmp[1:, :] = values
-        population_mask = self.population.id_to_index(ids)
-        tmp[0, :] = self.population.initial_values[variable][population_mask]
-        values = tmp
-        if clear:
-            self._devices[variable].resize(0)
+        translations = self.population.celltype.state_variable_translations[variable]
+        population_mask = self.population.id_to_index(np.asarray(ids, dtype=int))
+        # the monitor stores one column per recorded neuron, in order of index,
+        # so we copy only the columns of the requested neurons
+        brian2_var = device.variables[translations['translated_name']]
+        data = brian2_var.get_value()
+        if population_mask.size < data.shape[1]:
+            data = data[:, np.searchsorted(np.asarray(device.record), population_mask)]
+        if self._pending_sample(variable, np.asarray(device.t / ms)):
+            # the value at the current time has not yet been recorded by the monitor
+            data = np.vstack((data, self._current_values(variable, population_mask)))
+        values = translations['reverse_transform'](brian2.Quantity(data, dim=brian2_var.dim))
+        if clear and not simulator.state.standalone:
+            device.resize(0)
         times = None
         return values, times
 
+    def _drain(self, variable):
+        simulator.state.build()
+        device = self._devices.get(variable)
+        if device is None or variable in self._drained:
+            return np.array([]), (None if variable == 'spikes' else np.array([]))
+        if variable == 'spikes':
+            times, values = np.asarray(device.t / ms), None
+        else:
+            translations = self.population.celltype.state_variable_translations[variable]
+            brian2_var = device.variables[translations['translated_name']]
+            data = brian2_var.get_value()
+            sample_times = np.asarray(device.t / ms)
+            if variable in self._pending_samples:
+                # this sample has already been taken from the group in the previous call
+                new = sample_times > self._pending_samples.pop(variable) + 1e-9
+                data, sample_times = data[new], sample_times[new]
+            if self._pending_sample(variable, sample_times):
+                data = np.vstack((data, self._current_values(variable, np.asarray(device.record))))
+                sample_times = np.append(sample_times, simulator.state.t)
+                self._pending_samples[variable] = simulator.state.t
+            values = np.asarray(translations['reverse_transform'](
+                brian2.Quantity(data, dim=brian2_var.dim))).flatten()
+            times = np.repeat(sample_times, data.shape[1])
+        if simulator.state.standalone:
+            self._drained.add(variable)
+        else:
+            device.resize(0)
+            if variable == 'spikes':
+                # as in _clear_simulator(), SpikeMonitor.resize() does not reset N
+                device.variables['N'].set_value(0)
+        return times, values
+
+    def store_to_cache(self, annotations=None):
+        recording.Recorder.store_to_cache(self, annotations)
+        self._pending_samples = {}
+
     def _local_count(self, variable, filter_ids=None):
-        N = {}
-        filtered_ids = self.filter_recorded(variable, filter_ids)
-        padding = self.population.first_id
-        indices = np.fromiter(filtered_ids, dtype=int) - padding
-        spiky = self._devices['spikes'].spike_trains()
-        for i, id in zip(indices, filtered_ids):
-            #N[id] = len(self._devices['spikes'].spiketimes[i])
-            N[id] = len(spiky[i])
-        return N
+        simulator.state.build()
+        filtered_ids = np.fromiter(self.filter_recorded(variable, filter_ids), dtype=int)
+        counts = np.array(self._devices['spikes'].count[:])
+        if self._spike_count_offset is not None:
+            counts -= self._spike_count_offset
+        indices = filtered_ids - self.population.first_id
+        return dict(zip(filtered_ids.tolist(), counts[indices].tolist()))
+
+    def _local_count_array(self, variable, filter_ids=None, t_start=None, t_stop=None):
+        simulator.state.build()
+        if 'spikes' not in self._devices:
+            return np.zeros(self.population.size, dtype=np.int64)
+        device = self._devices['spikes']
+        if t_start is None and t_stop is None:
+            counts = np.array(device.count[:], dtype=np.int64)
+            if self._spike_count_offset is not None:
+                counts -= self._spike_count_offset
+        else:
+            counts = recording.count_spikes(np.asarray(device.i[:]), np.asarray(device.t / ms),
+                                            self.population.size, t_start, t_stop)
+        # the monitor counts the spikes of all neurons in the group
+        filtered_ids = np.fromiter(self.filter_recorded(variable, filter_ids), dtype=int)
+        mask = np.zeros(self.population.size, dtype=bool)
+        mask[filtered_ids - self.population.first_id] = True
+        counts[~mask] = 0
+        return counts
@@ -20,8 +20,14 @@ modules.
 
 """
 
+import atexit
+import gc
+import hashlib
 import logging
+import os
+import shutil
 import brian2
+from brian2.utils.filelock import FileLock
 import numpy as np
 from pyNN import common
 from pyNN.parameters import simplify
@@ -49,18 +55,214 @@ class State(common.control.BaseState):
         self.num_processes = 1
         self._min_delay = 'auto'
         self.network = None
+        self.standalone = False
+        self.build_dir = None
+        self.built = False
         self.clear()
 
+    def set_device(self, device="runtime", build_dir=None):
+        """
+        Choose between Brian2's runtime mode and a standalone device such as
+        "cpp_standalone". In standalone mode, `run()` only generates code: the
+        whole simulation is compiled and run when results are first needed
+        (see `build()`).
+
+        If `build_dir` is not given, a directory in the user's cache directory
+        whose name depends only on the structure of the network is used, so
+        that running the same model again, e.g. with different parameter
+        values, reuses the compiled program. Simulations that share a build
+        directory are run one after the other.
+        """
+        if self.standalone:
+            brian2.device.reinit()
+        if device == "runtime":
+            brian2.set_device("runtime")
+            self.standalone = False
+        else:
+            brian2.set_device(device, build_on_run=False)
+            # start from a new device even when coming from runtime mode, as
+            # Brian2 would otherwise copy the time step of the default clock
+            # into the generated code
+            brian2.device.reinit()
+            brian2.device.activate(build_on_run=False)
+            self.standalone = True
+        self.build_dir = build_dir
+        self.built = False
+
+    def object_name(self, prefix):
+        """
+        Return a name for a new Brian2 object. Brian2 numbers the names of the
+        objects within the whole process, so in standalone mode the objects are
+        numbered within the current network instead, so that the same model
+        always generates the same code.
+        """
+        if not self.standalone:
+            return prefix + "*"
+        count = self._name_counters.get(prefix, 0)
+        self._name_counters[prefix] = count + 1
+        return "%s_%d" % (prefix, count)
+
+    def _release_code_objects(self, objects):
+        """
+        Drop the references to the code objects of `objects`, which are kept
+        alive by the Populations of the old network. Brian2 derives the names
+        of code objects from those of their owners, adding a suffix if the name
+        is in use, so the code generated for the next network would otherwise
+        differ from that of the same network built in a new process.
+        """
+        for obj in objects:
+            for attr in ("codeobj", "_pushspikes_codeobj"):
+                if hasattr(obj, attr):
+                    setattr(obj, attr, None)
+            self._release_code_objects(obj.contained_objects)
+
+    def _default_build_dir(self):
+        """
+        Return a directory in the user's cache directory whose name depends on
+        the sizes and equations of the groups, the synaptic pathways and the
+        recorded variables, but not on the values of the parameters.
+        """
+        digest = hashlib.sha1(repr(self.dt).encode("utf-8"))
+        for obj in sorted(self.network.objects, key=lambda obj: obj.name):
+            description = [type(obj).__name__, obj.name, obj.clock.name,
+                           str(getattr(obj, "equations", ""))]
+            if isinstance(obj, (brian2.NeuronGroup, brian2.PoissonGroup,
+                                brian2.SpikeGeneratorGroup)):
+                description.extend([len(obj), getattr(obj, "event_codes", {})])
+            elif isinstance(obj, brian2.Synapses):
+                description.extend([obj.source.name, obj.target.name,
+                                    [pathway.code for pathway in obj._pathways]])
+            elif isinstance(obj, (brian2.SpikeMonitor, brian2.StateMonitor)):
+                description.extend([obj.source.name, sorted(obj.record_variables),
+                                    np.size(obj.record)])
+            digest.update(repr(description).encode("utf-8"))
+        cache_dir = os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+        return os.path.join(cache_dir, "pyNN", "brian2_standalone", digest.hexdigest()[:16])
+
+    def _extract_run_args(self):
+        """
+        Remove the values given to the state variables of the groups before the
+        first run from the generated code, and return them as arguments of the
+        compiled program, so that the code does not change, and so is not
+        recompiled, when only the parameter values change. Values of variables
+        that are used by code run before the network, or that are only set for
+        some of the neurons or synapses, are left in the code.
+        """
+        device = brian2.device
+        queue = device.main_queue
+        first_run = next((i for i, (action, _) in enumerate(queue) if action == "run_network"),
+                         len(queue))
+        if any(action == "insert_code" for action, _ in queue[:first_run]):
+            return {}
+        used = set()
+        for action, args in queue[:first_run]:
+            if action in ("run_code_object", "before_run_code_object"):
+                used.update(args[0].variables.values())
+        variables = dict((array_name, var) for var, array_name in device.arrays.items()
+                         if isinstance(var.owner, brian2.Group)
+                         and not (var.dynamic or var.read_only or var.name.startswith("_"))
+                         and var not in used)
+        for i, (action, args) in enumerate(queue):
+            # variables set for some indices only, or after the first run, stay
+            # in the code, as do single values whose value Brian2 does not know
+            if (action == "set_array_by_array"
+                    or (action.startswith("set_by_") and i > first_run)
+                    or (action == "set_by_single_value"
+                        and device.array_cache.get(variables.get(args[0])) is None)):
+                variables.pop(args[0], None)
+        values = {}
+        remaining = []
+        for action, args in queue[:first_run]:
+            var = variables.get(args[0]) if action.startswith("set_by_") else None
+            if var is None:
+                remaining.append((action, args))
+                continue
+            if action == "set_by_constant":
+                value = args[1]
+            elif action == "set_by_array":
+                value = device.static_arrays.pop(args[1])
+            else:  # set_by_single_value, for variables of size one
+                value = device.array_cache[var]
+            values[var] = value  # later values replace earlier ones
+        queue[:first_run] = remaining
+        return dict((var.owner.state(var.name), brian2.Quantity(value, dim=var.dim))
+                    for var, value in values.items())
+
+    def _sort_clock_assignments(self):
+        """
+        Brian2 sets the times of the clocks before each run in an arbitrary
+        order, which would change the generated code from one build to the
+        next, so put each series of these assignments in a fixed order.
+        """
+        queue = brian2.device.main_queue
+        clock_arrays = set(array_name for var, array_name in brian2.device.arrays.items()
+                           if isinstance(var.owner, brian2.Clock))
+        start = 0
+        for i in range(len(queue) + 1):
+            if (i < len(queue) and queue[i][0] == "set_by_single_value"
+                    and queue[i][1][0] in clock_arrays):
+                continue
+            queue[start:i] = sorted(queue[start:i], key=lambda entry: entry[1][0])
+            start = i + 1
+
+    def build(self):
+        """
+        In standalone mode, compile and run the code generated by all calls to
+        `run()` so far, so that recorded data and state variables can be
+        retrieved. The simulation cannot be continued afterwards.
+        Does nothing in runtime mode, or if the code has already been built.
+        """
+        if self.standalone and not self.built:
+            build_dir = self.build_dir or self._default_build_dir()
+            self._sort_clock_assignments()
+            run_args = self._extract_run_args()
+            # each process writes its results to its own directory, but the
+            # code and static data of the project are shared
+            results_dir = "results_%d" % os.getpid()
+            logger.info("Building Brian2 standalone project in %s", build_dir)
+            os.makedirs(build_dir, exist_ok=True)
+            with FileLock(os.path.join(build_dir, "pyNN.lock")):
+                brian2.device.build(directory=build_dir, results_directory=results_dir,
+                                    compile=True, run=True, run_args=run_args)
+                # the files holding the values passed to the program, and their
+                # locks, are not needed any more
+                for name in brian2.device.run_args_arrays:
+                    for path in (name, name + ".lock"):
+                        path = os.path.join(build_dir, "static_arrays", path)
+                        if os.path.exists(path):
+                            os.remove(path)
+            atexit.register(shutil.rmtree, os.path.join(build_dir, results_dir),
+                            ignore_errors=True)
+            self.built = True
+
     def run(self, simtime):
-        for recorder in self.recorders:
+        if self.built:
+            raise NotImplementedError(
+                "In Brian2 standalone mode, a simulation cannot be continued "
+                "after its results have been retrieved.")
+        # the monitors are created in a fixed order, so that they are always
+        # given the same names in standalone mode
+        for recorder in sorted(self.recorders, key=lambda recorder: recorder.population.first_id):
             recorder._finalize()
-        if not self.running:
+        if not self.running and not self.standalone:
             assert self.network.clock.t == 0 * ms
             self.network.store("before-first-run")
             # todo: handle the situation where new Populations or Projections are
             #       created after the first run and then "reset" is called
         self.running = True
-        self.network.run(simtime * ms)
+        # the run is split at the start and end of any recording windows, so that
+        # the monitors can be switched on and off
+        t = self.t
+        t_stop = t + simtime
+        switch_times = sorted(set(t_switch
+                                  for recorder in self.recorders
+                                  for t_switch in recorder._switch_times()
+                                  if t + 1e-9 < t_switch < t_stop - 1e-9))
+        for t_next in switch_times + [t_stop]:
+            for recorder in self.recorders:
+                recorder._update_active(t)
+            self.network.run((t_next - t) * ms)
+            t = t_next
 
     def run_until(self, tstop):
         self.run(tstop - self.t)
@@ -71,18 +273,29 @@ class State(common.control.BaseState):
         self.current_sources = []
         self.segment_counter = -1
         if self.network:
+            self._release_code_objects(self.network.objects)
             for item in self.network.sorted_objects:
                 del item
             del self.network
-        self.network = brian2.Network()
-        self.network.clock = brian2.Clock(0.1 * ms)
+        if self.standalone:
+            # free the released code objects now, rather than whenever
+            # the garbage collector next runs
+            gc.collect()
+        self._name_counters = {}
+        self.network = brian2.Network(name=self.object_name("network"))
+        self.network.clock = brian2.Clock(0.1 * ms, name=self.object_name("clock"))
         self.running = False
         self.reset()
 
     def reset(self):
         """Reset the state of the current network to time t = 0."""
         if self.running:
+            if self.standalone:
+                raise NotImplementedError("reset() is not supported in Brian2 standalone mode")
             self.network.restore("before-first-run")
+            for recorder in self.recorders:
+                # restoring the monitors also resets their spike counters
+                recorder._spike_count_offset = None
         self.running = False
         self.t_start = 0
         self.segment_counter += 1
@@ -101,9 +314,16 @@ class State(common.control.BaseState):
 
     @property
     def t(self):
+        if self.standalone:
+            # the clock variables are only available after the code has been run,
+            # but the network keeps track of the end time of each run
+            return float(self.network.t / ms)
         return float(self.network.clock.t / ms)
 
     def _get_min_delay(self):
+        if self._min_delay == 'auto' and self.standalone and not self.built:
+            # synaptic delays cannot be read before the simulation has been run
+            return self.dt
         if self._min_delay == 'auto':
             min_delay = np.inf
             for item in self.network.sorted_objects:
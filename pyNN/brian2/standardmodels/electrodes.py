@@ -32,6 +32,8 @@ class Brian2CurrentSource(StandardCurrentSource):
     """Base class for a source of current to be injected into a neuron."""
 
     def __init__(self, **parameters):
+        if simulator.state.standalone:
+            raise NotImplementedError("Current sources are not supported in Brian2 standalone mode")
         super(StandardCurrentSource, self).__init__(**parameters)
         self.cell_list = []
         self.indices = []
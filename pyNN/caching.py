@@ -0,0 +1,311 @@
+"""
+Persistent on-disk cache for generated connectivity.
+
+Building a projection from a connector can take much longer than the
+simulation itself, and in parameter sweeps in which only neuron parameters
+change the same connectivity is regenerated on every run. The classes in this
+module store the connections generated for a projection on disk, keyed by a
+stable hash of all the inputs that determine them, so that later runs can
+reload the connections instead of recomputing them.
+
+Classes:
+    ConnectionCache - a directory of cached connection arrays with LRU eviction
+
+Functions:
+    connection_key  - compute the cache key for a connector/projection pair
+
+:copyright: Copyright 2006-2022 by the PyNN team, see AUTHORS.
+:license: CeCILL, see LICENSE for details.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+import types
+import numpy as np
+from pyNN.random import RandomDistribution, NumpyRNG
+from pyNN.core import IndexBasedExpression
+from pyNN.parameters import LazyArray, ParameterSpace
+
+logger = logging.getLogger("PyNN")
+
+CACHE_FORMAT_VERSION = 2
+
+
+class UncacheableError(TypeError):
+    """Raised when a value cannot be reduced to a stable digest."""
+    pass
+
+
+class _Hasher(object):
+    """
+    Build a stable digest from the values that determine a projection's
+    connectivity.
+
+    Random number generators encountered along the way are collected in
+    `rngs`, so that their states can be saved and restored together with the
+    cached connections.
+    """
+
+    def __init__(self):
+        self._hash = hashlib.sha1()
+        self.rngs = []
+
+    def hexdigest(self):
+        return self._hash.hexdigest()
+
+    def _add(self, tag, data=b""):
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        self._hash.update(tag.encode("utf-8"))
+        self._hash.update(str(len(data)).encode("utf-8"))
+        self._hash.update(data)
+
+    def update(self, value):
+        if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+            self._add(type(value).__name__, repr(value))
+        elif isinstance(value, np.generic):
+            self._add("np." + type(value).__name__, repr(value.item()))
+        elif isinstance(value, np.ndarray):
+            if value.dtype == object:
+                self._add("objarray", repr(value.shape))
+                for item in value.flat:
+                    self.update(item)
+            else:
+                value = np.ascontiguousarray(value)
+                self._add("ndarray", "%s%s" % (value.dtype.str, value.shape))
+                self._hash.update(value.tobytes())
+        elif isinstance(value, (list, tuple)):
+            self._add(type(value).__name__, str(len(value)))
+            for item in value:
+                self.update(item)
+        elif isinstance(value, dict):
+            self._add("dict", str(len(value)))
+            for key in sorted(value, key=repr):
+                self.update(key)
+                self.update(value[key])
+        elif isinstance(value, NumpyRNG):
+            if value not in self.rngs:
+                self.rngs.append(value)
+            self._add("NumpyRNG", repr((value.seed, value.parallel_safe)))
+            # the current state is included, so that several projections sharing one RNG
+            # get different keys
+            state = value.rng.get_state()
+            self.update(state[1])
+            self._add("rngpos", repr(state[2:]))
+        elif isinstance(value, RandomDistribution):
+            self._add("RandomDistribution", value.name)
+            self.update(value.parameters)
+            self.update(value.rng)
+        elif isinstance(value, LazyArray):
+            self._add("LazyArray", repr((value._shape, value.dtype)))
+            self.update(value.base_value)
+            for operation in value.operations:
+                self._add("op", str(len(operation)))
+                for item in operation:
+                    self.update(item)
+        elif isinstance(value, ParameterSpace):
+            self._add("ParameterSpace", repr(value.shape))
+            self.update(dict(value.items()))
+        elif isinstance(value, IndexBasedExpression):
+            self._add("IndexBasedExpression", type(value).__qualname__)
+            self.update(dict((k, v) for k, v in vars(value).items() if k != "_projection"))
+        elif isinstance(value, types.FunctionType):
+            if value.__closure__:
+                raise UncacheableError("cannot hash closure %s" % value.__qualname__)
+            self._add("function", value.__qualname__)
+            self._update_code(value.__code__)
+            self.update(value.__defaults__)
+        elif isinstance(value, types.BuiltinFunctionType) or isinstance(value, np.ufunc):
+            self._add("builtin", "%s.%s" % (getattr(value, "__module__", None), value.__name__))
+        elif hasattr(value, "name") and hasattr(value, "read") and hasattr(value, "get_metadata"):
+            # a pyNN.recording.files file object
+            stat = os.stat(value.name)
+            self._add("file", repr((os.path.abspath(value.name), stat.st_size, stat.st_mtime_ns)))
+        else:
+            # includes random number generators other than NumpyRNG, whose state we cannot
+            # save and restore
+            raise UncacheableError("cannot hash value of type %s" % type(value).__name__)
+
+    def _update_code(self, code):
+        self._add("code", code.co_code)
+        self.update(code.co_names)
+        for const in code.co_consts:
+            if isinstance(const, types.CodeType):
+                self._update_code(const)
+            else:
+                self.update(const)
+
+
+def connection_key(connector, projection):
+    """
+    Return a (key, rngs) tuple for the connections that `connector` would
+    create for `projection`.
+
+    `key` is a hex digest of the connector class and parameters, any random
+    number generator seeds and states, the projection shape and the identity,
+    positions and locality of the pre- and post-synaptic cells, the space and
+    the synapse type and parameters. `rngs` is the list of random number
+    generators involved in the connection process.
+
+    Raises :class:`UncacheableError` if any of these cannot be hashed reliably
+    (e.g. closures, or random number generators other than `NumpyRNG`).
+    """
+    hasher = _Hasher()
+    hasher.update(CACHE_FORMAT_VERSION)
+    hasher.update(type(connector).__qualname__)
+    hasher.update(connector.get_parameters())
+    for name in ("rng", "n", "with_replacement", "column_names"):
+        if hasattr(connector, name):
+            hasher.update(name)
+            hasher.update(getattr(connector, name))
+    state = projection._simulator.state
+    hasher.update((state.mpi_rank, state.num_processes))
+    hasher.update(projection.shape)
+    for population in (projection.pre, projection.post):
+        hasher.update(np.asarray(population.all_cells, dtype=np.int64))
+        hasher.update(np.asarray(population._mask_local, dtype=bool))
+        hasher.update(population.positions)
+    space = projection.space
+    hasher.update((space.axes, space.scale_factor, space.offset, space.periodic_boundaries))
+    synapse_type = projection.synapse_type
+    hasher.update(type(synapse_type).__qualname__)
+    hasher.update(dict(synapse_type.native_parameters.items()))
+    return hasher.hexdigest(), hasher.rngs
+
+
+class ConnectionCache(object):
+    """
+    A directory of cached connectivity, with least-recently-used eviction.
+
+    Each entry is a sub-directory containing one ``.npy`` file per column
+    (``pre``, ``post`` and one per synaptic parameter), which are reloaded
+    with memory-mapping, and a small pickle file with metadata.
+
+    Arguments:
+        `directory`:
+            where to store the cache. If not given, a directory named
+            "pyNN_connection_cache" in the system temporary directory is used.
+        `max_size`:
+            the maximum total size of the cache, in bytes. When this is
+            exceeded, the least-recently-used entries are deleted.
+    """
+
+    def __init__(self, directory=None, max_size=2**30):
+        if directory is None:
+            directory = os.path.join(tempfile.gettempdir(), "pyNN_connection_cache")
+        self.directory = directory
+        self.max_size = max_size
+        if not os.path.exists(directory):
+            try:  # wrapping in try...except block for MPI
+                os.makedirs(directory)
+            except OSError:
+                pass  # we assume that the directory was already created by another MPI node
+
+    def _path(self, key):
+        return os.path.join(self.directory, key)
+
+    def __contains__(self, key):
+        return os.path.exists(os.path.join(self._path(key), "metadata.pkl"))
+
+    def load(self, key):
+        """
+        Return the cached connections for `key` as a tuple
+        `(pre, post, parameters, rng_states)`, where `pre` and `post` are
+        memory-mapped index arrays and `parameters` is a dict whose values are
+        either memory-mapped arrays or scalars. Return None if `key` is not in
+        the cache.
+        """
+        path = self._path(key)
+        try:
+            with open(os.path.join(path, "metadata.pkl"), "rb") as fp:
+                metadata = pickle.load(fp)
+        except (IOError, OSError, EOFError, pickle.UnpicklingError):
+            return None
+        pre = np.load(os.path.join(path, "pre.npy"), mmap_mode="r")
+        post = np.load(os.path.join(path, "post.npy"), mmap_mode="r")
+        parameters = dict(metadata["scalars"])
+        for i, name in enumerate(metadata["arrays"]):
+            parameters[name] = np.load(os.path.join(path, "p%d.npy" % i), mmap_mode="r")
+            if name in metadata["units"]:
+                # this reads the array into memory
+                parameters[name] = parameters[name] * metadata["units"][name]
+        os.utime(path)  # mark as recently used
+        logger.debug("Loaded %d connections from cache entry %s", pre.size, key)
+        return pre, post, parameters, metadata["rng_states"]
+
+    def store(self, key, pre, post, parameters, rng_states):
+        """
+        Store connections in the cache, then evict old entries if the cache is
+        larger than `max_size`.
+
+        `parameters` is a dict of arrays, each of the same size as `pre` and
+        `post`. Homogeneous arrays are stored as scalars. Arrays with units
+        (such as Brian2 Quantities) are stored as plain arrays, and their units
+        restored when they are loaded.
+        """
+        path = self._path(key)
+        tmp_path = tempfile.mkdtemp(dir=self.directory, prefix=".tmp")
+        scalars = {}
+        arrays = []
+        units = {}
+        for name, value in parameters.items():
+            value = np.asanyarray(value)
+            first = value.reshape(-1)[:1]  # unlike value.flat[0], this keeps any units
+            if value.size > 0 and (value == first).all():
+                scalars[name] = first[0]
+            else:
+                if type(value) is not np.ndarray:
+                    # a unit-carrying subclass: value == np.asarray(value) * unit
+                    units[name] = np.ones_like(value, shape=(), subok=True)
+                np.save(os.path.join(tmp_path, "p%d.npy" % len(arrays)), np.asarray(value))
+                arrays.append(name)
+        np.save(os.path.join(tmp_path, "pre.npy"), pre)
+        np.save(os.path.join(tmp_path, "post.npy"), post)
+        with open(os.path.join(tmp_path, "metadata.pkl"), "wb") as fp:
+            pickle.dump({"scalars": scalars, "arrays": arrays, "units": units,
+                         "rng_states": rng_states}, fp)
+        try:
+            os.rename(tmp_path, path)
+        except OSError:  # another process stored the same entry first
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        logger.debug("Stored %d connections in cache entry %s", len(pre), key)
+        self.evict()
+
+    def entries(self):
+        """
+        Return a list of `(last_access_time, size_in_bytes, key)` tuples, one
+        per cache entry, sorted from least to most recently used.
+        """
+        entries = []
+        for key in os.listdir(self.directory):
+            path = self._path(key)
+            if key.startswith(".") or not os.path.isdir(path):
+                continue
+            size = sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+            entries.append((os.path.getmtime(path), size, key))
+        return sorted(entries)
+
+    @property
+    def size(self):
+        """Total size of the cache, in bytes."""
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        """Delete least-recently-used entries until the cache fits in `max_size`."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, key in entries:
+            if total <= self.max_size:
+                break
+            logger.debug("Evicting connection cache entry %s", key)
+            shutil.rmtree(self._path(key), ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        """Delete all entries."""
+        for _, _, key in self.entries():
+            shutil.rmtree(self._path(key), ignore_errors=True)
@@ -29,6 +29,10 @@ class BaseState(object):
         # a list of (population, variable, filename) combinations that should be written to file on end()
         self.write_on_end = []
         self.recorders = set([])
+        # number of worker processes used to generate connections in single-process runs
+        self.connection_processes = 1
+        # number of completed recording segments kept in memory (None for all of them)
+        self.segments_in_memory = None
 
 
 def setup(timestep=DEFAULT_TIMESTEP, min_delay=DEFAULT_MIN_DELAY,
@@ -41,6 +45,19 @@ def setup(timestep=DEFAULT_TIMESTEP, min_delay=DEFAULT_MIN_DELAY,
 
     `extra_params` contains any keyword arguments that are required by a given
     simulator but not by others.
+
+    Common extra_params:
+
+    `connection_processes`:
+        number of worker processes used to generate connections from
+        connection maps (e.g. for :class:`FixedProbabilityConnector`) when not
+        running with MPI. Defaults to 1 (serial connection).
+
+    `segments_in_memory`:
+        if given, the recorded data for each completed segment (i.e. each
+        call to :func:`reset()`) are written to a temporary file, and only
+        this many of the most recently used segments are also kept in memory.
+        Defaults to None (all segments are kept in memory).
     """
     max_delay = extra_params.get('max_delay', DEFAULT_MAX_DELAY)
     invalid_extra_params = ('mindelay', 'maxdelay', 'dt', 'time_step')
@@ -75,6 +92,11 @@ def build_run(simulator):
         now = simulator.state.t
         if time_point - now < -simulator.state.dt / 2.0:  # allow for floating point error
             raise ValueError("Time %g is in the past (current time %g)" % (time_point, now))
+        # data for variables recorded with a reduction are reduced at regular
+        # intervals, rather than being accumulated until the end of the run
+        callbacks = list(callbacks or []) + [
+            recorder._reduction_callback for recorder in simulator.state.recorders
+            if recorder.reductions and recorder._incremental_reductions]
         if callbacks:
             callback_events = [(callback(simulator.state.t), callback)
                                for callback in callbacks]
@@ -37,6 +37,25 @@ def is_conductance(target_cell):
     return is_conductance
 
 
+def _write_positions(cells, file, metadata):
+    """
+    Write the index and position of each cell in a Population or Assembly
+    to a file, as columns ``index x y z``.
+    """
+    if cells._simulator.state.mpi_rank != 0:
+        return
+    indices = np.array([cells.id_to_index(id) for id in cells.all_cells])
+    if isinstance(file, files.StreamingFile):
+        # avoid building a copy of the positions array
+        file.write_columns([indices] + list(cells.positions), metadata)
+    else:
+        result = np.empty((indices.size, 4))
+        result[:, 0] = indices
+        result[:, 1:4] = cells.positions.T
+        file.write(result, metadata)
+    file.close()
+
+
 class IDMixin(object):
     """
     Instead of storing ids as integers, we store them as ID objects,
@@ -432,7 +451,8 @@ class BasePopulation(object):
     def injectable(self):
         return self.celltype.injectable
 
-    def record(self, variables, to_file=None, sampling_interval=None):
+    def record(self, variables, to_file=None, sampling_interval=None, start=None, stop=None,
+               reduce=None, bin=None):
         """
         Record the specified variable or variables for all cells in the
         Population or view.
@@ -445,7 +465,20 @@ class BasePopulation(object):
         will be automatically called when `end()` is called.
 
         `sampling_interval` should be a value in milliseconds, and an integer
-        multiple of the simulation timestep.
+        multiple of the simulation timestep. Different variables may be recorded
+        with different sampling intervals.
+
+        `start` and `stop` (in ms) restrict recording of state variables to a
+        time window, which saves memory for long simulations. They should be
+        integer multiples of the sampling interval. They do not apply to spikes.
+
+        If `reduce` is given, only a population-level reduction of the variable
+        is stored, rather than the values for each cell, so that memory use does
+        not grow with the number of cells. For spikes, `reduce` must be "count",
+        and `bin` gives the width (in ms) of the time bins in which spikes are
+        counted (i.e. a population PSTH). For state variables, `reduce` may be
+        "mean" or "sum", applied across cells at each sample time. The result is
+        returned by `get_data()` as a single-channel `AnalogSignal`.
         """
         if variables is None:  # reset the list of things to record
             # note that if record(None) is called on a view of a population
@@ -454,9 +487,11 @@ class BasePopulation(object):
         else:
             logger.debug("%s.record('%s')", self.label, variables)
             if self._record_filter is None:
-                self.recorder.record(variables, self.all_cells, sampling_interval)
+                self.recorder.record(variables, self.all_cells, sampling_interval, start, stop,
+                                     reduce, bin)
             else:
-                self.recorder.record(variables, self._record_filter, sampling_interval)
+                self.recorder.record(variables, self._record_filter, sampling_interval, start, stop,
+                                     reduce, bin)
         if isinstance(to_file, str):
             self.recorder.file = to_file
             self._simulator.state.write_on_end.append((self, variables, self.recorder.file))
@@ -554,23 +589,39 @@ class BasePopulation(object):
         # arguably, we should use indices
         return self.recorder.count('spikes', gather, self._record_filter)
 
+    def get_spike_count_array(self, gather=True, t_start=None, t_stop=None):
+        """
+        Returns the number of spikes for each neuron, as an array of integers
+        in the same order as the neurons in the population.
+
+        Neurons whose spikes are not recorded (or, if `gather` is False, are
+        not on the local MPI node) have a count of zero.
+
+        If `t_start` and/or `t_stop` are given (in ms), only spikes with
+        `t_start <= t < t_stop` are counted.
+        """
+        counts = self.recorder.count_array('spikes', gather, self._record_filter,
+                                           t_start, t_stop)
+        if hasattr(self, "parent"):
+            counts = counts[self.index_in_grandparent(np.arange(self.size))]
+        return counts
+
     @deprecated("mean_spike_count()")
     def meanSpikeCount(self, gather=True):
         return self.mean_spike_count(gather)
 
     def mean_spike_count(self, gather=True):
         """
-        Returns the mean number of spikes per neuron.
+        Returns the mean number of spikes per recorded neuron.
         """
-        spike_counts = self.get_spike_counts(gather)
-        total_spikes = sum(spike_counts.values())
-        if self._simulator.state.mpi_rank == 0 or not gather:  # should maybe use allgather, and get the numbers on all nodes
-            if len(spike_counts) > 0:
-                return float(total_spikes) / len(spike_counts)
-            else:
-                return 0
+        total_spikes = self.get_spike_count_array(gather).sum()
+        n_recorded = len(self.recorder.filter_recorded('spikes', self._record_filter))
+        if gather and self._simulator.state.num_processes > 1:
+            n_recorded = recording.mpi_sum(n_recorded)
+        if n_recorded > 0:
+            return float(total_spikes) / n_recorded
         else:
-            return np.nan
+            return 0
 
     def inject(self, current_source):
         """
@@ -587,13 +638,7 @@ class BasePopulation(object):
         """
         if isinstance(file, str):
             file = recording.files.StandardTextFile(file, mode='w')
-        cells = self.all_cells
-        result = np.empty((len(cells), 4))
-        result[:, 0] = np.array([self.id_to_index(id) for id in cells])
-        result[:, 1:4] = self.positions.T
-        if self._simulator.state.mpi_rank == 0:
-            file.write(result, {'population': self.label})
-            file.close()
+        _write_positions(self, file, {'population': self.label})
 
 
 class Population(BasePopulation):
@@ -1320,7 +1365,8 @@ class Assembly(object):
     def rset(self, parametername, rand_distr):
         self.set(parametername=rand_distr)
 
-    def record(self, variables, to_file=None, sampling_interval=None):
+    def record(self, variables, to_file=None, sampling_interval=None, start=None, stop=None,
+               reduce=None, bin=None):
         """
         Record the specified variable or variables for all cells in the Assembly.
 
@@ -1330,9 +1376,12 @@ class Assembly(object):
 
         If specified, `to_file` should be either a filename or a Neo IO instance and `write_data()`
         will be automatically called when `end()` is called.
+
+        See `Population.record()` for the other arguments. Note that with
+        `reduce`, each population in the Assembly is reduced separately.
         """
         for p in self.populations:
-            p.record(variables, to_file, sampling_interval)
+            p.record(variables, to_file, sampling_interval, start, stop, reduce, bin)
 
     @deprecated("record('v')")
     def record_v(self, to_file=True):
@@ -1360,13 +1409,7 @@ class Assembly(object):
         """
         if isinstance(file, str):
             file = files.StandardTextFile(file, mode='w')
-        cells = self.all_cells
-        result = np.empty((len(cells), 4))
-        result[:, 0] = np.array([self.id_to_index(id) for id in cells])
-        result[:, 1:4] = self.positions.T
-        if self._simulator.state.mpi_rank == 0:
-            file.write(result, {'assembly': self.label})
-            file.close()
+        _write_positions(self, file, {'assembly': self.label})
 
     @property
     def position_generator(self):
@@ -1429,14 +1472,27 @@ class Assembly(object):
 
     def mean_spike_count(self, gather=True):
         """
-        Returns the mean number of spikes per neuron.
+        Returns the mean number of spikes per recorded neuron.
         """
-        spike_counts = self.get_spike_counts()
-        total_spikes = sum(spike_counts.values())
-        if self._simulator.state.mpi_rank == 0 or not gather:  # should maybe use allgather, and get the numbers on all nodes
-            return float(total_spikes) / len(spike_counts)
+        total_spikes = self.get_spike_count_array(gather).sum()
+        n_recorded = sum(len(p.recorder.filter_recorded('spikes', p._record_filter))
+                         for p in self.populations)
+        if gather and self._simulator.state.num_processes > 1:
+            n_recorded = recording.mpi_sum(n_recorded)
+        if n_recorded > 0:
+            return float(total_spikes) / n_recorded
         else:
-            return np.nan
+            return 0
+
+    def get_spike_count_array(self, gather=True, t_start=None, t_stop=None):
+        """
+        Returns the number of spikes for each neuron, as an array of integers
+        in the same order as the neurons in the assembly.
+
+        See :meth:`Population.get_spike_count_array` for details.
+        """
+        return np.concatenate([p.get_spike_count_array(gather, t_start, t_stop)
+                               for p in self.populations])
 
     def get_spike_counts(self, gather=True):
         """
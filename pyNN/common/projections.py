@@ -21,6 +21,12 @@ from pyNN.standardmodels import StandardSynapseType
 from pyNN.connectors import Connector
 from .populations import BasePopulation, Assembly
 
+try:
+    from scipy import sparse
+    have_scipy = True
+except ImportError:
+    have_scipy = False
+
 logger = logging.getLogger("PyNN")
 deprecated = core.deprecated
 
@@ -176,6 +182,35 @@ class Projection(object):
         for i in range(len(self)):
             yield self[i]
 
+    def _bulk_connect(self, presynaptic_indices, postsynaptic_indices, **connection_parameters):
+        """
+        Create many connections at once.
+
+        `presynaptic_indices` and `postsynaptic_indices` are integer arrays of
+        equal length, with connections to the same post-synaptic neuron in
+        contiguous runs. Each value in `connection_parameters` is either a
+        scalar or an array of the same length.
+
+        This default implementation calls `_convergent_connect()` once per
+        run of post-synaptic indices. Backends which can create connections
+        more efficiently in bulk should override it.
+        """
+        postsynaptic_indices = np.asarray(postsynaptic_indices)
+        boundaries = np.hstack(([0],
+                                np.flatnonzero(np.diff(postsynaptic_indices)) + 1,
+                                [postsynaptic_indices.size]))
+        for left, right in zip(boundaries[:-1], boundaries[1:]):
+            if right > left:
+                params = {}
+                for name, value in connection_parameters.items():
+                    if isinstance(value, np.ndarray) and value.ndim > 0:
+                        # copy() rather than np.array(), to keep any units (e.g. Brian2)
+                        params[name] = value[left:right].copy()
+                    else:
+                        params[name] = value
+                self._convergent_connect(np.array(presynaptic_indices[left:right]),
+                                         int(postsynaptic_indices[left]), **params)
+
     # --- Methods for setting connection parameters ---------------------------
 
     def set(self, **attributes):
@@ -192,28 +227,119 @@ class Projection(object):
                 (as returned by `get(format='array')`
             (4) a mapping function, which accepts a single float argument (the
                 distance between pre- and post-synaptic cells) and returns a single value.
+            (5) a list or 1D array with one value per connection on the local
+                MPI node, in order of increasing presynaptic and then
+                postsynaptic index (i.e. the order of the non-NaN elements of
+                `get(format='array', gather=False)`, read row by row).
+                Multiple connections between the same pair of neurons are
+                taken in the order in which they were created.
+            (6) a SciPy sparse matrix with the same dimensions as the
+                connectivity matrix. Connections whose (pre, post) address is
+                not stored in the matrix keep their current value.
 
         Weights should be in nA for current-based and µS for conductance-based
         synapses. Delays should be in milliseconds.
 
         Note that where a projection contains multiple connections between a given pair
-        of neurons, all these connections will be set to the same value.
+        of neurons, all these connections will be set to the same value, except
+        when using option (5).
         """
         # should perhaps add a "distribute" argument, for symmetry with "gather" in get()
+        per_connection = {}
+        for name, value in list(attributes.items()):
+            if isinstance(value, list) or (isinstance(value, np.ndarray) and value.ndim == 1):
+                per_connection[name] = self._list_to_connection_values(name, attributes.pop(name))
+            elif have_scipy and sparse.issparse(value):
+                per_connection[name] = self._sparse_to_connection_values(name, value)
+                attributes.pop(name)
+        if per_connection:
+            self._set_connection_values(per_connection)
+        if attributes:
+            parameter_space = ParameterSpace(attributes,
+                                             self.synapse_type.get_schema(),
+                                             (self.pre.size, self.post.size))
+            parameter_space = self._handle_distance_expressions(parameter_space)
+            if isinstance(self.synapse_type, StandardSynapseType):
+                parameter_space = self.synapse_type.translate(parameter_space)
+            self._set_attributes(parameter_space)
+
+    def _connection_addresses(self):
+        """
+        Return arrays of the pre- and post-synaptic indices of the local
+        connections, in the order used by `get(format='list', gather=False)`.
+        """
+        addresses = np.array(self._get_attributes_as_list(["presynaptic_index",
+                                                           "postsynaptic_index"]),
+                             dtype=int).reshape((-1, 2))
+        return addresses[:, 0], addresses[:, 1]
 
-        # Note: we have removed the option:
-        #      "a list/1D array of the same length as the number of local connections"
-        # because it was proving tricky to implement and was holding up the release.
-        # The plan is to add this option back at a later date.
+    def _list_to_connection_values(self, name, values):
+        """
+        Reorder per-connection values given in order of increasing (pre, post)
+        address into the order of the local connections.
+        """
+        n = len(self)
+        if len(values) != n:
+            raise errors.InvalidDimensionsError(
+                "'%s' has %d values, but there are %d local connections" % (name, len(values), n))
+        pre, post = self._connection_addresses()
+        order = np.lexsort((post, pre))  # stable, so multiple connections keep their order
+        connection_values = np.empty(n, dtype=float)
+        connection_values[order] = values
+        return connection_values
+
+    def _sparse_to_connection_values(self, name, matrix):
+        """
+        Look up the value of each local connection in a sparse matrix indexed
+        by (pre, post). Connections without a stored entry keep their current
+        value.
+        """
+        if matrix.shape != self.shape:
+            raise errors.InvalidDimensionsError(
+                "Sparse matrix for '%s' has shape %s, expected %s" % (name, matrix.shape, self.shape))
+        matrix = matrix.tocsr()
+        matrix.sum_duplicates()  # also sorts the column indices within each row
+        pre, post = self._connection_addresses()
+        # since the column indices within each row are sorted, the flat (row-major)
+        # addresses of the stored entries are sorted
+        n_cols = self.shape[1]
+        stored = np.repeat(np.arange(self.shape[0], dtype=np.int64) * n_cols,
+                           np.diff(matrix.indptr)) + matrix.indices
+        wanted = pre.astype(np.int64) * n_cols + post
+        positions = np.searchsorted(stored, wanted)
+        found = positions < stored.size
+        found[found] = stored[positions[found]] == wanted[found]
+        if found.all():
+            values = np.asarray(matrix.data[positions], dtype=float)
+        else:
+            values = np.array(self.get(name, format='list', gather=False, with_address=False),
+                              dtype=float)
+            values[found] = matrix.data[positions[found]]
+        return values
 
-        attributes = self._value_list_to_array(attributes)
-        parameter_space = ParameterSpace(attributes,
-                                         self.synapse_type.get_schema(),
-                                         (self.pre.size, self.post.size))
-        parameter_space = self._handle_distance_expressions(parameter_space)
+    def _set_connection_values(self, attributes):
+        """
+        Set connection attributes from arrays containing one value per local
+        connection, in the order used by `get(format='list', gather=False)`.
+        """
+        parameter_space = ParameterSpace(attributes, self.synapse_type.get_schema(), (len(self),))
         if isinstance(self.synapse_type, StandardSynapseType):
             parameter_space = self.synapse_type.translate(parameter_space)
-        self._set_attributes(parameter_space)
+        parameter_space.evaluate(simplify=False)
+        self._set_attribute_vectors(parameter_space.as_dict())
+
+    def _set_attribute_vectors(self, attributes):
+        """
+        Set native connection attributes from arrays containing one value per
+        local connection, in the order of `self.connections`.
+
+        This default implementation sets the attributes of each `Connection`
+        object in turn. Backends which can set parameters in bulk should
+        override it.
+        """
+        for i, connection in enumerate(self.connections):
+            for name, values in attributes.items():
+                setattr(connection, name, values[i])
 
     def initialize(self, **initial_values):
         """
@@ -241,16 +367,6 @@ class Projection(object):
             self._set_initial_value_array(variable, initial_value)
             self.initial_values[variable] = initial_value
 
-    def _value_list_to_array(self, attributes):
-        """Convert a list of connection parameters/attributes to a 2D array."""
-        connection_mask = ~np.isnan(self.get('weight', format='array', gather='all'))
-        for name, value in attributes.items():
-            if isinstance(value, list) or (isinstance(value, np.ndarray) and value.ndim == 1):
-                array_value = np.nan * np.ones(self.shape)
-                array_value[connection_mask] = value
-                attributes[name] = array_value
-        return attributes
-
     def _handle_distance_expressions(self, parameter_space):
         # also index-based expressions
         for name, map in parameter_space.items():
@@ -400,21 +516,39 @@ class Projection(object):
     def _get_attributes_as_list(self, names):
         return [c.as_tuple(*names) for c in self.connections]
 
+    def _get_attribute_columns(self, names):
+        """
+        Return a list containing, for each name in `names`, an array with the
+        value of that attribute for each local connection, in the order of
+        `self.connections`.
+        """
+        return [np.array([getattr(c, name) for c in self.connections]) for name in names]
+
     def _get_attributes_as_arrays(self, names, multiple_synapses='sum'):
-        multi_synapse_operation = Projection.MULTI_SYNAPSE_OPERATIONS[multiple_synapses]
+        pre, post = self._connection_addresses()
+        addresses = pre.astype(np.int64) * self.post.size + post
+        if multiple_synapses in ('first', 'last'):
+            # index of the first (or last) connection for each (pre, post) pair
+            order = np.arange(addresses.size)
+            if multiple_synapses == 'last':
+                order = order[::-1]
+            addresses, first = np.unique(addresses[order], return_index=True)
+            selected = order[first]
+        names = [{"weights": "weight", "delays": "delay"}.get(name, name) for name in names]
         all_values = []
-        for attribute_name in names:
-            values = np.nan * np.ones((self.pre.size, self.post.size))
-            if attribute_name[-1] == "s":  # weights --> weight, delays --> delay
-                attribute_name = attribute_name[:-1]
-            for c in self.connections:
-                value = getattr(c, attribute_name)
-                addr = (c.presynaptic_index, c.postsynaptic_index)
-                if np.isnan(values[addr]):
-                    values[addr] = value
-                else:
-                    values[addr] = multi_synapse_operation(values[addr], value)
-            all_values.append(values)
+        for value in self._get_attribute_columns(names):
+            value = value.astype(float)
+            values = np.nan * np.ones((self.pre.size * self.post.size,))
+            if multiple_synapses == 'sum':
+                values[addresses] = 0.0
+                np.add.at(values, addresses, value)
+            elif multiple_synapses == 'min':
+                np.fmin.at(values, addresses, value)
+            elif multiple_synapses == 'max':
+                np.fmax.at(values, addresses, value)
+            else:
+                values[addresses] = value[selected]
+            all_values.append(values.reshape((self.pre.size, self.post.size)))
         return all_values
 
     @deprecated("get('weight', format, gather)")
@@ -441,6 +575,9 @@ class Projection(object):
             attribute_names = self.synapse_type.get_parameter_names()
         if isinstance(file, str):
             file = recording.files.StandardTextFile(file, mode='wb')
+        if format == 'list' and isinstance(file, recording.files.StreamingFile):
+            self._save_columns(attribute_names, file, gather, with_address)
+            return
         all_values = self.get(attribute_names, format=format,
                               gather=gather, with_address=with_address)
         if format == 'array':
@@ -453,6 +590,30 @@ class Projection(object):
             file.write(all_values, metadata)
             file.close()
 
+    def _save_columns(self, attribute_names, file, gather, with_address):
+        """
+        Write connection attributes to a file that can be written in pieces,
+        one column at a time, rather than as a list of tuples.
+        """
+        if isinstance(attribute_names, str):
+            attribute_names = [attribute_names]
+        if isinstance(self.synapse_type, StandardSynapseType):
+            native_names = self.synapse_type.get_native_names(*attribute_names)
+        else:
+            native_names = attribute_names
+        columns = self._get_attribute_columns(native_names)
+        if with_address:
+            columns = list(self._connection_addresses()) + columns
+        if gather and self._simulator.state.num_processes > 1:
+            columns = [recording.gather_array(np.asarray(column, dtype=float))
+                       for column in columns]
+        if self._simulator.state.mpi_rank == 0:
+            metadata = {"columns": list(attribute_names)}
+            if with_address:
+                metadata["columns"] = ["i", "j"] + metadata["columns"]
+            file.write_columns(columns, metadata)
+            file.close()
+
     @deprecated("save('all', file, format='list', gather=gather)")
     def saveConnections(self, file, gather=True, compatible_output=True):
         self.save('all', file, format='list', gather=gather)
@@ -9,14 +9,16 @@ for improved performance.
 """
 
 from pyNN.random import RandomDistribution, AbstractRNG, NumpyRNG, get_mpi_config
-from pyNN.core import IndexBasedExpression
-from pyNN import errors, descriptions
+from pyNN.core import IndexBasedExpression, concatenate_with_units
+from pyNN import errors, descriptions, caching
 from pyNN.recording import files
 from pyNN.parameters import LazyArray
 from pyNN.standardmodels import StandardSynapseType
 import numpy as np
 from itertools import repeat
+from collections import defaultdict
 import logging
+import multiprocessing
 from copy import copy, deepcopy
 
 from lazyarray import arccos, arcsin, arctan, arctan2, ceil, cos, cosh, exp, \
@@ -177,6 +179,8 @@ class MapConnector(Connector):
                 connection_map_generator(mask))
 
         parameter_space = self._parameters_from_synapse_type(projection, distance_map)
+        connection_buffer = _ConnectionBuffer(
+            projection, [name for name, map in parameter_space.items() if map.is_homogeneous])
 
         # Loop over columns of the connection_map array (equivalent to looping over post-synaptic neurons)
         for count, (col, postsynaptic_index, local, source_mask) in enumerate(zip(*components)):
@@ -227,12 +231,15 @@ class MapConnector(Connector):
                                 check(connection_parameters[native_parameter_name], projection)
 
                 if local:
-                    # Connect the neurons
+                    # Connect the neurons. The connections are passed to the projection in blocks,
+                    # as some backends can create many connections at once much more efficiently.
                     #logger.debug("Connecting to %d from %s" % (postsynaptic_index, source_mask))
-                    projection._convergent_connect(
-                        source_mask, postsynaptic_index, **connection_parameters)
+                    connection_buffer.add(source_mask, postsynaptic_index, connection_parameters)
+                    if connection_buffer.size >= BULK_CONNECT_SIZE:
+                        connection_buffer.flush()
                     if self.callback:
                         self.callback(count / projection.post.local_size)
+        connection_buffer.flush()
 
     def _connect_with_map(self, projection, connection_map, distance_map=None):
         """
@@ -248,7 +255,48 @@ class MapConnector(Connector):
                 TODO
         """
         logger.debug("Connecting %s using a connection map" % projection.label)
-        self._standard_connect(projection, connection_map.by_column, distance_map)
+        n_workers = getattr(projection._simulator.state, "connection_processes", 1)
+        if (n_workers > 1
+                and projection._simulator.state.num_processes == 1
+                and "fork" in multiprocessing.get_all_start_methods()):
+            self._parallel_connect(projection, connection_map, distance_map, n_workers)
+        else:
+            self._standard_connect(projection, connection_map.by_column, distance_map)
+
+    def _parallel_connect(self, projection, connection_map, distance_map, n_workers):
+        """
+        Create connections according to a connection map, using a pool of
+        `n_workers` processes.
+
+        The post-synaptic neurons are divided into blocks of
+        `PARALLEL_BLOCK_SIZE` columns of the connection map, which are
+        evaluated in parallel. Each block uses its own random number streams,
+        derived from the random number generators of the connection map and
+        synapse parameters and from the block index, so the connections do not
+        depend on the number of processes, but are not the same as those
+        created by serial connection.
+        """
+        logger.debug("Connecting %s using %d processes" % (projection.label, n_workers))
+        parameter_space = self._parameters_from_synapse_type(projection, distance_map)
+        rngs = _find_rngs([connection_map] + [map for name, map in parameter_space.items()])
+        # advancing the parent RNGs means that consecutive parallel connections differ
+        base_seeds = [rng.rng.randint(2**31) for rng in rngs]
+        n_post = projection.post.size
+        blocks = [(i, start, min(start + PARALLEL_BLOCK_SIZE, n_post))
+                  for i, start in enumerate(range(0, n_post, PARALLEL_BLOCK_SIZE))]
+        _parallel_task.update(connector=self, projection=projection,
+                              connection_map=connection_map, parameter_space=parameter_space,
+                              rngs=rngs, base_seeds=base_seeds)
+        try:
+            with multiprocessing.get_context("fork").Pool(n_workers) as pool:
+                for count, (sources, targets, connection_parameters) in enumerate(
+                        pool.imap(_connect_block, blocks)):
+                    if sources.size > 0:
+                        projection._bulk_connect(sources, targets, **connection_parameters)
+                    if self.callback:
+                        self.callback((count + 1) / len(blocks))
+        finally:
+            _parallel_task.clear()
 
     def _get_connection_map_no_self_connections(self, projection):
         from pyNN.common import Population
@@ -277,6 +325,138 @@ class MapConnector(Connector):
         return connection_map
 
 
+# Number of post-synaptic neurons handled by each task in parallel connection
+PARALLEL_BLOCK_SIZE = 256
+
+# Approximate number of connections passed to Projection._bulk_connect() at once
+# in serial connection
+BULK_CONNECT_SIZE = 100000
+
+
+class _ConnectionBuffer(object):
+    """
+    Accumulate the connections to successive post-synaptic neurons, and pass
+    them to `Projection._bulk_connect()` in blocks.
+    """
+
+    def __init__(self, projection, homogeneous_parameters=()):
+        self.projection = projection
+        self.homogeneous_parameters = homogeneous_parameters
+        self.clear()
+
+    def clear(self):
+        self.sources = []
+        self.targets = []
+        self.parameters = defaultdict(list)
+        self.size = 0
+
+    def add(self, presynaptic_indices, postsynaptic_index, connection_parameters):
+        presynaptic_indices = np.asarray(presynaptic_indices, dtype=int)
+        self.sources.append(presynaptic_indices)
+        self.targets.append(np.full(presynaptic_indices.shape, postsynaptic_index, dtype=int))
+        for name, value in connection_parameters.items():
+            self.parameters[name].append(value)
+        self.size += presynaptic_indices.size
+
+    def flush(self):
+        if self.size > 0:
+            connection_parameters = {}
+            for name, values in self.parameters.items():
+                if name in self.homogeneous_parameters:
+                    # homogeneous parameters have the same value for every neuron
+                    connection_parameters[name] = values[0]
+                else:
+                    # values may carry units (e.g. Brian2), which np.concatenate() would drop
+                    connection_parameters[name] = concatenate_with_units(
+                        values, [sources.shape for sources in self.sources])
+            self.projection._bulk_connect(np.concatenate(self.sources),
+                                          np.concatenate(self.targets),
+                                          **connection_parameters)
+        self.clear()
+
+# Set in the parent process before forking the pool in MapConnector._parallel_connect().
+# Connection maps and parameter spaces often contain functions that cannot be pickled,
+# so they are inherited by the worker processes rather than sent to them.
+_parallel_task = {}
+
+
+def _find_rngs(lazy_arrays):
+    """Return the NumpyRNG objects used by a list of lazy arrays."""
+    rngs = []
+
+    def visit(value):
+        if isinstance(value, LazyArray):
+            visit(value.base_value)
+            for operation in value.operations:
+                for item in operation:
+                    visit(item)
+        elif isinstance(value, RandomDistribution):
+            if isinstance(value.rng, NumpyRNG):
+                if not any(value.rng is rng for rng in rngs):
+                    rngs.append(value.rng)
+            else:
+                raise NotImplementedError(
+                    "Parallel connection requires NumpyRNG, not %s" % type(value.rng).__name__)
+    for lazy_array in lazy_arrays:
+        visit(lazy_array)
+    return rngs
+
+
+def _connect_block(block):
+    """
+    Evaluate the connections to one block of post-synaptic neurons, in a
+    worker process. Returns arrays of pre- and post-synaptic indices and a
+    dict of connection parameters.
+    """
+    block_index, start, stop = block
+    task = _parallel_task
+    for rng, base_seed in zip(task["rngs"], task["base_seeds"]):
+        rng.rng.seed([base_seed, block_index])
+    projection = task["projection"]
+    connection_map = task["connection_map"]
+    parameter_space = task["parameter_space"]
+    postsynaptic_indices = projection.post.id_to_index(projection.post.all_cells)
+    columns = connection_map[:, start:stop]
+    if not isinstance(columns, np.ndarray):  # homogeneous map
+        columns = np.full((projection.pre.size, stop - start), bool(columns))
+    else:
+        columns = columns.reshape((projection.pre.size, stop - start)).astype(bool)
+    all_sources, all_targets = [], []
+    all_parameters = defaultdict(list)
+    for offset in range(stop - start):
+        col = start + offset
+        source_mask = columns[:, offset].nonzero()[0]
+        if source_mask.size == 0:
+            continue
+        connection_parameters = {}
+        for name, map in parameter_space.items():
+            if map.is_homogeneous:
+                connection_parameters[name] = map.evaluate(simplify=True)
+            else:
+                connection_parameters[name] = map[source_mask, col]
+        if task["connector"].safe:
+            syn = projection.synapse_type
+            if hasattr(syn, "parameter_checks"):
+                for parameter_name, check in syn.parameter_checks.items():
+                    native_parameter_name = syn.translations[parameter_name]["translated_name"]
+                    if native_parameter_name in connection_parameters:
+                        check(connection_parameters[native_parameter_name], projection)
+        all_sources.append(source_mask.astype(np.int32))
+        all_targets.append(np.full(source_mask.size, postsynaptic_indices[col], dtype=np.int32))
+        for name, value in connection_parameters.items():
+            all_parameters[name].append(np.broadcast_to(value, source_mask.shape, subok=True))
+    if not all_sources:
+        return np.array([], dtype=np.int32), np.array([], dtype=np.int32), {}
+    connection_parameters = {}
+    for name, values in all_parameters.items():
+        values = concatenate_with_units(values)
+        if (values == values[0]).all():
+            connection_parameters[name] = values[0]
+        else:
+            connection_parameters[name] = values
+    return np.hstack(all_sources), np.hstack(all_targets), connection_parameters
+
+
 class AllToAllConnector(MapConnector):
     """
     Connects all cells in the presynaptic population to all cells in the
@@ -585,6 +765,25 @@ class FromListConnector(Connector):
         logger.debug("left = %s", left)
         logger.debug("right = %s", right)
 
+        if not any(callable(value.base_value) or isinstance(value.base_value, RandomDistribution)
+                   for name, value in projection.synapse_type.parameter_space.items()):
+            # The parameters do not depend on the connection index, so they can be evaluated
+            # for all the local connections at once, and the connections created in bulk.
+            local_rows = np.hstack([np.arange(l, r) for l, r in zip(left, right)]
+                                   + [np.array([], dtype=int)]).astype(int)
+            connection_parameters = deepcopy(projection.synapse_type.parameter_space)
+            connection_parameters.shape = (local_rows.size,)
+            for col, name in enumerate(self.column_names, 2):
+                connection_parameters.update(**{name: self.conn_list[local_rows, col]})
+            if isinstance(projection.synapse_type, StandardSynapseType):
+                connection_parameters = projection.synapse_type.translate(
+                    connection_parameters)
+            connection_parameters.evaluate(simplify=True)
+            projection._bulk_connect(self.conn_list[local_rows, 0].astype(int),
+                                     self.conn_list[local_rows, 1].astype(int),
+                                     **connection_parameters.as_dict())
+            return
+
         for tgt, l, r in zip(local_targets, left, right):
             sources = self.conn_list[l:r, 0].astype(int)
             connection_parameters = deepcopy(projection.synapse_type.parameter_space)
@@ -645,7 +844,16 @@ class FromFileConnector(FromListConnector):
         for ignore in "ij":
             if ignore in self.column_names:
                 self.column_names.remove(ignore)
-        self.conn_list = self.file.read()
+        if hasattr(self.file, "iter_chunks"):
+            # read the file in chunks, keeping only connections onto local cells
+            is_local = np.zeros(projection.post.size, dtype=bool)
+            is_local[np.arange(projection.post.size)[projection.post._mask_local]] = True
+            local_rows = [chunk[is_local[chunk[:, 1].astype(int)]]
+                          for chunk in self.file.iter_chunks()]
+            n_columns = len(self.column_names) + 2
+            self.conn_list = np.vstack(local_rows + [np.empty((0, n_columns))])
+        else:
+            self.conn_list = self.file.read()
         FromListConnector.connect(self, projection)
 
 
@@ -1106,3 +1314,133 @@ class FixedTotalNumberConnector(FixedNumberConnector):
             else:
                 return [np.array(x) for x in np.array(connections)[mask]]
         self._standard_connect(projection, build_source_masks)
+
+
+class CachedConnector(Connector):
+    """
+    Wraps another connector, storing the connections it creates in a
+    persistent on-disk cache, so that later runs which build the same
+    projection can reload the connections rather than regenerating them.
+
+    The cache key is a hash of the connector class and parameters, the seeds
+    and states of any random number generators, the sizes, IDs and positions
+    of the pre- and post-synaptic cells, the space and the synapse type and
+    parameters. The final states of the random number generators are stored
+    with the connections and restored on a cache hit, so a run using the
+    cache produces exactly the same network as one that does not.
+
+    Connectors whose inputs cannot be hashed reliably (for example those
+    using random number generators other than
+    :class:`~pyNN.random.NumpyRNG`, or parameters given as closures), and
+    connectors which bypass `Projection._convergent_connect` and
+    `Projection._bulk_connect` (for example simulator-native connectors), are
+    connected normally, without caching.
+
+    Arguments:
+        `connector`:
+            the connector to wrap.
+        `cache`:
+            a :class:`~pyNN.caching.ConnectionCache` instance, or a directory
+            name, or None to use the default cache directory.
+    """
+    parameter_names = ('connector',)
+
+    def __init__(self, connector, cache=None):
+        """
+        Create a new connector.
+        """
+        Connector.__init__(self, connector.safe, connector.callback)
+        self.connector = connector
+        if not isinstance(cache, caching.ConnectionCache):
+            cache = caching.ConnectionCache(cache)
+        self.cache = cache
+
+    def get_parameters(self):
+        return self.connector.get_parameters()
+
+    def describe(self, template='connector_default.txt', engine='default'):
+        return self.connector.describe(template, engine)
+
+    def connect(self, projection):
+        """Connect-up a Projection."""
+        try:
+            key, rngs = caching.connection_key(self.connector, projection)
+        except caching.UncacheableError as err:
+            logger.warning("Unable to cache connections for %s: %s", projection.label, err)
+            self.connector.connect(projection)
+            return
+        cached = self.cache.load(key)
+        if cached is None:
+            self._connect_and_store(projection, key, rngs)
+        else:
+            pre, post, parameters, rng_states = cached
+            self._replay(projection, pre, post, parameters)
+            for rng, state in zip(rngs, rng_states):
+                rng.rng.set_state(state)
+
+    def _connect_and_store(self, projection, key, rngs):
+        blocks = []
+        convergent_connect = projection._convergent_connect
+        bulk_connect = projection._bulk_connect
+        inside_bulk_connect = []
+
+        def record(presynaptic_indices, postsynaptic_indices, connection_parameters):
+            # copy the parameter values, in case the backend modifies them in place
+            blocks.append((np.array(presynaptic_indices, dtype=int),
+                           np.array(postsynaptic_indices, dtype=int),
+                           dict((name, np.array(value, subok=True))  # keep any units
+                                for name, value in connection_parameters.items())))
+
+        def recording_convergent_connect(presynaptic_indices, postsynaptic_index,
+                                         **connection_parameters):
+            if not inside_bulk_connect:
+                record(presynaptic_indices,
+                       np.full(np.shape(presynaptic_indices), postsynaptic_index),
+                       connection_parameters)
+            convergent_connect(presynaptic_indices, postsynaptic_index, **connection_parameters)
+
+        def recording_bulk_connect(presynaptic_indices, postsynaptic_indices,
+                                   **connection_parameters):
+            record(presynaptic_indices, postsynaptic_indices, connection_parameters)
+            # the backend may implement this by calling _convergent_connect()
+            inside_bulk_connect.append(True)
+            try:
+                bulk_connect(presynaptic_indices, postsynaptic_indices, **connection_parameters)
+            finally:
+                inside_bulk_connect.pop()
+
+        n_before = len(projection)
+        projection._convergent_connect = recording_convergent_connect
+        projection._bulk_connect = recording_bulk_connect
+        try:
+            self.connector.connect(projection)
+        finally:
+            del projection._convergent_connect
+            del projection._bulk_connect
+        n_recorded = sum(sources.size for sources, _, _ in blocks)
+        if len(projection) - n_before != n_recorded:
+            logger.warning("%s did not create its connections through _convergent_connect() "
+                           "or _bulk_connect(); not caching connections for %s",
+                           type(self.connector).__name__, projection.label)
+            return
+        if blocks:
+            pre = np.hstack([sources for sources, _, _ in blocks])
+            post = np.hstack([targets for _, targets, _ in blocks])
+            parameters = {}
+            for name in blocks[0][2]:
+                parameters[name] = concatenate_with_units(
+                    [params[name] for _, _, params in blocks],
+                    [sources.shape for sources, _, _ in blocks])
+                if parameters[name].dtype == object:
+                    logger.warning("Unable to cache non-numeric parameter '%s' for %s",
+                                   name, projection.label)
+                    return
+        else:
+            pre = post = np.array([], dtype=int)
+            parameters = {}
+        self.cache.store(key, pre, post, parameters,
+                         [rng.rng.get_state() for rng in rngs])
+
+    def _replay(self, projection, pre, post, parameters):
+        logger.debug("Connecting %s from cached connections" % projection.label)
+        projection._bulk_connect(pre, post, **parameters)
@@ -22,6 +22,30 @@ def is_listlike(obj):
     )
 
 
+def concatenate_with_units(arrays, shapes=None):
+    """
+    Concatenate a list of 1D arrays, preserving the type (and hence units) of
+    array subclasses such as Brian2 or `quantities` Quantities, which
+    `np.concatenate()` discards.
+
+    If `shapes` is given, each array (or scalar) is first broadcast to the
+    corresponding shape.
+    """
+    if shapes is not None:
+        arrays = [np.broadcast_to(array, shape, subok=True)
+                  for array, shape in zip(arrays, shapes)]
+    arrays = [np.asanyarray(array).reshape(-1) for array in arrays]
+    if all(type(array) is np.ndarray for array in arrays):
+        return np.concatenate(arrays)
+    result = np.empty_like(arrays[0], dtype=np.result_type(*arrays),
+                           shape=(sum(array.size for array in arrays),), subok=True)
+    start = 0
+    for array in arrays:
+        result[start:start + array.size] = array
+        start += array.size
+    return result
+
+
 class deprecated(object):
     """
     Decorator to mark functions/methods as deprecated. Emits a warning when
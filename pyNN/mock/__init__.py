@@ -39,6 +39,8 @@ def setup(timestep=DEFAULT_TIMESTEP, min_delay=DEFAULT_MIN_DELAY,
     simulator.state.max_delay = max_delay
     simulator.state.mpi_rank = extra_params.get('rank', 0)
     simulator.state.num_processes = extra_params.get('num_processes', 1)
+    simulator.state.connection_processes = extra_params.get('connection_processes', 1)
+    simulator.state.segments_in_memory = extra_params.get('segments_in_memory', None)
     return rank()
 
 
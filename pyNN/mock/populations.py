@@ -1,11 +1,18 @@
 import numpy as np
 from pyNN import common, errors
 from pyNN.standardmodels import StandardCellType
-from pyNN.parameters import ParameterSpace, simplify
+from pyNN.parameters import ParameterSpace, SequenceArray, simplify
 from . import simulator
 from .recording import Recorder
 
 
+def _as_stored(value):
+    # the mock backend stores sequence parameters as object arrays
+    if isinstance(value, SequenceArray):
+        return value.to_sequences()
+    return value
+
+
 class Assembly(common.Assembly):
     _simulator = simulator
 
@@ -30,7 +37,7 @@ class PopulationView(common.PopulationView):
         """parameter_space should contain native parameters"""
         for name, value in parameter_space.items():
             try:
-                self.parent._parameters[name][self.mask] = value.evaluate(simplify=True)
+                self.parent._parameters[name][self.mask] = _as_stored(value.evaluate(simplify=True))
             except ValueError as err:
                 raise errors.InvalidParameterValueError(f"{name} should not be of type {type(value)}")
 
@@ -63,7 +70,8 @@ class Population(common.Population):
             parameter_space = self.celltype.parameter_space
         parameter_space.shape = (self.size,)
         parameter_space.evaluate(mask=self._mask_local, simplify=False)
-        self._parameters = parameter_space.as_dict()
+        self._parameters = {name: _as_stored(value)
+                            for name, value in parameter_space.as_dict().items()}
 
         for id in self.all_cells:
             id.parent = self
@@ -88,4 +96,4 @@ class Population(common.Population):
         """parameter_space should contain native parameters"""
         parameter_space.evaluate(simplify=False, mask=self._mask_local)
         for name, value in parameter_space.items():
-            self._parameters[name] = value
+            self._parameters[name] = _as_stored(value)
@@ -41,9 +41,6 @@ class Projection(common.Projection):
     def __len__(self):
         return len(self.connections)
 
-    def set(self, **attributes):
-        raise NotImplementedError
-
     def _convergent_connect(self, presynaptic_indices, postsynaptic_index,
                             **connection_parameters):
         for name, value in connection_parameters.items():
@@ -54,3 +51,10 @@ class Projection(common.Projection):
             self.connections.append(
                 Connection(pre_idx, postsynaptic_index, **other_attributes)
             )
+
+    def _set_attributes(self, parameter_space):
+        parameter_space.evaluate(simplify=False)
+        for connection in self.connections:
+            addr = (connection.presynaptic_index, connection.postsynaptic_index)
+            for name, value in parameter_space.items():
+                setattr(connection, name, value[addr])
@@ -6,6 +6,10 @@ from . import simulator
 class Recorder(recording.Recorder):
     _simulator = simulator
 
+    def __init__(self, population, file=None):
+        recording.Recorder.__init__(self, population, file)
+        self._drained_until = {}
+
     def _record(self, variable, new_ids, sampling_interval=None):
         pass
 
@@ -20,9 +24,27 @@ class Recorder(recording.Recorder):
 
     def _get_all_signals(self, variable, ids, clear=False):
         # assuming not using cvode, otherwise need to get times as well and use IrregularlySampledAnalogSignal
-        n_samples = int(round(self._simulator.state.t / self._simulator.state.dt)) + 1
+        n_samples = self._n_samples(variable)
         return np.vstack([np.random.uniform(size=n_samples) for id in ids]).T, None
 
+    def _drain(self, variable):
+        # each recorded cell spikes in the middle of every millisecond, and the
+        # state variables of each cell are equal to its index in the population
+        t = self._simulator.state.t
+        last = self._drained_until.get(variable)
+        self._drained_until[variable] = t
+        ids = sorted(self.recorded[variable])
+        if variable == 'spikes':
+            first = 0 if last is None else int(np.floor(last - 0.5)) + 1
+            times = np.arange(first + 0.5, t + 1e-9, 1.0)
+            return np.repeat(times, len(ids)), None
+        else:
+            interval = self.sampling_intervals[variable]
+            first = 0 if last is None else int(round(last / interval)) + 1
+            times = interval * np.arange(first, int(round(t / interval)) + 1)
+            values = self.population.id_to_index(np.array(ids, dtype=int)).astype(float)
+            return np.repeat(times, len(ids)), np.tile(values, times.size)
+
     def _local_count(self, variable, filter_ids=None):
         N = {}
         if variable == 'spikes':
@@ -32,8 +54,23 @@ class Recorder(recording.Recorder):
             raise Exception("Only implemented for spikes")
         return N
 
+    def _local_count_array(self, variable, filter_ids=None, t_start=None, t_stop=None):
+        if variable != 'spikes':
+            raise Exception("Only implemented for spikes")
+        ids = np.fromiter(self.filter_recorded(variable, filter_ids), dtype=int)
+        if ids.size == 0:
+            return np.zeros(self.population.size, dtype=np.int64)
+        # the same spike times as given by _get_spiketimes()
+        times = np.hstack((ids, ids + 5)).astype(float) % self._simulator.state.t
+        indices = np.tile(self.population.id_to_index(ids), 2)
+        return recording.count_spikes(indices, times, self.population.size, t_start, t_stop)
+
     def _clear_simulator(self):
         pass
 
     def _reset(self):
-        pass
+        self._drained_until = {}
+
+    def store_to_cache(self, annotations=None):
+        recording.Recorder.store_to_cache(self, annotations)
+        self._drained_until = {}
@@ -114,6 +114,8 @@ def setup(timestep=DEFAULT_TIMESTEP, min_delay=DEFAULT_MIN_DELAY,
     for key in ("threads", "verbosity", "spike_precision", "recording_precision"):
         if key in extra_params:
             setattr(simulator.state, key, extra_params[key])
+    simulator.state.connection_processes = extra_params.get('connection_processes', 1)
+    simulator.state.segments_in_memory = extra_params.get('segments_in_memory', None)
     # set kernel RNG seeds
     simulator.state.num_threads = extra_params.get('threads') or 1
     if 'grng_seed' in extra_params:
@@ -77,8 +77,8 @@ class CSAConnector(DefaultCSAConnector):
             nest.CGConnect(presynaptic_cells, postsynaptic_cells, self.cset,
                            model=projection.nest_synapse_model)
 
-        # reset the caching of the connection list, since this will have to be recalculated
-        projection._connections = None
+        # invalidate the cached connection tables, since these will have to be recalculated
+        projection._simulator.state.connection_generation += 1
         projection._sources.extend(presynaptic_cells)
 
 
@@ -109,12 +109,36 @@ class NESTConnectorMixin(object):
                     value.shape = (1, 1)
                     # If parameter is given as a single number. Checking of the dimensions should be done in NEST
                     params[name] = float(value.evaluate())
-                if name == "weight" and projection.receptor_type == 'inhibitory' and self.post.conductance_based:
+                if name == "weight" and projection.receptor_type == 'inhibitory' and projection.post.conductance_based:
                     # NEST wants negative values for inhibitory weights, even if these are conductances
                     params[name] *= -1
         return params
 
 
+    def use_native_rule(self, projection):
+        """
+        Return True if the connections should be created by one of NEST's
+        (multithreaded) connection rules rather than by PyNN. This is the case
+        if the connector's random number generator, or that of any of the
+        synapse parameters, is a :class:`NativeRNG`.
+
+        Since NEST does not say in advance which connections it will create,
+        each synapse parameter must then either have a single value or be
+        drawn from a NEST random distribution.
+        """
+        native_parameters = projection.synapse_type.native_parameters
+        if not (native_parameters.has_native_rngs or isinstance(getattr(self, "rng", None), NativeRNG)):
+            return False
+        for name, value in native_parameters.items():
+            if not (value.is_homogeneous
+                    or (isinstance(value.base_value, random.RandomDistribution)
+                        and isinstance(value.base_value.rng, NativeRNG))):
+                raise NotImplementedError(
+                    "With NEST's connection rules, synapse parameter '%s' must be either a "
+                    "single value or a random distribution using a NativeRNG" % name)
+        return True
+
+
 class FixedProbabilityConnector(FixedProbabilityConnector, NESTConnectorMixin):
 
     def connect(self, projection):
@@ -149,71 +173,72 @@ class AllToAllConnector(AllToAllConnector, NESTConnectorMixin):
         projection._connect(rule_params, syn_params)
 
 
-# class OneToOneConnector():
-#
-#    def __init__(self, allow_self_connections=True, with_replacement=True, safe=True,
-#                 callback=None):
-#        self.allow_self_connections = allow_self_connections
-#        self.with_replacement = with_replacement
-#
-#    def connect(self, projection):
-#        syn_params = projection.synapse_parameters()
-#        rule_params = {'autapses': self.allow_self_connections,
-#                       'multapses': self.with_replacement,
-#                       'rule': 'one_to_one'}
-#
-#        projection._connect(rule_params, syn_params)
-#
-#
-# class FixedNumberPreConnector():
-#
-#    def __init__(self, n, allow_self_connections=True, with_replacement=True, safe=True,
-#                 callback=None, rng=None):
-#        self.allow_self_connections = allow_self_connections
-#        self.with_replacement = with_replacement
-#        self.n = n
-#
-#    def connect(self, projection):
-#        syn_params = projection.synapse_parameters()
-#        rule_params = {'autapses': self.allow_self_connections,
-#                       'multapses': self.with_replacement,
-#                       'rule': 'fixed_indegree',
-#                       'indegree': self.n }
-#
-#        projection._connect(rule_params, syn_params)
-#
-#
-# class FixedNumberPostConnector():
-#
-#    def __init__(self, n, allow_self_connections=True, with_replacement=True, safe=True,
-#                 callback=None, rng=None):
-#        self.allow_self_connections = allow_self_connections
-#        self.with_replacement = with_replacement
-#        self.n = n
-#
-#    def connect(self, projection):
-#        syn_params = projection.synapse_parameters()
-#        rule_params = {'autapses': self.allow_self_connections,
-#                       'multapses': self.with_replacement,
-#                       'rule': 'fixed_outdegree',
-#                       'outdegree': self.n }
-#
-#        projection._connect(rule_params, syn_params)
-#
-#
-# class FixedTotalNumberConnector():
-#
-#    def __init__(self, n, allow_self_connections=True, with_replacement=True, safe=True,
-#                 callback=None):
-#        self.allow_self_connections = allow_self_connections
-#        self.with_replacement = with_replacement
-#        self.n = n
-#
-#    def connect(self, projection):
-#        syn_params = projection.synapse_parameters()
-#        rule_params = {'autapses': self.allow_self_connections,
-#                       'multapses': self.with_replacement,
-#                       'rule': 'fixed_total_number',
-#                       'N': self.n
-#                   }
-#        projection._connect(rule_params, syn_params)
+class OneToOneConnector(OneToOneConnector, NESTConnectorMixin):
+
+    def connect(self, projection):
+        if self.use_native_rule(projection):
+            return self.native_connect(projection)
+        else:
+            return super(OneToOneConnector, self).connect(projection)
+
+    def native_connect(self, projection):
+        syn_params = self.synapse_parameters(projection)
+        rule_params = {'rule': 'one_to_one'}
+        projection._connect(rule_params, syn_params)
+
+
+class FixedNumberPreConnector(FixedNumberPreConnector, NESTConnectorMixin):
+
+    def connect(self, projection):
+        if (isinstance(self.n, int)
+                and self.allow_self_connections != 'NoMutual'
+                and self.use_native_rule(projection)):
+            return self.native_connect(projection)
+        else:
+            return super(FixedNumberPreConnector, self).connect(projection)
+
+    def native_connect(self, projection):
+        syn_params = self.synapse_parameters(projection)
+        rule_params = {'allow_autapses': self.allow_self_connections,
+                       'allow_multapses': self.with_replacement,
+                       'rule': 'fixed_indegree',
+                       'indegree': self.n}
+        projection._connect(rule_params, syn_params)
+
+
+class FixedNumberPostConnector(FixedNumberPostConnector, NESTConnectorMixin):
+
+    def connect(self, projection):
+        if (isinstance(self.n, int)
+                and self.allow_self_connections != 'NoMutual'
+                and self.use_native_rule(projection)):
+            return self.native_connect(projection)
+        else:
+            return super(FixedNumberPostConnector, self).connect(projection)
+
+    def native_connect(self, projection):
+        syn_params = self.synapse_parameters(projection)
+        rule_params = {'allow_autapses': self.allow_self_connections,
+                       'allow_multapses': self.with_replacement,
+                       'rule': 'fixed_outdegree',
+                       'outdegree': self.n}
+        projection._connect(rule_params, syn_params)
+
+
+class FixedTotalNumberConnector(FixedTotalNumberConnector, NESTConnectorMixin):
+
+    def connect(self, projection):
+        if (isinstance(self.n, int)
+                and self.allow_self_connections != 'NoMutual'
+                and self.use_native_rule(projection)):
+            return self.native_connect(projection)
+        else:
+            return super(FixedTotalNumberConnector, self).connect(projection)
+
+    def native_connect(self, projection):
+        syn_params = self.synapse_parameters(projection)
+        rule_params = {'allow_autapses': self.allow_self_connections,
+                       'allow_multapses': self.with_replacement,
+                       'rule': 'fixed_total_number',
+                       'N': self.n}
+        projection._connect(rule_params, syn_params)
@@ -11,7 +11,8 @@ import numpy as np
 import nest
 import logging
 from pyNN import common, errors
-from pyNN.parameters import ArrayParameter, Sequence, ParameterSpace, simplify, LazyArray
+from pyNN.parameters import (ArrayParameter, Sequence, SequenceArray, ParameterSpace,
+                             simplify, LazyArray)
 from pyNN.random import RandomDistribution
 from pyNN.standardmodels import StandardCellType
 from . import simulator
@@ -45,19 +46,27 @@ class PopulationMixin(object):
         else:
             ids = self.node_collection[self._mask_local]
 
-        if "spike_times" in names:
-            parameter_dict = {"spike_times": [Sequence(value)
-                                              for value in nest.GetStatus(ids, names)]}
+        # retrieve all parameters in a single call to the NEST kernel
+        names = list(names)
+        if len(ids) > 1:
+            values = ids.get(names)
+        elif len(ids) == 1:  # NEST returns single values rather than tuples
+            values = dict((name, [value]) for name, value in ids.get(names).items())
         else:
-            parameter_dict = {}
-            for name in names:  # one name at a time, since some parameter values may be tuples
-                val = np.array(nest.GetStatus(ids, name))
-                if isinstance(val[0], tuple) or len(val.shape) == 2:
-                    val = np.array([ArrayParameter(v) for v in val])
-                    val = LazyArray(simplify(val), shape=(self.local_size,), dtype=ArrayParameter)
-                    parameter_dict[name] = val
-                else:
-                    parameter_dict[name] = simplify(val)
+            values = dict((name, []) for name in names)
+        parameter_dict = {}
+        for name in names:
+            column = values[name]
+            if name == "spike_times":
+                parameter_dict[name] = [Sequence(value) for value in column]
+            elif len(column) > 0 and np.ndim(column[0]) > 0:  # array-valued parameter
+                val = np.array([ArrayParameter(v) for v in column])
+                parameter_dict[name] = LazyArray(simplify(val), shape=(self.local_size,),
+                                                 dtype=ArrayParameter)
+            elif len(column) > 0:
+                parameter_dict[name] = simplify(np.array(column))
+            else:
+                parameter_dict[name] = np.array([])
         ps = ParameterSpace(parameter_dict, shape=(self.local_size,))
         return ps
 
@@ -99,8 +108,10 @@ class PopulationView(common.PopulationView, PopulationMixin):
 
 def _build_params(parameter_space, mask_local, size=None, extra_parameters=None):
     """
-    Return either a single parameter dict or a list of dicts, suitable for use
-    in Create or SetStatus.
+    Return the parameters in a form suitable for use in Create or SetStatus:
+    a dict of single values if the parameters are homogeneous, otherwise a dict
+    containing a list of per-cell values for each parameter or, if any
+    parameter has array values (e.g. spike times), a list of per-cell dicts.
     """
     if "UNSUPPORTED" in parameter_space.keys():
         parameter_space.pop("UNSUPPORTED")
@@ -116,12 +127,34 @@ def _build_params(parameter_space, mask_local, size=None, extra_parameters=None)
                 cell_parameters[name] = val.value.tolist()
     else:
         parameter_space.evaluate(mask=mask_local)
-        cell_parameters = list(parameter_space)  # may not be the most efficient way.
-        # Might be best to set homogeneous parameters on creation,
-        # then inhomogeneous ones using SetStatus. Need some timings.
+        # NEST accepts a dict containing one list of values per parameter, which
+        # avoids building a dict for every cell. This does not work for
+        # array-valued parameters, since NEST would take the list as the value
+        # for every node, so in that case we fall back to a list of dicts.
+        cell_parameters = {}
+        for name, val in parameter_space.items():
+            if isinstance(val, SequenceArray):
+                break
+            elif isinstance(val, np.ndarray):
+                if val.dtype == object:
+                    break
+                cell_parameters[name] = val.tolist()
+            else:
+                cell_parameters[name] = val
+        else:
+            if extra_parameters:
+                cell_parameters.update(extra_parameters)
+            return cell_parameters
+        # the sequences in a SequenceArray are views into a single array, which
+        # NEST can take directly, without conversion to a list of Python floats
+        ragged = set(name for name, val in parameter_space.items()
+                     if isinstance(val, SequenceArray))
+        cell_parameters = list(parameter_space)
         for D in cell_parameters:
             for name, val in D.items():
-                if isinstance(val, ArrayParameter):
+                if name in ragged:
+                    D[name] = val.value
+                elif isinstance(val, ArrayParameter):
                     D[name] = val.value.tolist()
             if extra_parameters:
                 D.update(extra_parameters)
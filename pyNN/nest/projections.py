@@ -51,6 +51,16 @@ def split_array_to_avoid_repeats(arr, **associated_arrays):
     return sub_arrays, sub_associated
 
 
+def _ids_to_indices(population, ids):
+    """
+    Return the indices within `population` of the cells with the given IDs,
+    for any kind of population (Population, PopulationView or Assembly).
+    """
+    all_cells = np.asarray(population.all_cells, dtype=int)
+    order = np.argsort(all_cells, kind="stable")
+    return order[np.searchsorted(all_cells[order], ids)]
+
+
 class Projection(common.Projection):
     __doc__ = common.Projection.__doc__
     _simulator = simulator
@@ -66,7 +76,8 @@ class Projection(common.Projection):
         self.nest_synapse_label = Projection._nProj
         self.synapse_type._set_tau_minus(self.post.local_node_collection)
         self._sources = set()
-        self._connections = None
+        self._connection_table = None
+        self._connection_table_generation = -1
         # This is used to keep track of common synapse properties
         self._common_synapse_properties = {}
         self._common_synapse_property_names = None
@@ -89,25 +100,45 @@ class Projection(common.Projection):
 
     def __len__(self):
         """Return the number of connections on the local MPI node."""
-        nest_model = self.post.celltype.nest_name[self._simulator.state.spike_precision]
-        local_nodes = nest.GetNodes({"model": nest_model}, local_only=True)
-        local_connections = nest.GetConnections(target=local_nodes,
-                                                synapse_model=self.nest_synapse_model,
-                                                synapse_label=self.nest_synapse_label)
-        return len(local_connections)
+        return self._get_connection_table()[1].size
 
-    @property
-    def nest_connections(self):
-        if self._connections is None or self._simulator.state.stale_connection_cache:
+    def _get_connection_table(self):
+        """
+        Return a tuple `(connections, presynaptic_indices, postsynaptic_indices)`
+        for the connections of this projection on the local MPI node, where
+        `connections` is a NEST SynapseCollection and the indices are NumPy
+        arrays in the same order.
+
+        The table is retrieved from NEST once, and then cached until
+        connections are next created anywhere in the network.
+        """
+        generation = self._simulator.state.connection_generation
+        if self._connection_table is None or self._connection_table_generation != generation:
             if len(self._sources) > 0:
-                self._connections = nest.GetConnections(
+                connections = nest.GetConnections(
                     nest.NodeCollection(sorted(self._sources)),
                     synapse_model=self.nest_synapse_model,
                     synapse_label=self.nest_synapse_label)
             else:
-                self._connections = []
-            self._simulator.state.stale_connection_cache = False
-        return self._connections
+                connections = []
+            if len(connections) > 0:
+                addresses = connections.get(("source", "target"))
+                sources = np.atleast_1d(np.array(addresses["source"], dtype=int))
+                targets = np.atleast_1d(np.array(addresses["target"], dtype=int))
+                presynaptic_indices = _ids_to_indices(self.pre, sources)
+                postsynaptic_indices = _ids_to_indices(self.post, targets)
+            else:
+                presynaptic_indices = postsynaptic_indices = np.array([], dtype=int)
+            self._connection_table = (connections, presynaptic_indices, postsynaptic_indices)
+            self._connection_table_generation = generation
+        return self._connection_table
+
+    def _connection_addresses(self):
+        return self._get_connection_table()[1:]
+
+    @property
+    def nest_connections(self):
+        return self._get_connection_table()[0]
 
     @property
     def connections(self):
@@ -135,7 +166,7 @@ class Projection(common.Projection):
         nest.Connect(self.pre.node_collection,
                      self.post.node_collection,
                      rule_params, syn_params)
-        self._simulator.state.stale_connection_cache = True
+        self._simulator.state.connection_generation += 1
         self._sources.update(
             nest.GetConnections(synapse_model=self.nest_synapse_model,
                                 synapse_label=self.nest_synapse_label).sources()
@@ -175,14 +206,15 @@ class Projection(common.Projection):
                         syn_dict.update({name: value})
         return syn_dict
 
-    def _convergent_connect(self, presynaptic_indices, postsynaptic_index,
-                            **connection_parameters):
+    def _prepare_synapse_spec(self, connection_parameters, postsynaptic_indices):
         """
-        Connect a neuron to one or more other neurons with a static connection.
+        Adapt `connection_parameters` in place to the conventions of NEST, and
+        return a dictionary containing the other entries of the synapse
+        specification to be passed to `nest.Connect()`.
 
-        `presynaptic_indices` - 1D array of presynaptic indices
-        `postsynaptic_index` - integer - the index of the postsynaptic neuron
-        `connection_parameters` - dict whose keys are native NEST parameter names. Values may be scalars or arrays.
+        `postsynaptic_indices` - either the integer index of a single postsynaptic
+        neuron, or a 1D array containing the postsynaptic index of each connection,
+        in which case the post-synaptic properties are given per connection.
         """
         # Clean the connection parameters by removing parameters that are
         # used by PyNN but should not be passed to NEST
@@ -197,15 +229,58 @@ class Projection(common.Projection):
 
         # Weights require some special handling
         if self.receptor_type == 'inhibitory' and self.post.conductance_based:
-            connection_parameters['weight'] *= -1  # NEST wants negative values for inhibitory weights, even if these are conductances
+            connection_parameters['weight'] = -connection_parameters['weight']  # NEST wants negative values for inhibitory weights, even if these are conductances
             if "stdp" in self.nest_synapse_model:
                 syn_dict["Wmax"] = -1.2345e6  # just some very large negative value to avoid
                                               # NEST complaining about weight and Wmax having different signs
                                               # (see https://github.com/NeuralEnsemble/PyNN/issues/636)
                                               # Will be overwritten below.
-                connection_parameters["Wmax"] *= -1
+            if "Wmax" in connection_parameters:
+                connection_parameters["Wmax"] = -connection_parameters["Wmax"]
         if hasattr(self.post, "celltype") and hasattr(self.post.celltype, "receptor_scale"):  # this is a bit of a hack
-            connection_parameters['weight'] *= self.post.celltype.receptor_scale                                      # needed for the Izhikevich model
+            connection_parameters['weight'] = connection_parameters['weight'] * self.post.celltype.receptor_scale  # needed for the Izhikevich model
+
+        if np.ndim(postsynaptic_indices) == 0:
+            postsynaptic_cell = self.post[postsynaptic_indices]
+            celltype = postsynaptic_cell.celltype
+        else:
+            celltype = self.post.celltype
+        if celltype.standard_receptor_type:
+            # For Tsodyks-Markram synapses models we set the "tau_psc" parameter to match
+            # the relevant "tau_syn" parameter from the post-synaptic neuron.
+            if 'tsodyks' in self.nest_synapse_model:
+                if self.receptor_type == 'inhibitory':
+                    param_name = celltype.translations['tau_syn_I']['translated_name']
+                elif self.receptor_type == 'excitatory':
+                    param_name = celltype.translations['tau_syn_E']['translated_name']
+                else:
+                    raise NotImplementedError()
+                if np.ndim(postsynaptic_indices) == 0:
+                    syn_dict["tau_psc"] = nest.GetStatus(postsynaptic_cell.node_collection,
+                                                         param_name)[0]
+                else:
+                    tau_syn = np.array(nest.GetStatus(self.post.node_collection, param_name),
+                                       dtype=float)
+                    syn_dict["tau_psc"] = tau_syn[postsynaptic_indices]
+        else:
+            receptor_type = celltype.get_receptor_type(self.receptor_type)
+            if np.ndim(postsynaptic_indices) == 0:
+                syn_dict["receptor_type"] = receptor_type
+            else:
+                syn_dict["receptor_type"] = np.full(np.shape(postsynaptic_indices), receptor_type,
+                                                    dtype=float)
+        return syn_dict
+
+    def _convergent_connect(self, presynaptic_indices, postsynaptic_index,
+                            **connection_parameters):
+        """
+        Connect a neuron to one or more other neurons with a static connection.
+
+        `presynaptic_indices` - 1D array of presynaptic indices
+        `postsynaptic_index` - integer - the index of the postsynaptic neuron
+        `connection_parameters` - dict whose keys are native NEST parameter names. Values may be scalars or arrays.
+        """
+        syn_dict = self._prepare_synapse_spec(connection_parameters, postsynaptic_index)
 
         # Prepare connections. NodeCollections can't have repeated values, so for some
         # connector types we need to split the presynaptic cells into groups that
@@ -244,23 +319,6 @@ class Projection(common.Projection):
                     delays = np.array([delays])
                 syn_dict.update({'weight': weights, 'delay': delays})
 
-                if postsynaptic_cell.celltype.standard_receptor_type:
-                    # For Tsodyks-Markram synapses models we set the "tau_psc" parameter to match
-                    # the relevant "tau_syn" parameter from the post-synaptic neuron.
-                    if 'tsodyks' in self.nest_synapse_model:
-                        if self.receptor_type == 'inhibitory':
-                            param_name = postsynaptic_cell.celltype.translations['tau_syn_I']['translated_name']
-                        elif self.receptor_type == 'excitatory':
-                            param_name = postsynaptic_cell.celltype.translations['tau_syn_E']['translated_name']
-                        else:
-                            raise NotImplementedError()
-                        syn_dict["tau_psc"] = nest.GetStatus(postsynaptic_cell.node_collection,
-                                                             param_name)[0]
-                else:
-                    syn_dict.update(
-                        {"receptor_type": postsynaptic_cell.celltype.get_receptor_type(
-                            self.receptor_type)})
-
                 # For parameters other than weight and delay, we need to know if they are "common"
                 # parameters (the same for all synapses) or "local" (different synapses can have
                 # different values), as this affects how they are set.
@@ -312,9 +370,60 @@ class Projection(common.Projection):
                     weights, delays, self.nest_synapse_model)
                 raise errors.ConnectionError(errmsg)
 
-        # Reset the caching of the connection list, since this will have to be recalculated
-        self._connections = None
-        self._simulator.state.stale_connection_cache = True
+        # Invalidate the cached connection tables, since these will have to be recalculated
+        self._simulator.state.connection_generation += 1
+
+    def _bulk_connect(self, presynaptic_indices, postsynaptic_indices, **connection_parameters):
+        """
+        Create many connections with a single call to `nest.Connect()`, using
+        the "one_to_one" rule with arrays of node IDs and array-valued synapse
+        parameters. Repeated (pre, post) pairs are allowed.
+        """
+        if not hasattr(self.post, "celltype"):  # Assembly
+            return super(Projection, self)._bulk_connect(presynaptic_indices, postsynaptic_indices,
+                                                         **connection_parameters)
+        presynaptic_indices = np.asarray(presynaptic_indices, dtype=int)
+        postsynaptic_indices = np.asarray(postsynaptic_indices, dtype=int)
+        if presynaptic_indices.size == 0:
+            return
+        if self._common_synapse_property_names is None:
+            # We need an existing connection to find out which parameters are common
+            # (see _convergent_connect()), so we create the first connection separately
+            self._convergent_connect(
+                presynaptic_indices[:1], int(postsynaptic_indices[0]),
+                **dict((name, np.array(value[:1]) if isinstance(value, np.ndarray) and value.ndim > 0 else value)
+                       for name, value in connection_parameters.items()))
+            presynaptic_indices = presynaptic_indices[1:]
+            postsynaptic_indices = postsynaptic_indices[1:]
+            connection_parameters = dict(
+                (name, value[1:] if isinstance(value, np.ndarray) and value.ndim > 0 else value)
+                for name, value in connection_parameters.items())
+            if presynaptic_indices.size == 0:
+                return
+        n = presynaptic_indices.size
+
+        syn_dict = self._prepare_synapse_spec(connection_parameters, postsynaptic_indices)
+        syn_dict['weight'] = np.broadcast_to(connection_parameters.pop('weight'), (n,)).astype(float)
+        syn_dict['delay'] = np.broadcast_to(connection_parameters.pop('delay'), (n,)).astype(float)
+
+        for name, value in connection_parameters.items():
+            if name not in self._common_synapse_property_names:
+                syn_dict[name] = np.broadcast_to(make_sli_compatible(value), (n,)).astype(float)
+
+        sources = np.asarray(self.pre.all_cells, dtype=int)[presynaptic_indices]
+        targets = np.asarray(self.post.all_cells, dtype=int)[postsynaptic_indices]
+        try:
+            nest.Connect(sources, targets, 'one_to_one', syn_dict)
+        except nest.NESTError as e:
+            errmsg = "%s. %d connections, synapse model='%s'" % (e, n, self.nest_synapse_model)
+            raise errors.ConnectionError(errmsg)
+        self._sources.update(np.unique(sources).tolist())
+        for name, value in connection_parameters.items():
+            if name in self._common_synapse_property_names:
+                self._set_common_synapse_property(name, value)
+
+        # Invalidate the cached connection tables, since these will have to be recalculated
+        self._simulator.state.connection_generation += 1
 
     def _set_attributes(self, parameter_space):
         if "tau_minus" in parameter_space.keys() and not parameter_space["tau_minus"].is_homogeneous:
@@ -350,6 +459,20 @@ class Projection(common.Projection):
                     else:
                         self._set_common_synapse_property(name, value)
 
+    def _set_attribute_vectors(self, attributes):
+        if self._common_synapse_property_names is None:
+            self._identify_common_synapse_properties()
+        connections = self.nest_connections
+        for name, value in attributes.items():
+            if name == "weight" and self.receptor_type == 'inhibitory' and self.post.conductance_based:
+                value = -value  # NEST uses negative values for inhibitory weights, even if these are conductances
+            if name == "tau_minus":
+                raise ValueError("tau_minus cannot be set per connection with NEST.")
+            elif name not in self._common_synapse_property_names:
+                nest.SetStatus(connections, name, make_sli_compatible(value).tolist())
+            else:
+                self._set_common_synapse_property(name, value)
+
     def _set_common_synapse_property(self, name, value):
         """
             Sets the common synapse property while making sure its value stays
@@ -412,58 +535,31 @@ class Projection(common.Projection):
     #        file.write(lines, {'pre' : self.pre.label, 'post' : self.post.label})
     #        file.close()
 
-    def _get_attributes_as_list(self, names):
-        nest_names = []
+    def _get_attribute_columns(self, names):
+        connections, presynaptic_indices, postsynaptic_indices = self._get_connection_table()
+        nest_names = [name for name in names
+                      if name not in ('presynaptic_index', 'postsynaptic_index')]
+        if nest_names and len(connections) > 0:
+            values = np.array(nest.GetStatus(connections, nest_names)).reshape((-1, len(nest_names)))
+        else:
+            values = np.zeros((len(connections), len(nest_names)))
+        columns = []
         for name in names:
             if name == 'presynaptic_index':
-                nest_names.append('source')
+                columns.append(presynaptic_indices)
             elif name == 'postsynaptic_index':
-                nest_names.append('target')
+                columns.append(postsynaptic_indices)
             else:
-                nest_names.append(name)
-        values = nest.GetStatus(self.nest_connections, nest_names)
-        values = np.array(values)  # ought to preserve int type for source, target
-        if 'weight' in names:  # other attributes could also have scale factors - need to use translation mechanisms
-            scale_factors = np.ones(len(names))
-            scale_factors[names.index('weight')] = 0.001
-            if self.receptor_type == 'inhibitory' and self.post.conductance_based:
-                # NEST uses negative values for inhibitory weights, even if these are conductances
-                scale_factors[names.index('weight')] *= -1
-            values *= scale_factors
-        if 'presynaptic_index' in names:
-            values[:, names.index('presynaptic_index')] = self.pre.id_to_index(
-                values[:, names.index('presynaptic_index')])
-        if 'postsynaptic_index' in names:
-            values[:, names.index('postsynaptic_index')] = self.post.id_to_index(
-                values[:, names.index('postsynaptic_index')])
-        values = values.tolist()
-        for i in range(len(values)):
-            values[i] = tuple(values[i])
-        return values
-
-    def _get_attributes_as_arrays(self, names, multiple_synapses='sum'):
-        multi_synapse_operation = Projection.MULTI_SYNAPSE_OPERATIONS[multiple_synapses]
-        all_values = []
-        for attribute_name in names:
-            if attribute_name[-1] == "s":  # weights --> weight, delays --> delay
-                attribute_name = attribute_name[:-1]
-            value_arr = np.nan * np.ones((self.pre.size, self.post.size))
-            connection_attributes = nest.GetStatus(self.nest_connections,
-                                                   ('source', 'target', attribute_name))
-            for conn in connection_attributes:
-                # (offset is always 0,0 for connections created with connect())
-                src, tgt, value = conn
-                addr = self.pre.id_to_index(src), self.post.id_to_index(tgt)
-                if np.isnan(value_arr[addr]):
-                    value_arr[addr] = value
-                else:
-                    value_arr[addr] = multi_synapse_operation(value_arr[addr], value)
-            if attribute_name == 'weight':
-                value_arr *= 0.001
-                if self.receptor_type == 'inhibitory' and self.post.conductance_based:
-                    value_arr *= -1  # NEST uses negative values for inhibitory weights, even if these are conductances
-            all_values.append(value_arr)
-        return all_values
+                value = values[:, nest_names.index(name)]
+                if name == 'weight':  # other attributes could also have scale factors - need to use translation mechanisms
+                    value = value * 0.001
+                    if self.receptor_type == 'inhibitory' and self.post.conductance_based:
+                        value *= -1  # NEST uses negative values for inhibitory weights, even if these are conductances
+                columns.append(value)
+        return columns
+
+    def _get_attributes_as_list(self, names):
+        return list(zip(*[column.tolist() for column in self._get_attribute_columns(names)]))
 
     def _set_initial_value_array(self, variable, value):
         local_value = value.evaluate(simplify=True)
@@ -7,6 +7,7 @@ NEST v3 implementation of the PyNN API.
 """
 
 from collections import defaultdict
+from itertools import chain
 import numpy as np
 import logging
 import nest
@@ -51,6 +52,10 @@ class RecordingDevice(object):
         assert not self._connected
         self._all_ids = self._all_ids.union(new_ids)
 
+    def set_origin(self, origin):
+        """Called on reset(), with the new time origin of the simulation."""
+        pass
+
     def _get_data_arrays(self, variable, clear=False):
         """
         Return recorded data as pair of NumPy arrays: ids and values.
@@ -86,6 +91,20 @@ class RecordingDevice(object):
             values = values[valid_times_index]
         return ids, values
 
+    def drain(self, variable):
+        """
+        Return the data recorded since the last call as a pair of NumPy arrays,
+        times and values (None for spikes), and delete them from the device.
+        """
+        events = nest.GetStatus(self.device, 'events')[0]
+        nest.SetStatus(self.device, 'n_events', 0)
+        self._clean = False
+        times = events["times"] - simulator.state._time_offset
+        if variable == "spikes":
+            return times, None
+        values = events[VARIABLE_MAP.get(variable, variable)] * SCALE_FACTORS.get(variable, 1)
+        return times, values
+
     def get_data(self, variable, desired_ids, clear=False):
         """
         Return recorded data as a dictionary containing one numpy array for
@@ -106,7 +125,7 @@ class RecordingDevice(object):
             np.array(list(recorded_ids)), np.array(desired_ids))
         data = {k: data[k] for k in desired_and_existing_ids}
 
-        if variable != 'times':
+        if variable != 'times' and self._record_initial_values:
             if variable not in self._initial_values:
                 self._initial_values[variable] = {}
             for id in desired_ids:
@@ -165,24 +184,55 @@ class SpikeDetector(RecordingDevice):
 
     def get_spike_counts(self, desired_ids):
         events = nest.GetStatus(self.device, 'events')[0]
-        N = {}
-        for id in desired_ids:
-            mask = events['senders'] == int(id)
-            N[int(id)] = len(events['times'][mask])
+        senders, counts = np.unique(events['senders'], return_counts=True)
+        N = dict.fromkeys((int(id) for id in desired_ids), 0)
+        N.update((id, n) for id, n in zip(senders.tolist(), counts.tolist()) if id in N)
         return N
 
+    def get_spike_count_array(self, first_id, size, t_start=None, t_stop=None):
+        """
+        Return the number of spikes emitted by each of the `size` neurons with
+        consecutive ids starting at `first_id`, as an array of integers.
+        """
+        events = nest.GetStatus(self.device, 'events')[0]
+        times = events['times']
+        if t_start is not None or t_stop is not None:
+            times = times - simulator.state._time_offset
+        return recording.count_spikes(events['senders'].astype(int) - first_id, times, size,
+                                      t_start, t_stop)
+
 
 class Multimeter(RecordingDevice):
-    """A wrapper around the NEST multimeter device"""
+    """
+    A wrapper around the NEST multimeter device.
 
-    def __init__(self, to_memory=True):
+    If `start` is given, values are recorded from time `start` (inclusive) onwards;
+    if `stop` is given, up to time `stop` (inclusive).
+    """
+
+    def __init__(self, interval=None, start=None, stop=None, to_memory=True):
         self.device = nest.Create('multimeter')
         device_parameters = {
-            "interval": simulator.state.dt,
+            "interval": interval or simulator.state.dt,
         }
+        # NEST records values at times t with start < t <= stop
+        self._window = (start, stop)
+        if start:
+            device_parameters["start"] = start - simulator.state.dt
+        if stop is not None:
+            device_parameters["stop"] = stop
+        if device_parameters.keys() - {"interval"}:
+            device_parameters["origin"] = simulator.state._time_offset
         self._initial_values = {}
+        # NEST does not record values at the zeroth time step, so these are added
+        # in get_data(), unless the recording window starts later
+        self._record_initial_values = not start
         super(Multimeter, self).__init__(device_parameters, to_memory)
 
+    def set_origin(self, origin):
+        if self._window != (None, None):
+            _set_status(self.device, {"origin": origin})
+
     def connect_to_cells(self):
         assert not self._connected
         if len(self._all_ids) > 0:
@@ -212,18 +262,17 @@ class Recorder(recording.Recorder):
 
     def __init__(self, population, file=None):
         __doc__ = recording.Recorder.__doc__
-        self._multimeter = Multimeter()
+        self._multimeters = {}  # one per combination of sampling interval and recording window
         self._spike_detector = SpikeDetector()
         recording.Recorder.__init__(self, population, file)
         self.recorded_all = defaultdict(set)
 
-    def record(self, variables, ids, sampling_interval=None):
+    def record(self, variables, ids, sampling_interval=None, start=None, stop=None,
+               reduce=None, bin=None):
         """
         Add the cells in `ids` to the sets of recorded cells for the given variables.
         """
         logger.debug('Recorder.record(<%d cells>)' % len(ids))
-        self._check_sampling_interval(sampling_interval)
-
         # for NEST we need all ids, not just local ones, otherwise simulations
         # sometimes hang with MPI if some nodes aren't recording anything
         all_ids = set(ids)
@@ -231,6 +280,7 @@ class Recorder(recording.Recorder):
         for variable in recording.normalize_variables_arg(variables):
             if not self.population.can_record(variable):
                 raise errors.RecordingError(variable, self.population.celltype)
+            self._set_recording_options(variable, sampling_interval, start, stop, reduce, bin)
             new_ids = all_ids.difference(self.recorded_all[variable])
             self.recorded[variable] = self.recorded[variable].union(local_ids)
             self.recorded_all[variable] = self.recorded_all[variable].union(all_ids)
@@ -239,58 +289,77 @@ class Recorder(recording.Recorder):
     def _record(self, variable, new_ids, sampling_interval=None):
         """
         Add the cells in `new_ids` to the set of recorded cells for the given
-        variable. Since a given node can only be recorded from by one multimeter
-        (http://www.nest-initiative.org/index.php/Analog_recording_with_multimeter, 14/11/11)
-        we record all analog variables for all requested cells.
+        variable. All the analog variables with the same sampling interval and
+        recording window are recorded by a single multimeter, for all the cells
+        requested for any of those variables, except for variables recorded with
+        a reduction, which have their own multimeter.
         """
         if variable == 'spikes':
             self._spike_detector.add_ids(new_ids)
         else:
-            self.sampling_interval = sampling_interval
-            self._multimeter.add_variable(variable)
-            self._multimeter.add_ids(new_ids)
-
-    def _get_sampling_interval(self):
-        return nest.GetStatus(self._multimeter.device, "interval")[0]
-
-    def _set_sampling_interval(self, value):
-        if value is not None:
-            nest.SetStatus(self._multimeter.device, {"interval": value})
-    sampling_interval = property(fget=_get_sampling_interval,
-                                 fset=_set_sampling_interval)
+            multimeter = self._get_multimeter(variable)
+            multimeter.add_variable(variable)
+            multimeter.add_ids(new_ids)
+
+    def _get_multimeter(self, variable):
+        key = (self.sampling_intervals[variable],) + self.recording_windows.get(variable, (None, None))
+        if variable in self.reductions:
+            # the data for reduced variables are deleted during the run, so they
+            # cannot share a multimeter with other variables
+            key += (variable,)
+        if key not in self._multimeters:
+            self._multimeters[key] = Multimeter(*key[:3])
+        return self._multimeters[key]
 
     def _reset(self):
         """ """
-        simulator.state.recording_devices.remove(self._multimeter)
-        simulator.state.recording_devices.remove(self._spike_detector)
+        for device in chain(self._multimeters.values(), [self._spike_detector]):
+            simulator.state.recording_devices.remove(device)
         # I guess the existing devices still exist in NEST, can we delete them
         # or at least turn them off?
         # Maybe we can reset them, rather than create new ones?
-        self._multimeter = Multimeter()
+        self._multimeters = {}
         self._spike_detector = SpikeDetector()
 
     def _get_spiketimes(self, ids, clear=False):
         return self._spike_detector.get_spiketimes(ids, clear=clear)
 
     def _get_all_signals(self, variable, ids, clear=False):
-        data = self._multimeter.get_data(variable, ids, clear=clear)
+        data = self._get_multimeter(variable).get_data(variable, ids, clear=clear)
         times = None
         if len(ids) > 0:
             # JACOMMENT: this is very expensive but not sure how to get rid of it
-            return np.array([data[i] for i in ids]).T, times
+            return np.array([data.get(int(i), []) for i in ids]).T, times
         else:
             return np.array([]), times
 
+    def _drain(self, variable):
+        if variable == 'spikes':
+            return self._spike_detector.drain(variable)
+        else:
+            return self._get_multimeter(variable).drain(variable)
+
     def _local_count(self, variable, filter_ids):
         assert variable == 'spikes'
         return self._spike_detector.get_spike_counts(self.filter_recorded('spikes', filter_ids))
 
+    def _local_count_array(self, variable, filter_ids=None, t_start=None, t_stop=None):
+        assert variable == 'spikes'
+        counts = self._spike_detector.get_spike_count_array(
+            self.population.first_id, self.population.size, t_start, t_stop)
+        if filter_ids is not None:
+            filtered_ids = np.fromiter(self.filter_recorded(variable, filter_ids), dtype=int)
+            mask = np.zeros(self.population.size, dtype=bool)
+            mask[filtered_ids - self.population.first_id] = True
+            counts[~mask] = 0
+        return counts
+
     def _clear_simulator(self):
         """
         Should remove all recorded data held by the simulator and, ideally,
         free up the memory.
         """
-        for rec in (self._spike_detector, self._multimeter):
+        for rec in chain(self._multimeters.values(), [self._spike_detector]):
             nest.SetStatus(rec.device, 'n_events', 0)
             rec._clean = False
 
@@ -298,4 +367,5 @@ class Recorder(recording.Recorder):
         # we over-ride the implementation from the parent class so as to
         # do some reinitialisation.
         recording.Recorder.store_to_cache(self, annotations)
-        self._multimeter._initial_values = {}
+        for multimeter in self._multimeters.values():
+            multimeter._initial_values = {}
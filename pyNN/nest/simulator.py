@@ -60,7 +60,10 @@ def apply_time_offset(parameters, offset):
     parameters_copy = {}
     for name, value in parameters.items():
         if name in NEST_VARIABLES_TIME_DIMENSION:
-            parameters_copy[name] = value + offset
+            if isinstance(value, list):  # one value per node
+                parameters_copy[name] = [v + offset for v in value]
+            else:
+                parameters_copy[name] = value + offset
         elif name in NEST_ARRAY_VARIABLES_TIME_DIMENSION:
             parameters_copy[name] = [v + offset for v in value]
         else:
@@ -92,7 +95,11 @@ class _State(common.control.BaseState):
         self.current_sources = []
         self._time_offset = 0.0
         self.t_flush = -1
-        self.stale_connection_cache = False
+        # incremented whenever connections are created, since this can invalidate
+        # previously retrieved SynapseCollections. Projections cache their connection
+        # tables for a given generation.
+        self.connection_generation = 0
+        self._connection_generation_at_last_run = 0
 
     @property
     def t(self):
@@ -181,6 +188,7 @@ class _State(common.control.BaseState):
         for population in self.populations:
             if population._deferred_parrot_connections:
                 population._connect_parrot_neurons()
+                self.connection_generation += 1
         for device in self.recording_devices:
             if not device._connected:
                 device.connect_to_cells()
@@ -191,6 +199,11 @@ class _State(common.control.BaseState):
             self.running = True
         if simtime > 0:
             nest.Simulate(simtime)
+            if self.connection_generation != self._connection_generation_at_last_run:
+                # NEST sorts new connections when the simulation starts, which
+                # changes their identifiers
+                self.connection_generation += 1
+                self._connection_generation_at_last_run = self.connection_generation
 
     def run_until(self, tstop):
         self.run(tstop - self.t)
@@ -216,6 +229,8 @@ class _State(common.control.BaseState):
                 recorder._clear_simulator()
 
         self._time_offset = self.t_kernel
+        for device in self.recording_devices:
+            device.set_origin(self._time_offset)
 
         for p in self.populations:
             if hasattr(p.celltype, "uses_parrot") and p.celltype.uses_parrot:
@@ -290,29 +305,36 @@ class Connection(common.Connection):
         """
         return self.parent.nest_connections[self.index]
 
+    @property
+    def presynaptic_index(self):
+        return self.parent._connection_addresses()[0][self.index]
+
+    @property
+    def postsynaptic_index(self):
+        return self.parent._connection_addresses()[1][self.index]
+
     @property
     def source(self):
         """The ID of the pre-synaptic neuron."""
-        src = ID(nest.GetStatus(self.id(), 'source')[0])
-        src.parent = self.parent.pre
-        return src
+        return self.parent.pre[self.presynaptic_index]
     presynaptic_cell = source
 
     @property
     def target(self):
         """The ID of the post-synaptic neuron."""
-        tgt = ID(nest.GetStatus(self.id(), 'target')[0])
-        tgt.parent = self.parent.post
-        return tgt
+        return self.parent.post[self.postsynaptic_index]
     postsynaptic_cell = target
 
     def _set_weight(self, w):
-        nest.SetStatus(self.id(), 'weight', w * 1000.0)
+        w_nA = w * 1000.0
+        if self.parent.receptor_type == 'inhibitory' and self.parent.post.conductance_based:
+            w_nA *= -1  # NEST uses negative values for inhibitory weights, even if these are conductances
+        nest.SetStatus(self.id(), 'weight', w_nA)
 
     def _get_weight(self):
         """Synaptic weight in nA or µS."""
         w_nA = nest.GetStatus(self.id(), 'weight')[0]
-        if self.parent.synapse_type == 'inhibitory' and common.is_conductance(self.target):
+        if self.parent.receptor_type == 'inhibitory' and self.parent.post.conductance_based:
             w_nA *= -1  # NEST uses negative values for inhibitory weights, even if these are conductances
         return 0.001 * w_nA
 
@@ -77,6 +77,8 @@ def setup(timestep=DEFAULT_TIMESTEP, min_delay=DEFAULT_MIN_DELAY, **extra_params
     simulator.state.dt = timestep
     simulator.state.min_delay = min_delay
     simulator.state.max_delay = extra_params.get('max_delay', DEFAULT_MAX_DELAY)
+    simulator.state.connection_processes = extra_params.get('connection_processes', 1)
+    simulator.state.segments_in_memory = extra_params.get('segments_in_memory', None)
     if 'use_cvode' in extra_params:
         simulator.state.record_sample_times = extra_params['use_cvode']
         simulator.state.cvode.active(int(extra_params['use_cvode']))
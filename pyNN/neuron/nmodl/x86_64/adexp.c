@@ -0,0 +1,822 @@
+/* Created by Language version: 7.7.0 */
+/* VECTORIZED */
+#define NRN_VECTORIZED 1
+#include <stdio.h>
+#include <stdlib.h>
+#include <math.h>
+#include "mech_api.h"
+#undef PI
+#define nil 0
+#include "md1redef.h"
+#include "section.h"
+#include "nrniv_mf.h"
+#include "md2redef.h"
+ 
+#if METHOD3
+extern int _method3;
+#endif
+
+#if !NRNGPU
+#undef exp
+#define exp hoc_Exp
+extern double hoc_Exp(double);
+#endif
+ 
+#define nrn_init _nrn_init__AdExpIF
+#define _nrn_initial _nrn_initial__AdExpIF
+#define nrn_cur _nrn_cur__AdExpIF
+#define _nrn_current _nrn_current__AdExpIF
+#define nrn_jacob _nrn_jacob__AdExpIF
+#define nrn_state _nrn_state__AdExpIF
+#define _net_receive _net_receive__AdExpIF 
+#define states states__AdExpIF 
+ 
+#define _threadargscomma_ _p, _ppvar, _thread, _nt,
+#define _threadargsprotocomma_ double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt,
+#define _threadargs_ _p, _ppvar, _thread, _nt
+#define _threadargsproto_ double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt
+ 	/*SUPPRESS 761*/
+	/*SUPPRESS 762*/
+	/*SUPPRESS 763*/
+	/*SUPPRESS 765*/
+	 extern double *getarg(int);
+ /* Thread safe. No static _p or _ppvar. */
+ 
+#define t _nt->_t
+#define dt _nt->_dt
+#define vthresh _p[0]
+#define vthresh_columnindex 0
+#define vreset _p[1]
+#define vreset_columnindex 1
+#define vspike _p[2]
+#define vspike_columnindex 2
+#define vpeak _p[3]
+#define vpeak_columnindex 3
+#define trefrac _p[4]
+#define trefrac_columnindex 4
+#define spikewidth _p[5]
+#define spikewidth_columnindex 5
+#define a _p[6]
+#define a_columnindex 6
+#define b _p[7]
+#define b_columnindex 7
+#define tauw _p[8]
+#define tauw_columnindex 8
+#define EL _p[9]
+#define EL_columnindex 9
+#define GL _p[10]
+#define GL_columnindex 10
+#define delta _p[11]
+#define delta_columnindex 11
+#define winit _p[12]
+#define winit_columnindex 12
+#define i _p[13]
+#define i_columnindex 13
+#define w _p[14]
+#define w_columnindex 14
+#define irefrac _p[15]
+#define irefrac_columnindex 15
+#define iexp _p[16]
+#define iexp_columnindex 16
+#define grefrac _p[17]
+#define grefrac_columnindex 17
+#define refractory _p[18]
+#define refractory_columnindex 18
+#define spike_threshold _p[19]
+#define spike_threshold_columnindex 19
+#define Dw _p[20]
+#define Dw_columnindex 20
+#define v _p[21]
+#define v_columnindex 21
+#define _g _p[22]
+#define _g_columnindex 22
+#define _tsav _p[23]
+#define _tsav_columnindex 23
+#define _nd_area  *_ppvar[0]._pval
+ 
+#if MAC
+#if !defined(v)
+#define v _mlhv
+#endif
+#if !defined(h)
+#define h _mlhh
+#endif
+#endif
+ 
+#if defined(__cplusplus)
+extern "C" {
+#endif
+ static int hoc_nrnpointerindex =  -1;
+ static Datum* _extcall_thread;
+ static Prop* _extcall_prop;
+ /* external NEURON variables */
+ /* declaration of user functions */
+ static double _hoc_exp_current(void*);
+ static int _mechtype;
+extern void _nrn_cacheloop_reg(int, int);
+extern void hoc_register_prop_size(int, int, int);
+extern void hoc_register_limits(int, HocParmLimits*);
+extern void hoc_register_units(int, HocParmUnits*);
+extern void nrn_promote(Prop*, int, int);
+extern Memb_func* memb_func;
+ 
+#define NMODL_TEXT 1
+#if NMODL_TEXT
+static const char* nmodl_file_text;
+static const char* nmodl_filename;
+extern void hoc_reg_nmodl_text(int, const char*);
+extern void hoc_reg_nmodl_filename(int, const char*);
+#endif
+
+ extern Prop* nrn_point_prop_;
+ static int _pointtype;
+ static void* _hoc_create_pnt(Object* _ho) { void* create_point_process(int, Object*);
+ return create_point_process(_pointtype, _ho);
+}
+ static void _hoc_destroy_pnt(void*);
+ static double _hoc_loc_pnt(void* _vptr) {double loc_point_process(int, void*);
+ return loc_point_process(_pointtype, _vptr);
+}
+ static double _hoc_has_loc(void* _vptr) {double has_loc_point(void*);
+ return has_loc_point(_vptr);
+}
+ static double _hoc_get_loc_pnt(void* _vptr) {
+ double get_loc_point_process(void*); return (get_loc_point_process(_vptr));
+}
+ extern void _nrn_setdata_reg(int, void(*)(Prop*));
+ static void _setdata(Prop* _prop) {
+ _extcall_prop = _prop;
+ }
+ static void _hoc_setdata(void* _vptr) { Prop* _prop;
+ _prop = ((Point_process*)_vptr)->_prop;
+   _setdata(_prop);
+ }
+ /* connect user functions to hoc names */
+ static VoidFunc hoc_intfunc[] = {
+ 0,0
+};
+ static Member_func _member_func[] = {
+ "loc", _hoc_loc_pnt,
+ "has_loc", _hoc_has_loc,
+ "get_loc", _hoc_get_loc_pnt,
+ "exp_current", _hoc_exp_current,
+ 0, 0
+};
+#define exp_current exp_current_AdExpIF
+ extern double exp_current( _threadargsprotocomma_ double );
+ /* declare global and static user variables */
+#define gon gon_AdExpIF
+ double gon = 1e+06;
+ /* some parameters have upper and lower limits */
+ static HocParmLimits _hoc_parm_limits[] = {
+ 0,0,0
+};
+ static HocParmUnits _hoc_parm_units[] = {
+ "gon_AdExpIF", "uS",
+ "vthresh", "mV",
+ "vreset", "mV",
+ "vspike", "mV",
+ "vpeak", "mV",
+ "trefrac", "ms",
+ "spikewidth", "ms",
+ "a", "uS",
+ "b", "nA",
+ "tauw", "ms",
+ "EL", "mV",
+ "GL", "uS",
+ "delta", "mV",
+ "winit", "nA",
+ "w", "nA",
+ "i", "nA",
+ 0,0
+};
+ static double delta_t = 0.01;
+ static double w0 = 0;
+ /* connect global user variables to hoc */
+ static DoubScal hoc_scdoub[] = {
+ "gon_AdExpIF", &gon_AdExpIF,
+ 0,0
+};
+ static DoubVec hoc_vdoub[] = {
+ 0,0,0
+};
+ static double _sav_indep;
+ static void nrn_alloc(Prop*);
+static void  nrn_init(NrnThread*, _Memb_list*, int);
+static void nrn_state(NrnThread*, _Memb_list*, int);
+ static void nrn_cur(NrnThread*, _Memb_list*, int);
+static void  nrn_jacob(NrnThread*, _Memb_list*, int);
+ 
+#define _watch_array _ppvar + 3 
+ static void _watch_alloc(Datum*);
+ extern void hoc_reg_watch_allocate(int, void(*)(Datum*)); static void _hoc_destroy_pnt(void* _vptr) {
+   Prop* _prop = ((Point_process*)_vptr)->_prop;
+   if (_prop) { _nrn_free_watch(_prop->dparam, 3, 2);}
+   destroy_point_process(_vptr);
+}
+ 
+static int _ode_count(int);
+static void _ode_map(int, double**, double**, double*, Datum*, double*, int);
+static void _ode_spec(NrnThread*, _Memb_list*, int);
+static void _ode_matsol(NrnThread*, _Memb_list*, int);
+ 
+#define _cvode_ieq _ppvar[5]._i
+ static void _ode_matsol_instance1(_threadargsproto_);
+ /* connect range variables in _p that hoc is supposed to know about */
+ static const char *_mechanism[] = {
+ "7.7.0",
+"AdExpIF",
+ "vthresh",
+ "vreset",
+ "vspike",
+ "vpeak",
+ "trefrac",
+ "spikewidth",
+ "a",
+ "b",
+ "tauw",
+ "EL",
+ "GL",
+ "delta",
+ "winit",
+ 0,
+ "i",
+ 0,
+ "w",
+ 0,
+ 0};
+ 
+extern Prop* need_memb(Symbol*);
+
+static void nrn_alloc(Prop* _prop) {
+	Prop *prop_ion;
+	double *_p; Datum *_ppvar;
+  if (nrn_point_prop_) {
+	_prop->_alloc_seq = nrn_point_prop_->_alloc_seq;
+	_p = nrn_point_prop_->param;
+	_ppvar = nrn_point_prop_->dparam;
+ }else{
+ 	_p = nrn_prop_data_alloc(_mechtype, 24, _prop);
+ 	/*initialize range parameters*/
+ 	vthresh = -50;
+ 	vreset = -60;
+ 	vspike = -40;
+ 	vpeak = 0;
+ 	trefrac = 1;
+ 	spikewidth = 1e-12;
+ 	a = 0.004;
+ 	b = 0.0805;
+ 	tauw = 144;
+ 	EL = -70.6;
+ 	GL = 0.03;
+ 	delta = 2;
+ 	winit = 0;
+  }
+ 	_prop->param = _p;
+ 	_prop->param_size = 24;
+  if (!nrn_point_prop_) {
+ 	_ppvar = nrn_prop_datum_alloc(_mechtype, 6, _prop);
+  }
+ 	_prop->dparam = _ppvar;
+ 	/*connect ionic variables to this model*/
+ 
+}
+ static void _initlists();
+  /* some states have an absolute tolerance */
+ static Symbol** _atollist;
+ static HocStateTolerance _hoc_state_tol[] = {
+ 0,0
+};
+ 
+#define _tqitem &(_ppvar[2]._pvoid)
+ static void _net_receive(Point_process*, double*, double);
+ static void _thread_mem_init(Datum*);
+ static void _thread_cleanup(Datum*);
+ extern Symbol* hoc_lookup(const char*);
+extern void _nrn_thread_reg(int, int, void(*)(Datum*));
+extern void _nrn_thread_table_reg(int, void(*)(double*, Datum*, Datum*, NrnThread*, int));
+extern void hoc_register_tolerance(int, HocStateTolerance*, Symbol***);
+extern void _cvode_abstol( Symbol**, double*, int);
+
+ void _adexp_reg() {
+	int _vectorized = 1;
+  _initlists();
+ 	_pointtype = point_register_mech(_mechanism,
+	 nrn_alloc,nrn_cur, nrn_jacob, nrn_state, nrn_init,
+	 hoc_nrnpointerindex, 5,
+	 _hoc_create_pnt, _hoc_destroy_pnt, _member_func);
+  _extcall_thread = (Datum*)ecalloc(4, sizeof(Datum));
+  _thread_mem_init(_extcall_thread);
+ _mechtype = nrn_get_mechtype(_mechanism[1]);
+     _nrn_setdata_reg(_mechtype, _setdata);
+     _nrn_thread_reg(_mechtype, 1, _thread_mem_init);
+     _nrn_thread_reg(_mechtype, 0, _thread_cleanup);
+ #if NMODL_TEXT
+  hoc_reg_nmodl_text(_mechtype, nmodl_file_text);
+  hoc_reg_nmodl_filename(_mechtype, nmodl_filename);
+#endif
+  hoc_register_prop_size(_mechtype, 24, 6);
+  hoc_reg_watch_allocate(_mechtype, _watch_alloc);
+  hoc_register_dparam_semantics(_mechtype, 0, "area");
+  hoc_register_dparam_semantics(_mechtype, 1, "pntproc");
+  hoc_register_dparam_semantics(_mechtype, 2, "netsend");
+  hoc_register_dparam_semantics(_mechtype, 3, "watch");
+  hoc_register_dparam_semantics(_mechtype, 4, "watch");
+  hoc_register_dparam_semantics(_mechtype, 5, "cvodeieq");
+ 	hoc_register_cvode(_mechtype, _ode_count, _ode_map, _ode_spec, _ode_matsol);
+ 	hoc_register_tolerance(_mechtype, _hoc_state_tol, &_atollist);
+ add_nrn_has_net_event(_mechtype);
+ pnt_receive[_mechtype] = _net_receive;
+ pnt_receive_size[_mechtype] = 1;
+ 	hoc_register_var(hoc_scdoub, hoc_vdoub, hoc_intfunc);
+ 	ivoc_help("help ?1 AdExpIF /root/package/pyNN/neuron/nmodl/adexp.mod\n");
+ hoc_register_limits(_mechtype, _hoc_parm_limits);
+ hoc_register_units(_mechtype, _hoc_parm_units);
+ }
+static int _reset;
+static char *modelname = "";
+
+static int error;
+static int _ninits = 0;
+static int _match_recurse=1;
+static void _modl_cleanup(){ _match_recurse=1;}
+ 
+#define _deriv1_advance _thread[0]._i
+#define _dith1 1
+#define _recurse _thread[2]._i
+#define _newtonspace1 _thread[3]._pvoid
+ 
+static int _ode_spec1(_threadargsproto_);
+/*static int _ode_matsol1(_threadargsproto_);*/
+ static int _slist2[1];
+  static int _slist1[1], _dlist1[1];
+ static int states(_threadargsproto_);
+ 
+/*CVODE*/
+ static int _ode_spec1 (double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt) {int _reset = 0; {
+   Dw = ( a * ( v - EL ) - w ) / tauw ;
+   }
+ return _reset;
+}
+ static int _ode_matsol1 (double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt) {
+ Dw = Dw  / (1. - dt*( ( ( ( - 1.0 ) ) ) / tauw )) ;
+  return 0;
+}
+ /*END CVODE*/
+ 
+static int states (double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt) {int _reset=0; int error = 0;
+ { double* _savstate1 = _thread[_dith1]._pval;
+ double* _dlist2 = _thread[_dith1]._pval + 1;
+ int _counte = -1;
+ if (!_recurse) {
+ _recurse = 1;
+ {int _id; for(_id=0; _id < 1; _id++) { _savstate1[_id] = _p[_slist1[_id]];}}
+ error = nrn_newton_thread(_newtonspace1, 1,_slist2, _p, states, _dlist2, _ppvar, _thread, _nt);
+ _recurse = 0; if(error) {abort_run(error);}}
+ {
+   Dw = ( a * ( v - EL ) - w ) / tauw ;
+   {int _id; for(_id=0; _id < 1; _id++) {
+if (_deriv1_advance) {
+ _dlist2[++_counte] = _p[_dlist1[_id]] - (_p[_slist1[_id]] - _savstate1[_id])/dt;
+ }else{
+_dlist2[++_counte] = _p[_slist1[_id]] - _savstate1[_id];}}}
+ } }
+ return _reset;}
+ 
+double exp_current ( _threadargsprotocomma_ double _lv ) {
+   double _lexp_current;
+ if ( delta  == 0.0 ) {
+     _lexp_current = 0.0 ;
+     }
+   else if ( ( _lv - vthresh ) / delta > 100.0 ) {
+     _lexp_current = - exp ( 99.0 ) ;
+     }
+   else {
+     _lexp_current = - GL * delta * exp ( ( _lv - vthresh ) / delta ) ;
+     }
+   
+return _lexp_current;
+ }
+ 
+static double _hoc_exp_current(void* _vptr) {
+ double _r;
+   double* _p; Datum* _ppvar; Datum* _thread; NrnThread* _nt;
+   _p = ((Point_process*)_vptr)->_prop->param;
+  _ppvar = ((Point_process*)_vptr)->_prop->dparam;
+  _thread = _extcall_thread;
+  _nt = (NrnThread*)((Point_process*)_vptr)->_vnt;
+ _r =  exp_current ( _p, _ppvar, _thread, _nt, *getarg(1) );
+ return(_r);
+}
+ 
+static double _watch1_cond(Point_process* _pnt) {
+ 	double* _p; Datum* _ppvar; Datum* _thread; NrnThread* _nt;
+	_thread= (Datum*)0; _nt = (NrnThread*)_pnt->_vnt;
+ 	_p = _pnt->_prop->param; _ppvar = _pnt->_prop->dparam;
+	v = NODEV(_pnt->node);
+	return  ( v ) - ( spike_threshold ) ;
+}
+ 
+static void _net_receive (Point_process* _pnt, double* _args, double _lflag) 
+{  double* _p; Datum* _ppvar; Datum* _thread; NrnThread* _nt;
+   int _watch_rm = 0;
+   _thread = (Datum*)0; _nt = (NrnThread*)_pnt->_vnt;   _p = _pnt->_prop->param; _ppvar = _pnt->_prop->dparam;
+  if (_tsav > t){ extern char* hoc_object_name(Object*); hoc_execerror(hoc_object_name(_pnt->ob), ":Event arrived out of order. Must call ParallelContext.set_maxstep AFTER assigning minimum NetCon.delay");}
+ _tsav = t;  v = NODEV(_pnt->node);
+   if (_lflag == 1. ) {*(_tqitem) = 0;}
+ {
+   if ( _lflag  == 1.0 ) {
+     v = vpeak ;
+       if (nrn_netrec_state_adjust && !cvode_active_){
+    /* discon state adjustment for general derivimplicit and KINETIC case */
+    int __i, __neq = 1;
+    double __state = w;
+    double __primary_delta = (w + b) - __state;
+    double __dtsav = dt;
+    for (__i = 0; __i < __neq; ++__i) {
+      _p[_dlist1[__i]] = 0.0;
+    }
+    _p[_dlist1[0]] = __primary_delta;
+    dt *= 0.5;
+#if NRN_VECTORIZED
+    _thread = _nt->_ml_list[_mechtype]->_thread;
+#endif
+    _ode_matsol_instance1(_threadargs_);
+    dt = __dtsav;
+    for (__i = 0; __i < __neq; ++__i) {
+      _p[_slist1[__i]] += _p[_dlist1[__i]];
+    }
+  } else {
+ w = w + b ;
+       }
+ net_send ( _tqitem, _args, _pnt, t +  spikewidth , 2.0 ) ;
+     net_event ( _pnt, t ) ;
+     }
+   else if ( _lflag  == 2.0 ) {
+     v = vreset ;
+     grefrac = gon ;
+     if ( trefrac > spikewidth ) {
+       net_send ( _tqitem, _args, _pnt, t +  trefrac - spikewidth , 3.0 ) ;
+       }
+     else {
+       grefrac = 0.0 ;
+       }
+     }
+   else if ( _lflag  == 3.0 ) {
+     v = vreset ;
+     grefrac = 0.0 ;
+     }
+   else if ( _lflag  == 4.0 ) {
+       _nrn_watch_activate(_watch_array, _watch1_cond, 1, _pnt, _watch_rm++, 1.0);
+ }
+   } 
+ NODEV(_pnt->node) = v;
+ }
+ 
+static void _watch_alloc(Datum* _ppvar) {
+  Point_process* _pnt = (Point_process*)_ppvar[1]._pvoid;
+   _nrn_watch_allocate(_watch_array, _watch1_cond, 1, _pnt, 1.0);
+ }
+
+ 
+static int _ode_count(int _type){ return 1;}
+ 
+static void _ode_spec(NrnThread* _nt, _Memb_list* _ml, int _type) {
+   double* _p; Datum* _ppvar; Datum* _thread;
+   Node* _nd; double _v; int _iml, _cntml;
+  _cntml = _ml->_nodecount;
+  _thread = _ml->_thread;
+  for (_iml = 0; _iml < _cntml; ++_iml) {
+    _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+    _nd = _ml->_nodelist[_iml];
+    v = NODEV(_nd);
+     _ode_spec1 (_p, _ppvar, _thread, _nt);
+ }}
+ 
+static void _ode_map(int _ieq, double** _pv, double** _pvdot, double* _pp, Datum* _ppd, double* _atol, int _type) { 
+	double* _p; Datum* _ppvar;
+ 	int _i; _p = _pp; _ppvar = _ppd;
+	_cvode_ieq = _ieq;
+	for (_i=0; _i < 1; ++_i) {
+		_pv[_i] = _pp + _slist1[_i];  _pvdot[_i] = _pp + _dlist1[_i];
+		_cvode_abstol(_atollist, _atol, _i);
+	}
+ }
+ 
+static void _ode_matsol_instance1(_threadargsproto_) {
+ _ode_matsol1 (_p, _ppvar, _thread, _nt);
+ }
+ 
+static void _ode_matsol(NrnThread* _nt, _Memb_list* _ml, int _type) {
+   double* _p; Datum* _ppvar; Datum* _thread;
+   Node* _nd; double _v; int _iml, _cntml;
+  _cntml = _ml->_nodecount;
+  _thread = _ml->_thread;
+  for (_iml = 0; _iml < _cntml; ++_iml) {
+    _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+    _nd = _ml->_nodelist[_iml];
+    v = NODEV(_nd);
+ _ode_matsol_instance1(_threadargs_);
+ }}
+ 
+static void _thread_mem_init(Datum* _thread) {
+   _thread[_dith1]._pval = (double*)ecalloc(2, sizeof(double));
+   _newtonspace1 = nrn_cons_newtonspace(1);
+ }
+ 
+static void _thread_cleanup(Datum* _thread) {
+   free((void*)(_thread[_dith1]._pval));
+   nrn_destroy_newtonspace(_newtonspace1);
+ }
+
+static void initmodel(double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt) {
+  int _i; double _save;{
+  w = w0;
+ {
+   grefrac = 0.0 ;
+   net_send ( _tqitem, (double*)0, _ppvar[1]._pvoid, t +  0.0 , 4.0 ) ;
+   w = winit ;
+   if ( delta  == 0.0 ) {
+     spike_threshold = vthresh ;
+     }
+   else {
+     spike_threshold = vspike ;
+     }
+   }
+ 
+}
+}
+
+static void nrn_init(NrnThread* _nt, _Memb_list* _ml, int _type){
+double* _p; Datum* _ppvar; Datum* _thread;
+Node *_nd; double _v; int* _ni; int _iml, _cntml;
+#if CACHEVEC
+    _ni = _ml->_nodeindices;
+#endif
+_cntml = _ml->_nodecount;
+_thread = _ml->_thread;
+for (_iml = 0; _iml < _cntml; ++_iml) {
+ _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+ _tsav = -1e20;
+#if CACHEVEC
+  if (use_cachevec) {
+    _v = VEC_V(_ni[_iml]);
+  }else
+#endif
+  {
+    _nd = _ml->_nodelist[_iml];
+    _v = NODEV(_nd);
+  }
+ v = _v;
+ initmodel(_p, _ppvar, _thread, _nt);
+}
+}
+
+static double _nrn_current(double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt, double _v){double _current=0.;v=_v;{ {
+   irefrac = grefrac * ( v - vreset ) ;
+   iexp = exp_current ( _threadargscomma_ v ) ;
+   i = iexp + w + irefrac ;
+   }
+ _current += i;
+
+} return _current;
+}
+
+static void nrn_cur(NrnThread* _nt, _Memb_list* _ml, int _type) {
+double* _p; Datum* _ppvar; Datum* _thread;
+Node *_nd; int* _ni; double _rhs, _v; int _iml, _cntml;
+#if CACHEVEC
+    _ni = _ml->_nodeindices;
+#endif
+_cntml = _ml->_nodecount;
+_thread = _ml->_thread;
+for (_iml = 0; _iml < _cntml; ++_iml) {
+ _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+#if CACHEVEC
+  if (use_cachevec) {
+    _v = VEC_V(_ni[_iml]);
+  }else
+#endif
+  {
+    _nd = _ml->_nodelist[_iml];
+    _v = NODEV(_nd);
+  }
+ _g = _nrn_current(_p, _ppvar, _thread, _nt, _v + .001);
+ 	{ _rhs = _nrn_current(_p, _ppvar, _thread, _nt, _v);
+ 	}
+ _g = (_g - _rhs)/.001;
+ _g *=  1.e2/(_nd_area);
+ _rhs *= 1.e2/(_nd_area);
+#if CACHEVEC
+  if (use_cachevec) {
+	VEC_RHS(_ni[_iml]) -= _rhs;
+  }else
+#endif
+  {
+	NODERHS(_nd) -= _rhs;
+  }
+ 
+}
+ 
+}
+
+static void nrn_jacob(NrnThread* _nt, _Memb_list* _ml, int _type) {
+double* _p; Datum* _ppvar; Datum* _thread;
+Node *_nd; int* _ni; int _iml, _cntml;
+#if CACHEVEC
+    _ni = _ml->_nodeindices;
+#endif
+_cntml = _ml->_nodecount;
+_thread = _ml->_thread;
+for (_iml = 0; _iml < _cntml; ++_iml) {
+ _p = _ml->_data[_iml];
+#if CACHEVEC
+  if (use_cachevec) {
+	VEC_D(_ni[_iml]) += _g;
+  }else
+#endif
+  {
+     _nd = _ml->_nodelist[_iml];
+	NODED(_nd) += _g;
+  }
+ 
+}
+ 
+}
+
+static void nrn_state(NrnThread* _nt, _Memb_list* _ml, int _type) {
+double* _p; Datum* _ppvar; Datum* _thread;
+Node *_nd; double _v = 0.0; int* _ni; int _iml, _cntml;
+double _dtsav = dt;
+if (secondorder) { dt *= 0.5; }
+#if CACHEVEC
+    _ni = _ml->_nodeindices;
+#endif
+_cntml = _ml->_nodecount;
+_thread = _ml->_thread;
+for (_iml = 0; _iml < _cntml; ++_iml) {
+ _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+ _nd = _ml->_nodelist[_iml];
+#if CACHEVEC
+  if (use_cachevec) {
+    _v = VEC_V(_ni[_iml]);
+  }else
+#endif
+  {
+    _nd = _ml->_nodelist[_iml];
+    _v = NODEV(_nd);
+  }
+ v=_v;
+{
+ {  _deriv1_advance = 1;
+ derivimplicit_thread(1, _slist1, _dlist1, _p, states, _ppvar, _thread, _nt);
+_deriv1_advance = 0;
+     if (secondorder) {
+    int _i;
+    for (_i = 0; _i < 1; ++_i) {
+      _p[_slist1[_i]] += dt*_p[_dlist1[_i]];
+    }}
+ }}}
+ dt = _dtsav;
+}
+
+static void terminal(){}
+
+static void _initlists(){
+ double _x; double* _p = &_x;
+ int _i; static int _first = 1;
+  if (!_first) return;
+ _slist1[0] = w_columnindex;  _dlist1[0] = Dw_columnindex;
+ _slist2[0] = w_columnindex;
+_first = 0;
+}
+
+#if defined(__cplusplus)
+} /* extern "C" */
+#endif
+
+#if NMODL_TEXT
+static const char* nmodl_filename = "/root/package/pyNN/neuron/nmodl/adexp.mod";
+static const char* nmodl_file_text = 
+  ": Insert in a passive compartment to get an adaptive-exponential (Brette-Gerstner)\n"
+  ": integrate-and-fire neuron with a refractory period.\n"
+  ": This calculates the adaptive current, sets the membrane potential to the\n"
+  ": correct value at the start and end of the refractory period, and prevents spikes\n"
+  ": during the refractory period by clamping the membrane potential to the reset\n"
+  ": voltage with a huge conductance.\n"
+  ":\n"
+  ": Reference:\n"
+  ":\n"
+  ": Brette R and Gerstner W. Adaptive exponential integrate-and-fire\n"
+  ":   model as an effective description of neuronal activity. \n"
+  ":   J. Neurophysiol. 94: 3637-3642, 2005.\n"
+  ":  \n"
+  ": Implemented by Andrew Davison. UNIC, CNRS, March 2009.\n"
+  "\n"
+  "NEURON {\n"
+  "    POINT_PROCESS AdExpIF\n"
+  "    RANGE vreset, trefrac, vspike, vthresh, vpeak, spikewidth\n"
+  "    RANGE w, winit\n"
+  "    RANGE a, b, tauw, EL, GL, delta\n"
+  "    NONSPECIFIC_CURRENT i\n"
+  "}\n"
+  "\n"
+  "UNITS {\n"
+  "    (mV) = (millivolt)\n"
+  "    (nA) = (nanoamp)\n"
+  "    (uS) = (microsiemens)\n"
+  "}\n"
+  "\n"
+  "PARAMETER {\n"
+  "    vthresh = -50   (mV)   : spike threshold for exponential calculation purposes\n"
+  "    vreset  = -60   (mV)   : reset potential after a spike\n"
+  "    vspike  = -40   (mV)   : spike detection threshold\n"
+  "    vpeak   = 0     (mV)   : peak of spike\n"
+  "    trefrac = 1     (ms)   : refractory period\n"
+  "    gon    = 1e6   (uS)   : refractory clamp conductance\n"
+  "    spikewidth = 1e-12 (ms) : must be less than trefrac\n"
+  "    \n"
+  "    a 	    = 0.004  (uS)   : level of adaptation\n"
+  "    b	    = 0.0805 (nA)   : increment of adaptation\n"
+  "    tauw   = 144    (ms)   : time constant of adaptation\n"
+  "    EL	    = -70.6  (mV)   : leak reversal (must be equal to e_pas)\n"
+  "    GL	    = 0.03   (uS)   : leak conductance (must be equal to g_pas(S/cm2)*membrane area(um2)*1e-2)\n"
+  "    delta   = 2      (mV)   : steepness of exponential approach to threshold\n"
+  "\n"
+  "    winit  = 0      (nA)\n"
+  "}\n"
+  "\n"
+  "\n"
+  "ASSIGNED {\n"
+  "    v (mV)\n"
+  "    i (nA)\n"
+  "    irefrac (nA)\n"
+  "    iexp (nA)\n"
+  "    grefrac (uS)\n"
+  "    refractory\n"
+  "    spike_threshold (mV)\n"
+  "}\n"
+  "\n"
+  "STATE {\n"
+  "    w  (nA)\n"
+  "}\n"
+  "\n"
+  "INITIAL {\n"
+  "    grefrac = 0\n"
+  "    net_send(0,4)\n"
+  "    w = winit\n"
+  "    if (delta == 0) {\n"
+  "        spike_threshold = vthresh\n"
+  "    } else {\n"
+  "        spike_threshold = vspike\n"
+  "    }\n"
+  "}\n"
+  "\n"
+  "BREAKPOINT {\n"
+  "    SOLVE states METHOD derivimplicit  : cnexp\n"
+  "    irefrac = grefrac*(v-vreset)\n"
+  "    iexp = exp_current(v)\n"
+  "    i = iexp + w + irefrac\n"
+  "    :printf(\"BP: t = %f  dt = %f  v = %f  w = %f  irefrac = %f  iexp = %f  i = %f\\n\", t, dt, v, w, irefrac, iexp, i)\n"
+  "}\n"
+  "\n"
+  "DERIVATIVE states {		: solve eq for adaptation variable\n"
+  "    w' = (a*(v-EL) - w)/tauw\n"
+  "}\n"
+  "\n"
+  "FUNCTION exp_current(v) {  : handle the case where delta is 0 or very small\n"
+  "    if (delta == 0) {\n"
+  "        exp_current = 0\n"
+  "    } else if ((v - vthresh)/delta > 100) {\n"
+  "        exp_current = -exp(99)\n"
+  "    } else {\n"
+  "        exp_current = -GL*delta*exp((v-vthresh)/delta)\n"
+  "    }\n"
+  "}\n"
+  "\n"
+  "NET_RECEIVE (weight) {\n"
+  "    if (flag == 1) {        : beginning of spike\n"
+  "        v = vpeak\n"
+  "        w = w + b\n"
+  "        net_send(spikewidth, 2)\n"
+  "        net_event(t)\n"
+  "        :printf(\"spike: t = %f  v = %f   w = %f   i = %f\\n\", t, v, w, i)\n"
+  "    } else if (flag == 2) { : end of spike, beginning of refractory period\n"
+  "        v = vreset\n"
+  "        grefrac = gon\n"
+  "        if (trefrac > spikewidth) {\n"
+  "            net_send(trefrac-spikewidth, 3)\n"
+  "        } else { : also the end of the refractory period\n"
+  "            grefrac = 0\n"
+  "        }\n"
+  "        :printf(\"refrac: t = %f  v = %f   w = %f   i = %f\\n\", t, v, w, i)\n"
+  "    } else if (flag == 3) { : end of refractory period\n"
+  "        v = vreset\n"
+  "        grefrac = 0\n"
+  "        :printf(\"end_refrac: t = %f  v = %f   w = %f   i = %f\\n\", t, v, w, i)\n"
+  "    } else if (flag == 4) { : watch membrane potential\n"
+  "        WATCH (v > spike_threshold) 1\n"
+  "    }\n"
+  "}\n"
+  ;
+#endif
@@ -0,0 +1,1086 @@
+/* Created by Language version: 7.7.0 */
+/* NOT VECTORIZED */
+#define NRN_VECTORIZED 0
+#include <stdio.h>
+#include <stdlib.h>
+#include <math.h>
+#include "mech_api.h"
+#undef PI
+#define nil 0
+#include "md1redef.h"
+#include "section.h"
+#include "nrniv_mf.h"
+#include "md2redef.h"
+ 
+#if METHOD3
+extern int _method3;
+#endif
+
+#if !NRNGPU
+#undef exp
+#define exp hoc_Exp
+extern double hoc_Exp(double);
+#endif
+ 
+#define nrn_init _nrn_init__GifCurrent
+#define _nrn_initial _nrn_initial__GifCurrent
+#define nrn_cur _nrn_cur__GifCurrent
+#define _nrn_current _nrn_current__GifCurrent
+#define nrn_jacob _nrn_jacob__GifCurrent
+#define nrn_state _nrn_state__GifCurrent
+#define _net_receive _net_receive__GifCurrent 
+#define setRNG setRNG__GifCurrent 
+#define states states__GifCurrent 
+ 
+#define _threadargscomma_ /**/
+#define _threadargsprotocomma_ /**/
+#define _threadargs_ /**/
+#define _threadargsproto_ /**/
+ 	/*SUPPRESS 761*/
+	/*SUPPRESS 762*/
+	/*SUPPRESS 763*/
+	/*SUPPRESS 765*/
+	 extern double *getarg(int);
+ static double *_p; static Datum *_ppvar;
+ 
+#define t nrn_threads->_t
+#define dt nrn_threads->_dt
+#define Vr _p[0]
+#define Vr_columnindex 0
+#define Tref _p[1]
+#define Tref_columnindex 1
+#define Vt_star _p[2]
+#define Vt_star_columnindex 2
+#define DV _p[3]
+#define DV_columnindex 3
+#define lambda0 _p[4]
+#define lambda0_columnindex 4
+#define tau_eta1 _p[5]
+#define tau_eta1_columnindex 5
+#define tau_eta2 _p[6]
+#define tau_eta2_columnindex 6
+#define tau_eta3 _p[7]
+#define tau_eta3_columnindex 7
+#define a_eta1 _p[8]
+#define a_eta1_columnindex 8
+#define a_eta2 _p[9]
+#define a_eta2_columnindex 9
+#define a_eta3 _p[10]
+#define a_eta3_columnindex 10
+#define tau_gamma1 _p[11]
+#define tau_gamma1_columnindex 11
+#define tau_gamma2 _p[12]
+#define tau_gamma2_columnindex 12
+#define tau_gamma3 _p[13]
+#define tau_gamma3_columnindex 13
+#define a_gamma1 _p[14]
+#define a_gamma1_columnindex 14
+#define a_gamma2 _p[15]
+#define a_gamma2_columnindex 15
+#define a_gamma3 _p[16]
+#define a_gamma3_columnindex 16
+#define e_spike _p[17]
+#define e_spike_columnindex 17
+#define i _p[18]
+#define i_columnindex 18
+#define i_eta _p[19]
+#define i_eta_columnindex 19
+#define p_dontspike _p[20]
+#define p_dontspike_columnindex 20
+#define rand _p[21]
+#define rand_columnindex 21
+#define gamma_sum _p[22]
+#define gamma_sum_columnindex 22
+#define v_t _p[23]
+#define v_t_columnindex 23
+#define verboseLevel _p[24]
+#define verboseLevel_columnindex 24
+#define isrefrac _p[25]
+#define isrefrac_columnindex 25
+#define eta1 _p[26]
+#define eta1_columnindex 26
+#define eta2 _p[27]
+#define eta2_columnindex 27
+#define eta3 _p[28]
+#define eta3_columnindex 28
+#define gamma1 _p[29]
+#define gamma1_columnindex 29
+#define gamma2 _p[30]
+#define gamma2_columnindex 30
+#define gamma3 _p[31]
+#define gamma3_columnindex 31
+#define lambda _p[32]
+#define lambda_columnindex 32
+#define irefrac _p[33]
+#define irefrac_columnindex 33
+#define grefrac _p[34]
+#define grefrac_columnindex 34
+#define Deta1 _p[35]
+#define Deta1_columnindex 35
+#define Deta2 _p[36]
+#define Deta2_columnindex 36
+#define Deta3 _p[37]
+#define Deta3_columnindex 37
+#define Dgamma1 _p[38]
+#define Dgamma1_columnindex 38
+#define Dgamma2 _p[39]
+#define Dgamma2_columnindex 39
+#define Dgamma3 _p[40]
+#define Dgamma3_columnindex 40
+#define _g _p[41]
+#define _g_columnindex 41
+#define _tsav _p[42]
+#define _tsav_columnindex 42
+#define _nd_area  *_ppvar[0]._pval
+#define rng	*_ppvar[2]._pval
+#define _p_rng	_ppvar[2]._pval
+ 
+#if MAC
+#if !defined(v)
+#define v _mlhv
+#endif
+#if !defined(h)
+#define h _mlhh
+#endif
+#endif
+ 
+#if defined(__cplusplus)
+extern "C" {
+#endif
+ static int hoc_nrnpointerindex =  2;
+ /* external NEURON variables */
+ /* declaration of user functions */
+ static double _hoc_setRNG(void*);
+ static double _hoc_toggleVerbose(void*);
+ static double _hoc_urand(void*);
+ static int _mechtype;
+extern void _nrn_cacheloop_reg(int, int);
+extern void hoc_register_prop_size(int, int, int);
+extern void hoc_register_limits(int, HocParmLimits*);
+extern void hoc_register_units(int, HocParmUnits*);
+extern void nrn_promote(Prop*, int, int);
+extern Memb_func* memb_func;
+ 
+#define NMODL_TEXT 1
+#if NMODL_TEXT
+static const char* nmodl_file_text;
+static const char* nmodl_filename;
+extern void hoc_reg_nmodl_text(int, const char*);
+extern void hoc_reg_nmodl_filename(int, const char*);
+#endif
+
+ extern Prop* nrn_point_prop_;
+ static int _pointtype;
+ static void* _hoc_create_pnt(Object* _ho) { void* create_point_process(int, Object*);
+ return create_point_process(_pointtype, _ho);
+}
+ static void _hoc_destroy_pnt(void*);
+ static double _hoc_loc_pnt(void* _vptr) {double loc_point_process(int, void*);
+ return loc_point_process(_pointtype, _vptr);
+}
+ static double _hoc_has_loc(void* _vptr) {double has_loc_point(void*);
+ return has_loc_point(_vptr);
+}
+ static double _hoc_get_loc_pnt(void* _vptr) {
+ double get_loc_point_process(void*); return (get_loc_point_process(_vptr));
+}
+ extern void _nrn_setdata_reg(int, void(*)(Prop*));
+ static void _setdata(Prop* _prop) {
+ _p = _prop->param; _ppvar = _prop->dparam;
+ }
+ static void _hoc_setdata(void* _vptr) { Prop* _prop;
+ _prop = ((Point_process*)_vptr)->_prop;
+   _setdata(_prop);
+ }
+ /* connect user functions to hoc names */
+ static VoidFunc hoc_intfunc[] = {
+ 0,0
+};
+ static Member_func _member_func[] = {
+ "loc", _hoc_loc_pnt,
+ "has_loc", _hoc_has_loc,
+ "get_loc", _hoc_get_loc_pnt,
+ "setRNG", _hoc_setRNG,
+ "toggleVerbose", _hoc_toggleVerbose,
+ "urand", _hoc_urand,
+ 0, 0
+};
+#define toggleVerbose toggleVerbose_GifCurrent
+#define urand urand_GifCurrent
+ extern double toggleVerbose( );
+ extern double urand( );
+ /* declare global and static user variables */
+#define gon gon_GifCurrent
+ double gon = 1e+06;
+ /* some parameters have upper and lower limits */
+ static HocParmLimits _hoc_parm_limits[] = {
+ 0,0,0
+};
+ static HocParmUnits _hoc_parm_units[] = {
+ "gon_GifCurrent", "uS",
+ "Vr", "mV",
+ "Tref", "ms",
+ "Vt_star", "mV",
+ "DV", "mV",
+ "lambda0", "Hz",
+ "tau_eta1", "ms",
+ "tau_eta2", "ms",
+ "tau_eta3", "ms",
+ "a_eta1", "nA",
+ "a_eta2", "nA",
+ "a_eta3", "nA",
+ "tau_gamma1", "ms",
+ "tau_gamma2", "ms",
+ "tau_gamma3", "ms",
+ "a_gamma1", "mV",
+ "a_gamma2", "mV",
+ "a_gamma3", "mV",
+ "e_spike", "mV",
+ "eta1", "nA",
+ "eta2", "nA",
+ "eta3", "nA",
+ "gamma1", "mV",
+ "gamma2", "mV",
+ "gamma3", "mV",
+ "i", "nA",
+ "i_eta", "nA",
+ "p_dontspike", "1",
+ "rand", "1",
+ "gamma_sum", "mV",
+ "v_t", "mV",
+ "verboseLevel", "1",
+ "isrefrac", "1",
+ 0,0
+};
+ static double delta_t = 0.01;
+ static double eta30 = 0;
+ static double eta20 = 0;
+ static double eta10 = 0;
+ static double gamma30 = 0;
+ static double gamma20 = 0;
+ static double gamma10 = 0;
+ static double v = 0;
+ /* connect global user variables to hoc */
+ static DoubScal hoc_scdoub[] = {
+ "gon_GifCurrent", &gon_GifCurrent,
+ 0,0
+};
+ static DoubVec hoc_vdoub[] = {
+ 0,0,0
+};
+ static double _sav_indep;
+ static void _ba1(Node*_nd, double* _pp, Datum* _ppd, Datum* _thread, NrnThread* _nt) ;
+ static void nrn_alloc(Prop*);
+static void  nrn_init(NrnThread*, _Memb_list*, int);
+static void nrn_state(NrnThread*, _Memb_list*, int);
+ static void nrn_cur(NrnThread*, _Memb_list*, int);
+static void  nrn_jacob(NrnThread*, _Memb_list*, int);
+ 
+#define _watch_array _ppvar + 4 
+ static void _watch_alloc(Datum*);
+ extern void hoc_reg_watch_allocate(int, void(*)(Datum*)); static void _hoc_destroy_pnt(void* _vptr) {
+   Prop* _prop = ((Point_process*)_vptr)->_prop;
+   if (_prop) { _nrn_free_watch(_prop->dparam, 4, 2);}
+   destroy_point_process(_vptr);
+}
+ 
+static int _ode_count(int);
+static void _ode_map(int, double**, double**, double*, Datum*, double*, int);
+static void _ode_spec(NrnThread*, _Memb_list*, int);
+static void _ode_matsol(NrnThread*, _Memb_list*, int);
+ 
+#define _cvode_ieq _ppvar[6]._i
+ static void _ode_matsol_instance1(_threadargsproto_);
+ /* connect range variables in _p that hoc is supposed to know about */
+ static const char *_mechanism[] = {
+ "7.7.0",
+"GifCurrent",
+ "Vr",
+ "Tref",
+ "Vt_star",
+ "DV",
+ "lambda0",
+ "tau_eta1",
+ "tau_eta2",
+ "tau_eta3",
+ "a_eta1",
+ "a_eta2",
+ "a_eta3",
+ "tau_gamma1",
+ "tau_gamma2",
+ "tau_gamma3",
+ "a_gamma1",
+ "a_gamma2",
+ "a_gamma3",
+ "e_spike",
+ 0,
+ "i",
+ "i_eta",
+ "p_dontspike",
+ "rand",
+ "gamma_sum",
+ "v_t",
+ "verboseLevel",
+ "isrefrac",
+ 0,
+ "eta1",
+ "eta2",
+ "eta3",
+ "gamma1",
+ "gamma2",
+ "gamma3",
+ 0,
+ "rng",
+ 0};
+ 
+extern Prop* need_memb(Symbol*);
+
+static void nrn_alloc(Prop* _prop) {
+	Prop *prop_ion;
+	double *_p; Datum *_ppvar;
+  if (nrn_point_prop_) {
+	_prop->_alloc_seq = nrn_point_prop_->_alloc_seq;
+	_p = nrn_point_prop_->param;
+	_ppvar = nrn_point_prop_->dparam;
+ }else{
+ 	_p = nrn_prop_data_alloc(_mechtype, 43, _prop);
+ 	/*initialize range parameters*/
+ 	Vr = -50;
+ 	Tref = 4;
+ 	Vt_star = -48;
+ 	DV = 0.5;
+ 	lambda0 = 1;
+ 	tau_eta1 = 1;
+ 	tau_eta2 = 10;
+ 	tau_eta3 = 100;
+ 	a_eta1 = 1;
+ 	a_eta2 = 1;
+ 	a_eta3 = 1;
+ 	tau_gamma1 = 1;
+ 	tau_gamma2 = 10;
+ 	tau_gamma3 = 100;
+ 	a_gamma1 = 1;
+ 	a_gamma2 = 1;
+ 	a_gamma3 = 1;
+ 	e_spike = 0;
+  }
+ 	_prop->param = _p;
+ 	_prop->param_size = 43;
+  if (!nrn_point_prop_) {
+ 	_ppvar = nrn_prop_datum_alloc(_mechtype, 7, _prop);
+  }
+ 	_prop->dparam = _ppvar;
+ 	/*connect ionic variables to this model*/
+ 
+}
+ static void _initlists();
+  /* some states have an absolute tolerance */
+ static Symbol** _atollist;
+ static HocStateTolerance _hoc_state_tol[] = {
+ 0,0
+};
+ 
+#define _tqitem &(_ppvar[3]._pvoid)
+ static void _net_receive(Point_process*, double*, double);
+ extern Symbol* hoc_lookup(const char*);
+extern void _nrn_thread_reg(int, int, void(*)(Datum*));
+extern void _nrn_thread_table_reg(int, void(*)(double*, Datum*, Datum*, NrnThread*, int));
+extern void hoc_register_tolerance(int, HocStateTolerance*, Symbol***);
+extern void _cvode_abstol( Symbol**, double*, int);
+
+ void _gif_reg() {
+	int _vectorized = 0;
+  _initlists();
+ 	_pointtype = point_register_mech(_mechanism,
+	 nrn_alloc,nrn_cur, nrn_jacob, nrn_state, nrn_init,
+	 hoc_nrnpointerindex, 0,
+	 _hoc_create_pnt, _hoc_destroy_pnt, _member_func);
+ _mechtype = nrn_get_mechtype(_mechanism[1]);
+     _nrn_setdata_reg(_mechtype, _setdata);
+ #if NMODL_TEXT
+  hoc_reg_nmodl_text(_mechtype, nmodl_file_text);
+  hoc_reg_nmodl_filename(_mechtype, nmodl_filename);
+#endif
+  hoc_register_prop_size(_mechtype, 43, 7);
+  hoc_reg_watch_allocate(_mechtype, _watch_alloc);
+  hoc_register_dparam_semantics(_mechtype, 0, "area");
+  hoc_register_dparam_semantics(_mechtype, 1, "pntproc");
+  hoc_register_dparam_semantics(_mechtype, 2, "pointer");
+  hoc_register_dparam_semantics(_mechtype, 3, "netsend");
+  hoc_register_dparam_semantics(_mechtype, 4, "watch");
+  hoc_register_dparam_semantics(_mechtype, 5, "watch");
+  hoc_register_dparam_semantics(_mechtype, 6, "cvodeieq");
+ 	hoc_register_cvode(_mechtype, _ode_count, _ode_map, _ode_spec, _ode_matsol);
+ 	hoc_register_tolerance(_mechtype, _hoc_state_tol, &_atollist);
+ pnt_receive[_mechtype] = _net_receive;
+ pnt_receive_size[_mechtype] = 1;
+ 	hoc_reg_ba(_mechtype, _ba1, 22);
+ 	hoc_register_var(hoc_scdoub, hoc_vdoub, hoc_intfunc);
+ 	ivoc_help("help ?1 GifCurrent /root/package/pyNN/neuron/nmodl/gif.mod\n");
+ hoc_register_limits(_mechtype, _hoc_parm_limits);
+ hoc_register_units(_mechtype, _hoc_parm_units);
+ }
+static int _reset;
+static char *modelname = "";
+
+static int error;
+static int _ninits = 0;
+static int _match_recurse=1;
+static void _modl_cleanup(){ _match_recurse=1;}
+static int setRNG();
+ 
+static int _ode_spec1(_threadargsproto_);
+/*static int _ode_matsol1(_threadargsproto_);*/
+ static int _slist1[6], _dlist1[6];
+ static int states(_threadargsproto_);
+ 
+/*VERBATIM*/
+#include<stdlib.h>
+#include<stdio.h>
+#include<math.h>
+
+double nrn_random_pick(void* r);
+void* nrn_random_arg(int argpos);
+ /* AFTER SOLVE */
+ static void _ba1(Node*_nd, double* _pp, Datum* _ppd, Datum* _thread, NrnThread* _nt)  {
+    _p = _pp; _ppvar = _ppd;
+  v = NODEV(_nd);
+ rand = urand ( _threadargs_ ) ;
+   }
+ 
+/*CVODE*/
+ static int _ode_spec1 () {_reset=0;
+ {
+   Deta1 = - eta1 / tau_eta1 ;
+   Deta2 = - eta2 / tau_eta2 ;
+   Deta3 = - eta3 / tau_eta3 ;
+   Dgamma1 = - gamma1 / tau_gamma1 ;
+   Dgamma2 = - gamma2 / tau_gamma2 ;
+   Dgamma3 = - gamma3 / tau_gamma3 ;
+   }
+ return _reset;
+}
+ static int _ode_matsol1 () {
+ Deta1 = Deta1  / (1. - dt*( ( - 1.0 ) / tau_eta1 )) ;
+ Deta2 = Deta2  / (1. - dt*( ( - 1.0 ) / tau_eta2 )) ;
+ Deta3 = Deta3  / (1. - dt*( ( - 1.0 ) / tau_eta3 )) ;
+ Dgamma1 = Dgamma1  / (1. - dt*( ( - 1.0 ) / tau_gamma1 )) ;
+ Dgamma2 = Dgamma2  / (1. - dt*( ( - 1.0 ) / tau_gamma2 )) ;
+ Dgamma3 = Dgamma3  / (1. - dt*( ( - 1.0 ) / tau_gamma3 )) ;
+  return 0;
+}
+ /*END CVODE*/
+ static int states () {_reset=0;
+ {
+    eta1 = eta1 + (1. - exp(dt*(( - 1.0 ) / tau_eta1)))*(- ( 0.0 ) / ( ( - 1.0 ) / tau_eta1 ) - eta1) ;
+    eta2 = eta2 + (1. - exp(dt*(( - 1.0 ) / tau_eta2)))*(- ( 0.0 ) / ( ( - 1.0 ) / tau_eta2 ) - eta2) ;
+    eta3 = eta3 + (1. - exp(dt*(( - 1.0 ) / tau_eta3)))*(- ( 0.0 ) / ( ( - 1.0 ) / tau_eta3 ) - eta3) ;
+    gamma1 = gamma1 + (1. - exp(dt*(( - 1.0 ) / tau_gamma1)))*(- ( 0.0 ) / ( ( - 1.0 ) / tau_gamma1 ) - gamma1) ;
+    gamma2 = gamma2 + (1. - exp(dt*(( - 1.0 ) / tau_gamma2)))*(- ( 0.0 ) / ( ( - 1.0 ) / tau_gamma2 ) - gamma2) ;
+    gamma3 = gamma3 + (1. - exp(dt*(( - 1.0 ) / tau_gamma3)))*(- ( 0.0 ) / ( ( - 1.0 ) / tau_gamma3 ) - gamma3) ;
+   }
+  return 0;
+}
+ 
+static double _watch1_cond(Point_process* _pnt) {
+  	_p = _pnt->_prop->param; _ppvar = _pnt->_prop->dparam;
+	v = NODEV(_pnt->node);
+	return  ( rand ) - ( p_dontspike ) ;
+}
+ 
+static void _net_receive (Point_process* _pnt, double* _args, double _lflag) 
+{   int _watch_rm = 0;
+    _p = _pnt->_prop->param; _ppvar = _pnt->_prop->dparam;
+  if (_tsav > t){ extern char* hoc_object_name(Object*); hoc_execerror(hoc_object_name(_pnt->ob), ":Event arrived out of order. Must call ParallelContext.set_maxstep AFTER assigning minimum NetCon.delay");}
+ _tsav = t;  v = NODEV(_pnt->node);
+   if (_lflag == 1. ) {*(_tqitem) = 0;}
+ {
+   if ( _lflag  == 1.0 ) {
+     isrefrac = 1.0 ;
+     net_send ( _tqitem, _args, _pnt, t +  dt , 2.0 ) ;
+     if ( verboseLevel > 0.0 ) {
+       printf ( "Next dt: spike, at time %g: rand=%g, p_dontspike=%g\n" , t , rand , p_dontspike ) ;
+       }
+     }
+   else if ( _lflag  == 2.0 ) {
+     v = Vr ;
+     grefrac = gon ;
+     net_send ( _tqitem, _args, _pnt, t +  Tref - dt , 3.0 ) ;
+       if (nrn_netrec_state_adjust && !cvode_active_){
+    /* discon state adjustment for cnexp case (rate uses no local variable) */
+    double __state = eta1;
+    double __primary = (eta1 + a_eta1) - __state;
+     __primary += ( 1. - exp( 0.5*dt*( ( - 1.0 ) / tau_eta1 ) ) )*( - ( 0.0 ) / ( ( - 1.0 ) / tau_eta1 ) - __primary );
+    eta1 += __primary;
+  } else {
+ eta1 = eta1 + a_eta1 ;
+       }
+   if (nrn_netrec_state_adjust && !cvode_active_){
+    /* discon state adjustment for cnexp case (rate uses no local variable) */
+    double __state = eta2;
+    double __primary = (eta2 + a_eta2) - __state;
+     __primary += ( 1. - exp( 0.5*dt*( ( - 1.0 ) / tau_eta2 ) ) )*( - ( 0.0 ) / ( ( - 1.0 ) / tau_eta2 ) - __primary );
+    eta2 += __primary;
+  } else {
+ eta2 = eta2 + a_eta2 ;
+       }
+   if (nrn_netrec_state_adjust && !cvode_active_){
+    /* discon state adjustment for cnexp case (rate uses no local variable) */
+    double __state = eta3;
+    double __primary = (eta3 + a_eta3) - __state;
+     __primary += ( 1. - exp( 0.5*dt*( ( - 1.0 ) / tau_eta3 ) ) )*( - ( 0.0 ) / ( ( - 1.0 ) / tau_eta3 ) - __primary );
+    eta3 += __primary;
+  } else {
+ eta3 = eta3 + a_eta3 ;
+       }
+   if (nrn_netrec_state_adjust && !cvode_active_){
+    /* discon state adjustment for cnexp case (rate uses no local variable) */
+    double __state = gamma1;
+    double __primary = (gamma1 + a_gamma1) - __state;
+     __primary += ( 1. - exp( 0.5*dt*( ( - 1.0 ) / tau_gamma1 ) ) )*( - ( 0.0 ) / ( ( - 1.0 ) / tau_gamma1 ) - __primary );
+    gamma1 += __primary;
+  } else {
+ gamma1 = gamma1 + a_gamma1 ;
+       }
+   if (nrn_netrec_state_adjust && !cvode_active_){
+    /* discon state adjustment for cnexp case (rate uses no local variable) */
+    double __state = gamma2;
+    double __primary = (gamma2 + a_gamma2) - __state;
+     __primary += ( 1. - exp( 0.5*dt*( ( - 1.0 ) / tau_gamma2 ) ) )*( - ( 0.0 ) / ( ( - 1.0 ) / tau_gamma2 ) - __primary );
+    gamma2 += __primary;
+  } else {
+ gamma2 = gamma2 + a_gamma2 ;
+       }
+   if (nrn_netrec_state_adjust && !cvode_active_){
+    /* discon state adjustment for cnexp case (rate uses no local variable) */
+    double __state = gamma3;
+    double __primary = (gamma3 + a_gamma3) - __state;
+     __primary += ( 1. - exp( 0.5*dt*( ( - 1.0 ) / tau_gamma3 ) ) )*( - ( 0.0 ) / ( ( - 1.0 ) / tau_gamma3 ) - __primary );
+    gamma3 += __primary;
+  } else {
+ gamma3 = gamma3 + a_gamma3 ;
+       }
+ if ( verboseLevel > 0.0 ) {
+       printf ( "Start spike, at time %g: rand=%g, p_dontspike=%g\n" , t , rand , p_dontspike ) ;
+       }
+     }
+   else if ( _lflag  == 3.0 ) {
+     v = Vr ;
+     isrefrac = 0.0 ;
+     grefrac = 0.0 ;
+     if ( verboseLevel > 0.0 ) {
+       printf ( "End refrac, at time %g: rand=%g, p_dontspike=%g\n" , t , rand , p_dontspike ) ;
+       }
+     }
+   else if ( _lflag  == 4.0 ) {
+       _nrn_watch_activate(_watch_array, _watch1_cond, 1, _pnt, _watch_rm++, 1.0);
+ }
+   } 
+ NODEV(_pnt->node) = v;
+ }
+ 
+static int  setRNG (  ) {
+   
+/*VERBATIM*/
+    {
+        /**
+         * This function takes a NEURON Random object declared in hoc and makes it usable by this mod file.
+         * Note that this method is taken from Brett paper as used by netstim.hoc and netstim.mod
+         * which points out that the Random must be in uniform(1) mode
+         */
+        void** pv = (void**)(&_p_rng);
+        if( ifarg(1)) {
+            *pv = nrn_random_arg(1);
+        } else {
+            *pv = (void*)0;
+        }
+    }
+  return 0; }
+ 
+static double _hoc_setRNG(void* _vptr) {
+ double _r;
+    _hoc_setdata(_vptr);
+ _r = 1.;
+ setRNG (  );
+ return(_r);
+}
+ 
+double urand (  ) {
+   double _lurand;
+ 
+/*VERBATIM*/
+        double value;
+        if (_p_rng) {
+            /*
+            :Supports separate independent but reproducible streams for
+            : each instance. However, the corresponding hoc Random
+            : distribution MUST be set to Random.negexp(1)
+            */
+            value = nrn_random_pick(_p_rng);
+            //printf("random stream for this simulation = %lf\n",value);
+            return value;
+        }else{
+ value = scop_random ( 1.0 ) ;
+   
+/*VERBATIM*/
+        }
+ _lurand = value ;
+   
+return _lurand;
+ }
+ 
+static double _hoc_urand(void* _vptr) {
+ double _r;
+    _hoc_setdata(_vptr);
+ _r =  urand (  );
+ return(_r);
+}
+ 
+double toggleVerbose (  ) {
+   double _ltoggleVerbose;
+ verboseLevel = 1.0 - verboseLevel ;
+   
+return _ltoggleVerbose;
+ }
+ 
+static double _hoc_toggleVerbose(void* _vptr) {
+ double _r;
+    _hoc_setdata(_vptr);
+ _r =  toggleVerbose (  );
+ return(_r);
+}
+ 
+static void _watch_alloc(Datum* _ppvar) {
+  Point_process* _pnt = (Point_process*)_ppvar[1]._pvoid;
+   _nrn_watch_allocate(_watch_array, _watch1_cond, 1, _pnt, 1.0);
+ }
+
+ 
+static int _ode_count(int _type){ return 6;}
+ 
+static void _ode_spec(NrnThread* _nt, _Memb_list* _ml, int _type) {
+   Datum* _thread;
+   Node* _nd; double _v; int _iml, _cntml;
+  _cntml = _ml->_nodecount;
+  _thread = _ml->_thread;
+  for (_iml = 0; _iml < _cntml; ++_iml) {
+    _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+    _nd = _ml->_nodelist[_iml];
+    v = NODEV(_nd);
+     _ode_spec1 ();
+ }}
+ 
+static void _ode_map(int _ieq, double** _pv, double** _pvdot, double* _pp, Datum* _ppd, double* _atol, int _type) { 
+ 	int _i; _p = _pp; _ppvar = _ppd;
+	_cvode_ieq = _ieq;
+	for (_i=0; _i < 6; ++_i) {
+		_pv[_i] = _pp + _slist1[_i];  _pvdot[_i] = _pp + _dlist1[_i];
+		_cvode_abstol(_atollist, _atol, _i);
+	}
+ }
+ 
+static void _ode_matsol_instance1(_threadargsproto_) {
+ _ode_matsol1 ();
+ }
+ 
+static void _ode_matsol(NrnThread* _nt, _Memb_list* _ml, int _type) {
+   Datum* _thread;
+   Node* _nd; double _v; int _iml, _cntml;
+  _cntml = _ml->_nodecount;
+  _thread = _ml->_thread;
+  for (_iml = 0; _iml < _cntml; ++_iml) {
+    _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+    _nd = _ml->_nodelist[_iml];
+    v = NODEV(_nd);
+ _ode_matsol_instance1(_threadargs_);
+ }}
+
+static void initmodel() {
+  int _i; double _save;_ninits++;
+ _save = t;
+ t = 0.0;
+{
+  eta3 = eta30;
+  eta2 = eta20;
+  eta1 = eta10;
+  gamma3 = gamma30;
+  gamma2 = gamma20;
+  gamma1 = gamma10;
+ {
+   grefrac = 0.0 ;
+   eta1 = 0.0 ;
+   eta2 = 0.0 ;
+   eta3 = 0.0 ;
+   gamma1 = 0.0 ;
+   gamma2 = 0.0 ;
+   gamma3 = 0.0 ;
+   rand = urand ( _threadargs_ ) ;
+   p_dontspike = 2.0 ;
+   isrefrac = 0.0 ;
+   net_send ( _tqitem, (double*)0, _ppvar[1]._pvoid, t +  0.0 , 4.0 ) ;
+   }
+  _sav_indep = t; t = _save;
+
+}
+}
+
+static void nrn_init(NrnThread* _nt, _Memb_list* _ml, int _type){
+Node *_nd; double _v; int* _ni; int _iml, _cntml;
+#if CACHEVEC
+    _ni = _ml->_nodeindices;
+#endif
+_cntml = _ml->_nodecount;
+for (_iml = 0; _iml < _cntml; ++_iml) {
+ _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+ _tsav = -1e20;
+#if CACHEVEC
+  if (use_cachevec) {
+    _v = VEC_V(_ni[_iml]);
+  }else
+#endif
+  {
+    _nd = _ml->_nodelist[_iml];
+    _v = NODEV(_nd);
+  }
+ v = _v;
+ initmodel();
+}}
+
+static double _nrn_current(double _v){double _current=0.;v=_v;{ {
+   i_eta = eta1 + eta2 + eta3 ;
+   gamma_sum = gamma1 + gamma2 + gamma3 ;
+   v_t = Vt_star + gamma_sum ;
+   lambda = lambda0 * exp ( ( v - v_t ) / DV ) ;
+   if ( isrefrac > 0.0 ) {
+     p_dontspike = 2.0 ;
+     }
+   else {
+     p_dontspike = exp ( - lambda * ( dt * ( 1e-3 ) ) ) ;
+     }
+   irefrac = grefrac * ( v - Vr ) ;
+   i = irefrac + i_eta ;
+   }
+ _current += i;
+
+} return _current;
+}
+
+static void nrn_cur(NrnThread* _nt, _Memb_list* _ml, int _type){
+Node *_nd; int* _ni; double _rhs, _v; int _iml, _cntml;
+#if CACHEVEC
+    _ni = _ml->_nodeindices;
+#endif
+_cntml = _ml->_nodecount;
+for (_iml = 0; _iml < _cntml; ++_iml) {
+ _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+#if CACHEVEC
+  if (use_cachevec) {
+    _v = VEC_V(_ni[_iml]);
+  }else
+#endif
+  {
+    _nd = _ml->_nodelist[_iml];
+    _v = NODEV(_nd);
+  }
+ _g = _nrn_current(_v + .001);
+ 	{ _rhs = _nrn_current(_v);
+ 	}
+ _g = (_g - _rhs)/.001;
+ _g *=  1.e2/(_nd_area);
+ _rhs *= 1.e2/(_nd_area);
+#if CACHEVEC
+  if (use_cachevec) {
+	VEC_RHS(_ni[_iml]) -= _rhs;
+  }else
+#endif
+  {
+	NODERHS(_nd) -= _rhs;
+  }
+ 
+}}
+
+static void nrn_jacob(NrnThread* _nt, _Memb_list* _ml, int _type){
+Node *_nd; int* _ni; int _iml, _cntml;
+#if CACHEVEC
+    _ni = _ml->_nodeindices;
+#endif
+_cntml = _ml->_nodecount;
+for (_iml = 0; _iml < _cntml; ++_iml) {
+ _p = _ml->_data[_iml];
+#if CACHEVEC
+  if (use_cachevec) {
+	VEC_D(_ni[_iml]) += _g;
+  }else
+#endif
+  {
+     _nd = _ml->_nodelist[_iml];
+	NODED(_nd) += _g;
+  }
+ 
+}}
+
+static void nrn_state(NrnThread* _nt, _Memb_list* _ml, int _type){
+Node *_nd; double _v = 0.0; int* _ni; int _iml, _cntml;
+#if CACHEVEC
+    _ni = _ml->_nodeindices;
+#endif
+_cntml = _ml->_nodecount;
+for (_iml = 0; _iml < _cntml; ++_iml) {
+ _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+ _nd = _ml->_nodelist[_iml];
+#if CACHEVEC
+  if (use_cachevec) {
+    _v = VEC_V(_ni[_iml]);
+  }else
+#endif
+  {
+    _nd = _ml->_nodelist[_iml];
+    _v = NODEV(_nd);
+  }
+ v=_v;
+{
+ { error =  states();
+ if(error){fprintf(stderr,"at line 104 in file gif.mod:\n\n"); nrn_complain(_p); abort_run(error);}
+ }}}
+
+}
+
+static void terminal(){}
+
+static void _initlists() {
+ int _i; static int _first = 1;
+  if (!_first) return;
+ _slist1[0] = eta1_columnindex;  _dlist1[0] = Deta1_columnindex;
+ _slist1[1] = eta2_columnindex;  _dlist1[1] = Deta2_columnindex;
+ _slist1[2] = eta3_columnindex;  _dlist1[2] = Deta3_columnindex;
+ _slist1[3] = gamma1_columnindex;  _dlist1[3] = Dgamma1_columnindex;
+ _slist1[4] = gamma2_columnindex;  _dlist1[4] = Dgamma2_columnindex;
+ _slist1[5] = gamma3_columnindex;  _dlist1[5] = Dgamma3_columnindex;
+_first = 0;
+}
+
+#if NMODL_TEXT
+static const char* nmodl_filename = "/root/package/pyNN/neuron/nmodl/gif.mod";
+static const char* nmodl_file_text = 
+  ": Generalized Integrate and Fire model defined in Pozzorini et al. PLOS Comp. Biol. 2015\n"
+  ": Filter for eta and gamma defined as linear combination of three exponential functions each.\n"
+  ":\n"
+  ": Implemented by Christian Roessert, EPFL/Blue Brain Project, 2016\n"
+  "\n"
+  "\n"
+  "NEURON {\n"
+  "    POINT_PROCESS GifCurrent\n"
+  "    RANGE Vr, Tref, Vt_star\n"
+  "    RANGE DV, lambda0\n"
+  "    RANGE tau_eta1, tau_eta2, tau_eta3, a_eta1, a_eta2, a_eta3\n"
+  "    RANGE tau_gamma1, tau_gamma2, tau_gamma3, a_gamma1, a_gamma2, a_gamma3\n"
+  "    RANGE i_eta, gamma_sum, v_t, verboseLevel, p_dontspike, rand\n"
+  "    RANGE e_spike, isrefrac\n"
+  "    POINTER rng\n"
+  "    NONSPECIFIC_CURRENT i\n"
+  "}\n"
+  "\n"
+  "UNITS {\n"
+  "    (mV) = (millivolt)\n"
+  "    (nA) = (nanoamp)\n"
+  "    (uS) = (microsiemens)\n"
+  "}\n"
+  "\n"
+  "PARAMETER {\n"
+  "    Vr = -50 (mV)\n"
+  "    Tref = 4.0 (ms)\n"
+  "    Vt_star = -48 (mV)\n"
+  "    DV = 0.5 (mV)\n"
+  "    lambda0 = 1.0 (Hz)\n"
+  "\n"
+  "    tau_eta1 = 1 (ms)\n"
+  "    tau_eta2 = 10. (ms)\n"
+  "    tau_eta3 = 100. (ms)\n"
+  "    a_eta1 = 1. (nA)\n"
+  "    a_eta2 = 1. (nA)\n"
+  "    a_eta3 = 1. (nA)\n"
+  "\n"
+  "    tau_gamma1 = 1 (ms)\n"
+  "    tau_gamma2 = 10. (ms)\n"
+  "    tau_gamma3 = 100. (ms)\n"
+  "    a_gamma1 = 1. (mV)\n"
+  "    a_gamma2 = 1. (mV)\n"
+  "    a_gamma3 = 1. (mV)\n"
+  "\n"
+  "    gon = 1e6 (uS)    : refractory clamp conductance\n"
+  "    e_spike = 0 (mV)  : spike height\n"
+  "}\n"
+  "\n"
+  "COMMENT\n"
+  "The Verbatim block is needed to allow RNG.\n"
+  "ENDCOMMENT\n"
+  "VERBATIM\n"
+  "#include<stdlib.h>\n"
+  "#include<stdio.h>\n"
+  "#include<math.h>\n"
+  "\n"
+  "double nrn_random_pick(void* r);\n"
+  "void* nrn_random_arg(int argpos);\n"
+  "ENDVERBATIM\n"
+  "\n"
+  "ASSIGNED {\n"
+  "    v (mV)\n"
+  "    i (nA)\n"
+  "    i_eta (nA)\n"
+  "    p_dontspike (1)\n"
+  "    lambda (Hz)\n"
+  "    irefrac (nA)\n"
+  "    rand (1)\n"
+  "    grefrac (uS)\n"
+  "    gamma_sum (mV)\n"
+  "    v_t (mV)\n"
+  "    verboseLevel (1)\n"
+  "    dt (ms)\n"
+  "    rng\n"
+  "    isrefrac (1) : is in refractory period\n"
+  "}\n"
+  "\n"
+  "STATE {\n"
+  "    eta1  (nA)\n"
+  "    eta2  (nA)\n"
+  "    eta3  (nA)\n"
+  "    gamma1  (mV)\n"
+  "    gamma2  (mV)\n"
+  "    gamma3  (mV)\n"
+  "}\n"
+  "\n"
+  "INITIAL {\n"
+  "    grefrac = 0\n"
+  "    eta1 = 0\n"
+  "    eta2 = 0\n"
+  "    eta3 = 0\n"
+  "    gamma1 = 0\n"
+  "    gamma2 = 0\n"
+  "    gamma3 = 0\n"
+  "    rand = urand()\n"
+  "    p_dontspike = 2\n"
+  "    isrefrac = 0\n"
+  "    net_send(0,4)\n"
+  "}\n"
+  "\n"
+  "BREAKPOINT {\n"
+  "    SOLVE states METHOD cnexp :derivimplicit :euler\n"
+  "\n"
+  "    i_eta = eta1 + eta2 + eta3\n"
+  "\n"
+  "    gamma_sum = gamma1 + gamma2 + gamma3\n"
+  "    v_t = Vt_star + gamma_sum\n"
+  "    lambda = lambda0*exp( (v-v_t)/DV )\n"
+  "    if (isrefrac > 0) {\n"
+  "        p_dontspike = 2   : is in refractory period, make it impossible to trigger a spike\n"
+  "    } else {\n"
+  "        p_dontspike = exp(-lambda*(dt * (1e-3)))\n"
+  "    }\n"
+  "\n"
+  "    irefrac = grefrac*(v-Vr)\n"
+  "    i = irefrac + i_eta\n"
+  "\n"
+  "}\n"
+  "\n"
+  "AFTER SOLVE {\n"
+  "    rand = urand()\n"
+  "}\n"
+  "\n"
+  "DERIVATIVE states {		: solve spike frequency adaptation and spike triggered current kernels\n"
+  "    eta1' = -eta1/tau_eta1\n"
+  "    eta2' = -eta2/tau_eta2\n"
+  "    eta3' = -eta3/tau_eta3\n"
+  "    gamma1' = -gamma1/tau_gamma1\n"
+  "    gamma2' = -gamma2/tau_gamma2\n"
+  "    gamma3' = -gamma3/tau_gamma3\n"
+  "}\n"
+  "\n"
+  "NET_RECEIVE (weight) {\n"
+  "    if (flag == 1) { : start spike next dt\n"
+  "        isrefrac = 1\n"
+  "        net_send(dt, 2)\n"
+  "\n"
+  "        if( verboseLevel > 0 ) {\n"
+  "            printf(\"Next dt: spike, at time %g: rand=%g, p_dontspike=%g\\n\", t, rand, p_dontspike)\n"
+  "        }\n"
+  "\n"
+  "    } else if (flag == 2) { : beginning of spike\n"
+  "        v = Vr\n"
+  "        grefrac = gon\n"
+  "        net_send(Tref-dt, 3)\n"
+  "        :net_event(t)\n"
+  "\n"
+  "        : increase filters after spike\n"
+  "        eta1 = eta1 + a_eta1\n"
+  "        eta2 = eta2 + a_eta2\n"
+  "        eta3 = eta3 + a_eta3\n"
+  "        gamma1 = gamma1 + a_gamma1\n"
+  "        gamma2 = gamma2 + a_gamma2\n"
+  "        gamma3 = gamma3 + a_gamma3\n"
+  "\n"
+  "        if( verboseLevel > 0 ) {\n"
+  "            printf(\"Start spike, at time %g: rand=%g, p_dontspike=%g\\n\", t, rand, p_dontspike)\n"
+  "        }\n"
+  "\n"
+  "    } else if (flag == 3) { : end of refractory period\n"
+  "        v = Vr\n"
+  "        isrefrac = 0\n"
+  "        grefrac = 0\n"
+  "\n"
+  "        if( verboseLevel > 0 ) {\n"
+  "            printf(\"End refrac, at time %g: rand=%g, p_dontspike=%g\\n\", t, rand, p_dontspike)\n"
+  "        }\n"
+  "\n"
+  "    } else if (flag == 4) { : watch for spikes\n"
+  "        WATCH (rand>p_dontspike) 1\n"
+  "    }\n"
+  "}\n"
+  "\n"
+  "PROCEDURE setRNG() {\n"
+  "VERBATIM\n"
+  "    {\n"
+  "        /**\n"
+  "         * This function takes a NEURON Random object declared in hoc and makes it usable by this mod file.\n"
+  "         * Note that this method is taken from Brett paper as used by netstim.hoc and netstim.mod\n"
+  "         * which points out that the Random must be in uniform(1) mode\n"
+  "         */\n"
+  "        void** pv = (void**)(&_p_rng);\n"
+  "        if( ifarg(1)) {\n"
+  "            *pv = nrn_random_arg(1);\n"
+  "        } else {\n"
+  "            *pv = (void*)0;\n"
+  "        }\n"
+  "    }\n"
+  "ENDVERBATIM\n"
+  "}\n"
+  "\n"
+  "FUNCTION urand() {\n"
+  "VERBATIM\n"
+  "        double value;\n"
+  "        if (_p_rng) {\n"
+  "            /*\n"
+  "            :Supports separate independent but reproducible streams for\n"
+  "            : each instance. However, the corresponding hoc Random\n"
+  "            : distribution MUST be set to Random.negexp(1)\n"
+  "            */\n"
+  "            value = nrn_random_pick(_p_rng);\n"
+  "            //printf(\"random stream for this simulation = %lf\\n\",value);\n"
+  "            return value;\n"
+  "        }else{\n"
+  "ENDVERBATIM\n"
+  "            : the old standby. Cannot use if reproducible parallel sim\n"
+  "            : independent of nhost or which host this instance is on\n"
+  "            : is desired, since each instance on this cpu draws from\n"
+  "            : the same stream\n"
+  "            value = scop_random(1)\n"
+  "VERBATIM\n"
+  "        }\n"
+  "ENDVERBATIM\n"
+  "        urand = value\n"
+  "}\n"
+  "\n"
+  "FUNCTION toggleVerbose() {\n"
+  "    verboseLevel = 1-verboseLevel\n"
+  "}\n"
+  ;
+#endif
@@ -0,0 +1,631 @@
+/* Created by Language version: 7.7.0 */
+/* VECTORIZED */
+#define NRN_VECTORIZED 1
+#include <stdio.h>
+#include <stdlib.h>
+#include <math.h>
+#include "mech_api.h"
+#undef PI
+#define nil 0
+#include "md1redef.h"
+#include "section.h"
+#include "nrniv_mf.h"
+#include "md2redef.h"
+ 
+#if METHOD3
+extern int _method3;
+#endif
+
+#if !NRNGPU
+#undef exp
+#define exp hoc_Exp
+extern double hoc_Exp(double);
+#endif
+ 
+#define nrn_init _nrn_init__GsfaGrr
+#define _nrn_initial _nrn_initial__GsfaGrr
+#define nrn_cur _nrn_cur__GsfaGrr
+#define _nrn_current _nrn_current__GsfaGrr
+#define nrn_jacob _nrn_jacob__GsfaGrr
+#define nrn_state _nrn_state__GsfaGrr
+#define _net_receive _net_receive__GsfaGrr 
+#define states states__GsfaGrr 
+ 
+#define _threadargscomma_ _p, _ppvar, _thread, _nt,
+#define _threadargsprotocomma_ double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt,
+#define _threadargs_ _p, _ppvar, _thread, _nt
+#define _threadargsproto_ double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt
+ 	/*SUPPRESS 761*/
+	/*SUPPRESS 762*/
+	/*SUPPRESS 763*/
+	/*SUPPRESS 765*/
+	 extern double *getarg(int);
+ /* Thread safe. No static _p or _ppvar. */
+ 
+#define t _nt->_t
+#define dt _nt->_dt
+#define vthresh _p[0]
+#define vthresh_columnindex 0
+#define q_r _p[1]
+#define q_r_columnindex 1
+#define q_s _p[2]
+#define q_s_columnindex 2
+#define tau_s _p[3]
+#define tau_s_columnindex 3
+#define tau_r _p[4]
+#define tau_r_columnindex 4
+#define E_s _p[5]
+#define E_s_columnindex 5
+#define E_r _p[6]
+#define E_r_columnindex 6
+#define i _p[7]
+#define i_columnindex 7
+#define g_s _p[8]
+#define g_s_columnindex 8
+#define g_r _p[9]
+#define g_r_columnindex 9
+#define Dg_s _p[10]
+#define Dg_s_columnindex 10
+#define Dg_r _p[11]
+#define Dg_r_columnindex 11
+#define v _p[12]
+#define v_columnindex 12
+#define _g _p[13]
+#define _g_columnindex 13
+#define _tsav _p[14]
+#define _tsav_columnindex 14
+#define _nd_area  *_ppvar[0]._pval
+ 
+#if MAC
+#if !defined(v)
+#define v _mlhv
+#endif
+#if !defined(h)
+#define h _mlhh
+#endif
+#endif
+ 
+#if defined(__cplusplus)
+extern "C" {
+#endif
+ static int hoc_nrnpointerindex =  -1;
+ static Datum* _extcall_thread;
+ static Prop* _extcall_prop;
+ /* external NEURON variables */
+ /* declaration of user functions */
+ static int _mechtype;
+extern void _nrn_cacheloop_reg(int, int);
+extern void hoc_register_prop_size(int, int, int);
+extern void hoc_register_limits(int, HocParmLimits*);
+extern void hoc_register_units(int, HocParmUnits*);
+extern void nrn_promote(Prop*, int, int);
+extern Memb_func* memb_func;
+ 
+#define NMODL_TEXT 1
+#if NMODL_TEXT
+static const char* nmodl_file_text;
+static const char* nmodl_filename;
+extern void hoc_reg_nmodl_text(int, const char*);
+extern void hoc_reg_nmodl_filename(int, const char*);
+#endif
+
+ extern Prop* nrn_point_prop_;
+ static int _pointtype;
+ static void* _hoc_create_pnt(Object* _ho) { void* create_point_process(int, Object*);
+ return create_point_process(_pointtype, _ho);
+}
+ static void _hoc_destroy_pnt(void*);
+ static double _hoc_loc_pnt(void* _vptr) {double loc_point_process(int, void*);
+ return loc_point_process(_pointtype, _vptr);
+}
+ static double _hoc_has_loc(void* _vptr) {double has_loc_point(void*);
+ return has_loc_point(_vptr);
+}
+ static double _hoc_get_loc_pnt(void* _vptr) {
+ double get_loc_point_process(void*); return (get_loc_point_process(_vptr));
+}
+ extern void _nrn_setdata_reg(int, void(*)(Prop*));
+ static void _setdata(Prop* _prop) {
+ _extcall_prop = _prop;
+ }
+ static void _hoc_setdata(void* _vptr) { Prop* _prop;
+ _prop = ((Point_process*)_vptr)->_prop;
+   _setdata(_prop);
+ }
+ /* connect user functions to hoc names */
+ static VoidFunc hoc_intfunc[] = {
+ 0,0
+};
+ static Member_func _member_func[] = {
+ "loc", _hoc_loc_pnt,
+ "has_loc", _hoc_has_loc,
+ "get_loc", _hoc_get_loc_pnt,
+ 0, 0
+};
+ /* declare global and static user variables */
+ /* some parameters have upper and lower limits */
+ static HocParmLimits _hoc_parm_limits[] = {
+ 0,0,0
+};
+ static HocParmUnits _hoc_parm_units[] = {
+ "vthresh", "mV",
+ "q_r", "nS",
+ "q_s", "nS",
+ "tau_s", "ms",
+ "tau_r", "ms",
+ "E_s", "mV",
+ "E_r", "mV",
+ "g_s", "nS",
+ "g_r", "nS",
+ "i", "nA",
+ 0,0
+};
+ static double delta_t = 0.01;
+ static double g_r0 = 0;
+ static double g_s0 = 0;
+ /* connect global user variables to hoc */
+ static DoubScal hoc_scdoub[] = {
+ 0,0
+};
+ static DoubVec hoc_vdoub[] = {
+ 0,0,0
+};
+ static double _sav_indep;
+ static void nrn_alloc(Prop*);
+static void  nrn_init(NrnThread*, _Memb_list*, int);
+static void nrn_state(NrnThread*, _Memb_list*, int);
+ static void nrn_cur(NrnThread*, _Memb_list*, int);
+static void  nrn_jacob(NrnThread*, _Memb_list*, int);
+ 
+#define _watch_array _ppvar + 3 
+ static void _watch_alloc(Datum*);
+ extern void hoc_reg_watch_allocate(int, void(*)(Datum*)); static void _hoc_destroy_pnt(void* _vptr) {
+   Prop* _prop = ((Point_process*)_vptr)->_prop;
+   if (_prop) { _nrn_free_watch(_prop->dparam, 3, 2);}
+   destroy_point_process(_vptr);
+}
+ 
+static int _ode_count(int);
+static void _ode_map(int, double**, double**, double*, Datum*, double*, int);
+static void _ode_spec(NrnThread*, _Memb_list*, int);
+static void _ode_matsol(NrnThread*, _Memb_list*, int);
+ 
+#define _cvode_ieq _ppvar[5]._i
+ static void _ode_matsol_instance1(_threadargsproto_);
+ /* connect range variables in _p that hoc is supposed to know about */
+ static const char *_mechanism[] = {
+ "7.7.0",
+"GsfaGrr",
+ "vthresh",
+ "q_r",
+ "q_s",
+ "tau_s",
+ "tau_r",
+ "E_s",
+ "E_r",
+ 0,
+ "i",
+ 0,
+ "g_s",
+ "g_r",
+ 0,
+ 0};
+ 
+extern Prop* need_memb(Symbol*);
+
+static void nrn_alloc(Prop* _prop) {
+	Prop *prop_ion;
+	double *_p; Datum *_ppvar;
+  if (nrn_point_prop_) {
+	_prop->_alloc_seq = nrn_point_prop_->_alloc_seq;
+	_p = nrn_point_prop_->param;
+	_ppvar = nrn_point_prop_->dparam;
+ }else{
+ 	_p = nrn_prop_data_alloc(_mechtype, 15, _prop);
+ 	/*initialize range parameters*/
+ 	vthresh = -57;
+ 	q_r = 3214;
+ 	q_s = 14.48;
+ 	tau_s = 110;
+ 	tau_r = 1.97;
+ 	E_s = -70;
+ 	E_r = -70;
+  }
+ 	_prop->param = _p;
+ 	_prop->param_size = 15;
+  if (!nrn_point_prop_) {
+ 	_ppvar = nrn_prop_datum_alloc(_mechtype, 6, _prop);
+  }
+ 	_prop->dparam = _ppvar;
+ 	/*connect ionic variables to this model*/
+ 
+}
+ static void _initlists();
+  /* some states have an absolute tolerance */
+ static Symbol** _atollist;
+ static HocStateTolerance _hoc_state_tol[] = {
+ 0,0
+};
+ 
+#define _tqitem &(_ppvar[2]._pvoid)
+ static void _net_receive(Point_process*, double*, double);
+ extern Symbol* hoc_lookup(const char*);
+extern void _nrn_thread_reg(int, int, void(*)(Datum*));
+extern void _nrn_thread_table_reg(int, void(*)(double*, Datum*, Datum*, NrnThread*, int));
+extern void hoc_register_tolerance(int, HocStateTolerance*, Symbol***);
+extern void _cvode_abstol( Symbol**, double*, int);
+
+ void _gsfa_grr_reg() {
+	int _vectorized = 1;
+  _initlists();
+ 	_pointtype = point_register_mech(_mechanism,
+	 nrn_alloc,nrn_cur, nrn_jacob, nrn_state, nrn_init,
+	 hoc_nrnpointerindex, 1,
+	 _hoc_create_pnt, _hoc_destroy_pnt, _member_func);
+ _mechtype = nrn_get_mechtype(_mechanism[1]);
+     _nrn_setdata_reg(_mechtype, _setdata);
+ #if NMODL_TEXT
+  hoc_reg_nmodl_text(_mechtype, nmodl_file_text);
+  hoc_reg_nmodl_filename(_mechtype, nmodl_filename);
+#endif
+  hoc_register_prop_size(_mechtype, 15, 6);
+  hoc_reg_watch_allocate(_mechtype, _watch_alloc);
+  hoc_register_dparam_semantics(_mechtype, 0, "area");
+  hoc_register_dparam_semantics(_mechtype, 1, "pntproc");
+  hoc_register_dparam_semantics(_mechtype, 2, "netsend");
+  hoc_register_dparam_semantics(_mechtype, 3, "watch");
+  hoc_register_dparam_semantics(_mechtype, 4, "watch");
+  hoc_register_dparam_semantics(_mechtype, 5, "cvodeieq");
+ 	hoc_register_cvode(_mechtype, _ode_count, _ode_map, _ode_spec, _ode_matsol);
+ 	hoc_register_tolerance(_mechtype, _hoc_state_tol, &_atollist);
+ pnt_receive[_mechtype] = _net_receive;
+ pnt_receive_size[_mechtype] = 1;
+ 	hoc_register_var(hoc_scdoub, hoc_vdoub, hoc_intfunc);
+ 	ivoc_help("help ?1 GsfaGrr /root/package/pyNN/neuron/nmodl/gsfa_grr.mod\n");
+ hoc_register_limits(_mechtype, _hoc_parm_limits);
+ hoc_register_units(_mechtype, _hoc_parm_units);
+ }
+static int _reset;
+static char *modelname = "";
+
+static int error;
+static int _ninits = 0;
+static int _match_recurse=1;
+static void _modl_cleanup(){ _match_recurse=1;}
+ 
+static int _ode_spec1(_threadargsproto_);
+/*static int _ode_matsol1(_threadargsproto_);*/
+ static int _slist1[2], _dlist1[2];
+ static int states(_threadargsproto_);
+ 
+/*CVODE*/
+ static int _ode_spec1 (double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt) {int _reset = 0; {
+   Dg_s = - g_s / tau_s ;
+   Dg_r = - g_r / tau_r ;
+   }
+ return _reset;
+}
+ static int _ode_matsol1 (double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt) {
+ Dg_s = Dg_s  / (1. - dt*( ( - 1.0 ) / tau_s )) ;
+ Dg_r = Dg_r  / (1. - dt*( ( - 1.0 ) / tau_r )) ;
+  return 0;
+}
+ /*END CVODE*/
+ static int states (double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt) { {
+    g_s = g_s + (1. - exp(dt*(( - 1.0 ) / tau_s)))*(- ( 0.0 ) / ( ( - 1.0 ) / tau_s ) - g_s) ;
+    g_r = g_r + (1. - exp(dt*(( - 1.0 ) / tau_r)))*(- ( 0.0 ) / ( ( - 1.0 ) / tau_r ) - g_r) ;
+   }
+  return 0;
+}
+ 
+static double _watch1_cond(Point_process* _pnt) {
+ 	double* _p; Datum* _ppvar; Datum* _thread; NrnThread* _nt;
+	_thread= (Datum*)0; _nt = (NrnThread*)_pnt->_vnt;
+ 	_p = _pnt->_prop->param; _ppvar = _pnt->_prop->dparam;
+	v = NODEV(_pnt->node);
+	return  ( v ) - ( vthresh ) ;
+}
+ 
+static void _net_receive (Point_process* _pnt, double* _args, double _lflag) 
+{  double* _p; Datum* _ppvar; Datum* _thread; NrnThread* _nt;
+   int _watch_rm = 0;
+   _thread = (Datum*)0; _nt = (NrnThread*)_pnt->_vnt;   _p = _pnt->_prop->param; _ppvar = _pnt->_prop->dparam;
+  if (_tsav > t){ extern char* hoc_object_name(Object*); hoc_execerror(hoc_object_name(_pnt->ob), ":Event arrived out of order. Must call ParallelContext.set_maxstep AFTER assigning minimum NetCon.delay");}
+ _tsav = t;   if (_lflag == 1. ) {*(_tqitem) = 0;}
+ {
+   if ( _lflag  == 1.0 ) {
+         if (nrn_netrec_state_adjust && !cvode_active_){
+    /* discon state adjustment for cnexp case (rate uses no local variable) */
+    double __state = g_s;
+    double __primary = (g_s + q_s ) - __state;
+     __primary += ( 1. - exp( 0.5*dt*( ( - 1.0 ) / tau_s ) ) )*( - ( 0.0 ) / ( ( - 1.0 ) / tau_s ) - __primary );
+    g_s += __primary;
+  } else {
+ g_s = g_s + q_s  ;
+       }
+     if (nrn_netrec_state_adjust && !cvode_active_){
+    /* discon state adjustment for cnexp case (rate uses no local variable) */
+    double __state = g_r;
+    double __primary = (g_r + q_r ) - __state;
+     __primary += ( 1. - exp( 0.5*dt*( ( - 1.0 ) / tau_r ) ) )*( - ( 0.0 ) / ( ( - 1.0 ) / tau_r ) - __primary );
+    g_r += __primary;
+  } else {
+ g_r = g_r + q_r  ;
+       }
+ }
+   else if ( _lflag  == 2.0 ) {
+       _nrn_watch_activate(_watch_array, _watch1_cond, 1, _pnt, _watch_rm++, 1.0);
+ }
+   } }
+ 
+static void _watch_alloc(Datum* _ppvar) {
+  Point_process* _pnt = (Point_process*)_ppvar[1]._pvoid;
+   _nrn_watch_allocate(_watch_array, _watch1_cond, 1, _pnt, 1.0);
+ }
+
+ 
+static int _ode_count(int _type){ return 2;}
+ 
+static void _ode_spec(NrnThread* _nt, _Memb_list* _ml, int _type) {
+   double* _p; Datum* _ppvar; Datum* _thread;
+   Node* _nd; double _v; int _iml, _cntml;
+  _cntml = _ml->_nodecount;
+  _thread = _ml->_thread;
+  for (_iml = 0; _iml < _cntml; ++_iml) {
+    _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+    _nd = _ml->_nodelist[_iml];
+    v = NODEV(_nd);
+     _ode_spec1 (_p, _ppvar, _thread, _nt);
+ }}
+ 
+static void _ode_map(int _ieq, double** _pv, double** _pvdot, double* _pp, Datum* _ppd, double* _atol, int _type) { 
+	double* _p; Datum* _ppvar;
+ 	int _i; _p = _pp; _ppvar = _ppd;
+	_cvode_ieq = _ieq;
+	for (_i=0; _i < 2; ++_i) {
+		_pv[_i] = _pp + _slist1[_i];  _pvdot[_i] = _pp + _dlist1[_i];
+		_cvode_abstol(_atollist, _atol, _i);
+	}
+ }
+ 
+static void _ode_matsol_instance1(_threadargsproto_) {
+ _ode_matsol1 (_p, _ppvar, _thread, _nt);
+ }
+ 
+static void _ode_matsol(NrnThread* _nt, _Memb_list* _ml, int _type) {
+   double* _p; Datum* _ppvar; Datum* _thread;
+   Node* _nd; double _v; int _iml, _cntml;
+  _cntml = _ml->_nodecount;
+  _thread = _ml->_thread;
+  for (_iml = 0; _iml < _cntml; ++_iml) {
+    _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+    _nd = _ml->_nodelist[_iml];
+    v = NODEV(_nd);
+ _ode_matsol_instance1(_threadargs_);
+ }}
+
+static void initmodel(double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt) {
+  int _i; double _save;{
+  g_r = g_r0;
+  g_s = g_s0;
+ {
+   g_s = 0.0 ;
+   g_r = 0.0 ;
+   net_send ( _tqitem, (double*)0, _ppvar[1]._pvoid, t +  0.0 , 2.0 ) ;
+   }
+ 
+}
+}
+
+static void nrn_init(NrnThread* _nt, _Memb_list* _ml, int _type){
+double* _p; Datum* _ppvar; Datum* _thread;
+Node *_nd; double _v; int* _ni; int _iml, _cntml;
+#if CACHEVEC
+    _ni = _ml->_nodeindices;
+#endif
+_cntml = _ml->_nodecount;
+_thread = _ml->_thread;
+for (_iml = 0; _iml < _cntml; ++_iml) {
+ _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+ _tsav = -1e20;
+#if CACHEVEC
+  if (use_cachevec) {
+    _v = VEC_V(_ni[_iml]);
+  }else
+#endif
+  {
+    _nd = _ml->_nodelist[_iml];
+    _v = NODEV(_nd);
+  }
+ v = _v;
+ initmodel(_p, _ppvar, _thread, _nt);
+}
+}
+
+static double _nrn_current(double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt, double _v){double _current=0.;v=_v;{ {
+   i = ( 0.001 ) * ( g_r * ( v - E_r ) + g_s * ( v - E_s ) ) ;
+   }
+ _current += i;
+
+} return _current;
+}
+
+static void nrn_cur(NrnThread* _nt, _Memb_list* _ml, int _type) {
+double* _p; Datum* _ppvar; Datum* _thread;
+Node *_nd; int* _ni; double _rhs, _v; int _iml, _cntml;
+#if CACHEVEC
+    _ni = _ml->_nodeindices;
+#endif
+_cntml = _ml->_nodecount;
+_thread = _ml->_thread;
+for (_iml = 0; _iml < _cntml; ++_iml) {
+ _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+#if CACHEVEC
+  if (use_cachevec) {
+    _v = VEC_V(_ni[_iml]);
+  }else
+#endif
+  {
+    _nd = _ml->_nodelist[_iml];
+    _v = NODEV(_nd);
+  }
+ _g = _nrn_current(_p, _ppvar, _thread, _nt, _v + .001);
+ 	{ _rhs = _nrn_current(_p, _ppvar, _thread, _nt, _v);
+ 	}
+ _g = (_g - _rhs)/.001;
+ _g *=  1.e2/(_nd_area);
+ _rhs *= 1.e2/(_nd_area);
+#if CACHEVEC
+  if (use_cachevec) {
+	VEC_RHS(_ni[_iml]) -= _rhs;
+  }else
+#endif
+  {
+	NODERHS(_nd) -= _rhs;
+  }
+ 
+}
+ 
+}
+
+static void nrn_jacob(NrnThread* _nt, _Memb_list* _ml, int _type) {
+double* _p; Datum* _ppvar; Datum* _thread;
+Node *_nd; int* _ni; int _iml, _cntml;
+#if CACHEVEC
+    _ni = _ml->_nodeindices;
+#endif
+_cntml = _ml->_nodecount;
+_thread = _ml->_thread;
+for (_iml = 0; _iml < _cntml; ++_iml) {
+ _p = _ml->_data[_iml];
+#if CACHEVEC
+  if (use_cachevec) {
+	VEC_D(_ni[_iml]) += _g;
+  }else
+#endif
+  {
+     _nd = _ml->_nodelist[_iml];
+	NODED(_nd) += _g;
+  }
+ 
+}
+ 
+}
+
+static void nrn_state(NrnThread* _nt, _Memb_list* _ml, int _type) {
+double* _p; Datum* _ppvar; Datum* _thread;
+Node *_nd; double _v = 0.0; int* _ni; int _iml, _cntml;
+#if CACHEVEC
+    _ni = _ml->_nodeindices;
+#endif
+_cntml = _ml->_nodecount;
+_thread = _ml->_thread;
+for (_iml = 0; _iml < _cntml; ++_iml) {
+ _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+ _nd = _ml->_nodelist[_iml];
+#if CACHEVEC
+  if (use_cachevec) {
+    _v = VEC_V(_ni[_iml]);
+  }else
+#endif
+  {
+    _nd = _ml->_nodelist[_iml];
+    _v = NODEV(_nd);
+  }
+ v=_v;
+{
+ {   states(_p, _ppvar, _thread, _nt);
+  }}}
+
+}
+
+static void terminal(){}
+
+static void _initlists(){
+ double _x; double* _p = &_x;
+ int _i; static int _first = 1;
+  if (!_first) return;
+ _slist1[0] = g_s_columnindex;  _dlist1[0] = Dg_s_columnindex;
+ _slist1[1] = g_r_columnindex;  _dlist1[1] = Dg_r_columnindex;
+_first = 0;
+}
+
+#if defined(__cplusplus)
+} /* extern "C" */
+#endif
+
+#if NMODL_TEXT
+static const char* nmodl_filename = "/root/package/pyNN/neuron/nmodl/gsfa_grr.mod";
+static const char* nmodl_file_text = 
+  ":    conductance based spike-frequency adaptation, and a conductance-based relative refractory\n"
+  ":    mechanism ... to be inserted in a integrate-and-fire neuron\n"
+  ":\n"
+  ":    See: Muller et al (2007) Spike-frequency adapting neural ensembles: Beyond\n"
+  ":    mean-adaptation and renewal theories. Neural Computation 19: 2958-3010.\n"
+  ":\n"
+  ":  \n"
+  ": Implemented from adexp.mod by Eilif Muller. EPFL-BMI, Jan 2011.\n"
+  "\n"
+  "NEURON {\n"
+  "    POINT_PROCESS GsfaGrr\n"
+  "    RANGE vthresh\n"
+  "    RANGE q_r, q_s\n"
+  "    RANGE E_s, E_r, tau_s, tau_r\n"
+  "    NONSPECIFIC_CURRENT i\n"
+  "}\n"
+  "\n"
+  "UNITS {\n"
+  "    (mV) = (millivolt)\n"
+  "    (nA) = (nanoamp)\n"
+  "    (uS) = (microsiemens)\n"
+  "    (nS) = (nanosiemens)\n"
+  "}\n"
+  "\n"
+  "PARAMETER {\n"
+  "    vthresh = -57   (mV)   : spike threshold\n"
+  "    q_r    = 3214.0   (nS)   : relative refractory quantal conductance\n"
+  "    q_s    = 14.48 (nS)   : SFA quantal conductance\n"
+  "    tau_s   = 110.0    (ms)   : time constant of SFA\n"
+  "    tau_r   = 1.97   (ms)   : time constant of relative refractory mechanism\n"
+  "    E_s     = -70    (mV)   : SFA reversal potential\n"
+  "    E_r     = -70    (mV)   : relative refractory period reversal potential\n"
+  "}\n"
+  "\n"
+  "\n"
+  "ASSIGNED {\n"
+  "    v (mV)\n"
+  "    i (nA)\n"
+  "}\n"
+  "\n"
+  "STATE {\n"
+  "    g_s  (nS)\n"
+  "    g_r  (nS)\n"
+  "}\n"
+  "\n"
+  "INITIAL {\n"
+  "    g_s = 0\n"
+  "    g_r = 0\n"
+  "    net_send(0,2)\n"
+  "}\n"
+  "\n"
+  "BREAKPOINT {\n"
+  "    SOLVE states METHOD cnexp   :derivimplicit\n"
+  "    i =  (0.001)*(g_r*(v-E_r) + g_s*(v-E_s))\n"
+  "}\n"
+  "\n"
+  "\n"
+  "DERIVATIVE states {		: solve eq for adaptation, relref variable\n"
+  "    g_s' = -g_s/tau_s\n"
+  "    g_r' = -g_r/tau_r\n"
+  "}\n"
+  "\n"
+  "NET_RECEIVE (weight) {\n"
+  "    if (flag == 1) {        : beginning of spike\n"
+  "        state_discontinuity(g_s, g_s + q_s)\n"
+  "	state_discontinuity(g_r, g_r + q_r)\n"
+  "    } else if (flag == 2) { : watch membrane potential\n"
+  "        WATCH (v > vthresh) 1\n"
+  "    }\n"
+  "}\n"
+  ;
+#endif
@@ -0,0 +1,866 @@
+/* Created by Language version: 7.7.0 */
+/* VECTORIZED */
+#define NRN_VECTORIZED 1
+#include <stdio.h>
+#include <stdlib.h>
+#include <math.h>
+#include "mech_api.h"
+#undef PI
+#define nil 0
+#include "md1redef.h"
+#include "section.h"
+#include "nrniv_mf.h"
+#include "md2redef.h"
+ 
+#if METHOD3
+extern int _method3;
+#endif
+
+#if !NRNGPU
+#undef exp
+#define exp hoc_Exp
+extern double hoc_Exp(double);
+#endif
+ 
+#define nrn_init _nrn_init__hh_traub
+#define _nrn_initial _nrn_initial__hh_traub
+#define nrn_cur _nrn_cur__hh_traub
+#define _nrn_current _nrn_current__hh_traub
+#define nrn_jacob _nrn_jacob__hh_traub
+#define nrn_state _nrn_state__hh_traub
+#define _net_receive _net_receive__hh_traub 
+#define _f_rates _f_rates__hh_traub 
+#define rates rates__hh_traub 
+#define states states__hh_traub 
+ 
+#define _threadargscomma_ _p, _ppvar, _thread, _nt,
+#define _threadargsprotocomma_ double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt,
+#define _threadargs_ _p, _ppvar, _thread, _nt
+#define _threadargsproto_ double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt
+ 	/*SUPPRESS 761*/
+	/*SUPPRESS 762*/
+	/*SUPPRESS 763*/
+	/*SUPPRESS 765*/
+	 extern double *getarg(int);
+ /* Thread safe. No static _p or _ppvar. */
+ 
+#define t _nt->_t
+#define dt _nt->_dt
+#define gnabar _p[0]
+#define gnabar_columnindex 0
+#define gkbar _p[1]
+#define gkbar_columnindex 1
+#define gl _p[2]
+#define gl_columnindex 2
+#define el _p[3]
+#define el_columnindex 3
+#define vT _p[4]
+#define vT_columnindex 4
+#define gna _p[5]
+#define gna_columnindex 5
+#define gk _p[6]
+#define gk_columnindex 6
+#define il _p[7]
+#define il_columnindex 7
+#define m _p[8]
+#define m_columnindex 8
+#define h _p[9]
+#define h_columnindex 9
+#define n _p[10]
+#define n_columnindex 10
+#define Dm _p[11]
+#define Dm_columnindex 11
+#define Dh _p[12]
+#define Dh_columnindex 12
+#define Dn _p[13]
+#define Dn_columnindex 13
+#define ena _p[14]
+#define ena_columnindex 14
+#define ek _p[15]
+#define ek_columnindex 15
+#define ina _p[16]
+#define ina_columnindex 16
+#define ik _p[17]
+#define ik_columnindex 17
+#define v _p[18]
+#define v_columnindex 18
+#define _g _p[19]
+#define _g_columnindex 19
+#define _ion_ena	*_ppvar[0]._pval
+#define _ion_ina	*_ppvar[1]._pval
+#define _ion_dinadv	*_ppvar[2]._pval
+#define _ion_ek	*_ppvar[3]._pval
+#define _ion_ik	*_ppvar[4]._pval
+#define _ion_dikdv	*_ppvar[5]._pval
+ 
+#if MAC
+#if !defined(v)
+#define v _mlhv
+#endif
+#if !defined(h)
+#define h _mlhh
+#endif
+#endif
+ 
+#if defined(__cplusplus)
+extern "C" {
+#endif
+ static int hoc_nrnpointerindex =  -1;
+ static Datum* _extcall_thread;
+ static Prop* _extcall_prop;
+ /* external NEURON variables */
+ /* declaration of user functions */
+ static void _hoc_rates(void);
+ static void _hoc_vtrap(void);
+ static int _mechtype;
+extern void _nrn_cacheloop_reg(int, int);
+extern void hoc_register_prop_size(int, int, int);
+extern void hoc_register_limits(int, HocParmLimits*);
+extern void hoc_register_units(int, HocParmUnits*);
+extern void nrn_promote(Prop*, int, int);
+extern Memb_func* memb_func;
+ 
+#define NMODL_TEXT 1
+#if NMODL_TEXT
+static const char* nmodl_file_text;
+static const char* nmodl_filename;
+extern void hoc_reg_nmodl_text(int, const char*);
+extern void hoc_reg_nmodl_filename(int, const char*);
+#endif
+
+ extern void _nrn_setdata_reg(int, void(*)(Prop*));
+ static void _setdata(Prop* _prop) {
+ _extcall_prop = _prop;
+ }
+ static void _hoc_setdata() {
+ Prop *_prop, *hoc_getdata_range(int);
+ _prop = hoc_getdata_range(_mechtype);
+   _setdata(_prop);
+ hoc_retpushx(1.);
+}
+ /* connect user functions to hoc names */
+ static VoidFunc hoc_intfunc[] = {
+ "setdata_hh_traub", _hoc_setdata,
+ "rates_hh_traub", _hoc_rates,
+ "vtrap_hh_traub", _hoc_vtrap,
+ 0, 0
+};
+#define vtrap vtrap_hh_traub
+ extern double vtrap( _threadargsprotocomma_ double , double );
+ 
+static void _check_rates(double*, Datum*, Datum*, NrnThread*); 
+static void _check_table_thread(double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt, int _type) {
+   _check_rates(_p, _ppvar, _thread, _nt);
+ }
+ /* declare global and static user variables */
+ static int _thread1data_inuse = 0;
+static double _thread1data[6];
+#define _gth 0
+#define htau_hh_traub _thread1data[0]
+#define htau _thread[_gth]._pval[0]
+#define hinf_hh_traub _thread1data[1]
+#define hinf _thread[_gth]._pval[1]
+#define mtau_hh_traub _thread1data[2]
+#define mtau _thread[_gth]._pval[2]
+#define minf_hh_traub _thread1data[3]
+#define minf _thread[_gth]._pval[3]
+#define ntau_hh_traub _thread1data[4]
+#define ntau _thread[_gth]._pval[4]
+#define ninf_hh_traub _thread1data[5]
+#define ninf _thread[_gth]._pval[5]
+#define usetable usetable_hh_traub
+ double usetable = 1;
+ /* some parameters have upper and lower limits */
+ static HocParmLimits _hoc_parm_limits[] = {
+ "gl_hh_traub", 0, 1e+09,
+ "gkbar_hh_traub", 0, 1e+09,
+ "gnabar_hh_traub", 0, 1e+09,
+ "usetable_hh_traub", 0, 1,
+ 0,0,0
+};
+ static HocParmUnits _hoc_parm_units[] = {
+ "mtau_hh_traub", "ms",
+ "htau_hh_traub", "ms",
+ "ntau_hh_traub", "ms",
+ "gnabar_hh_traub", "S/cm2",
+ "gkbar_hh_traub", "S/cm2",
+ "gl_hh_traub", "S/cm2",
+ "el_hh_traub", "mV",
+ "vT_hh_traub", "mV",
+ "gna_hh_traub", "S/cm2",
+ "gk_hh_traub", "S/cm2",
+ "il_hh_traub", "mA/cm2",
+ 0,0
+};
+ static double delta_t = 0.01;
+ static double h0 = 0;
+ static double m0 = 0;
+ static double n0 = 0;
+ /* connect global user variables to hoc */
+ static DoubScal hoc_scdoub[] = {
+ "minf_hh_traub", &minf_hh_traub,
+ "hinf_hh_traub", &hinf_hh_traub,
+ "ninf_hh_traub", &ninf_hh_traub,
+ "mtau_hh_traub", &mtau_hh_traub,
+ "htau_hh_traub", &htau_hh_traub,
+ "ntau_hh_traub", &ntau_hh_traub,
+ "usetable_hh_traub", &usetable_hh_traub,
+ 0,0
+};
+ static DoubVec hoc_vdoub[] = {
+ 0,0,0
+};
+ static double _sav_indep;
+ static void nrn_alloc(Prop*);
+static void  nrn_init(NrnThread*, _Memb_list*, int);
+static void nrn_state(NrnThread*, _Memb_list*, int);
+ static void nrn_cur(NrnThread*, _Memb_list*, int);
+static void  nrn_jacob(NrnThread*, _Memb_list*, int);
+ 
+static int _ode_count(int);
+static void _ode_map(int, double**, double**, double*, Datum*, double*, int);
+static void _ode_spec(NrnThread*, _Memb_list*, int);
+static void _ode_matsol(NrnThread*, _Memb_list*, int);
+ 
+#define _cvode_ieq _ppvar[6]._i
+ static void _ode_matsol_instance1(_threadargsproto_);
+ /* connect range variables in _p that hoc is supposed to know about */
+ static const char *_mechanism[] = {
+ "7.7.0",
+"hh_traub",
+ "gnabar_hh_traub",
+ "gkbar_hh_traub",
+ "gl_hh_traub",
+ "el_hh_traub",
+ "vT_hh_traub",
+ 0,
+ "gna_hh_traub",
+ "gk_hh_traub",
+ "il_hh_traub",
+ 0,
+ "m_hh_traub",
+ "h_hh_traub",
+ "n_hh_traub",
+ 0,
+ 0};
+ static Symbol* _na_sym;
+ static Symbol* _k_sym;
+ 
+extern Prop* need_memb(Symbol*);
+
+static void nrn_alloc(Prop* _prop) {
+	Prop *prop_ion;
+	double *_p; Datum *_ppvar;
+ 	_p = nrn_prop_data_alloc(_mechtype, 20, _prop);
+ 	/*initialize range parameters*/
+ 	gnabar = 0.02;
+ 	gkbar = 0.006;
+ 	gl = 1e-05;
+ 	el = -60;
+ 	vT = -63;
+ 	_prop->param = _p;
+ 	_prop->param_size = 20;
+ 	_ppvar = nrn_prop_datum_alloc(_mechtype, 7, _prop);
+ 	_prop->dparam = _ppvar;
+ 	/*connect ionic variables to this model*/
+ prop_ion = need_memb(_na_sym);
+ nrn_promote(prop_ion, 0, 1);
+ 	_ppvar[0]._pval = &prop_ion->param[0]; /* ena */
+ 	_ppvar[1]._pval = &prop_ion->param[3]; /* ina */
+ 	_ppvar[2]._pval = &prop_ion->param[4]; /* _ion_dinadv */
+ prop_ion = need_memb(_k_sym);
+ nrn_promote(prop_ion, 0, 1);
+ 	_ppvar[3]._pval = &prop_ion->param[0]; /* ek */
+ 	_ppvar[4]._pval = &prop_ion->param[3]; /* ik */
+ 	_ppvar[5]._pval = &prop_ion->param[4]; /* _ion_dikdv */
+ 
+}
+ static void _initlists();
+  /* some states have an absolute tolerance */
+ static Symbol** _atollist;
+ static HocStateTolerance _hoc_state_tol[] = {
+ 0,0
+};
+ static void _thread_mem_init(Datum*);
+ static void _thread_cleanup(Datum*);
+ static void _update_ion_pointer(Datum*);
+ extern Symbol* hoc_lookup(const char*);
+extern void _nrn_thread_reg(int, int, void(*)(Datum*));
+extern void _nrn_thread_table_reg(int, void(*)(double*, Datum*, Datum*, NrnThread*, int));
+extern void hoc_register_tolerance(int, HocStateTolerance*, Symbol***);
+extern void _cvode_abstol( Symbol**, double*, int);
+
+ void _hh_traub_reg() {
+	int _vectorized = 1;
+  _initlists();
+ 	ion_reg("na", -10000.);
+ 	ion_reg("k", -10000.);
+ 	_na_sym = hoc_lookup("na_ion");
+ 	_k_sym = hoc_lookup("k_ion");
+ 	register_mech(_mechanism, nrn_alloc,nrn_cur, nrn_jacob, nrn_state, nrn_init, hoc_nrnpointerindex, 2);
+  _extcall_thread = (Datum*)ecalloc(1, sizeof(Datum));
+  _thread_mem_init(_extcall_thread);
+  _thread1data_inuse = 0;
+ _mechtype = nrn_get_mechtype(_mechanism[1]);
+     _nrn_setdata_reg(_mechtype, _setdata);
+     _nrn_thread_reg(_mechtype, 1, _thread_mem_init);
+     _nrn_thread_reg(_mechtype, 0, _thread_cleanup);
+     _nrn_thread_reg(_mechtype, 2, _update_ion_pointer);
+     _nrn_thread_table_reg(_mechtype, _check_table_thread);
+ #if NMODL_TEXT
+  hoc_reg_nmodl_text(_mechtype, nmodl_file_text);
+  hoc_reg_nmodl_filename(_mechtype, nmodl_filename);
+#endif
+  hoc_register_prop_size(_mechtype, 20, 7);
+  hoc_register_dparam_semantics(_mechtype, 0, "na_ion");
+  hoc_register_dparam_semantics(_mechtype, 1, "na_ion");
+  hoc_register_dparam_semantics(_mechtype, 2, "na_ion");
+  hoc_register_dparam_semantics(_mechtype, 3, "k_ion");
+  hoc_register_dparam_semantics(_mechtype, 4, "k_ion");
+  hoc_register_dparam_semantics(_mechtype, 5, "k_ion");
+  hoc_register_dparam_semantics(_mechtype, 6, "cvodeieq");
+ 	hoc_register_cvode(_mechtype, _ode_count, _ode_map, _ode_spec, _ode_matsol);
+ 	hoc_register_tolerance(_mechtype, _hoc_state_tol, &_atollist);
+ 	hoc_register_var(hoc_scdoub, hoc_vdoub, hoc_intfunc);
+ 	ivoc_help("help ?1 hh_traub /root/package/pyNN/neuron/nmodl/hh_traub.mod\n");
+ hoc_register_limits(_mechtype, _hoc_parm_limits);
+ hoc_register_units(_mechtype, _hoc_parm_units);
+ }
+ static double *_t_minf;
+ static double *_t_mtau;
+ static double *_t_hinf;
+ static double *_t_htau;
+ static double *_t_ninf;
+ static double *_t_ntau;
+static int _reset;
+static char *modelname = "";
+
+static int error;
+static int _ninits = 0;
+static int _match_recurse=1;
+static void _modl_cleanup(){ _match_recurse=1;}
+static int _f_rates(_threadargsprotocomma_ double);
+static int rates(_threadargsprotocomma_ double);
+ 
+static int _ode_spec1(_threadargsproto_);
+/*static int _ode_matsol1(_threadargsproto_);*/
+ static void _n_rates(_threadargsprotocomma_ double _lv);
+ static int _slist1[3], _dlist1[3];
+ static int states(_threadargsproto_);
+ 
+/*CVODE*/
+ static int _ode_spec1 (double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt) {int _reset = 0; {
+   rates ( _threadargscomma_ v ) ;
+   Dm = ( minf - m ) / mtau ;
+   Dh = ( hinf - h ) / htau ;
+   Dn = ( ninf - n ) / ntau ;
+   }
+ return _reset;
+}
+ static int _ode_matsol1 (double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt) {
+ rates ( _threadargscomma_ v ) ;
+ Dm = Dm  / (1. - dt*( ( ( ( - 1.0 ) ) ) / mtau )) ;
+ Dh = Dh  / (1. - dt*( ( ( ( - 1.0 ) ) ) / htau )) ;
+ Dn = Dn  / (1. - dt*( ( ( ( - 1.0 ) ) ) / ntau )) ;
+  return 0;
+}
+ /*END CVODE*/
+ static int states (double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt) { {
+   rates ( _threadargscomma_ v ) ;
+    m = m + (1. - exp(dt*(( ( ( - 1.0 ) ) ) / mtau)))*(- ( ( ( minf ) ) / mtau ) / ( ( ( ( - 1.0 ) ) ) / mtau ) - m) ;
+    h = h + (1. - exp(dt*(( ( ( - 1.0 ) ) ) / htau)))*(- ( ( ( hinf ) ) / htau ) / ( ( ( ( - 1.0 ) ) ) / htau ) - h) ;
+    n = n + (1. - exp(dt*(( ( ( - 1.0 ) ) ) / ntau)))*(- ( ( ( ninf ) ) / ntau ) / ( ( ( ( - 1.0 ) ) ) / ntau ) - n) ;
+   }
+  return 0;
+}
+ static double _mfac_rates, _tmin_rates;
+  static void _check_rates(double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt) {
+  static int _maktable=1; int _i, _j, _ix = 0;
+  double _xi, _tmax;
+  if (!usetable) {return;}
+  if (_maktable) { double _x, _dx; _maktable=0;
+   _tmin_rates =  - 100.0 ;
+   _tmax =  100.0 ;
+   _dx = (_tmax - _tmin_rates)/200.; _mfac_rates = 1./_dx;
+   for (_i=0, _x=_tmin_rates; _i < 201; _x += _dx, _i++) {
+    _f_rates(_p, _ppvar, _thread, _nt, _x);
+    _t_minf[_i] = minf;
+    _t_mtau[_i] = mtau;
+    _t_hinf[_i] = hinf;
+    _t_htau[_i] = htau;
+    _t_ninf[_i] = ninf;
+    _t_ntau[_i] = ntau;
+   }
+  }
+ }
+
+ static int rates(double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt, double _lv) { 
+#if 0
+_check_rates(_p, _ppvar, _thread, _nt);
+#endif
+ _n_rates(_p, _ppvar, _thread, _nt, _lv);
+ return 0;
+ }
+
+ static void _n_rates(double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt, double _lv){ int _i, _j;
+ double _xi, _theta;
+ if (!usetable) {
+ _f_rates(_p, _ppvar, _thread, _nt, _lv); return; 
+}
+ _xi = _mfac_rates * (_lv - _tmin_rates);
+ if (isnan(_xi)) {
+  minf = _xi;
+  mtau = _xi;
+  hinf = _xi;
+  htau = _xi;
+  ninf = _xi;
+  ntau = _xi;
+  return;
+ }
+ if (_xi <= 0.) {
+ minf = _t_minf[0];
+ mtau = _t_mtau[0];
+ hinf = _t_hinf[0];
+ htau = _t_htau[0];
+ ninf = _t_ninf[0];
+ ntau = _t_ntau[0];
+ return; }
+ if (_xi >= 200.) {
+ minf = _t_minf[200];
+ mtau = _t_mtau[200];
+ hinf = _t_hinf[200];
+ htau = _t_htau[200];
+ ninf = _t_ninf[200];
+ ntau = _t_ntau[200];
+ return; }
+ _i = (int) _xi;
+ _theta = _xi - (double)_i;
+ minf = _t_minf[_i] + _theta*(_t_minf[_i+1] - _t_minf[_i]);
+ mtau = _t_mtau[_i] + _theta*(_t_mtau[_i+1] - _t_mtau[_i]);
+ hinf = _t_hinf[_i] + _theta*(_t_hinf[_i+1] - _t_hinf[_i]);
+ htau = _t_htau[_i] + _theta*(_t_htau[_i+1] - _t_htau[_i]);
+ ninf = _t_ninf[_i] + _theta*(_t_ninf[_i+1] - _t_ninf[_i]);
+ ntau = _t_ntau[_i] + _theta*(_t_ntau[_i+1] - _t_ntau[_i]);
+ }
+
+ 
+static int  _f_rates ( _threadargsprotocomma_ double _lv ) {
+   double _lalpha , _lbeta , _lsum , _lu ;
+  _lu = _lv - vT ;
+   _lalpha = 0.32 * vtrap ( _threadargscomma_ 13.0 - _lu , 4.0 ) ;
+   _lbeta = 0.28 * vtrap ( _threadargscomma_ _lu - 40.0 , 5.0 ) ;
+   _lsum = _lalpha + _lbeta ;
+   mtau = 1.0 / _lsum ;
+   minf = _lalpha / _lsum ;
+   _lalpha = 0.128 * exp ( ( 17.0 - _lu ) / 18.0 ) ;
+   _lbeta = 4.0 / ( exp ( ( 40.0 - _lu ) / 5.0 ) + 1.0 ) ;
+   _lsum = _lalpha + _lbeta ;
+   htau = 1.0 / _lsum ;
+   hinf = _lalpha / _lsum ;
+   _lalpha = 0.032 * vtrap ( _threadargscomma_ 15.0 - _lu , 5.0 ) ;
+   _lbeta = 0.5 * exp ( ( 10.0 - _lu ) / 40.0 ) ;
+   _lsum = _lalpha + _lbeta ;
+   ntau = 1.0 / _lsum ;
+   ninf = _lalpha / _lsum ;
+    return 0; }
+ 
+static void _hoc_rates(void) {
+  double _r;
+   double* _p; Datum* _ppvar; Datum* _thread; NrnThread* _nt;
+   if (_extcall_prop) {_p = _extcall_prop->param; _ppvar = _extcall_prop->dparam;}else{ _p = (double*)0; _ppvar = (Datum*)0; }
+  _thread = _extcall_thread;
+  _nt = nrn_threads;
+ 
+#if 1
+ _check_rates(_p, _ppvar, _thread, _nt);
+#endif
+ _r = 1.;
+ rates ( _p, _ppvar, _thread, _nt, *getarg(1) );
+ hoc_retpushx(_r);
+}
+ 
+double vtrap ( _threadargsprotocomma_ double _lx , double _ly ) {
+   double _lvtrap;
+ if ( fabs ( _lx / _ly ) < 1e-6 ) {
+     _lvtrap = _ly * ( 1.0 - _lx / _ly / 2.0 ) ;
+     }
+   else {
+     _lvtrap = _lx / ( exp ( _lx / _ly ) - 1.0 ) ;
+     }
+   
+return _lvtrap;
+ }
+ 
+static void _hoc_vtrap(void) {
+  double _r;
+   double* _p; Datum* _ppvar; Datum* _thread; NrnThread* _nt;
+   if (_extcall_prop) {_p = _extcall_prop->param; _ppvar = _extcall_prop->dparam;}else{ _p = (double*)0; _ppvar = (Datum*)0; }
+  _thread = _extcall_thread;
+  _nt = nrn_threads;
+ _r =  vtrap ( _p, _ppvar, _thread, _nt, *getarg(1) , *getarg(2) );
+ hoc_retpushx(_r);
+}
+ 
+static int _ode_count(int _type){ return 3;}
+ 
+static void _ode_spec(NrnThread* _nt, _Memb_list* _ml, int _type) {
+   double* _p; Datum* _ppvar; Datum* _thread;
+   Node* _nd; double _v; int _iml, _cntml;
+  _cntml = _ml->_nodecount;
+  _thread = _ml->_thread;
+  for (_iml = 0; _iml < _cntml; ++_iml) {
+    _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+    _nd = _ml->_nodelist[_iml];
+    v = NODEV(_nd);
+  ena = _ion_ena;
+  ek = _ion_ek;
+     _ode_spec1 (_p, _ppvar, _thread, _nt);
+   }}
+ 
+static void _ode_map(int _ieq, double** _pv, double** _pvdot, double* _pp, Datum* _ppd, double* _atol, int _type) { 
+	double* _p; Datum* _ppvar;
+ 	int _i; _p = _pp; _ppvar = _ppd;
+	_cvode_ieq = _ieq;
+	for (_i=0; _i < 3; ++_i) {
+		_pv[_i] = _pp + _slist1[_i];  _pvdot[_i] = _pp + _dlist1[_i];
+		_cvode_abstol(_atollist, _atol, _i);
+	}
+ }
+ 
+static void _ode_matsol_instance1(_threadargsproto_) {
+ _ode_matsol1 (_p, _ppvar, _thread, _nt);
+ }
+ 
+static void _ode_matsol(NrnThread* _nt, _Memb_list* _ml, int _type) {
+   double* _p; Datum* _ppvar; Datum* _thread;
+   Node* _nd; double _v; int _iml, _cntml;
+  _cntml = _ml->_nodecount;
+  _thread = _ml->_thread;
+  for (_iml = 0; _iml < _cntml; ++_iml) {
+    _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+    _nd = _ml->_nodelist[_iml];
+    v = NODEV(_nd);
+  ena = _ion_ena;
+  ek = _ion_ek;
+ _ode_matsol_instance1(_threadargs_);
+ }}
+ 
+static void _thread_mem_init(Datum* _thread) {
+  if (_thread1data_inuse) {_thread[_gth]._pval = (double*)ecalloc(6, sizeof(double));
+ }else{
+ _thread[_gth]._pval = _thread1data; _thread1data_inuse = 1;
+ }
+ }
+ 
+static void _thread_cleanup(Datum* _thread) {
+  if (_thread[_gth]._pval == _thread1data) {
+   _thread1data_inuse = 0;
+  }else{
+   free((void*)_thread[_gth]._pval);
+  }
+ }
+ extern void nrn_update_ion_pointer(Symbol*, Datum*, int, int);
+ static void _update_ion_pointer(Datum* _ppvar) {
+   nrn_update_ion_pointer(_na_sym, _ppvar, 0, 0);
+   nrn_update_ion_pointer(_na_sym, _ppvar, 1, 3);
+   nrn_update_ion_pointer(_na_sym, _ppvar, 2, 4);
+   nrn_update_ion_pointer(_k_sym, _ppvar, 3, 0);
+   nrn_update_ion_pointer(_k_sym, _ppvar, 4, 3);
+   nrn_update_ion_pointer(_k_sym, _ppvar, 5, 4);
+ }
+
+static void initmodel(double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt) {
+  int _i; double _save;{
+  h = h0;
+  m = m0;
+  n = n0;
+ {
+   m = 0.0 ;
+   h = 0.0 ;
+   n = 0.0 ;
+   }
+ 
+}
+}
+
+static void nrn_init(NrnThread* _nt, _Memb_list* _ml, int _type){
+double* _p; Datum* _ppvar; Datum* _thread;
+Node *_nd; double _v; int* _ni; int _iml, _cntml;
+#if CACHEVEC
+    _ni = _ml->_nodeindices;
+#endif
+_cntml = _ml->_nodecount;
+_thread = _ml->_thread;
+for (_iml = 0; _iml < _cntml; ++_iml) {
+ _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+
+#if 0
+ _check_rates(_p, _ppvar, _thread, _nt);
+#endif
+#if CACHEVEC
+  if (use_cachevec) {
+    _v = VEC_V(_ni[_iml]);
+  }else
+#endif
+  {
+    _nd = _ml->_nodelist[_iml];
+    _v = NODEV(_nd);
+  }
+ v = _v;
+  ena = _ion_ena;
+  ek = _ion_ek;
+ initmodel(_p, _ppvar, _thread, _nt);
+  }
+}
+
+static double _nrn_current(double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt, double _v){double _current=0.;v=_v;{ {
+   gna = gnabar * m * m * m * h ;
+   ina = gna * ( v - ena ) ;
+   gk = gkbar * n * n * n * n ;
+   ik = gk * ( v - ek ) ;
+   il = gl * ( v - el ) ;
+   }
+ _current += ina;
+ _current += ik;
+ _current += il;
+
+} return _current;
+}
+
+static void nrn_cur(NrnThread* _nt, _Memb_list* _ml, int _type) {
+double* _p; Datum* _ppvar; Datum* _thread;
+Node *_nd; int* _ni; double _rhs, _v; int _iml, _cntml;
+#if CACHEVEC
+    _ni = _ml->_nodeindices;
+#endif
+_cntml = _ml->_nodecount;
+_thread = _ml->_thread;
+for (_iml = 0; _iml < _cntml; ++_iml) {
+ _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+#if CACHEVEC
+  if (use_cachevec) {
+    _v = VEC_V(_ni[_iml]);
+  }else
+#endif
+  {
+    _nd = _ml->_nodelist[_iml];
+    _v = NODEV(_nd);
+  }
+  ena = _ion_ena;
+  ek = _ion_ek;
+ _g = _nrn_current(_p, _ppvar, _thread, _nt, _v + .001);
+ 	{ double _dik;
+ double _dina;
+  _dina = ina;
+  _dik = ik;
+ _rhs = _nrn_current(_p, _ppvar, _thread, _nt, _v);
+  _ion_dinadv += (_dina - ina)/.001 ;
+  _ion_dikdv += (_dik - ik)/.001 ;
+ 	}
+ _g = (_g - _rhs)/.001;
+  _ion_ina += ina ;
+  _ion_ik += ik ;
+#if CACHEVEC
+  if (use_cachevec) {
+	VEC_RHS(_ni[_iml]) -= _rhs;
+  }else
+#endif
+  {
+	NODERHS(_nd) -= _rhs;
+  }
+ 
+}
+ 
+}
+
+static void nrn_jacob(NrnThread* _nt, _Memb_list* _ml, int _type) {
+double* _p; Datum* _ppvar; Datum* _thread;
+Node *_nd; int* _ni; int _iml, _cntml;
+#if CACHEVEC
+    _ni = _ml->_nodeindices;
+#endif
+_cntml = _ml->_nodecount;
+_thread = _ml->_thread;
+for (_iml = 0; _iml < _cntml; ++_iml) {
+ _p = _ml->_data[_iml];
+#if CACHEVEC
+  if (use_cachevec) {
+	VEC_D(_ni[_iml]) += _g;
+  }else
+#endif
+  {
+     _nd = _ml->_nodelist[_iml];
+	NODED(_nd) += _g;
+  }
+ 
+}
+ 
+}
+
+static void nrn_state(NrnThread* _nt, _Memb_list* _ml, int _type) {
+double* _p; Datum* _ppvar; Datum* _thread;
+Node *_nd; double _v = 0.0; int* _ni; int _iml, _cntml;
+#if CACHEVEC
+    _ni = _ml->_nodeindices;
+#endif
+_cntml = _ml->_nodecount;
+_thread = _ml->_thread;
+for (_iml = 0; _iml < _cntml; ++_iml) {
+ _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+ _nd = _ml->_nodelist[_iml];
+#if CACHEVEC
+  if (use_cachevec) {
+    _v = VEC_V(_ni[_iml]);
+  }else
+#endif
+  {
+    _nd = _ml->_nodelist[_iml];
+    _v = NODEV(_nd);
+  }
+ v=_v;
+{
+  ena = _ion_ena;
+  ek = _ion_ek;
+ {   states(_p, _ppvar, _thread, _nt);
+  }  }}
+
+}
+
+static void terminal(){}
+
+static void _initlists(){
+ double _x; double* _p = &_x;
+ int _i; static int _first = 1;
+  if (!_first) return;
+ _slist1[0] = m_columnindex;  _dlist1[0] = Dm_columnindex;
+ _slist1[1] = h_columnindex;  _dlist1[1] = Dh_columnindex;
+ _slist1[2] = n_columnindex;  _dlist1[2] = Dn_columnindex;
+   _t_minf = makevector(201*sizeof(double));
+   _t_mtau = makevector(201*sizeof(double));
+   _t_hinf = makevector(201*sizeof(double));
+   _t_htau = makevector(201*sizeof(double));
+   _t_ninf = makevector(201*sizeof(double));
+   _t_ntau = makevector(201*sizeof(double));
+_first = 0;
+}
+
+#if defined(__cplusplus)
+} /* extern "C" */
+#endif
+
+#if NMODL_TEXT
+static const char* nmodl_filename = "/root/package/pyNN/neuron/nmodl/hh_traub.mod";
+static const char* nmodl_file_text = 
+  "COMMENT\n"
+  "Modified Hodgkin-Huxley model\n"
+  "ENDCOMMENT\n"
+  " \n"
+  "UNITS {\n"
+  "        (mA) = (milliamp)\n"
+  "        (mV) = (millivolt)\n"
+  "	(uS) = (microsiemens)\n"
+  "        (S) = (siemens)\n"
+  "}\n"
+  " \n"
+  "NEURON {\n"
+  "        SUFFIX hh_traub\n"
+  "        USEION na READ ena WRITE ina\n"
+  "        USEION k READ ek WRITE ik\n"
+  "        NONSPECIFIC_CURRENT il\n"
+  "        RANGE gnabar, gkbar, gl, el, gna, gk, vT\n"
+  "        GLOBAL minf, hinf, ninf, mtau, htau, ntau\n"
+  "	THREADSAFE : assigned GLOBALs will be per thread\n"
+  "}\n"
+  " \n"
+  "PARAMETER {\n"
+  "        gnabar = 0.02 (S/cm2)	<0,1e9>\n"
+  "        gkbar = 0.006 (S/cm2)	<0,1e9>\n"
+  "        gl = 0.00001 (S/cm2)	<0,1e9>\n"
+  "        el = -60.0 (mV)\n"
+  "        vT = -63.0 (mV)\n"
+  "}\n"
+  " \n"
+  "STATE {\n"
+  "        m h n\n"
+  "}\n"
+  " \n"
+  "ASSIGNED {\n"
+  "        v (mV)\n"
+  "        ena (mV)\n"
+  "        ek (mV)\n"
+  "        \n"
+  "	gna (S/cm2)\n"
+  "	gk (S/cm2)\n"
+  "        ina (mA/cm2)\n"
+  "        ik (mA/cm2)\n"
+  "        il (mA/cm2)\n"
+  "        minf hinf ninf\n"
+  "	mtau (ms) htau (ms) ntau (ms)\n"
+  "}\n"
+  " \n"
+  "BREAKPOINT {\n"
+  "        SOLVE states METHOD cnexp\n"
+  "        gna = gnabar*m*m*m*h\n"
+  "	ina = gna*(v - ena)\n"
+  "        gk = gkbar*n*n*n*n\n"
+  "	ik = gk*(v - ek)      \n"
+  "        il = gl*(v - el)\n"
+  "}\n"
+  " \n"
+  " \n"
+  "INITIAL {\n"
+  "        : the following (commented out) is the preferred initialization\n"
+  "	:rates(v)\n"
+  "	:m = minf\n"
+  "	:h = hinf\n"
+  "	:n = ninf\n"
+  "        : but for compatibility with NEST, we use the following\n"
+  "        m = 0\n"
+  "        h = 0\n"
+  "        n = 0\n"
+  "}\n"
+  "\n"
+  "DERIVATIVE states {  \n"
+  "        rates(v)\n"
+  "        m' =  (minf-m)/mtau\n"
+  "        h' = (hinf-h)/htau\n"
+  "        n' = (ninf-n)/ntau\n"
+  "}\n"
+  " \n"
+  "PROCEDURE rates(v(mV)) {\n"
+  "        LOCAL  alpha, beta, sum, u\n"
+  "        TABLE minf, mtau, hinf, htau, ninf, ntau FROM -100 TO 100 WITH 200\n"
+  "\n"
+  "UNITSOFF\n"
+  "        u = v - vT\n"
+  "                :\"m\" sodium activation system\n"
+  "        alpha = 0.32 * vtrap(13-u, 4)\n"
+  "        beta =  0.28 * vtrap(u-40, 5)\n"
+  "        sum = alpha + beta\n"
+  "	mtau = 1/sum\n"
+  "        minf = alpha/sum\n"
+  "                :\"h\" sodium inactivation system\n"
+  "        alpha = 0.128 * exp((17-u)/18)\n"
+  "        beta = 4 / (exp((40-u)/5) + 1)\n"
+  "        sum = alpha + beta\n"
+  "	htau = 1/sum\n"
+  "        hinf = alpha/sum\n"
+  "                :\"n\" potassium activation system\n"
+  "        alpha = 0.032*vtrap(15-u, 5) \n"
+  "        beta = 0.5*exp((10-u)/40)\n"
+  "	sum = alpha + beta\n"
+  "        ntau = 1/sum\n"
+  "        ninf = alpha/sum\n"
+  "}\n"
+  " \n"
+  "FUNCTION vtrap(x,y) {  :Traps for 0 in denominator of rate eqns.\n"
+  "        if (fabs(x/y) < 1e-6) {\n"
+  "                vtrap = y*(1 - x/y/2)\n"
+  "        }else{\n"
+  "                vtrap = x/(exp(x/y) - 1)\n"
+  "        }\n"
+  "}\n"
+  " \n"
+  "UNITSON\n"
+  ;
+#endif
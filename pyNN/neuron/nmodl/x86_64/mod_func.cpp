@@ -0,0 +1,97 @@
+#include <stdio.h>
+#include "hocdec.h"
+extern int nrnmpi_myid;
+extern int nrn_nobanner_;
+#if defined(__cplusplus)
+extern "C" {
+#endif
+
+extern void _adexp_reg(void);
+extern void _alphaisyn_reg(void);
+extern void _alphasyn_reg(void);
+extern void _expisyn_reg(void);
+extern void _gammastim_reg(void);
+extern void _gap_reg(void);
+extern void _gif_reg(void);
+extern void _gsfa_grr_reg(void);
+extern void _hh_traub_reg(void);
+extern void _izhikevich_reg(void);
+extern void _netstim2_reg(void);
+extern void _poisson_stim_refractory_reg(void);
+extern void _quantal_stp_reg(void);
+extern void _refrac_reg(void);
+extern void _reset_reg(void);
+extern void _stdwa_guetig_reg(void);
+extern void _stdwa_softlimits_reg(void);
+extern void _stdwa_songabbott_reg(void);
+extern void _stdwa_symm_reg(void);
+extern void _stdwa_vogels2011_reg(void);
+extern void _stochastic_synapse_reg(void);
+extern void _stochastic_tsodyksmarkram_reg(void);
+extern void _tmgsyn_reg(void);
+extern void _tmisyn_reg(void);
+extern void _tsodyksmarkram_reg(void);
+extern void _vecstim_reg(void);
+
+void modl_reg() {
+  if (!nrn_nobanner_) if (nrnmpi_myid < 1) {
+    fprintf(stderr, "Additional mechanisms from files\n");
+    fprintf(stderr, " \"adexp.mod\"");
+    fprintf(stderr, " \"alphaisyn.mod\"");
+    fprintf(stderr, " \"alphasyn.mod\"");
+    fprintf(stderr, " \"expisyn.mod\"");
+    fprintf(stderr, " \"gammastim.mod\"");
+    fprintf(stderr, " \"gap.mod\"");
+    fprintf(stderr, " \"gif.mod\"");
+    fprintf(stderr, " \"gsfa_grr.mod\"");
+    fprintf(stderr, " \"hh_traub.mod\"");
+    fprintf(stderr, " \"izhikevich.mod\"");
+    fprintf(stderr, " \"netstim2.mod\"");
+    fprintf(stderr, " \"poisson_stim_refractory.mod\"");
+    fprintf(stderr, " \"quantal_stp.mod\"");
+    fprintf(stderr, " \"refrac.mod\"");
+    fprintf(stderr, " \"reset.mod\"");
+    fprintf(stderr, " \"stdwa_guetig.mod\"");
+    fprintf(stderr, " \"stdwa_softlimits.mod\"");
+    fprintf(stderr, " \"stdwa_songabbott.mod\"");
+    fprintf(stderr, " \"stdwa_symm.mod\"");
+    fprintf(stderr, " \"stdwa_vogels2011.mod\"");
+    fprintf(stderr, " \"stochastic_synapse.mod\"");
+    fprintf(stderr, " \"stochastic_tsodyksmarkram.mod\"");
+    fprintf(stderr, " \"tmgsyn.mod\"");
+    fprintf(stderr, " \"tmisyn.mod\"");
+    fprintf(stderr, " \"tsodyksmarkram.mod\"");
+    fprintf(stderr, " \"vecstim.mod\"");
+    fprintf(stderr, "\n");
+  }
+  _adexp_reg();
+  _alphaisyn_reg();
+  _alphasyn_reg();
+  _expisyn_reg();
+  _gammastim_reg();
+  _gap_reg();
+  _gif_reg();
+  _gsfa_grr_reg();
+  _hh_traub_reg();
+  _izhikevich_reg();
+  _netstim2_reg();
+  _poisson_stim_refractory_reg();
+  _quantal_stp_reg();
+  _refrac_reg();
+  _reset_reg();
+  _stdwa_guetig_reg();
+  _stdwa_softlimits_reg();
+  _stdwa_songabbott_reg();
+  _stdwa_symm_reg();
+  _stdwa_vogels2011_reg();
+  _stochastic_synapse_reg();
+  _stochastic_tsodyksmarkram_reg();
+  _tmgsyn_reg();
+  _tmisyn_reg();
+  _tsodyksmarkram_reg();
+  _vecstim_reg();
+}
+
+#if defined(__cplusplus)
+}
+#endif
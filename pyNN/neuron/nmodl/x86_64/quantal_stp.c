@@ -0,0 +1,550 @@
+/* Created by Language version: 7.7.0 */
+/* NOT VECTORIZED */
+#define NRN_VECTORIZED 0
+#include <stdio.h>
+#include <stdlib.h>
+#include <math.h>
+#include "mech_api.h"
+#undef PI
+#define nil 0
+#include "md1redef.h"
+#include "section.h"
+#include "nrniv_mf.h"
+#include "md2redef.h"
+ 
+#if METHOD3
+extern int _method3;
+#endif
+
+#if !NRNGPU
+#undef exp
+#define exp hoc_Exp
+extern double hoc_Exp(double);
+#endif
+ 
+#define nrn_init _nrn_init__QuantalSTPWA
+#define _nrn_initial _nrn_initial__QuantalSTPWA
+#define nrn_cur _nrn_cur__QuantalSTPWA
+#define _nrn_current _nrn_current__QuantalSTPWA
+#define nrn_jacob _nrn_jacob__QuantalSTPWA
+#define nrn_state _nrn_state__QuantalSTPWA
+#define _net_receive _net_receive__QuantalSTPWA 
+#define setRNG setRNG__QuantalSTPWA 
+ 
+#define _threadargscomma_ /**/
+#define _threadargsprotocomma_ /**/
+#define _threadargs_ /**/
+#define _threadargsproto_ /**/
+ 	/*SUPPRESS 761*/
+	/*SUPPRESS 762*/
+	/*SUPPRESS 763*/
+	/*SUPPRESS 765*/
+	 extern double *getarg(int);
+ static double *_p; static Datum *_ppvar;
+ 
+#define t nrn_threads->_t
+#define dt nrn_threads->_dt
+#define tau_rec _p[0]
+#define tau_rec_columnindex 0
+#define tau_fac _p[1]
+#define tau_fac_columnindex 1
+#define U _p[2]
+#define U_columnindex 2
+#define u0 _p[3]
+#define u0_columnindex 3
+#define n _p[4]
+#define n_columnindex 4
+#define u _p[5]
+#define u_columnindex 5
+#define _tsav _p[6]
+#define _tsav_columnindex 6
+#define _nd_area  *_ppvar[0]._pval
+#define wsyn	*_ppvar[2]._pval
+#define _p_wsyn	_ppvar[2]._pval
+#define rng	*_ppvar[3]._pval
+#define _p_rng	_ppvar[3]._pval
+ 
+#if MAC
+#if !defined(v)
+#define v _mlhv
+#endif
+#if !defined(h)
+#define h _mlhh
+#endif
+#endif
+ 
+#if defined(__cplusplus)
+extern "C" {
+#endif
+ static int hoc_nrnpointerindex =  2;
+ /* external NEURON variables */
+ /* declaration of user functions */
+ static double _hoc_setRNG(void*);
+ static double _hoc_urand(void*);
+ static int _mechtype;
+extern void _nrn_cacheloop_reg(int, int);
+extern void hoc_register_prop_size(int, int, int);
+extern void hoc_register_limits(int, HocParmLimits*);
+extern void hoc_register_units(int, HocParmUnits*);
+extern void nrn_promote(Prop*, int, int);
+extern Memb_func* memb_func;
+ 
+#define NMODL_TEXT 1
+#if NMODL_TEXT
+static const char* nmodl_file_text;
+static const char* nmodl_filename;
+extern void hoc_reg_nmodl_text(int, const char*);
+extern void hoc_reg_nmodl_filename(int, const char*);
+#endif
+
+ extern Prop* nrn_point_prop_;
+ static int _pointtype;
+ static void* _hoc_create_pnt(Object* _ho) { void* create_point_process(int, Object*);
+ return create_point_process(_pointtype, _ho);
+}
+ static void _hoc_destroy_pnt(void*);
+ static double _hoc_loc_pnt(void* _vptr) {double loc_point_process(int, void*);
+ return loc_point_process(_pointtype, _vptr);
+}
+ static double _hoc_has_loc(void* _vptr) {double has_loc_point(void*);
+ return has_loc_point(_vptr);
+}
+ static double _hoc_get_loc_pnt(void* _vptr) {
+ double get_loc_point_process(void*); return (get_loc_point_process(_vptr));
+}
+ extern void _nrn_setdata_reg(int, void(*)(Prop*));
+ static void _setdata(Prop* _prop) {
+ _p = _prop->param; _ppvar = _prop->dparam;
+ }
+ static void _hoc_setdata(void* _vptr) { Prop* _prop;
+ _prop = ((Point_process*)_vptr)->_prop;
+   _setdata(_prop);
+ }
+ /* connect user functions to hoc names */
+ static VoidFunc hoc_intfunc[] = {
+ 0,0
+};
+ static Member_func _member_func[] = {
+ "loc", _hoc_loc_pnt,
+ "has_loc", _hoc_has_loc,
+ "get_loc", _hoc_get_loc_pnt,
+ "setRNG", _hoc_setRNG,
+ "urand", _hoc_urand,
+ 0, 0
+};
+#define urand urand_QuantalSTPWA
+ extern double urand( );
+ /* declare global and static user variables */
+ /* some parameters have upper and lower limits */
+ static HocParmLimits _hoc_parm_limits[] = {
+ "U", 0, 1,
+ "u0", 0, 1,
+ 0,0,0
+};
+ static HocParmUnits _hoc_parm_units[] = {
+ "tau_rec", "ms",
+ "tau_fac", "ms",
+ "U", "1",
+ "u0", "1",
+ 0,0
+};
+ static double v = 0;
+ /* connect global user variables to hoc */
+ static DoubScal hoc_scdoub[] = {
+ 0,0
+};
+ static DoubVec hoc_vdoub[] = {
+ 0,0,0
+};
+ static double _sav_indep;
+ static void nrn_alloc(Prop*);
+static void  nrn_init(NrnThread*, _Memb_list*, int);
+static void nrn_state(NrnThread*, _Memb_list*, int);
+ static void _hoc_destroy_pnt(void* _vptr) {
+   destroy_point_process(_vptr);
+}
+ /* connect range variables in _p that hoc is supposed to know about */
+ static const char *_mechanism[] = {
+ "7.7.0",
+"QuantalSTPWA",
+ "tau_rec",
+ "tau_fac",
+ "U",
+ "u0",
+ "n",
+ 0,
+ 0,
+ 0,
+ "wsyn",
+ "rng",
+ 0};
+ 
+extern Prop* need_memb(Symbol*);
+
+static void nrn_alloc(Prop* _prop) {
+	Prop *prop_ion;
+	double *_p; Datum *_ppvar;
+  if (nrn_point_prop_) {
+	_prop->_alloc_seq = nrn_point_prop_->_alloc_seq;
+	_p = nrn_point_prop_->param;
+	_ppvar = nrn_point_prop_->dparam;
+ }else{
+ 	_p = nrn_prop_data_alloc(_mechtype, 7, _prop);
+ 	/*initialize range parameters*/
+ 	tau_rec = 800;
+ 	tau_fac = 0;
+ 	U = 0.5;
+ 	u0 = 0.5;
+ 	n = 1;
+  }
+ 	_prop->param = _p;
+ 	_prop->param_size = 7;
+  if (!nrn_point_prop_) {
+ 	_ppvar = nrn_prop_datum_alloc(_mechtype, 4, _prop);
+  }
+ 	_prop->dparam = _ppvar;
+ 	/*connect ionic variables to this model*/
+ 
+}
+ static void _initlists();
+ static void _net_receive(Point_process*, double*, double);
+ static void _net_init(Point_process*, double*, double);
+ extern Symbol* hoc_lookup(const char*);
+extern void _nrn_thread_reg(int, int, void(*)(Datum*));
+extern void _nrn_thread_table_reg(int, void(*)(double*, Datum*, Datum*, NrnThread*, int));
+extern void hoc_register_tolerance(int, HocStateTolerance*, Symbol***);
+extern void _cvode_abstol( Symbol**, double*, int);
+
+ void _quantal_stp_reg() {
+	int _vectorized = 0;
+  _initlists();
+ 	_pointtype = point_register_mech(_mechanism,
+	 nrn_alloc,(void*)0, (void*)0, (void*)0, nrn_init,
+	 hoc_nrnpointerindex, 0,
+	 _hoc_create_pnt, _hoc_destroy_pnt, _member_func);
+ _mechtype = nrn_get_mechtype(_mechanism[1]);
+     _nrn_setdata_reg(_mechtype, _setdata);
+ #if NMODL_TEXT
+  hoc_reg_nmodl_text(_mechtype, nmodl_file_text);
+  hoc_reg_nmodl_filename(_mechtype, nmodl_filename);
+#endif
+  hoc_register_prop_size(_mechtype, 7, 4);
+  hoc_register_dparam_semantics(_mechtype, 0, "area");
+  hoc_register_dparam_semantics(_mechtype, 1, "pntproc");
+  hoc_register_dparam_semantics(_mechtype, 2, "pointer");
+  hoc_register_dparam_semantics(_mechtype, 3, "pointer");
+ pnt_receive[_mechtype] = _net_receive;
+ pnt_receive_init[_mechtype] = _net_init;
+ pnt_receive_size[_mechtype] = 3;
+ 	hoc_register_var(hoc_scdoub, hoc_vdoub, hoc_intfunc);
+ 	ivoc_help("help ?1 QuantalSTPWA /root/package/pyNN/neuron/nmodl/quantal_stp.mod\n");
+ hoc_register_limits(_mechtype, _hoc_parm_limits);
+ hoc_register_units(_mechtype, _hoc_parm_units);
+ }
+static int _reset;
+static char *modelname = "";
+
+static int error;
+static int _ninits = 0;
+static int _match_recurse=1;
+static void _modl_cleanup(){ _match_recurse=1;}
+static int setRNG();
+ 
+static void _net_receive (Point_process* _pnt, double* _args, double _lflag) 
+{    _p = _pnt->_prop->param; _ppvar = _pnt->_prop->dparam;
+  if (_tsav > t){ extern char* hoc_object_name(Object*); hoc_execerror(hoc_object_name(_pnt->ob), ":Event arrived out of order. Must call ParallelContext.set_maxstep AFTER assigning minimum NetCon.delay");}
+ _tsav = t; {
+   double _ldepleted , _lrv , _lp_decay , _lu_decay , _ln_release , _li ;
+ _lp_decay = exp ( - ( t - _args[2] ) / tau_rec ) ;
+   if ( tau_fac < 1e-10 ) {
+     _lu_decay = 0.0 ;
+     }
+   else {
+     _lu_decay = exp ( - ( t - _args[2] ) / tau_fac ) ;
+     }
+   u = U + u * ( 1.0 - U ) * _lu_decay ;
+   _ldepleted = n - _args[1] ;
+   while ( _ldepleted > 0.0 ) {
+     _lrv = urand ( _threadargs_ ) ;
+     if ( _lrv < ( 1.0 - _lp_decay ) ) {
+       _args[1] = _args[1] + 1.0 ;
+       }
+     _ldepleted = _ldepleted - 1.0 ;
+     }
+   _ln_release = 0.0 ;
+   _li = _args[1] ;
+   while ( _li > 0.0 ) {
+     _lrv = urand ( _threadargs_ ) ;
+     if ( _lrv < u ) {
+       _ln_release = _ln_release + 1.0 ;
+       }
+     _li = _li - 1.0 ;
+     }
+   if ( _ln_release > 0.0 ) {
+     wsyn = _ln_release / n * _args[0] ;
+     _args[1] = _args[1] - _ln_release ;
+     }
+   else {
+     wsyn = 0.0 ;
+     }
+   _args[2] = t ;
+   } }
+ 
+static void _net_init(Point_process* _pnt, double* _args, double _lflag) {
+       _p = _pnt->_prop->param; _ppvar = _pnt->_prop->dparam;
+ _args[1] = n ;
+   _args[2] = - 1e99 ;
+   }
+ 
+/*VERBATIM*/
+double nrn_random_pick(void* r);
+void* nrn_random_arg(int argpos);
+ 
+static int  setRNG (  ) {
+   
+/*VERBATIM*/
+    {
+        void** pv = (void**)(&_p_rng);
+        if( ifarg(1)) {
+            *pv = nrn_random_arg(1);
+        } else {
+            *pv = (void*)0;
+        }
+    }
+  return 0; }
+ 
+static double _hoc_setRNG(void* _vptr) {
+ double _r;
+    _hoc_setdata(_vptr);
+ _r = 1.;
+ setRNG (  );
+ return(_r);
+}
+ 
+double urand (  ) {
+   double _lurand;
+ 
+/*VERBATIM*/
+        double value;
+        if (_p_rng) {
+            /*
+            :Supports separate independent but reproducible streams for
+            : each instance. However, the corresponding hoc Random
+            : distribution MUST be set to Random.negexp(1)
+            */
+            value = nrn_random_pick(_p_rng);
+            //printf("random stream for this simulation = %lf\n",value);
+            return value;
+        } else {
+ value = scop_random ( 1.0 ) ;
+   
+/*VERBATIM*/
+        }
+ _lurand = value ;
+   
+return _lurand;
+ }
+ 
+static double _hoc_urand(void* _vptr) {
+ double _r;
+    _hoc_setdata(_vptr);
+ _r =  urand (  );
+ return(_r);
+}
+
+static void initmodel() {
+  int _i; double _save;_ninits++;
+{
+ {
+   u = u0 ;
+   }
+
+}
+}
+
+static void nrn_init(NrnThread* _nt, _Memb_list* _ml, int _type){
+Node *_nd; double _v; int* _ni; int _iml, _cntml;
+#if CACHEVEC
+    _ni = _ml->_nodeindices;
+#endif
+_cntml = _ml->_nodecount;
+for (_iml = 0; _iml < _cntml; ++_iml) {
+ _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+ _tsav = -1e20;
+#if CACHEVEC
+  if (use_cachevec) {
+    _v = VEC_V(_ni[_iml]);
+  }else
+#endif
+  {
+    _nd = _ml->_nodelist[_iml];
+    _v = NODEV(_nd);
+  }
+ v = _v;
+ initmodel();
+}}
+
+static double _nrn_current(double _v){double _current=0.;v=_v;{
+} return _current;
+}
+
+static void nrn_state(NrnThread* _nt, _Memb_list* _ml, int _type){
+Node *_nd; double _v = 0.0; int* _ni; int _iml, _cntml;
+#if CACHEVEC
+    _ni = _ml->_nodeindices;
+#endif
+_cntml = _ml->_nodecount;
+for (_iml = 0; _iml < _cntml; ++_iml) {
+ _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+ _nd = _ml->_nodelist[_iml];
+#if CACHEVEC
+  if (use_cachevec) {
+    _v = VEC_V(_ni[_iml]);
+  }else
+#endif
+  {
+    _nd = _ml->_nodelist[_iml];
+    _v = NODEV(_nd);
+  }
+ v=_v;
+{
+}}
+
+}
+
+static void terminal(){}
+
+static void _initlists() {
+ int _i; static int _first = 1;
+  if (!_first) return;
+_first = 0;
+}
+
+#if NMODL_TEXT
+static const char* nmodl_filename = "/root/package/pyNN/neuron/nmodl/quantal_stp.mod";
+static const char* nmodl_file_text = 
+  "COMMENT\n"
+  "Implementation of the NEST quantal_stp_connection model for NEURON\n"
+  "\n"
+  "Original NEST version by Marc-Oliver Gewaltig\n"
+  "Adapted to NMODL by Andrew Davison, UNIC, CNRS, 2016.\n"
+  "ENDCOMMENT\n"
+  "\n"
+  "NEURON {\n"
+  "    POINT_PROCESS QuantalSTPWA\n"
+  "    RANGE tau_rec, tau_fac, U, u0, n\n"
+  "    POINTER wsyn, rng\n"
+  "}\n"
+  "\n"
+  "PARAMETER {\n"
+  "    tau_rec = 800  (ms)         : time constant for depression\n"
+  "    tau_fac = 0    (ms)         : time constant for facilitation\n"
+  "    U       = 0.5  (1) <0, 1>   : maximal fraction of available resource\n"
+  "    u0      = 0.5  (1) <0, 1>   : initial available fraction of resources\n"
+  "	n       = 1                 : total number of release sites\n"
+  "}\n"
+  "\n"
+  "ASSIGNED {\n"
+  "    u (1)        : available fraction of resources\n"
+  "    wsyn         : transmitted synaptic weight\n"
+  "    rng\n"
+  "}\n"
+  "\n"
+  "INITIAL {\n"
+  "    u = u0\n"
+  "}\n"
+  "\n"
+  "NET_RECEIVE(w, available, t_last (ms)) {\n"
+  "    : available - number of available release sites\n"
+  "    : t_last - time of the last spike\n"
+  "\n"
+  "    LOCAL depleted, rv, p_decay, u_decay, n_release, i\n"
+  "\n"
+  "    INITIAL{\n"
+  "        available = n\n"
+  "		t_last = -1e99\n"
+  "    }\n"
+  "\n"
+  "    : Compute the decay factors, based on the time since the last spike.\n"
+  "    p_decay = exp(-(t - t_last)/tau_rec)\n"
+  "    if (tau_fac < 1e-10) {\n"
+  "        u_decay = 0.0\n"
+  "	} else {\n"
+  "		u_decay = exp( -(t - t_last)/tau_fac)\n"
+  "    }\n"
+  "\n"
+  "    : Compute release probability\n"
+  "    u = U + u*(1 - U)*u_decay\n"
+  "\n"
+  "    : Compute number of sites that recovered during the interval.\n"
+  "    depleted = n - available\n"
+  "    while (depleted > 0) {\n"
+  "        rv = urand()\n"
+  "        if (rv < (1 - p_decay)) {\n"
+  "            available = available + 1\n"
+  "		}\n"
+  "        depleted = depleted - 1\n"
+  "    }\n"
+  "\n"
+  "    : Compute number of released sites\n"
+  "    n_release = 0\n"
+  "    i = available\n"
+  "    while (i > 0) {\n"
+  "        rv = urand()\n"
+  "		if (rv < u) {\n"
+  "            n_release = n_release + 1\n"
+  "        }\n"
+  "        i = i - 1\n"
+  "    }\n"
+  "\n"
+  "    if (n_release > 0) {\n"
+  "		wsyn = n_release/n * w\n"
+  "        available = available - n_release\n"
+  "    } else {\n"
+  "		wsyn = 0\n"
+  "    }\n"
+  "	t_last = t\n"
+  "}\n"
+  "\n"
+  "VERBATIM\n"
+  "double nrn_random_pick(void* r);\n"
+  "void* nrn_random_arg(int argpos);\n"
+  "ENDVERBATIM\n"
+  "\n"
+  "PROCEDURE setRNG() {\n"
+  "    : This function takes a NEURON Random object declared in hoc and makes it usable by this mod file\n"
+  "    : The Random must be in uniform(1) mode\n"
+  "VERBATIM\n"
+  "    {\n"
+  "        void** pv = (void**)(&_p_rng);\n"
+  "        if( ifarg(1)) {\n"
+  "            *pv = nrn_random_arg(1);\n"
+  "        } else {\n"
+  "            *pv = (void*)0;\n"
+  "        }\n"
+  "    }\n"
+  "ENDVERBATIM\n"
+  "}\n"
+  "\n"
+  "FUNCTION urand() {\n"
+  "VERBATIM\n"
+  "        double value;\n"
+  "        if (_p_rng) {\n"
+  "            /*\n"
+  "            :Supports separate independent but reproducible streams for\n"
+  "            : each instance. However, the corresponding hoc Random\n"
+  "            : distribution MUST be set to Random.negexp(1)\n"
+  "            */\n"
+  "            value = nrn_random_pick(_p_rng);\n"
+  "            //printf(\"random stream for this simulation = %lf\\n\",value);\n"
+  "            return value;\n"
+  "        } else {\n"
+  "ENDVERBATIM\n"
+  "            value = scop_random(1)\n"
+  "VERBATIM\n"
+  "        }\n"
+  "ENDVERBATIM\n"
+  "        urand = value\n"
+  "}\n"
+  ;
+#endif
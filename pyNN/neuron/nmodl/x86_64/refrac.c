@@ -0,0 +1,503 @@
+/* Created by Language version: 7.7.0 */
+/* VECTORIZED */
+#define NRN_VECTORIZED 1
+#include <stdio.h>
+#include <stdlib.h>
+#include <math.h>
+#include "mech_api.h"
+#undef PI
+#define nil 0
+#include "md1redef.h"
+#include "section.h"
+#include "nrniv_mf.h"
+#include "md2redef.h"
+ 
+#if METHOD3
+extern int _method3;
+#endif
+
+#if !NRNGPU
+#undef exp
+#define exp hoc_Exp
+extern double hoc_Exp(double);
+#endif
+ 
+#define nrn_init _nrn_init__ResetRefrac
+#define _nrn_initial _nrn_initial__ResetRefrac
+#define nrn_cur _nrn_cur__ResetRefrac
+#define _nrn_current _nrn_current__ResetRefrac
+#define nrn_jacob _nrn_jacob__ResetRefrac
+#define nrn_state _nrn_state__ResetRefrac
+#define _net_receive _net_receive__ResetRefrac 
+ 
+#define _threadargscomma_ _p, _ppvar, _thread, _nt,
+#define _threadargsprotocomma_ double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt,
+#define _threadargs_ _p, _ppvar, _thread, _nt
+#define _threadargsproto_ double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt
+ 	/*SUPPRESS 761*/
+	/*SUPPRESS 762*/
+	/*SUPPRESS 763*/
+	/*SUPPRESS 765*/
+	 extern double *getarg(int);
+ /* Thread safe. No static _p or _ppvar. */
+ 
+#define t _nt->_t
+#define dt _nt->_dt
+#define vthresh _p[0]
+#define vthresh_columnindex 0
+#define vreset _p[1]
+#define vreset_columnindex 1
+#define vspike _p[2]
+#define vspike_columnindex 2
+#define trefrac _p[3]
+#define trefrac_columnindex 3
+#define i _p[4]
+#define i_columnindex 4
+#define g _p[5]
+#define g_columnindex 5
+#define refractory _p[6]
+#define refractory_columnindex 6
+#define v _p[7]
+#define v_columnindex 7
+#define _g _p[8]
+#define _g_columnindex 8
+#define _tsav _p[9]
+#define _tsav_columnindex 9
+#define _nd_area  *_ppvar[0]._pval
+ 
+#if MAC
+#if !defined(v)
+#define v _mlhv
+#endif
+#if !defined(h)
+#define h _mlhh
+#endif
+#endif
+ 
+#if defined(__cplusplus)
+extern "C" {
+#endif
+ static int hoc_nrnpointerindex =  -1;
+ static Datum* _extcall_thread;
+ static Prop* _extcall_prop;
+ /* external NEURON variables */
+ /* declaration of user functions */
+ static int _mechtype;
+extern void _nrn_cacheloop_reg(int, int);
+extern void hoc_register_prop_size(int, int, int);
+extern void hoc_register_limits(int, HocParmLimits*);
+extern void hoc_register_units(int, HocParmUnits*);
+extern void nrn_promote(Prop*, int, int);
+extern Memb_func* memb_func;
+ 
+#define NMODL_TEXT 1
+#if NMODL_TEXT
+static const char* nmodl_file_text;
+static const char* nmodl_filename;
+extern void hoc_reg_nmodl_text(int, const char*);
+extern void hoc_reg_nmodl_filename(int, const char*);
+#endif
+
+ extern Prop* nrn_point_prop_;
+ static int _pointtype;
+ static void* _hoc_create_pnt(Object* _ho) { void* create_point_process(int, Object*);
+ return create_point_process(_pointtype, _ho);
+}
+ static void _hoc_destroy_pnt(void*);
+ static double _hoc_loc_pnt(void* _vptr) {double loc_point_process(int, void*);
+ return loc_point_process(_pointtype, _vptr);
+}
+ static double _hoc_has_loc(void* _vptr) {double has_loc_point(void*);
+ return has_loc_point(_vptr);
+}
+ static double _hoc_get_loc_pnt(void* _vptr) {
+ double get_loc_point_process(void*); return (get_loc_point_process(_vptr));
+}
+ extern void _nrn_setdata_reg(int, void(*)(Prop*));
+ static void _setdata(Prop* _prop) {
+ _extcall_prop = _prop;
+ }
+ static void _hoc_setdata(void* _vptr) { Prop* _prop;
+ _prop = ((Point_process*)_vptr)->_prop;
+   _setdata(_prop);
+ }
+ /* connect user functions to hoc names */
+ static VoidFunc hoc_intfunc[] = {
+ 0,0
+};
+ static Member_func _member_func[] = {
+ "loc", _hoc_loc_pnt,
+ "has_loc", _hoc_has_loc,
+ "get_loc", _hoc_get_loc_pnt,
+ 0, 0
+};
+ /* declare global and static user variables */
+#define g_on g_on_ResetRefrac
+ double g_on = 1e+12;
+#define spikewidth spikewidth_ResetRefrac
+ double spikewidth = 1e-12;
+ /* some parameters have upper and lower limits */
+ static HocParmLimits _hoc_parm_limits[] = {
+ 0,0,0
+};
+ static HocParmUnits _hoc_parm_units[] = {
+ "g_on_ResetRefrac", "uS",
+ "spikewidth_ResetRefrac", "ms",
+ "vthresh", "mV",
+ "vreset", "mV",
+ "vspike", "mV",
+ "trefrac", "ms",
+ "i", "nA",
+ 0,0
+};
+ /* connect global user variables to hoc */
+ static DoubScal hoc_scdoub[] = {
+ "g_on_ResetRefrac", &g_on_ResetRefrac,
+ "spikewidth_ResetRefrac", &spikewidth_ResetRefrac,
+ 0,0
+};
+ static DoubVec hoc_vdoub[] = {
+ 0,0,0
+};
+ static double _sav_indep;
+ static void nrn_alloc(Prop*);
+static void  nrn_init(NrnThread*, _Memb_list*, int);
+static void nrn_state(NrnThread*, _Memb_list*, int);
+ static void nrn_cur(NrnThread*, _Memb_list*, int);
+static void  nrn_jacob(NrnThread*, _Memb_list*, int);
+ 
+#define _watch_array _ppvar + 3 
+ static void _watch_alloc(Datum*);
+ extern void hoc_reg_watch_allocate(int, void(*)(Datum*)); static void _hoc_destroy_pnt(void* _vptr) {
+   Prop* _prop = ((Point_process*)_vptr)->_prop;
+   if (_prop) { _nrn_free_watch(_prop->dparam, 3, 2);}
+   destroy_point_process(_vptr);
+}
+ /* connect range variables in _p that hoc is supposed to know about */
+ static const char *_mechanism[] = {
+ "7.7.0",
+"ResetRefrac",
+ "vthresh",
+ "vreset",
+ "vspike",
+ "trefrac",
+ 0,
+ "i",
+ 0,
+ 0,
+ 0};
+ 
+extern Prop* need_memb(Symbol*);
+
+static void nrn_alloc(Prop* _prop) {
+	Prop *prop_ion;
+	double *_p; Datum *_ppvar;
+  if (nrn_point_prop_) {
+	_prop->_alloc_seq = nrn_point_prop_->_alloc_seq;
+	_p = nrn_point_prop_->param;
+	_ppvar = nrn_point_prop_->dparam;
+ }else{
+ 	_p = nrn_prop_data_alloc(_mechtype, 10, _prop);
+ 	/*initialize range parameters*/
+ 	vthresh = -50;
+ 	vreset = -60;
+ 	vspike = 40;
+ 	trefrac = 1;
+  }
+ 	_prop->param = _p;
+ 	_prop->param_size = 10;
+  if (!nrn_point_prop_) {
+ 	_ppvar = nrn_prop_datum_alloc(_mechtype, 5, _prop);
+  }
+ 	_prop->dparam = _ppvar;
+ 	/*connect ionic variables to this model*/
+ 
+}
+ static void _initlists();
+ 
+#define _tqitem &(_ppvar[2]._pvoid)
+ static void _net_receive(Point_process*, double*, double);
+ extern Symbol* hoc_lookup(const char*);
+extern void _nrn_thread_reg(int, int, void(*)(Datum*));
+extern void _nrn_thread_table_reg(int, void(*)(double*, Datum*, Datum*, NrnThread*, int));
+extern void hoc_register_tolerance(int, HocStateTolerance*, Symbol***);
+extern void _cvode_abstol( Symbol**, double*, int);
+
+ void _refrac_reg() {
+	int _vectorized = 1;
+  _initlists();
+ 	_pointtype = point_register_mech(_mechanism,
+	 nrn_alloc,nrn_cur, nrn_jacob, nrn_state, nrn_init,
+	 hoc_nrnpointerindex, 1,
+	 _hoc_create_pnt, _hoc_destroy_pnt, _member_func);
+ _mechtype = nrn_get_mechtype(_mechanism[1]);
+     _nrn_setdata_reg(_mechtype, _setdata);
+ #if NMODL_TEXT
+  hoc_reg_nmodl_text(_mechtype, nmodl_file_text);
+  hoc_reg_nmodl_filename(_mechtype, nmodl_filename);
+#endif
+  hoc_register_prop_size(_mechtype, 10, 5);
+  hoc_reg_watch_allocate(_mechtype, _watch_alloc);
+  hoc_register_dparam_semantics(_mechtype, 0, "area");
+  hoc_register_dparam_semantics(_mechtype, 1, "pntproc");
+  hoc_register_dparam_semantics(_mechtype, 2, "netsend");
+  hoc_register_dparam_semantics(_mechtype, 3, "watch");
+  hoc_register_dparam_semantics(_mechtype, 4, "watch");
+ add_nrn_has_net_event(_mechtype);
+ pnt_receive[_mechtype] = _net_receive;
+ pnt_receive_size[_mechtype] = 1;
+ 	hoc_register_var(hoc_scdoub, hoc_vdoub, hoc_intfunc);
+ 	ivoc_help("help ?1 ResetRefrac /root/package/pyNN/neuron/nmodl/refrac.mod\n");
+ hoc_register_limits(_mechtype, _hoc_parm_limits);
+ hoc_register_units(_mechtype, _hoc_parm_units);
+ }
+static int _reset;
+static char *modelname = "";
+
+static int error;
+static int _ninits = 0;
+static int _match_recurse=1;
+static void _modl_cleanup(){ _match_recurse=1;}
+ 
+static double _watch1_cond(Point_process* _pnt) {
+ 	double* _p; Datum* _ppvar; Datum* _thread; NrnThread* _nt;
+	_thread= (Datum*)0; _nt = (NrnThread*)_pnt->_vnt;
+ 	_p = _pnt->_prop->param; _ppvar = _pnt->_prop->dparam;
+	v = NODEV(_pnt->node);
+	return  ( v ) - ( vthresh ) ;
+}
+ 
+static void _net_receive (Point_process* _pnt, double* _args, double _lflag) 
+{  double* _p; Datum* _ppvar; Datum* _thread; NrnThread* _nt;
+   int _watch_rm = 0;
+   _thread = (Datum*)0; _nt = (NrnThread*)_pnt->_vnt;   _p = _pnt->_prop->param; _ppvar = _pnt->_prop->dparam;
+  if (_tsav > t){ extern char* hoc_object_name(Object*); hoc_execerror(hoc_object_name(_pnt->ob), ":Event arrived out of order. Must call ParallelContext.set_maxstep AFTER assigning minimum NetCon.delay");}
+ _tsav = t;  v = NODEV(_pnt->node);
+   if (_lflag == 1. ) {*(_tqitem) = 0;}
+ {
+   if ( _lflag  == 1.0 ) {
+     g = g_on ;
+       v = vspike  ;
+     net_send ( _tqitem, _args, _pnt, t +  spikewidth , 2.0 ) ;
+     net_event ( _pnt, t ) ;
+     }
+   else if ( _lflag  == 2.0 ) {
+       v = vreset  ;
+     if ( trefrac > spikewidth ) {
+       net_send ( _tqitem, _args, _pnt, t +  trefrac - spikewidth , 3.0 ) ;
+       }
+     else {
+       g = 0.0 ;
+       }
+     }
+   else if ( _lflag  == 3.0 ) {
+       v = vreset  ;
+     g = 0.0 ;
+     }
+   else if ( _lflag  == 4.0 ) {
+       _nrn_watch_activate(_watch_array, _watch1_cond, 1, _pnt, _watch_rm++, 1.0);
+ }
+   } 
+ NODEV(_pnt->node) = v;
+ }
+ 
+static void _watch_alloc(Datum* _ppvar) {
+  Point_process* _pnt = (Point_process*)_ppvar[1]._pvoid;
+   _nrn_watch_allocate(_watch_array, _watch1_cond, 1, _pnt, 1.0);
+ }
+
+
+static void initmodel(double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt) {
+  int _i; double _save;{
+ {
+   g = 0.0 ;
+   net_send ( _tqitem, (double*)0, _ppvar[1]._pvoid, t +  0.0 , 4.0 ) ;
+   }
+
+}
+}
+
+static void nrn_init(NrnThread* _nt, _Memb_list* _ml, int _type){
+double* _p; Datum* _ppvar; Datum* _thread;
+Node *_nd; double _v; int* _ni; int _iml, _cntml;
+#if CACHEVEC
+    _ni = _ml->_nodeindices;
+#endif
+_cntml = _ml->_nodecount;
+_thread = _ml->_thread;
+for (_iml = 0; _iml < _cntml; ++_iml) {
+ _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+ _tsav = -1e20;
+#if CACHEVEC
+  if (use_cachevec) {
+    _v = VEC_V(_ni[_iml]);
+  }else
+#endif
+  {
+    _nd = _ml->_nodelist[_iml];
+    _v = NODEV(_nd);
+  }
+ v = _v;
+ initmodel(_p, _ppvar, _thread, _nt);
+}
+}
+
+static double _nrn_current(double* _p, Datum* _ppvar, Datum* _thread, NrnThread* _nt, double _v){double _current=0.;v=_v;{ {
+   i = g * ( v - vreset ) ;
+   }
+ _current += i;
+
+} return _current;
+}
+
+static void nrn_cur(NrnThread* _nt, _Memb_list* _ml, int _type) {
+double* _p; Datum* _ppvar; Datum* _thread;
+Node *_nd; int* _ni; double _rhs, _v; int _iml, _cntml;
+#if CACHEVEC
+    _ni = _ml->_nodeindices;
+#endif
+_cntml = _ml->_nodecount;
+_thread = _ml->_thread;
+for (_iml = 0; _iml < _cntml; ++_iml) {
+ _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+#if CACHEVEC
+  if (use_cachevec) {
+    _v = VEC_V(_ni[_iml]);
+  }else
+#endif
+  {
+    _nd = _ml->_nodelist[_iml];
+    _v = NODEV(_nd);
+  }
+ _g = _nrn_current(_p, _ppvar, _thread, _nt, _v + .001);
+ 	{ _rhs = _nrn_current(_p, _ppvar, _thread, _nt, _v);
+ 	}
+ _g = (_g - _rhs)/.001;
+ _g *=  1.e2/(_nd_area);
+ _rhs *= 1.e2/(_nd_area);
+#if CACHEVEC
+  if (use_cachevec) {
+	VEC_RHS(_ni[_iml]) -= _rhs;
+  }else
+#endif
+  {
+	NODERHS(_nd) -= _rhs;
+  }
+ 
+}
+ 
+}
+
+static void nrn_jacob(NrnThread* _nt, _Memb_list* _ml, int _type) {
+double* _p; Datum* _ppvar; Datum* _thread;
+Node *_nd; int* _ni; int _iml, _cntml;
+#if CACHEVEC
+    _ni = _ml->_nodeindices;
+#endif
+_cntml = _ml->_nodecount;
+_thread = _ml->_thread;
+for (_iml = 0; _iml < _cntml; ++_iml) {
+ _p = _ml->_data[_iml];
+#if CACHEVEC
+  if (use_cachevec) {
+	VEC_D(_ni[_iml]) += _g;
+  }else
+#endif
+  {
+     _nd = _ml->_nodelist[_iml];
+	NODED(_nd) += _g;
+  }
+ 
+}
+ 
+}
+
+static void nrn_state(NrnThread* _nt, _Memb_list* _ml, int _type) {
+
+}
+
+static void terminal(){}
+
+static void _initlists(){
+ double _x; double* _p = &_x;
+ int _i; static int _first = 1;
+  if (!_first) return;
+_first = 0;
+}
+
+#if defined(__cplusplus)
+} /* extern "C" */
+#endif
+
+#if NMODL_TEXT
+static const char* nmodl_filename = "/root/package/pyNN/neuron/nmodl/refrac.mod";
+static const char* nmodl_file_text = 
+  ": Insert in a passive compartment to get an integrate-and-fire neuron\n"
+  ": with a refractory period.\n"
+  ": Note that this only sets the membrane potential to the correct value\n"
+  ": at the start and end of the refractory period, and prevents spikes\n"
+  ": during the period by clamping the membrane potential to the reset\n"
+  ": voltage with a huge conductance.\n"
+  ":\n"
+  ": Andrew P. Davison. UNIC, CNRS, May 2006.\n"
+  "\n"
+  "NEURON {\n"
+  "    POINT_PROCESS ResetRefrac\n"
+  "    RANGE vreset, trefrac, vspike, vthresh\n"
+  "    NONSPECIFIC_CURRENT i\n"
+  "}\n"
+  "\n"
+  "UNITS {\n"
+  "    (mV) = (millivolt)\n"
+  "    (nA) = (nanoamp)\n"
+  "    (uS) = (microsiemens)\n"
+  "}\n"
+  "\n"
+  "PARAMETER {\n"
+  "    vthresh = -50   (mV)    : spike threshold\n"
+  "    vreset  = -60   (mV)    : reset potential after a spike\n"
+  "    vspike  = 40    (mV)    : spike height (mainly for graphical purposes)\n"
+  "    trefrac = 1     (ms)\n"
+  "    g_on    = 1e12  (uS)\n"
+  "    spikewidth = 1e-12 (ms) : must be less than trefrac. Check for this?\n"
+  "}\n"
+  "\n"
+  "\n"
+  "ASSIGNED {\n"
+  "    v (mV)\n"
+  "    i (nA)\n"
+  "    g (uS)\n"
+  "    refractory\n"
+  "}\n"
+  "\n"
+  "INITIAL {\n"
+  "    g = 0\n"
+  "    net_send(0,4)\n"
+  "}\n"
+  "\n"
+  "BREAKPOINT {\n"
+  "    i = g*(v-vreset)\n"
+  "}\n"
+  "\n"
+  "NET_RECEIVE (weight) {\n"
+  "    if (flag == 1) {        : beginning of spike\n"
+  "        g = g_on\n"
+  "        state_discontinuity(v,vspike)\n"
+  "        net_send(spikewidth,2)\n"
+  "        net_event(t)\n"
+  "    } else if (flag == 2) { : end of spike, beginning of refractory period\n"
+  "        state_discontinuity(v,vreset)\n"
+  "        if (trefrac > spikewidth) {\n"
+  "            net_send(trefrac-spikewidth,3)\n"
+  "        } else { : also the end of the refractory period\n"
+  "            g = 0\n"
+  "        }\n"
+  "    } else if (flag == 3) { : end of refractory period\n"
+  "        state_discontinuity(v,vreset)\n"
+  "        g = 0\n"
+  "    } else if (flag == 4) { : watch membrane potential\n"
+  "         WATCH (v > vthresh) 1\n"
+  "    }\n"
+  "}\n"
+  ;
+#endif
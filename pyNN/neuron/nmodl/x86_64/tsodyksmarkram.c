@@ -0,0 +1,409 @@
+/* Created by Language version: 7.7.0 */
+/* NOT VECTORIZED */
+#define NRN_VECTORIZED 0
+#include <stdio.h>
+#include <stdlib.h>
+#include <math.h>
+#include "mech_api.h"
+#undef PI
+#define nil 0
+#include "md1redef.h"
+#include "section.h"
+#include "nrniv_mf.h"
+#include "md2redef.h"
+ 
+#if METHOD3
+extern int _method3;
+#endif
+
+#if !NRNGPU
+#undef exp
+#define exp hoc_Exp
+extern double hoc_Exp(double);
+#endif
+ 
+#define nrn_init _nrn_init__TsodyksMarkramWA
+#define _nrn_initial _nrn_initial__TsodyksMarkramWA
+#define nrn_cur _nrn_cur__TsodyksMarkramWA
+#define _nrn_current _nrn_current__TsodyksMarkramWA
+#define nrn_jacob _nrn_jacob__TsodyksMarkramWA
+#define nrn_state _nrn_state__TsodyksMarkramWA
+#define _net_receive _net_receive__TsodyksMarkramWA 
+ 
+#define _threadargscomma_ /**/
+#define _threadargsprotocomma_ /**/
+#define _threadargs_ /**/
+#define _threadargsproto_ /**/
+ 	/*SUPPRESS 761*/
+	/*SUPPRESS 762*/
+	/*SUPPRESS 763*/
+	/*SUPPRESS 765*/
+	 extern double *getarg(int);
+ static double *_p; static Datum *_ppvar;
+ 
+#define t nrn_threads->_t
+#define dt nrn_threads->_dt
+#define tau_rec _p[0]
+#define tau_rec_columnindex 0
+#define tau_facil _p[1]
+#define tau_facil_columnindex 1
+#define U _p[2]
+#define U_columnindex 2
+#define u0 _p[3]
+#define u0_columnindex 3
+#define tau_syn _p[4]
+#define tau_syn_columnindex 4
+#define x _p[5]
+#define x_columnindex 5
+#define y _p[6]
+#define y_columnindex 6
+#define z _p[7]
+#define z_columnindex 7
+#define u _p[8]
+#define u_columnindex 8
+#define t_last _p[9]
+#define t_last_columnindex 9
+#define _tsav _p[10]
+#define _tsav_columnindex 10
+#define _nd_area  *_ppvar[0]._pval
+#define wsyn	*_ppvar[2]._pval
+#define _p_wsyn	_ppvar[2]._pval
+ 
+#if MAC
+#if !defined(v)
+#define v _mlhv
+#endif
+#if !defined(h)
+#define h _mlhh
+#endif
+#endif
+ 
+#if defined(__cplusplus)
+extern "C" {
+#endif
+ static int hoc_nrnpointerindex =  2;
+ /* external NEURON variables */
+ /* declaration of user functions */
+ static int _mechtype;
+extern void _nrn_cacheloop_reg(int, int);
+extern void hoc_register_prop_size(int, int, int);
+extern void hoc_register_limits(int, HocParmLimits*);
+extern void hoc_register_units(int, HocParmUnits*);
+extern void nrn_promote(Prop*, int, int);
+extern Memb_func* memb_func;
+ 
+#define NMODL_TEXT 1
+#if NMODL_TEXT
+static const char* nmodl_file_text;
+static const char* nmodl_filename;
+extern void hoc_reg_nmodl_text(int, const char*);
+extern void hoc_reg_nmodl_filename(int, const char*);
+#endif
+
+ extern Prop* nrn_point_prop_;
+ static int _pointtype;
+ static void* _hoc_create_pnt(Object* _ho) { void* create_point_process(int, Object*);
+ return create_point_process(_pointtype, _ho);
+}
+ static void _hoc_destroy_pnt(void*);
+ static double _hoc_loc_pnt(void* _vptr) {double loc_point_process(int, void*);
+ return loc_point_process(_pointtype, _vptr);
+}
+ static double _hoc_has_loc(void* _vptr) {double has_loc_point(void*);
+ return has_loc_point(_vptr);
+}
+ static double _hoc_get_loc_pnt(void* _vptr) {
+ double get_loc_point_process(void*); return (get_loc_point_process(_vptr));
+}
+ extern void _nrn_setdata_reg(int, void(*)(Prop*));
+ static void _setdata(Prop* _prop) {
+ _p = _prop->param; _ppvar = _prop->dparam;
+ }
+ static void _hoc_setdata(void* _vptr) { Prop* _prop;
+ _prop = ((Point_process*)_vptr)->_prop;
+   _setdata(_prop);
+ }
+ /* connect user functions to hoc names */
+ static VoidFunc hoc_intfunc[] = {
+ 0,0
+};
+ static Member_func _member_func[] = {
+ "loc", _hoc_loc_pnt,
+ "has_loc", _hoc_has_loc,
+ "get_loc", _hoc_get_loc_pnt,
+ 0, 0
+};
+ /* declare global and static user variables */
+ /* some parameters have upper and lower limits */
+ static HocParmLimits _hoc_parm_limits[] = {
+ "U", 0, 1,
+ "tau_syn", 1e-09, 1e+09,
+ "tau_facil", 0, 1e+09,
+ "tau_rec", 1e-09, 1e+09,
+ "u0", 0, 1,
+ 0,0,0
+};
+ static HocParmUnits _hoc_parm_units[] = {
+ "tau_rec", "ms",
+ "tau_facil", "ms",
+ "U", "1",
+ "u0", "1",
+ "tau_syn", "ms",
+ 0,0
+};
+ static double v = 0;
+ /* connect global user variables to hoc */
+ static DoubScal hoc_scdoub[] = {
+ 0,0
+};
+ static DoubVec hoc_vdoub[] = {
+ 0,0,0
+};
+ static double _sav_indep;
+ static void nrn_alloc(Prop*);
+static void  nrn_init(NrnThread*, _Memb_list*, int);
+static void nrn_state(NrnThread*, _Memb_list*, int);
+ static void _hoc_destroy_pnt(void* _vptr) {
+   destroy_point_process(_vptr);
+}
+ /* connect range variables in _p that hoc is supposed to know about */
+ static const char *_mechanism[] = {
+ "7.7.0",
+"TsodyksMarkramWA",
+ "tau_rec",
+ "tau_facil",
+ "U",
+ "u0",
+ "tau_syn",
+ 0,
+ 0,
+ 0,
+ "wsyn",
+ 0};
+ 
+extern Prop* need_memb(Symbol*);
+
+static void nrn_alloc(Prop* _prop) {
+	Prop *prop_ion;
+	double *_p; Datum *_ppvar;
+  if (nrn_point_prop_) {
+	_prop->_alloc_seq = nrn_point_prop_->_alloc_seq;
+	_p = nrn_point_prop_->param;
+	_ppvar = nrn_point_prop_->dparam;
+ }else{
+ 	_p = nrn_prop_data_alloc(_mechtype, 11, _prop);
+ 	/*initialize range parameters*/
+ 	tau_rec = 100;
+ 	tau_facil = 1000;
+ 	U = 0.04;
+ 	u0 = 0;
+ 	tau_syn = 2;
+  }
+ 	_prop->param = _p;
+ 	_prop->param_size = 11;
+  if (!nrn_point_prop_) {
+ 	_ppvar = nrn_prop_datum_alloc(_mechtype, 3, _prop);
+  }
+ 	_prop->dparam = _ppvar;
+ 	/*connect ionic variables to this model*/
+ 
+}
+ static void _initlists();
+ static void _net_receive(Point_process*, double*, double);
+ static void _net_init(Point_process*, double*, double);
+ extern Symbol* hoc_lookup(const char*);
+extern void _nrn_thread_reg(int, int, void(*)(Datum*));
+extern void _nrn_thread_table_reg(int, void(*)(double*, Datum*, Datum*, NrnThread*, int));
+extern void hoc_register_tolerance(int, HocStateTolerance*, Symbol***);
+extern void _cvode_abstol( Symbol**, double*, int);
+
+ void _tsodyksmarkram_reg() {
+	int _vectorized = 0;
+  _initlists();
+ 	_pointtype = point_register_mech(_mechanism,
+	 nrn_alloc,(void*)0, (void*)0, (void*)0, nrn_init,
+	 hoc_nrnpointerindex, 0,
+	 _hoc_create_pnt, _hoc_destroy_pnt, _member_func);
+ _mechtype = nrn_get_mechtype(_mechanism[1]);
+     _nrn_setdata_reg(_mechtype, _setdata);
+ #if NMODL_TEXT
+  hoc_reg_nmodl_text(_mechtype, nmodl_file_text);
+  hoc_reg_nmodl_filename(_mechtype, nmodl_filename);
+#endif
+  hoc_register_prop_size(_mechtype, 11, 3);
+  hoc_register_dparam_semantics(_mechtype, 0, "area");
+  hoc_register_dparam_semantics(_mechtype, 1, "pntproc");
+  hoc_register_dparam_semantics(_mechtype, 2, "pointer");
+ pnt_receive[_mechtype] = _net_receive;
+ pnt_receive_init[_mechtype] = _net_init;
+ pnt_receive_size[_mechtype] = 1;
+ 	hoc_register_var(hoc_scdoub, hoc_vdoub, hoc_intfunc);
+ 	ivoc_help("help ?1 TsodyksMarkramWA /root/package/pyNN/neuron/nmodl/tsodyksmarkram.mod\n");
+ hoc_register_limits(_mechtype, _hoc_parm_limits);
+ hoc_register_units(_mechtype, _hoc_parm_units);
+ }
+static int _reset;
+static char *modelname = "";
+
+static int error;
+static int _ninits = 0;
+static int _match_recurse=1;
+static void _modl_cleanup(){ _match_recurse=1;}
+ 
+static void _net_receive (Point_process* _pnt, double* _args, double _lflag) 
+{    _p = _pnt->_prop->param; _ppvar = _pnt->_prop->dparam;
+  if (_tsav > t){ extern char* hoc_object_name(Object*); hoc_execerror(hoc_object_name(_pnt->ob), ":Event arrived out of order. Must call ParallelContext.set_maxstep AFTER assigning minimum NetCon.delay");}
+ _tsav = t; {
+   z = z * exp ( - ( t - t_last ) / tau_rec ) ;
+   z = z + y * ( exp ( - ( t - t_last ) / tau_syn ) - exp ( - ( t - t_last ) / tau_rec ) ) / ( ( tau_syn / tau_rec ) - 1.0 ) ;
+   y = y * exp ( - ( t - t_last ) / tau_syn ) ;
+   x = 1.0 - y - z ;
+   if ( tau_facil > 0.0 ) {
+     u = u * exp ( - ( t - t_last ) / tau_facil ) ;
+     u = u + U * ( 1.0 - u ) ;
+     }
+   else {
+     u = U ;
+     }
+   wsyn = _args[0] * x * u ;
+   y = y + x * u ;
+   t_last = t ;
+   } }
+ 
+static void _net_init(Point_process* _pnt, double* _args, double _lflag) {
+       _p = _pnt->_prop->param; _ppvar = _pnt->_prop->dparam;
+ t_last = t ;
+   }
+
+static void initmodel() {
+  int _i; double _save;_ninits++;
+{
+ {
+   y = 0.0 ;
+   z = 0.0 ;
+   u = u0 ;
+   t_last = - 1e99 ;
+   }
+
+}
+}
+
+static void nrn_init(NrnThread* _nt, _Memb_list* _ml, int _type){
+Node *_nd; double _v; int* _ni; int _iml, _cntml;
+#if CACHEVEC
+    _ni = _ml->_nodeindices;
+#endif
+_cntml = _ml->_nodecount;
+for (_iml = 0; _iml < _cntml; ++_iml) {
+ _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+ _tsav = -1e20;
+#if CACHEVEC
+  if (use_cachevec) {
+    _v = VEC_V(_ni[_iml]);
+  }else
+#endif
+  {
+    _nd = _ml->_nodelist[_iml];
+    _v = NODEV(_nd);
+  }
+ v = _v;
+ initmodel();
+}}
+
+static double _nrn_current(double _v){double _current=0.;v=_v;{
+} return _current;
+}
+
+static void nrn_state(NrnThread* _nt, _Memb_list* _ml, int _type){
+Node *_nd; double _v = 0.0; int* _ni; int _iml, _cntml;
+#if CACHEVEC
+    _ni = _ml->_nodeindices;
+#endif
+_cntml = _ml->_nodecount;
+for (_iml = 0; _iml < _cntml; ++_iml) {
+ _p = _ml->_data[_iml]; _ppvar = _ml->_pdata[_iml];
+ _nd = _ml->_nodelist[_iml];
+#if CACHEVEC
+  if (use_cachevec) {
+    _v = VEC_V(_ni[_iml]);
+  }else
+#endif
+  {
+    _nd = _ml->_nodelist[_iml];
+    _v = NODEV(_nd);
+  }
+ v=_v;
+{
+}}
+
+}
+
+static void terminal(){}
+
+static void _initlists() {
+ int _i; static int _first = 1;
+  if (!_first) return;
+_first = 0;
+}
+
+#if NMODL_TEXT
+static const char* nmodl_filename = "/root/package/pyNN/neuron/nmodl/tsodyksmarkram.mod";
+static const char* nmodl_file_text = 
+  "COMMENT\n"
+  "Implementation of the Tsodyks-Markram mechanism for synaptic depression and\n"
+  "facilitation as a \"weight adjuster\"\n"
+  "Andrew Davison, UNIC, CNRS, 2013\n"
+  "ENDCOMMENT\n"
+  "\n"
+  "NEURON {\n"
+  "    POINT_PROCESS TsodyksMarkramWA\n"
+  "    RANGE tau_rec, tau_facil, U, u0, tau_syn\n"
+  "    POINTER wsyn\n"
+  "}\n"
+  "\n"
+  "PARAMETER {\n"
+  "    tau_rec   = 100  (ms) <1e-9, 1e9>\n"
+  "    tau_facil = 1000 (ms) <0, 1e9>\n"
+  "    U         = 0.04 (1)  <0, 1>\n"
+  "    u0        = 0    (1)  <0, 1>\n"
+  "    tau_syn   = 2    (ms) <1e-9, 1e9>  : should be set to be the same as the receiving synapse\n"
+  "}\n"
+  "\n"
+  "ASSIGNED {\n"
+  "    x\n"
+  "    y\n"
+  "    z\n"
+  "    u\n"
+  "    t_last (ms)\n"
+  "    wsyn\n"
+  "}\n"
+  "\n"
+  "INITIAL {\n"
+  "    y = 0\n"
+  "    z = 0\n"
+  "    u = u0\n"
+  "    t_last = -1e99\n"
+  "}\n"
+  "\n"
+  "NET_RECEIVE(w) {\n"
+  "    INITIAL {\n"
+  "        t_last = t\n"
+  "    }\n"
+  "    z = z*exp(-(t - t_last)/tau_rec)\n"
+  "    z = z + y*(exp(-(t - t_last)/tau_syn) - exp(-(t - t_last)/tau_rec)) / ((tau_syn/tau_rec) - 1)\n"
+  "    y = y*exp(-(t - t_last)/tau_syn)\n"
+  "    x = 1 - y - z\n"
+  "    if (tau_facil > 0) {\n"
+  "        u = u*exp(-(t - t_last)/tau_facil)\n"
+  "        u = u + U*(1-u)\n"
+  "    } else {\n"
+  "        u = U\n"
+  "    }\n"
+  "    wsyn = w*x*u\n"
+  "    y = y + x*u\n"
+  "    :printf(\"U=%g  tau_rec=%g  tau_facil=%g  tau_syn=%g  w=%g\\n\", U, tau_rec, tau_facil, tau_syn, w)\n"
+  "    :printf(\"%g\\t%g\\t%g\\t%g\\t%g\\t%g\\t%g\\n\", t, t - t_last, y, z, u, x, wsyn)\n"
+  "    t_last = t\n"
+  "}\n"
+  ;
+#endif
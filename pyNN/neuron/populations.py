@@ -7,10 +7,13 @@ nrnpython implementation of the PyNN API.
 
 """
 
+from itertools import repeat
 import numpy as np
 import logging
 from pyNN import common
-from pyNN.parameters import ArrayParameter, Sequence, ParameterSpace, simplify, LazyArray
+from pyNN.core import is_listlike
+from pyNN.parameters import (ArrayParameter, Sequence, SequenceArray, ParameterSpace,
+                             simplify, LazyArray)
 from pyNN.standardmodels import StandardCellType
 from pyNN.random import RandomDistribution
 from . import simulator
@@ -99,8 +102,10 @@ class Population(common.Population, PopulationMixin):
         # perhaps should check for that
         self.first_id = simulator.state.gid_counter
         self.last_id = simulator.state.gid_counter + self.size - 1
-        self.all_cells = np.array([id for id in range(self.first_id, self.last_id + 1)],
-                                     simulator.ID)
+        self.all_cells = np.array([simulator.ID(id) for id in range(self.first_id, self.last_id + 1)],
+                                  simulator.ID)
+        for id in self.all_cells:
+            id.parent = self
 
         # mask_local is used to extract those elements from arrays that apply to the cells on the current node
         # round-robin distribution of cells between nodes
@@ -112,14 +117,33 @@ class Population(common.Population, PopulationMixin):
             parameter_space = self.celltype.parameter_space
         parameter_space.shape = (self.size,)
         parameter_space.evaluate(mask=None)
-        for i, (id, is_local, params) in enumerate(zip(self.all_cells, self._mask_local, parameter_space)):
-            self.all_cells[i] = simulator.ID(id)
-            self.all_cells[i].parent = self
-            if is_local:
-                if hasattr(self.celltype, "extra_parameters"):
-                    params.update(self.celltype.extra_parameters)
-                self.all_cells[i]._build_cell(self.celltype.model, params)
-        simulator.initializer.register(*self.all_cells[self._mask_local])
+        local_cells = self.all_cells[self._mask_local]
+        # rather than building a dict per cell by iterating over the parameter
+        # space, we take the local part of each parameter array as a list once,
+        # and zip the lists together
+        names = []
+        columns = []
+        for name, value in parameter_space.items():
+            names.append(name)
+            if isinstance(value, np.ndarray):
+                columns.append(value[self._mask_local].tolist())
+            elif isinstance(value, SequenceArray):
+                columns.append(value[self._mask_local])  # iterates over Sequence views
+            elif is_listlike(value):
+                columns.append([value[i] for i in self._mask_local.nonzero()[0]])
+            else:
+                columns.append(repeat(value))
+        extra_parameters = getattr(self.celltype, "extra_parameters", {})
+        cell_model = self.celltype.model
+        for id, values in zip(local_cells, zip(*columns) if columns else repeat(())):
+            params = dict(zip(names, values))
+            params.update(extra_parameters)
+            id._cell = cell_model(**params)
+        simulator.state.register_gids(local_cells)
+        if not self.celltype.injectable:
+            # injectable cells are initialized through the population, which
+            # is registered in __init__()
+            simulator.initializer.register(*local_cells)
         simulator.state.gid_counter += self.size
 
     def _native_rset(self, parametername, rand_distr):
@@ -10,7 +10,6 @@ from copy import deepcopy
 import numpy as np
 import logging
 from itertools import repeat, chain
-from collections import defaultdict
 from pyNN import common, errors, core
 from pyNN.random import RandomDistribution, NativeRNG
 from pyNN.space import Space
@@ -35,8 +34,12 @@ class Projection(common.Projection):
         common.Projection.__init__(self, presynaptic_population, postsynaptic_population,
                                    connector, synapse_type, source, receptor_type,
                                    space, label)
-        self._connections = dict((index, defaultdict(list))
-                                 for index in self.post._mask_local.nonzero()[0])
+        # connections are stored in creation order, together with their
+        # pre- and post-synaptic indices, so that parameters can be read and
+        # written as whole arrays
+        self._connection_list = []
+        self._presynaptic_index_chunks = []
+        self._postsynaptic_index_chunks = []
         connector.connect(self)
         self._presynaptic_components = dict((index, {}) for index in
                                             self.pre._mask_local.nonzero()[0])
@@ -47,10 +50,7 @@ class Projection(common.Projection):
 
     @property
     def connections(self):
-        for x in self._connections.values():
-            for y in x.values():
-                for z in y:
-                    yield z
+        return self._connection_list
 
     def __getitem__(self, i):
         __doc__ = common.Projection.__getitem__.__doc__
@@ -67,7 +67,7 @@ class Projection(common.Projection):
 
     def __len__(self):
         """Return the number of connections on the local MPI node."""
-        return len(list(self.connections))
+        return len(self._connection_list)
 
     def _convergent_connect(self, presynaptic_indices, postsynaptic_index,
                             **connection_parameters):
@@ -86,15 +86,32 @@ class Projection(common.Projection):
             errmsg = "Invalid post-synaptic cell: %s (gid_counter=%d)" % (
                 postsynaptic_cell, simulator.state.gid_counter)
             raise errors.ConnectionError(errmsg)
+        presynaptic_indices = np.asarray(presynaptic_indices, dtype=int).reshape(-1)
         for name, value in connection_parameters.items():
             if isinstance(value, (float, int)):
                 connection_parameters[name] = repeat(value)
+            elif isinstance(value, np.ndarray):
+                # NEURON is faster with Python floats than with NumPy scalars
+                connection_parameters[name] = value.tolist()
         assert postsynaptic_cell.local
-        for pre_idx, values in core.ezip(presynaptic_indices, *connection_parameters.values()):
-            parameters = dict(zip(connection_parameters.keys(), values))
-            # logger.debug("Connecting neuron #%s to neuron #%s with synapse type %s, receptor type %s, parameters %s", pre_idx, postsynaptic_index, self.synapse_type, self.receptor_type, parameters)
-            self._connections[postsynaptic_index][pre_idx].append(
-                self.synapse_type.connection_type(self, pre_idx, postsynaptic_index, **parameters))
+        connection_type = self.synapse_type.connection_type
+        names = list(connection_parameters.keys())
+        for pre_idx, values in core.ezip(presynaptic_indices.tolist(), *connection_parameters.values()):
+            # logger.debug("Connecting neuron #%s to neuron #%s with synapse type %s, receptor type %s, parameters %s", pre_idx, postsynaptic_index, self.synapse_type, self.receptor_type, values)
+            self._connection_list.append(
+                connection_type(self, pre_idx, postsynaptic_index, **dict(zip(names, values))))
+        self._presynaptic_index_chunks.append(presynaptic_indices)
+        self._postsynaptic_index_chunks.append(
+            np.full(presynaptic_indices.shape, postsynaptic_index, dtype=int))
+
+    def _connection_addresses(self):
+        if len(self._presynaptic_index_chunks) != 1:
+            # merge the per-column chunks, so that this is only done once
+            self._presynaptic_index_chunks = [
+                np.concatenate(self._presynaptic_index_chunks + [np.array([], dtype=int)])]
+            self._postsynaptic_index_chunks = [
+                np.concatenate(self._postsynaptic_index_chunks + [np.array([], dtype=int)])]
+        return self._presynaptic_index_chunks[0], self._postsynaptic_index_chunks[0]
 
     def _configure_presynaptic_components(self):
         """
@@ -128,14 +145,34 @@ class Projection(common.Projection):
                     for index in component:
                         setattr(component[index], name, value[index])
         # Evaluate the parameters for the post-synaptic components (typically the "Connection" object)
-        # only columns for connections that exist on this machine
+        # only columns for connections that exist on this machine, then pick out
+        # the value for each connection
+        local_columns = self.post._mask_local.nonzero()[0]
         parameter_space.evaluate(mask=(slice(None), self.post._mask_local))
-        for connection_group, connection_parameters in zip(self._connections.values(),
-                                                           parameter_space.columns()):
-            for name, value in connection_parameters.items():
-                for index in connection_group:
-                    for connection in connection_group[index]:
-                        setattr(connection, name, value[index])
+        pre, post = self._connection_addresses()
+        column_index = np.zeros(self.post.size, dtype=int)
+        column_index[local_columns] = np.arange(local_columns.size)
+        address = (pre, column_index[post])
+        self._set_attribute_vectors(dict((name, value[address])
+                                         for name, value in parameter_space.items()))
+
+    def _set_attribute_vectors(self, attributes):
+        for name, values in attributes.items():
+            if values.dtype != object:
+                values = values.tolist()
+            for connection, value in zip(self._connection_list, values):
+                setattr(connection, name, value)
+
+    def _get_attributes_as_list(self, names):
+        columns = []
+        for name in names:
+            if name == "presynaptic_index":
+                columns.append(self._connection_addresses()[0].tolist())
+            elif name == "postsynaptic_index":
+                columns.append(self._connection_addresses()[1].tolist())
+            else:
+                columns.append([getattr(c, name) for c in self._connection_list])
+        return list(zip(*columns))
 
     def _set_initial_value_array(self, variable, value):
         raise NotImplemented
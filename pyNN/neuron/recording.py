@@ -19,6 +19,12 @@ class Recorder(recording.Recorder):
     """Encapsulates data and functions related to recording model variables."""
     _simulator = simulator
 
+    def __init__(self, population, file=None):
+        __doc__ = recording.Recorder.__doc__
+        recording.Recorder.__init__(self, population, file)
+        self._sample_time_vectors = {}
+        self._samples_drained = {}  # number of values already retrieved for reduced variables
+
     def _record(self, variable, new_ids, sampling_interval=None):
         """Add the cells in `new_ids` to the set of recorded cells."""
         if variable == 'spikes':
@@ -28,7 +34,6 @@ class Recorder(recording.Recorder):
                 else:  # SpikeSourceArray
                     id._cell.recording = True
         else:
-            self.sampling_interval = sampling_interval or self._simulator.state.dt
             for id in new_ids:
                 self._record_state_variable(id._cell, variable)
 
@@ -44,19 +49,39 @@ class Recorder(recording.Recorder):
         else:
             source, var_name = self._resolve_variable(cell, variable)
             hoc_var = getattr(source, "_ref_%s" % var_name)
+        sampling_interval = self.sampling_intervals.get(variable, self.sampling_interval)
+        start, stop = self.recording_windows.get(variable, (None, None))
         cell.traces[variable] = vec = h.Vector()
-        if self.sampling_interval == self._simulator.state.dt or self.record_times:
+        if self.record_times:
+            vec.record(hoc_var)
+        elif stop is not None:
+            # record only at the sample times within the window
+            vec.record(hoc_var, self._sample_times(variable))
+        elif sampling_interval == self._simulator.state.dt:
             vec.record(hoc_var)
         else:
-            vec.record(hoc_var, self.sampling_interval)
+            vec.record(hoc_var, sampling_interval)
         if not cell.recording_time:
             cell.recorded_times = h.Vector()
-            if self.sampling_interval == self._simulator.state.dt or self.record_times:
+            if sampling_interval == self._simulator.state.dt or self.record_times:
                 cell.recorded_times.record(h._ref_t)
             else:
-                cell.recorded_times.record(h._ref_t, self.sampling_interval)
+                cell.recorded_times.record(h._ref_t, sampling_interval)
             cell.recording_time += 1
 
+    def _sample_times(self, variable):
+        """
+        Return a hoc Vector containing the times at which `variable` should be
+        recorded within its recording window. The Vector is shared by all cells.
+        """
+        interval = self.sampling_intervals[variable]
+        start, stop = self.recording_windows[variable]
+        key = (interval, start, stop)
+        if key not in self._sample_time_vectors:
+            times = (start or 0.0) + interval * np.arange(int(round((stop - (start or 0.0)) / interval)) + 1)
+            self._sample_time_vectors[key] = h.Vector(times)
+        return self._sample_time_vectors[key]
+
     # could be staticmethod
     def _resolve_variable(self, cell, variable_path):
         match = recordable_pattern.match(variable_path)
@@ -76,6 +101,7 @@ class Recorder(recording.Recorder):
 
     def _reset(self):
         """Reset the list of things to be recorded."""
+        self._samples_drained = {}
         for id in set.union(*self.recorded.values()):
             id._cell.traces = {}
             id._cell.spike_times = h.Vector(0)
@@ -119,19 +145,80 @@ class Recorder(recording.Recorder):
                 # the following line assumes all cells are sampled at the same time
                 # which should be true if cvode.use_local_dt() returns False
                 times = np.array(ids[0]._cell.recorded_times)
+                start, stop = self.recording_windows.get(variable, (None, None))
+                if (start, stop) != (None, None):
+                    mask = times >= (start or 0.0) - 1e-9
+                    if stop is not None:
+                        mask &= times <= stop + 1e-9
+                    signals, times = signals[mask], times[mask]
             else:
-                expected_length = np.rint(simulator.state.tstop / self.sampling_interval) + 1
-                if signals.shape[0] != expected_length:  # generally due to floating point/rounding issues
+                start, stop = self.recording_windows.get(variable, (None, None))
+                if start and stop is None:
+                    # recorded from the beginning of the simulation, so we discard
+                    # the values before the window
+                    signals = signals[int(round(start / self.sampling_intervals[variable])):]
+                expected_length = self._n_samples(variable)
+                if signals.shape[0] == expected_length - 1 and signals.shape[0] > 0:
+                    # generally due to floating point/rounding issues
                     signals = np.vstack((signals, signals[-1, :]))
         else:
             signals = np.array([])
         return signals, times
 
+    def _drain(self, variable):
+        ids = sorted(self.recorded[variable])
+        if variable == 'spikes':
+            all_spiketimes = [np.array([])]
+            for id in ids:
+                if id._cell.rec is None:  # SpikeSourceArray
+                    spikes = id._cell.get_recorded_spike_times()
+                    all_spiketimes.append(spikes[spikes <= simulator.state.t + 1e-9])
+                    id._cell.clear_past_spikes()
+                else:
+                    all_spiketimes.append(id._cell.spike_times.as_numpy().copy())
+                    id._cell.spike_times.resize(0)
+            return np.hstack(all_spiketimes), None
+        elif len(ids) > 0:
+            # as_numpy() copes with empty Vectors, e.g. before the first time step
+            signals = np.vstack([id._cell.traces[variable].as_numpy() for id in ids]).T
+            for id in ids:
+                id._cell.traces[variable].resize(0)
+            n_drained = self._samples_drained.get(variable, 0)
+            self._samples_drained[variable] = n_drained + signals.shape[0]
+            sample_times = self.sampling_intervals[variable] * np.arange(n_drained, n_drained + signals.shape[0])
+            return np.repeat(sample_times, len(ids)), signals.flatten()
+        else:
+            return np.array([]), np.array([])
+
+    def store_to_cache(self, annotations=None):
+        recording.Recorder.store_to_cache(self, annotations)
+        self._samples_drained = {}
+
     def _local_count(self, variable, filter_ids=None):
         N = {}
         if variable == 'spikes':
             for id in self.filter_recorded(variable, filter_ids):
-                N[int(id)] = id._cell.spike_times.size()
+                N[int(id)] = self._spike_count(id)
         else:
             raise Exception("Only implemented for spikes")
         return N
+
+    def _local_count_array(self, variable, filter_ids=None, t_start=None, t_stop=None):
+        if t_start is not None or t_stop is not None:
+            return recording.Recorder._local_count_array(self, variable, filter_ids,
+                                                         t_start, t_stop)
+        if variable != 'spikes':
+            raise Exception("Only implemented for spikes")
+        ids = list(self.filter_recorded(variable, filter_ids))
+        counts = np.zeros(self.population.size, dtype=np.int64)
+        if ids:
+            indices = self.population.id_to_index(np.array(ids, dtype=int))
+            counts[indices] = np.fromiter((self._spike_count(id) for id in ids),
+                                          dtype=np.int64, count=len(ids))
+        return counts
+
+    def _spike_count(self, id):
+        if id._cell.rec is None:  # SpikeSourceArray
+            spikes = id._cell.get_recorded_spike_times()
+            return np.count_nonzero(spikes <= simulator.state.t + 1e-9)
+        return id._cell.spike_times.size()
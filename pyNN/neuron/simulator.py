@@ -196,6 +196,20 @@ class _State(common.control.BaseState):
             return h.min_delay
     min_delay = property(fset=__set_min_delay, fget=__get_min_delay)
 
+    def register_gids(self, cells):
+        """
+        Register the global IDs of a sequence of cells, whose NEURON cell
+        objects have already been created, with the global `ParallelContext`
+        instance.
+        """
+        parallel_context = self.parallel_context
+        for cell in cells:
+            gid = int(cell)
+            cell_object = cell._cell
+            self.register_gid(gid, cell_object.source, section=cell_object.source_section)
+            if hasattr(cell_object, "get_threshold"):  # this is not adequate, since the threshold may be changed after cell creation
+                parallel_context.threshold(gid, cell_object.get_threshold())  # the problem is that the cell object does not know its own gid
+
     def register_gid(self, gid, source, section=None):
         """Register a global ID with the global `ParallelContext` instance."""
         ###print("registering gid %s to %s (section=%s)" % (gid, source, section))
@@ -324,11 +338,8 @@ class ID(int, common.IDMixin):
         `cell_parameters` -- a ParameterSpace containing the parameters used to
                              initialise the cell model.
         """
-        gid = int(self)
         self._cell = cell_model(**cell_parameters)          # create the cell object
-        state.register_gid(gid, self._cell.source, section=self._cell.source_section)
-        if hasattr(self._cell, "get_threshold"):            # this is not adequate, since the threshold may be changed after cell creation
-            state.parallel_context.threshold(int(self), self._cell.get_threshold())  # the problem is that self._cell does not know its own gid
+        state.register_gids([self])
 
     def get_initial_value(self, variable):
         """Get the initial value of a state variable of the cell."""
@@ -5,6 +5,7 @@ Parameter set handling
 :license: CeCILL, see LICENSE for details.
 """
 
+import operator
 import numpy as np
 from collections.abc import Sized
 from pyNN.core import is_listlike
@@ -93,6 +94,40 @@ class LazyArray(larray):
             for j in column_indices:
                 yield self._partially_evaluate((slice(None), j), simplify=True)
 
+    def evaluate_at(self, *indices):
+        """
+        Evaluate the array only at the points given by `indices`, one integer
+        array per dimension, all of the same length, as for NumPy integer array
+        indexing. Returns a 1D array with one value per point.
+
+        Functions `f(i, j)`, including distance expressions, are called once
+        with the index arrays, and random distributions draw one number per
+        point. The exception is a random distribution with a parallel-safe RNG,
+        which must draw the same numbers whatever the points requested: a 2D
+        array is then evaluated one column at a time, so the full array is
+        never held in memory.
+        """
+        if len(indices) != len(self._shape):
+            raise ValueError("Need %d index arrays, got %d" % (len(self._shape), len(indices)))
+        indices = tuple(np.asarray(index, dtype=int) for index in indices)
+        if indices[0].size == 0:
+            return np.array([], dtype=self.dtype or float)
+        if (isinstance(self.base_value, RandomDistribution)
+                and self.base_value.rng.parallel_safe
+                and not self.is_homogeneous):
+            if len(self._shape) == 1:
+                return self.evaluate()[indices]
+            rows, cols = indices
+            values = np.empty(rows.shape, dtype=self.dtype or float)
+            order = np.argsort(cols, kind="stable")
+            boundaries = np.searchsorted(cols[order], np.arange(self.ncols + 1))
+            for j in range(self.ncols):
+                column = self._partially_evaluate((slice(None), j))
+                points = order[boundaries[j]:boundaries[j + 1]]
+                values[points] = column[rows[points]]
+            return values
+        return self._partially_evaluate(indices)
+
 
 class ArrayParameter(object):
     """
@@ -214,6 +249,206 @@ class Sequence(ArrayParameter):
     pass
 
 
+class SequenceArray(object):
+    """
+    A one-dimensional array of :class:`Sequence` objects, e.g. the spike times
+    of all the spike sources in a population, stored as a single flat array
+    of values plus an array of offsets, rather than as one :class:`Sequence`
+    object per element.
+
+    Sequence `i` is ``values[offsets[i]:offsets[i + 1]]``. Indexing with an
+    integer returns a :class:`Sequence` whose value is a view into `values`;
+    indexing with a slice returns a :class:`SequenceArray` which shares
+    `values` with the original. Indexing with an array of indices or a boolean
+    mask copies the selected sequences.
+
+    Arguments:
+        `values`:
+            1D array containing the values of all the sequences, one sequence
+            after another.
+        `offsets`:
+            integer array, of length one more than the number of sequences,
+            giving the start of each sequence within `values`, followed by the
+            end of the last sequence.
+
+    :class:`SequenceArray` objects should be treated as immutable: arithmetic
+    operations return new objects.
+    """
+
+    def __init__(self, values, offsets):
+        if isinstance(values, np.ndarray):
+            self.values = values
+        else:
+            self.values = np.array(values, float)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        if self.values.ndim != 1 or self.offsets.ndim != 1 or self.offsets.size == 0:
+            raise ValueError("values and offsets must be non-empty one-dimensional arrays")
+        if (self.offsets[0] < 0 or self.offsets[-1] > self.values.size
+                or np.any(self.offsets[1:] < self.offsets[:-1])):
+            raise ValueError("offsets must be non-decreasing and lie within values")
+
+    # Note that __len__() is deliberately not defined: lazyarray would otherwise
+    # treat a SequenceArray as an array of numbers rather than of sequences.
+
+    @classmethod
+    def from_pairs(cls, indices, values, size):
+        """
+        Create a :class:`SequenceArray` containing `size` sequences, in which
+        `values[k]` belongs to sequence `indices[k]`. The values within each
+        sequence are sorted.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        values = np.asarray(values, dtype=float)
+        if indices.shape != values.shape:
+            raise ValueError("indices and values must have the same shape")
+        if indices.size > 0 and (indices.min() < 0 or indices.max() >= size):
+            raise IndexError("Sequence index out of range")
+        order = np.lexsort((values, indices))
+        offsets = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(indices, minlength=size), out=offsets[1:])
+        return cls(values[order], offsets)
+
+    @classmethod
+    def from_sequences(cls, sequences):
+        """
+        Create a :class:`SequenceArray` from a list or array of
+        :class:`Sequence` objects (or of anything which can be converted to a
+        1D NumPy array).
+        """
+        arrays = [np.asarray(seq.value if isinstance(seq, ArrayParameter) else seq,
+                             dtype=float).ravel()
+                  for seq in sequences]
+        offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+        np.cumsum([arr.size for arr in arrays], out=offsets[1:])
+        if arrays:
+            values = np.concatenate(arrays)
+        else:
+            values = np.array([], dtype=float)
+        return cls(values, offsets)
+
+    @property
+    def size(self):
+        """Number of sequences."""
+        return self.offsets.size - 1
+
+    @property
+    def shape(self):
+        return (self.size,)
+
+    def lengths(self):
+        """Return an array containing the length of each sequence."""
+        return np.diff(self.offsets)
+
+    def is_sorted(self):
+        """Return True if the values within every sequence are in non-decreasing order."""
+        values, offsets = self._compact()
+        decreasing = np.flatnonzero(values[1:] < values[:-1]) + 1
+        # a decrease is allowed only where one sequence ends and the next begins
+        return bool(np.isin(decreasing, offsets).all())
+
+    def _compact(self):
+        """
+        Return the values actually used by this array (which may share its
+        values with a larger array), and offsets relative to those values.
+        """
+        start, stop = self.offsets[0], self.offsets[-1]
+        return self.values[start:stop], self.offsets - start
+
+    def __getitem__(self, addr):
+        if isinstance(addr, tuple) and len(addr) == 1:
+            addr = addr[0]
+        if isinstance(addr, (int, np.integer)):
+            i = addr + self.size if addr < 0 else addr
+            if not 0 <= i < self.size:
+                raise IndexError("index %d is out of bounds for SequenceArray of size %d" % (addr, self.size))
+            return Sequence(self.values[self.offsets[i]:self.offsets[i + 1]])
+        if isinstance(addr, slice):
+            start, stop, step = addr.indices(self.size)
+            if step == 1:
+                return self.__class__(self.values, self.offsets[start:max(start, stop) + 1])
+            addr = np.arange(start, stop, step)
+        addr = np.asarray(addr)
+        if addr.dtype == bool:
+            if addr.shape != self.shape:
+                raise IndexError("boolean mask has wrong shape")
+            addr = np.flatnonzero(addr)
+        addr = np.where(addr < 0, addr + self.size, addr)
+        starts = self.offsets[addr]
+        lengths = self.offsets[addr + 1] - starts
+        offsets = np.zeros(addr.size + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        positions = np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1])
+        return self.__class__(self.values[positions], offsets)
+
+    def __iter__(self):
+        for i in range(self.size):
+            yield self[i]
+
+    def lazily_evaluate(self, mask=None, shape=None):
+        """Used by :class:`LazyArray` to evaluate the array, or part of it."""
+        if mask is None:
+            return self
+        return self[mask]
+
+    def to_sequences(self):
+        """
+        Return a NumPy object array containing one :class:`Sequence` per
+        element, each a view into the values of this array.
+        """
+        sequences = np.empty(self.size, dtype=object)
+        for i in range(self.size):
+            sequences[i] = self[i]
+        return sequences
+
+    def max(self):
+        """Return the maximum value across all sequences."""
+        return self._compact()[0].max()
+
+    def _apply(self, operation, val):
+        values, offsets = self._compact()
+        if np.ndim(val) > 0:
+            # one operand per sequence
+            val = np.repeat(val, np.diff(offsets))
+        return self.__class__(operation(values, val), offsets)
+
+    def __add__(self, val):
+        """
+        Return a new :class:`SequenceArray` in which `val` has been added to
+        all values. If `val` is an array, element `i` of `val` is added to
+        sequence `i`. The same applies to the other arithmetic operations.
+        """
+        return self._apply(operator.add, val)
+
+    __radd__ = __add__
+
+    def __sub__(self, val):
+        return self._apply(operator.sub, val)
+
+    def __mul__(self, val):
+        return self._apply(operator.mul, val)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, val):
+        return self._apply(operator.truediv, val)
+
+    def __deepcopy__(self, memo):
+        return self  # immutable
+
+    def __eq__(self, other):
+        if isinstance(other, SequenceArray):
+            values, offsets = self._compact()
+            other_values, other_offsets = other._compact()
+            return (np.array_equal(offsets, other_offsets)
+                    and np.array_equal(values, other_values))
+        return False
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "%s(size=%d, values=%s)" % (self.__class__.__name__, self.size, self._compact()[0])
+
+
 class ParameterSpace(object):
     """
     Representation of one or more points in a parameter space.
@@ -296,6 +531,15 @@ class ParameterSpace(object):
                     raise errors.NonExistentParameterError(name,
                                                            model_name,
                                                            valid_parameter_names=self.schema.keys())
+                if isinstance(value, SequenceArray):
+                    if not issubclass(expected_dtype, ArrayParameter):
+                        raise errors.InvalidParameterValueError(
+                            "For parameter %s expected %s, got %s" % (name, expected_dtype, type(value)))
+                    if self._shape is not None and value.shape != self._shape:
+                        raise errors.InvalidDimensionsError(
+                            "Parameter %s has shape %s, expected %s" % (name, value.shape, self._shape))
+                    self._parameters[name] = LazyArray(value, shape=self._shape)
+                    continue
                 if issubclass(expected_dtype, ArrayParameter) and isinstance(value, Sized):
                     if len(value) == 0:
                         value = ArrayParameter([])
@@ -365,6 +609,20 @@ class ParameterSpace(object):
         self._evaluated = True
         # should possibly update self.shape according to mask?
 
+    def evaluate_at(self, *indices):
+        """
+        Evaluate all lazy arrays contained in the parameter space only at the
+        points given by `indices`, one integer array per dimension, e.g. the
+        pre- and post-synaptic indices of the connections in a projection.
+        After evaluation, each value is a 1D array with one element per point.
+        """
+        if self._shape is None:
+            raise Exception("Must set shape of parameter space before evaluating")
+        for name, value in self._parameters.items():
+            self._parameters[name] = value.evaluate_at(*indices)
+        self._evaluated_shape = (len(indices[0]),)
+        self._evaluated = True
+
     def as_dict(self):
         """
         Return a plain dict containing the same keys and values as the
@@ -404,7 +662,7 @@ class ParameterSpace(object):
         for i in range(self._evaluated_shape[0]):
             D = {}
             for name, value in self._parameters.items():
-                if is_listlike(value):
+                if is_listlike(value) or isinstance(value, SequenceArray):
                     D[name] = value[i]
                 else:
                     D[name] = value
@@ -13,8 +13,10 @@ internal use.
 import logging
 import numpy as np
 import os
-from copy import copy
-from collections import defaultdict
+import pickle
+import shutil
+import tempfile
+from collections import defaultdict, OrderedDict
 from warnings import warn
 from pyNN import errors
 import neo
@@ -113,6 +115,25 @@ def mpi_sum(x):
         return x
 
 
+def count_spikes(indices, times, size, t_start=None, t_stop=None):
+    """
+    Return the number of spikes emitted by each of `size` cells, as an array
+    of integers, given the index of the cell emitting each spike and the spike
+    times. If `t_start` and/or `t_stop` are given (in ms), only spikes with
+    `t_start <= t < t_stop` are counted.
+    """
+    indices = np.asarray(indices, dtype=int)
+    if t_start is not None or t_stop is not None:
+        times = np.asarray(times)
+        mask = np.ones(times.shape, dtype=bool)
+        if t_start is not None:
+            mask &= times >= t_start
+        if t_stop is not None:
+            mask &= times < t_stop
+        indices = indices[mask]
+    return np.bincount(indices, minlength=size).astype(np.int64)
+
+
 def normalize_variables_arg(variables):
     """If variables is a single string, encapsulate it in a list."""
     if isinstance(variables, str) and variables != 'all':
@@ -154,6 +175,20 @@ def get_io(filename):
         raise Exception("file extension %s not supported" % extension)
 
 
+def _empty_segment_like(segment):
+    """
+    Return a new `Segment` with the same metadata and annotations as `segment`,
+    but no data.
+
+    With recent versions of Neo, a shallow copy of a segment shares its lists of
+    data objects with the original, so cannot be used for this.
+    """
+    return neo.Segment(name=segment.name, description=segment.description,
+                       file_origin=segment.file_origin, file_datetime=segment.file_datetime,
+                       rec_datetime=segment.rec_datetime, index=segment.index,
+                       **segment.annotations)
+
+
 def filter_by_variables(segment, variables):
     """
     Return a new `Segment` containing only recordings of the variables given in
@@ -162,10 +197,12 @@ def filter_by_variables(segment, variables):
     if variables == 'all':
         return segment
     else:
-        new_segment = copy(segment)  # shallow copy
-        if 'spikes' not in variables:
-            new_segment.spiketrains = []
+        new_segment = _empty_segment_like(segment)
+        if 'spikes' in variables:
+            new_segment.spiketrains = list(segment.spiketrains)
         new_segment.analogsignals = [sig for sig in segment.analogsignals if sig.name in variables]
+        for kind in ("irregularlysampledsignals", "events", "epochs"):
+            setattr(new_segment, kind, list(getattr(segment, kind)))
         # also need to handle Units, RecordingChannels
         return new_segment
 
@@ -183,7 +220,7 @@ def remove_duplicate_spiketrains(data):
 
 
 class DataCache(object):
-    # primitive implementation for now, storing in memory - later can consider caching to disk
+    """Stores the completed segments of a recording in memory."""
 
     def __init__(self):
         self._data = []
@@ -196,12 +233,219 @@ class DataCache(object):
             logger.debug("Adding %s to cache" % obj)
             self._data.append(obj)
 
+    def get_segments(self, variables):
+        """Return a list of the cached segments, containing only the given variables."""
+        return [filter_by_variables(segment, variables) for segment in self._data]
+
     def clear(self):
         self._data = []
 
 
+class _SegmentPickler(pickle.Pickler):
+    """
+    Pickles the data objects of a Neo `Segment` without the segment itself,
+    which they refer to.
+    """
+
+    def __init__(self, file, segment):
+        pickle.Pickler.__init__(self, file, pickle.HIGHEST_PROTOCOL)
+        self.segment = segment
+
+    def persistent_id(self, obj):
+        if obj is self.segment:
+            return "segment"
+        return None
+
+
+class _SegmentUnpickler(pickle.Unpickler):
+
+    def persistent_load(self, pid):
+        return None  # the data objects are attached to a new segment when loaded
+
+
+class DiskDataCache(DataCache):
+    """
+    Stores the completed segments of a recording in temporary files, one per
+    segment, keeping only the `max_in_memory` most recently used segments in
+    memory as well.
+
+    Each recorded variable is stored separately, so that when segments are
+    retrieved only the data for the requested variables are read back. The
+    files are deleted when the cache is cleared.
+    """
+
+    def __init__(self, max_in_memory=0, directory=None):
+        self.max_in_memory = max_in_memory
+        self.directory = directory
+        self._tmpdir = None
+        self._index = []  # for each segment, the file path and a list of (kind, name, offset)
+        self._in_memory = OrderedDict()  # least recently used first
+
+    def __iter__(self):
+        return (self._load(i, 'all') for i in range(len(self._index)))
+
+    def __len__(self):
+        return len(self._index)
+
+    def store(self, obj):
+        if self._tmpdir is None:
+            self._tmpdir = tempfile.mkdtemp(prefix="pyNN_segments_", dir=self.directory)
+        path = os.path.join(self._tmpdir, "segment%05d.pkl" % len(self._index))
+        logger.debug("Adding %s to cache in %s" % (obj, path))
+        items = [("segment", None, _empty_segment_like(obj))]
+        if len(obj.spiketrains) > 0:
+            items.append(("spiketrains", "spikes", obj.spiketrains))
+        for kind in ("analogsignals", "irregularlysampledsignals"):
+            items.extend((kind, signal.name, signal) for signal in getattr(obj, kind))
+        entries = []
+        with open(path, 'wb') as fp:
+            pickler = _SegmentPickler(fp, obj)
+            for kind, name, item in items:
+                entries.append((kind, name, fp.tell()))
+                pickler.clear_memo()  # each item must be loadable on its own
+                pickler.dump(item)
+        self._index.append((path, entries))
+        self._remember(len(self._index) - 1, obj)
+
+    def _remember(self, i, segment):
+        if self.max_in_memory > 0:
+            self._in_memory[i] = segment
+            self._in_memory.move_to_end(i)
+            while len(self._in_memory) > self.max_in_memory:
+                self._in_memory.popitem(last=False)
+
+    def _load(self, i, variables):
+        if i in self._in_memory:
+            self._in_memory.move_to_end(i)
+            return filter_by_variables(self._in_memory[i], variables)
+        path, entries = self._index[i]
+        with open(path, 'rb') as fp:
+            def load(offset):
+                fp.seek(offset)
+                return _SegmentUnpickler(fp).load()
+            segment = load(entries[0][2])
+            for kind, name, offset in entries[1:]:
+                if variables == 'all' or name in variables:
+                    if kind == "spiketrains":
+                        segment.spiketrains = load(offset)
+                    else:
+                        getattr(segment, kind).append(load(offset))
+        if variables == 'all':
+            self._remember(i, segment)
+        return segment
+
+    def get_segments(self, variables):
+        __doc__ = DataCache.get_segments.__doc__
+        return [self._load(i, variables) for i in range(len(self._index))]
+
+    def clear(self):
+        if self._tmpdir is not None:
+            shutil.rmtree(self._tmpdir, ignore_errors=True)
+            self._tmpdir = None
+        self._index = []
+        self._in_memory = OrderedDict()
+
+    def __del__(self):
+        try:
+            self.clear()
+        except Exception:  # e.g. during interpreter shutdown
+            pass
+
+
+class Reduction(object):
+    """
+    Population-level reduction of a recorded variable, accumulated incrementally
+    so that only the reduced values are kept in memory.
+
+    For spikes, the only operation is "count", giving the total number of spikes
+    emitted by the recorded cells in each time bin of width `interval` (in ms).
+    For state variables, the operation is "mean" or "sum" over the recorded
+    cells at each sample time, `interval` being the sampling interval.
+    """
+    operations = {'spikes': ('count',), None: ('mean', 'sum')}
+
+    def __init__(self, operation, interval):
+        self.operation = operation
+        self.interval = interval
+        self.reset()
+
+    def reset(self):
+        """Discard all accumulated values."""
+        self.first = 0  # index of the bin or sample time corresponding to totals[0]
+        self.totals = np.zeros((0,))
+        self.counts = np.zeros((0,), dtype=int)
+
+    def index(self, times):
+        """Return the indices of the bins or sample times containing `times` (in ms)."""
+        if self.operation == 'count':
+            return np.floor(np.asarray(times) / self.interval + 1e-9).astype(int)
+        else:
+            return np.rint(np.asarray(times) / self.interval).astype(int)
+
+    def add(self, times, values=None):
+        """
+        Add recorded data, given as flat arrays of event times (in ms) and, for
+        state variables, the corresponding values, for any of the recorded cells.
+        """
+        index = self.index(times) - self.first
+        mask = index >= 0
+        if not mask.all():
+            index = index[mask]
+            if values is not None:
+                values = np.asarray(values)[mask]
+        if index.size == 0:
+            return
+        n = index.max() + 1
+        if n > self.counts.size:
+            extra = n - self.counts.size
+            self.totals = np.hstack((self.totals, np.zeros(extra)))
+            self.counts = np.hstack((self.counts, np.zeros(extra, dtype=int)))
+        self.counts[:n] += np.bincount(index, minlength=n)
+        if values is not None:
+            self.totals[:n] += np.bincount(index, weights=values, minlength=n)
+
+    def discard(self, t):
+        """Discard the values for bins or sample times before time `t` (in ms)."""
+        first = int(self.index(t))
+        n_drop = min(max(first - self.first, 0), self.counts.size)
+        self.totals = self.totals[n_drop:]
+        self.counts = self.counts[n_drop:]
+        self.first = max(first, self.first)
+
+    def values(self, stop):
+        """
+        Return an array of the reduced values from index `first` up to, but not
+        including, index `stop`. For state variables, sample times for which no
+        data have been recorded are given the value NaN.
+        """
+        n = max(stop - self.first, 0)
+        counts = np.zeros(n, dtype=int)
+        totals = np.zeros(n)
+        m = min(n, self.counts.size)
+        counts[:m] = self.counts[:m]
+        totals[:m] = self.totals[:m]
+        if self.operation == 'count':
+            return counts.astype(float)
+        values = np.where(counts > 0, totals, np.nan)
+        if self.operation == 'mean':
+            values /= np.where(counts > 0, counts, 1)
+        return values
+
+    def reduce(self, values):
+        """Apply the reduction to an array of values for individual cells."""
+        if self.operation == 'mean':
+            return np.mean(values)
+        else:
+            return np.sum(values)
+
+
 class Recorder(object):
     """Encapsulates data and functions related to recording model variables."""
+    #: interval (in ms of simulated time) at which data for variables recorded
+    #: with a reduction are retrieved from the simulator and reduced
+    reduction_interval = 100.0
+    #: whether the data for reduced variables can be retrieved during a run
+    _incremental_reductions = True
 
     def __init__(self, population, file=None):
         """
@@ -217,48 +461,177 @@ class Recorder(object):
         self.file = file
         self.population = population  # needed for writing header information
         self.recorded = defaultdict(set)
-        self.cache = DataCache()
+        segments_in_memory = getattr(self._simulator.state, "segments_in_memory", None)
+        if segments_in_memory is None:
+            self.cache = DataCache()
+        else:
+            self.cache = DiskDataCache(segments_in_memory)
         self._simulator.state.recorders.add(self)
         self.clear_flag = False
         self._recording_start_time = self._simulator.state.t * pq.ms
         self.sampling_interval = self._simulator.state.dt
+        self.sampling_intervals = {}  # per variable
+        self.recording_windows = {}   # per variable, (start, stop) in ms; absent means the whole run
+        self.reductions = {}          # per variable, for variables recorded with a reduction
         if hasattr(self._simulator.state, "record_sample_times"):
             self.record_times = self._simulator.state.record_sample_times
         else:
             self.record_times = False
 
-    def record(self, variables, ids, sampling_interval=None):
+    def record(self, variables, ids, sampling_interval=None, start=None, stop=None,
+               reduce=None, bin=None):
         """
         Add the cells in `ids` to the sets of recorded cells for the given variables.
         """
         logger.debug('Recorder.record(<%d cells>)' % len(ids))
-        self._check_sampling_interval(sampling_interval)
-
         ids = set([id for id in ids if id.local])
         for variable in normalize_variables_arg(variables):
             if not self.population.can_record(variable):
                 raise errors.RecordingError(variable, self.population.celltype)
+            self._set_recording_options(variable, sampling_interval, start, stop, reduce, bin)
             new_ids = ids.difference(self.recorded[variable])
             self.recorded[variable] = self.recorded[variable].union(ids)
             self._record(variable, new_ids, sampling_interval)
 
-    def _check_sampling_interval(self, sampling_interval):
+    def _set_recording_options(self, variable, sampling_interval, start, stop,
+                               reduce=None, bin=None):
+        """
+        Store the sampling interval, recording window and reduction for
+        `variable`, after checking that record() has not been called previously
+        for this variable with different values. Sampling intervals and
+        recording windows do not apply to recording of spikes.
+        """
+        if reduce is not None or bin is not None:
+            self._check_reduction(variable, reduce, bin, start, stop)
+        elif variable in self.reductions:
+            raise ValueError(
+                "'%s' is already recorded with reduce='%s'. A variable cannot be recorded "
+                "both with and without a reduction." % (variable, self.reductions[variable].operation))
+        if variable == 'spikes':
+            if start is not None or stop is not None:
+                raise ValueError("Recording windows can only be used for state variables, not for spikes.")
+            if reduce is not None and variable not in self.reductions:
+                self.reductions[variable] = Reduction(reduce, bin)
+            return
+        if variable in self.sampling_intervals:
+            if sampling_interval is not None and sampling_interval != self.sampling_intervals[variable]:
+                raise ValueError(
+                    "All neurons in a population must be recorded with the same sampling interval "
+                    "for a given variable.")
+            if (start, stop) != (None, None) and (start, stop) != self.recording_windows.get(variable):
+                raise ValueError(
+                    "All neurons in a population must be recorded with the same recording window "
+                    "for a given variable.")
+        else:
+            self.sampling_intervals[variable] = sampling_interval or self._simulator.state.dt
+            if (start, stop) != (None, None):
+                if stop is not None and stop <= (start or 0.0):
+                    raise ValueError("The end of the recording window must be after its start.")
+                self.recording_windows[variable] = (start, stop)
+        if reduce is not None and variable not in self.reductions:
+            self.reductions[variable] = Reduction(reduce, self.sampling_intervals[variable])
+
+    def _check_reduction(self, variable, reduce, bin, start, stop):
         """
-        Check whether record() has been called previously with a different sampling interval
-        (we exclude recording of spikes, as the sampling interval does not apply in that case)
+        Check that recording `variable` with the reduction `reduce` is possible
+        and consistent with any previous calls to record() for this variable.
         """
-        if sampling_interval is not None and sampling_interval != self.sampling_interval:
-            recorded_variables = list(self.recorded.keys())
-            if "spikes" in recorded_variables:
-                recorded_variables.remove("spikes")
-            if len(recorded_variables) > 0:
+        if variable == 'spikes':
+            if reduce not in Reduction.operations['spikes']:
+                raise ValueError("Spikes can only be recorded with reduce='count', not '%s'." % reduce)
+            if bin is None or bin <= 0:
+                raise ValueError("A positive bin width, `bin`, must be given with reduce='count'.")
+        else:
+            if reduce not in Reduction.operations[None]:
+                raise ValueError("State variables can be recorded with reduce=%s, not '%s'."
+                                 % (" or ".join("'%s'" % op for op in Reduction.operations[None]),
+                                    reduce))
+            if bin is not None:
+                raise ValueError("`bin` only applies to spikes. The values of state variables "
+                                 "are reduced at each sample time.")
+            if self.record_times:
+                raise ValueError("State variables cannot be recorded with a reduction when "
+                                 "sample times are recorded (variable time step integration).")
+        if start is not None or stop is not None:
+            raise ValueError("Recording windows cannot be combined with reductions.")
+        if variable in self.reductions:
+            reduction = self.reductions[variable]
+            if reduction.operation != reduce or (bin is not None and bin != reduction.interval):
                 raise ValueError(
-                    "All neurons in a population must be recorded with the same sampling interval.")
+                    "All neurons in a population must be recorded with the same reduction "
+                    "for a given variable.")
+        elif self.recorded.get(variable):
+            raise ValueError(
+                "'%s' is already recorded without a reduction. A variable cannot be recorded "
+                "both with and without a reduction." % variable)
+
+    def _collect_reductions(self):
+        """
+        Retrieve the data recorded by the simulator since the last call for
+        variables recorded with a reduction, and add them to the reductions.
+        """
+        for variable, reduction in self.reductions.items():
+            times, values = self._drain(variable)
+            reduction.add(times, values)
+
+    def _reduction_callback(self, t):
+        """Called during run() so that data for reduced variables do not accumulate."""
+        self._collect_reductions()
+        return t + self.reduction_interval
+
+    def _get_reduced_signal(self, variable):
+        """Return the reduced values of `variable` as a single-channel `AnalogSignal`."""
+        reduction = self.reductions[variable]
+        t = self._simulator.state.t
+        if variable == 'spikes':
+            stop = int(reduction.index(t))  # only complete bins
+            units = pq.dimensionless
+        else:
+            stop = int(reduction.index(t)) + 1
+            units = self.population.find_units(variable)
+        values = reduction.values(stop)
+        if variable != 'spikes' and reduction.first == 0 and values.size > 0 and np.isnan(values[0]):
+            # some simulators do not record values at the zeroth time step
+            ids = np.fromiter(self.recorded[variable], dtype=int)
+            initial_values = self.population.initial_values[variable][self.population.id_to_index(ids)]
+            values[0] = reduction.reduce(initial_values)
+        annotations = {}
+        if variable == 'spikes':
+            annotations["bin"] = reduction.interval
+        return neo.AnalogSignal(
+            values[:, np.newaxis],
+            units=units,
+            t_start=reduction.first * reduction.interval * pq.ms,
+            sampling_period=reduction.interval * pq.ms,
+            name=variable,
+            source_population=self.population.label,
+            reduction=reduction.operation,
+            **annotations
+        )
+
+    def _n_samples(self, variable):
+        """
+        Return the number of values of `variable` that should have been
+        recorded for each cell up to the current time, from the start of the
+        simulation or of the recording window.
+        """
+        interval = self.sampling_intervals[variable]
+        start, stop = self.recording_windows.get(variable, (None, None))
+        t_first = start or 0.0
+        t_last = self._simulator.state.t
+        if stop is not None:
+            t_last = min(stop, t_last)
+        if t_last < t_first:
+            return 0
+        return int(round((t_last - t_first) / interval)) + 1
 
     def reset(self):
         """Reset the list of things to be recorded."""
         self._reset()
         self.recorded = defaultdict(set)
+        self.sampling_intervals = {}
+        self.recording_windows = {}
+        self.reductions = {}
 
     def filter_recorded(self, variable, filter_ids):
         if filter_ids is not None:
@@ -273,7 +646,12 @@ class Recorder(object):
         variables_to_include = set(self.recorded.keys())
         if variables != 'all':
             variables_to_include = variables_to_include.intersection(set(variables))
-        for variable in variables_to_include:
+        reduced_variables = sorted(variables_to_include.intersection(self.reductions))
+        if reduced_variables:
+            self._collect_reductions()
+            for variable in reduced_variables:
+                segment.analogsignals.append(self._get_reduced_signal(variable))
+        for variable in variables_to_include.difference(reduced_variables):
             if variable == 'spikes':
                 t_stop = self._simulator.state.t * pq.ms  # must run on all MPI nodes
                 sids = sorted(self.filter_recorded('spikes', filter_ids))
@@ -346,8 +724,11 @@ class Recorder(object):
                         segment.irregularlysampledsignals.extend(signals)
                     else:
                         t_start = self._recording_start_time
+                        window_start = self.recording_windows.get(variable, (None, None))[0]
+                        if window_start is not None:
+                            t_start = max(t_start, window_start * pq.ms)
                         t_stop = self._simulator.state.t * pq.ms
-                        sampling_period = self.sampling_interval * pq.ms
+                        sampling_period = self.sampling_intervals.get(variable, self.sampling_interval) * pq.ms
                         current_time = self._simulator.state.t * pq.ms
                         signal = neo.AnalogSignal(
                             signal_array,
@@ -369,8 +750,7 @@ class Recorder(object):
         """Return the recorded data as a Neo `Block`."""
         variables = normalize_variables_arg(variables)
         data = neo.Block()
-        data.segments = [filter_by_variables(segment, variables)
-                         for segment in self.cache]
+        data.segments = self.cache.get_segments(variables)
         if self._simulator.state.running:  # reset() has not been called, so current segment is not in cache
             data.segments.append(self._get_current_segment(
                 filter_ids=filter_ids, variables=variables, clear=clear))
@@ -395,6 +775,10 @@ class Recorder(object):
         self.cache.clear()
         self.clear_flag = True
         self._recording_start_time = self._simulator.state.t * pq.ms
+        if self.reductions and self._incremental_reductions:
+            self._collect_reductions()
+        for reduction in self.reductions.values():
+            reduction.discard(self._simulator.state.t)
         self._clear_simulator()
 
     def write(self, variables, file=None, gather=False, filter_ids=None,
@@ -443,6 +827,62 @@ class Recorder(object):
             N = gather_dict(N)
         return N
 
+    def count_array(self, variable='spikes', gather=True, filter_ids=None,
+                    t_start=None, t_stop=None):
+        """
+        Return the number of data points for each cell, as an array of integers
+        in the same order as the cells in the population. Cells which are not
+        recorded (or, if `gather` is False, not local) have a count of zero.
+
+        If `t_start` and/or `t_stop` are given (in ms), only spikes with
+        `t_start <= t < t_stop` are counted.
+
+        With MPI, the counts from all nodes are combined with a single
+        reduction, and are available on all nodes.
+        """
+        if variable != 'spikes':
+            raise Exception("Only implemented for spikes.")
+        counts = self._local_count_array(variable, filter_ids, t_start, t_stop)
+        if gather and self._simulator.state.num_processes > 1:
+            mpi_comm, mpi_flags = get_mpi_comm()
+            total = np.empty_like(counts)
+            mpi_comm.Allreduce(counts, total, op=mpi_flags['SUM'])
+            counts = total
+        return counts
+
+    def _local_count_array(self, variable, filter_ids=None, t_start=None, t_stop=None):
+        """
+        Return the number of data points for each local cell, as an array
+        with one element per cell in the population.
+
+        This implementation is built on `_local_count()` and
+        `_get_spiketimes()`; backends can over-ride it to count directly from
+        the simulator's own arrays.
+        """
+        size = self.population.size
+        if t_start is None and t_stop is None:
+            N = self._local_count(variable, filter_ids)
+            counts = np.zeros(size, dtype=np.int64)
+            if N:
+                ids = np.fromiter(N.keys(), dtype=int, count=len(N))
+                counts[self.population.id_to_index(ids)] = np.fromiter(
+                    N.values(), dtype=np.int64, count=len(N))
+            return counts
+        sids = sorted(self.filter_recorded(variable, filter_ids))
+        if not sids:
+            return np.zeros(size, dtype=np.int64)
+        data = self._get_spiketimes(sids)
+        if isinstance(data, dict):
+            spiketimes = [np.asarray(data.get(int(id), []), dtype=float) for id in sids]
+            id_array = np.repeat(np.array(sids, dtype=int), [t.size for t in spiketimes])
+            times = np.concatenate(spiketimes)
+        else:
+            id_array, times = data
+        if id_array.size == 0:
+            return np.zeros(size, dtype=np.int64)
+        return count_spikes(self.population.id_to_index(np.asarray(id_array, dtype=int)),
+                            times, size, t_start, t_stop)
+
     def store_to_cache(self, annotations=None):
         # make sure we haven't called get with clear=True since last reset
         # and that we did not do two resets in a row
@@ -454,3 +894,5 @@ class Recorder(object):
             self.cache.store(segment)
         self.clear_flag = False
         self._recording_start_time = 0.0 * pq.ms
+        for reduction in self.reductions.values():
+            reduction.reset()
@@ -8,6 +8,11 @@ Classes:
     PickleFile
     NumpyBinaryFile
     HDF5ArrayFile - requires PyTables
+    NumpyMemmapFile
+    HDF5ChunkedFile - requires h5py
+
+The last two can be written incrementally and read in part (see
+:class:`StreamingFile`), for arrays too large to hold in memory.
 
 :copyright: Copyright 2006-2022 by the PyNN team, see AUTHORS.
 :license: CeCILL, see LICENSE for details.
@@ -16,16 +21,27 @@ Classes:
 
 import numpy as np
 import os
+import io
 import shutil
 import pickle
+import json
+import warnings
+import multiprocessing
 
 try:
     import tables
     have_hdf5 = True
 except ImportError:
     have_hdf5 = False
+try:
+    import h5py
+    have_h5py = True
+except ImportError:
+    have_h5py = False
 
 DEFAULT_BUFFER_SIZE = 10000
+DEFAULT_CHUNK_ROWS = 65536
+DEFAULT_CHUNK_BYTES = 2**26
 
 
 def _savetxt(filename, data, format, delimiter):
@@ -74,6 +90,48 @@ def savez(file, *args, **kwds):
     shutil.rmtree(direc)
 
 
+def _text_byte_ranges(filename, chunk_bytes):
+    """
+    Split a text file into consecutive byte ranges of about `chunk_bytes`
+    bytes, each of which ends at the end of a line.
+    """
+    size = os.path.getsize(filename)
+    boundaries = [0]
+    with open(filename, 'rb') as fileobj:
+        while boundaries[-1] < size:
+            if boundaries[-1] + chunk_bytes >= size:
+                boundaries.append(size)
+            else:
+                fileobj.seek(boundaries[-1] + chunk_bytes - 1)
+                fileobj.readline()  # move to the end of the current line
+                boundaries.append(fileobj.tell())
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def _read_text_range(args):
+    """
+    Parse the lines of numbers in a byte range of a text file into a 2D
+    array. Lines starting with "#" are ignored. The columns are separated by
+    `delimiter`, or by whitespace if `delimiter` is None.
+    """
+    filename, start, stop, delimiter = args
+    with open(filename, 'rb') as fileobj:
+        fileobj.seek(start)
+        block = fileobj.read(stop - start)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)  # blocks containing only comments
+        return np.loadtxt(io.BytesIO(block), delimiter=delimiter, comments='#', ndmin=2)
+
+
+def _guess_delimiter(filename):
+    """Return "," if the first line of data in a text file contains commas, otherwise None."""
+    with open(filename, 'rb') as fileobj:
+        for line in fileobj:
+            if line.strip() and not line.lstrip().startswith(b'#'):
+                return ',' if b',' in line else None
+    return None
+
+
 class BaseFile(object):
     """
     Base class for PyNN File classes.
@@ -105,10 +163,13 @@ class BaseFile(object):
 
     def rename(self, filename):
         self.close()
-        try:  # Need this because in parallel, only one node will delete the file with NFS
-            os.remove(self.name)
-        except Exception:
-            pass
+        if 'w' in self.mode:
+            # the file was created on opening, but we don't want to delete an
+            # existing file we were only going to read from
+            try:  # Need this because in parallel, only one node will delete the file with NFS
+                os.remove(self.name)
+            except Exception:
+                pass
         self.name = filename
         self.fileobj = open(self.name, self.mode, DEFAULT_BUFFER_SIZE)
 
@@ -141,8 +202,16 @@ class StandardTextFile(BaseFile):
     """
     Data and metadata is written as text. Metadata is written at the top of the
     file, with each line preceded by "#". Data is written with one data point per line.
+
+    Large files can be read in pieces with :meth:`iter_chunks`, using several
+    processes if `processes` is greater than 1.
     """
 
+    def __init__(self, filename, mode='rb', chunk_bytes=DEFAULT_CHUNK_BYTES, processes=1):
+        BaseFile.__init__(self, filename, mode)
+        self.chunk_bytes = chunk_bytes
+        self.processes = processes
+
     def write(self, data, metadata):
         __doc__ = BaseFile.write.__doc__
         self._check_open()
@@ -161,6 +230,32 @@ class StandardTextFile(BaseFile):
         self._check_open()
         return np.loadtxt(self.fileobj)
 
+    def iter_chunks(self, delimiter="auto"):
+        """
+        Iterate over the data in the file as 2D arrays, each containing the
+        lines from about `chunk_bytes` bytes of the file, in order. Columns
+        may be separated by whitespace or by commas (with the default
+        `delimiter`, this is determined from the first line of data).
+
+        With `processes` > 1, the chunks are parsed in parallel by a pool of
+        worker processes.
+        """
+        self._check_open()
+        if delimiter == "auto":
+            delimiter = _guess_delimiter(self.name)
+        tasks = [(self.name, start, stop, delimiter)
+                 for start, stop in _text_byte_ranges(self.name, self.chunk_bytes)]
+        if self.processes > 1 and len(tasks) > 1:
+            with multiprocessing.Pool(min(self.processes, len(tasks))) as pool:
+                for chunk in pool.imap(_read_text_range, tasks):
+                    if chunk.size > 0:
+                        yield chunk
+        else:
+            for task in tasks:
+                chunk = _read_text_range(task)
+                if chunk.size > 0:
+                    yield chunk
+
     def get_metadata(self):
         self._check_open()
         D = {}
@@ -285,3 +380,228 @@ if have_hdf5:
             for name in node._v_attrs._f_list():
                 D[name] = node.attrs.__getattr__(name)
             return D
+
+
+class StreamingFile(BaseFile):
+    """
+    Base class for PyNN File classes which, as well as :meth:`write`, support
+    adding rows to the end of the data with :meth:`append`, and reading only
+    some of the rows with ``read(rows=...)``, so that large arrays can be
+    written and read in pieces rather than all at once.
+
+    The file is only opened when it is first written to or read from.
+    """
+
+    def __init__(self, filename, mode='r', chunk_rows=DEFAULT_CHUNK_ROWS):
+        """
+        Create a file object for the given filename and mode ('r', 'w' or 'a').
+        """
+        self.name = filename
+        self.mode = mode.replace('b', '')
+        self.chunk_rows = chunk_rows
+        dir = os.path.dirname(filename)
+        if dir and not os.path.exists(dir):
+            try:  # wrapping in try...except block for MPI
+                os.makedirs(dir)
+            except IOError:
+                pass  # we assume that the directory was already created by another MPI node
+
+    def rename(self, filename):
+        self.close()
+        self.name = filename
+
+    def append(self, data):
+        """
+        Add the rows of `data`, a NumPy array, to the end of the data in the
+        file, creating it if necessary.
+        """
+        raise NotImplementedError
+
+    def read(self, rows=None):
+        """
+        Read data from the file and return a NumPy array. If `rows` (a slice,
+        an array of indices or a boolean mask) is given, only those rows are
+        read.
+        """
+        raise NotImplementedError
+
+    @property
+    def shape(self):
+        """Shape of the array in the file."""
+        raise NotImplementedError
+
+    def iter_chunks(self):
+        """Iterate over the data in the file, `chunk_rows` rows at a time."""
+        n_rows = self.shape[0]
+        for start in range(0, n_rows, self.chunk_rows):
+            yield self.read(rows=slice(start, min(start + self.chunk_rows, n_rows)))
+
+    def write_columns(self, columns, metadata):
+        """
+        Write a list of equal-length 1D arrays as the columns of a 2D array,
+        `chunk_rows` rows at a time, without building the full 2D array.
+        """
+        columns = [np.asarray(column) for column in columns]
+        n_rows = columns[0].size if columns else 0
+        dtype = np.result_type(*columns) if columns else float
+        self.write(np.empty((0, len(columns)), dtype=dtype), metadata)
+        for start in range(0, n_rows, self.chunk_rows):
+            self.append(np.column_stack([column[start:start + self.chunk_rows]
+                                         for column in columns]))
+
+    def close(self):
+        """Close the file."""
+        pass
+
+
+class NumpyMemmapFile(StreamingFile):
+    """
+    Data are saved in NumPy .npy format, and memory-mapped when read, so that
+    only the parts of the array that are accessed are loaded from disk.
+    Metadata are saved as JSON in a separate file, whose name is that of the
+    data file with ".json" appended.
+    """
+
+    @property
+    def metadata_file(self):
+        return self.name + ".json"
+
+    def write(self, data, metadata):
+        __doc__ = BaseFile.write.__doc__
+        data = np.ascontiguousarray(data)
+        with open(self.name, 'wb') as fileobj:
+            np.lib.format.write_array(fileobj, data)
+        with open(self.metadata_file, 'w') as fileobj:
+            json.dump(metadata, fileobj, default=str)
+
+    def append(self, data):
+        __doc__ = StreamingFile.append.__doc__
+        data = np.asarray(data)
+        if not os.path.exists(self.name):
+            self.write(data, {})
+            return
+        with open(self.name, 'r+b') as fileobj:
+            version = np.lib.format.read_magic(fileobj)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(fileobj)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(fileobj)
+            data_offset = fileobj.tell()
+            if fortran_order or data.shape[1:] != shape[1:]:
+                raise ValueError("Cannot append data with shape %s to an array with shape %s"
+                                 % (data.shape, shape))
+            new_shape = (shape[0] + data.shape[0],) + shape[1:]
+            # NumPy pads the header so that it can hold a larger first dimension,
+            # which lets us update the shape in place
+            fileobj.seek(0)
+            header = {"descr": np.lib.format.dtype_to_descr(dtype),
+                      "fortran_order": False,
+                      "shape": new_shape}
+            if version == (1, 0):
+                np.lib.format.write_array_header_1_0(fileobj, header)
+            else:
+                np.lib.format.write_array_header_2_0(fileobj, header)
+            if fileobj.tell() != data_offset:
+                raise IOError("Unable to resize the array in %s" % self.name)
+            fileobj.seek(0, os.SEEK_END)
+            fileobj.write(np.ascontiguousarray(data, dtype=dtype).tobytes())
+
+    def read(self, rows=None):
+        __doc__ = StreamingFile.read.__doc__
+        data = np.load(self.name, mmap_mode='r')
+        if rows is None:
+            return data
+        return data[rows]
+
+    @property
+    def shape(self):
+        return np.load(self.name, mmap_mode='r').shape
+
+    def get_metadata(self):
+        __doc__ = BaseFile.get_metadata.__doc__
+        if not os.path.exists(self.metadata_file):
+            return {}
+        with open(self.metadata_file) as fileobj:
+            return json.load(fileobj)
+
+
+if have_h5py:
+    class HDF5ChunkedFile(StreamingFile):
+        """
+        Data are saved in a chunked, compressed HDF5 dataset named "data",
+        which can be extended with :meth:`append`. Metadata are saved as
+        attributes of this dataset.
+        """
+
+        def __init__(self, filename, mode='r', chunk_rows=DEFAULT_CHUNK_ROWS, compression="gzip"):
+            StreamingFile.__init__(self, filename, mode, chunk_rows)
+            self.compression = compression
+            self._h5file = None
+
+        @property
+        def _file(self):
+            if self._h5file is None:
+                self._h5file = h5py.File(self.name, self.mode)
+                if self.mode == 'w':
+                    self.mode = 'a'  # don't truncate the file if it is closed and reopened
+            return self._h5file
+
+        def _create_dataset(self, data):
+            if "data" in self._file:
+                del self._file["data"]
+            return self._file.create_dataset(
+                "data", data=data, maxshape=(None,) + data.shape[1:],
+                chunks=(self.chunk_rows,) + data.shape[1:],
+                compression=self.compression)
+
+        def write(self, data, metadata):
+            __doc__ = BaseFile.write.__doc__
+            node = self._create_dataset(np.asarray(data))
+            for name, value in metadata.items():
+                node.attrs[name] = value
+
+        def append(self, data):
+            __doc__ = StreamingFile.append.__doc__
+            data = np.asarray(data)
+            if "data" not in self._file:
+                self._create_dataset(data)
+                return
+            node = self._file["data"]
+            if data.shape[1:] != node.shape[1:]:
+                raise ValueError("Cannot append data with shape %s to an array with shape %s"
+                                 % (data.shape, node.shape))
+            n_rows = node.shape[0]
+            node.resize(n_rows + data.shape[0], axis=0)
+            node[n_rows:] = data
+
+        def read(self, rows=None):
+            __doc__ = StreamingFile.read.__doc__
+            node = self._file["data"]
+            if rows is None:
+                return node[()]
+            if isinstance(rows, slice):
+                return node[rows]
+            rows = np.asarray(rows)
+            if rows.dtype == bool:
+                rows = np.flatnonzero(rows)
+            # HDF5 requires the indices to be increasing and unique
+            unique_rows, inverse = np.unique(rows, return_inverse=True)
+            return node[unique_rows][inverse]
+
+        @property
+        def shape(self):
+            return self._file["data"].shape
+
+        def get_metadata(self):
+            __doc__ = BaseFile.get_metadata.__doc__
+            D = {}
+            for name, value in self._file["data"].attrs.items():
+                if isinstance(value, np.ndarray):
+                    value = value.tolist()
+                D[name] = value
+            return D
+
+        def close(self):
+            if getattr(self, "_h5file", None) is not None:
+                self._h5file.close()
+                self._h5file = None
@@ -31,6 +31,7 @@ import os
 from os.path import join, isdir, exists
 from collections import defaultdict
 import shutil
+import tempfile
 from string import Template
 import csv
 from warnings import warn
@@ -43,8 +44,12 @@ try:
 except ImportError:
     HAVE_H5PY = False
 import numpy as np
+from copy import deepcopy
+from pyNN import errors, recording
+from pyNN.connectors import Connector
 from pyNN.network import Network
-from pyNN.parameters import Sequence
+from pyNN.parameters import SequenceArray, LazyArray
+from pyNN.standardmodels import StandardSynapseType
 
 
 # Note: The SonataIO class will be moved to Neo once fully implemented
@@ -89,16 +94,29 @@ class SonataIO(BaseIO):
         block = neo.Block(file_origin=file_path)
         segment = neo.Segment(file_origin=file_path)
         spikes_file = h5py.File(file_path, 'r')
-        for gid in np.unique(spikes_file['spikes']['gids']):
-            index = spikes_file['spikes']['gids'][()] == gid
-            spike_times = spikes_file['spikes']['timestamps'][index]
-            segment.spiketrains.append(
-                neo.SpikeTrain(spike_times,
-                               t_stop=spike_times.max() + 1.0,
-                               t_start=0.0,
-                               units='ms',
-                               source_id=gid)
-            )
+        spikes_group = spikes_file['spikes']
+        if 'gids' in spikes_group:  # older layout, without node populations
+            populations = [(None, spikes_group['gids'], spikes_group['timestamps'])]
+        else:
+            populations = [(name, group['node_ids'], group['timestamps'])
+                           for name, group in spikes_group.items()]
+        for population, gids, timestamps in populations:
+            gids = gids[()]
+            order = np.argsort(gids, kind="stable")
+            gids = gids[order]
+            spike_times = timestamps[()][order]
+            boundaries = np.flatnonzero(np.diff(gids)) + 1
+            for gid, times in zip(gids[np.hstack(([0], boundaries)).astype(int)[:gids.size]],
+                                  np.split(spike_times, boundaries)):
+                spiketrain = neo.SpikeTrain(times,
+                                            t_stop=times.max() + 1.0,
+                                            t_start=0.0,
+                                            units='ms',
+                                            source_id=gid)
+                if population is not None:
+                    spiketrain.annotate(source_population=population)
+                segment.spiketrains.append(spiketrain)
+        spikes_file.close()
         block.segments.append(segment)
         return [block]
 
@@ -106,73 +124,316 @@ class SonataIO(BaseIO):
         """
         Write a list of Blocks to SONATA HDF5 files.
 
+        Spikes from each Block are written to a separate node population, named
+        after the Block. Signals from successive Segments are concatenated, and
+        so must be contiguous in time.
         """
         if not os.path.isdir(self.base_dir):
             os.makedirs(self.base_dir)
         # Write spikes
         spike_file_path = join(self.base_dir, self.spike_file)
-        spikes_file = h5py.File(spike_file_path, 'w')
-        spike_trains = []
+        spike_writer = SpikeWriter(spike_file_path, sort_order=self.spikes_sort_order)
         for block in blocks:
             for segment in block.segments:
-                spike_trains.extend(segment.spiketrains)
-        n_spikes = sum(st.size for st in spike_trains)
-
-        spikes_group = spikes_file.create_group("spikes")
-        all_spike_times = np.hstack(st.rescale('ms').magnitude
-                                    for st in spike_trains).astype(np.float64)
-        gids = np.hstack(st.annotations["source_index"] * np.ones(st.shape, dtype=np.uint64)
-                         for st in spike_trains)
-        # todo: handle sorting
-        spikes_group.create_dataset("timestamps", data=all_spike_times, dtype=np.float64)
-        spikes_group.create_dataset("gids", data=gids, dtype=np.uint64)
-        spikes_file.close()
+                spike_writer.write_spiketrains(block.name, segment.spiketrains)
+        spike_writer.close()
         logger.info("Wrote spike output to {}".format(spike_file_path))
 
         # Write signals
-        for report_name, report_metadata in self.report_config.items():
+        for report_name, report_metadata in (self.report_config or {}).items():
             file_name = report_metadata.get("file_name", report_name + ".h5")
             file_path = join(self.base_dir, file_name)
+            variable_name = report_metadata["variable_name"]
 
-            signal_file = h5py.File(file_path, 'w')
+            report_writer = ReportWriter(file_path, variable_name)
             targets = self.node_sets[report_metadata["cells"]]
             for block in blocks:
                 for (assembly, mask) in targets:
                     if block.name == assembly.label:
-                        if len(block.segments) > 1:
-                            raise NotImplementedError()
-                        signal = block.segments[0].filter(name=report_metadata["variable_name"])
-                        if len(signal) != 1:
-                            raise NotImplementedError()
-
                         node_ids = np.arange(assembly.size)[mask]
-
-                        report_group = signal_file.create_group("report")
-                        population_group = report_group.create_group(assembly.label)
-                        dataset = population_group.create_dataset("data", data=signal[0].magnitude)
-                        dataset.attrs["units"] = signal[0].units.dimensionality.string
-                        dataset.attrs["variable_name"] = report_metadata["variable_name"]
-                        n = dataset.shape[1]
-                        mapping_group = population_group.create_group("mapping")
-                        mapping_group.create_dataset("node_ids", data=node_ids)
-                        # "gids" not in the spec, but expected by some bmtk utils
-                        mapping_group.create_dataset("gids", data=node_ids)
-                        #mapping_group.create_dataset("index_pointers", data=np.zeros((n,)))
-                        mapping_group.create_dataset(
-                            "index_pointer", data=np.arange(0, n+1))  # ??spec unclear
-                        mapping_group.create_dataset("element_ids", data=np.zeros((n,)))
-                        mapping_group.create_dataset("element_pos", data=np.zeros((n,)))
-                        time_ds = mapping_group.create_dataset("time",
-                                                               data=(float(signal[0].t_start.rescale('ms')),
-                                                                     float(
-                                                                         signal[0].t_stop.rescale('ms')),
-                                                                     float(signal[0].sampling_period.rescale('ms'))))
-                        time_ds.attrs["units"] = "ms"
+                        for segment in block.segments:
+                            signals = segment.filter(name=variable_name,
+                                                     objects=neo.AnalogSignal)
+                            if len(signals) != 1:
+                                raise NotImplementedError()
+                            report_writer.write(assembly.label, signals[0], node_ids)
                         logger.info("Wrote block {} to {}".format(block.name, file_path))
-            signal_file.close()
+            report_writer.close()
+
+
+SORT_ORDERS = {
+    None: "none",
+    "none": "none",
+    "time": "by_time",
+    "by_time": "by_time",
+    "id": "by_id",
+    "by_id": "by_id"
+}
+
+
+class SpikeWriter(object):
+    """
+    Write spikes to a SONATA spikes file incrementally.
+
+    Spikes are appended to the file as they are written, so a SpikeWriter can
+    be used from a callback passed to :func:`run()` to save spikes in pieces
+    during a long simulation, e.g.::
+
+        writer = SpikeWriter("spikes.h5", sort_order="time")
+
+        def save_spikes(t):
+            data = population.get_data("spikes", clear=True)
+            writer.write_spiketrains(population.label, data.segments[0].spiketrains)
+            return t + 1000.0
+
+        sim.run(t_stop, callbacks=[save_spikes])
+        writer.close()
+
+    Arguments:
+        `file_path`:
+            the path of the file to be written.
+        `sort_order`:
+            "time", "id" or "none" (or None). If the spikes are to be sorted,
+            they are first written to a temporary file, and sorted, with an
+            external merge sort if they do not fit in memory, when the writer
+            is closed.
+        `buffer_size`:
+            the maximum number of spikes to hold in memory while sorting.
+    """
+
+    def __init__(self, file_path, sort_order=None, buffer_size=None):
+        if not HAVE_H5PY:
+            raise Exception("You need to install h5py to use SONATA")
+        if sort_order not in SORT_ORDERS:
+            raise ValueError("Invalid spike sort order: {}. Valid values are: {}".format(
+                sort_order, ", ".join(str(order) for order in SORT_ORDERS)))
+        self.file_path = file_path
+        self.sorting = SORT_ORDERS[sort_order]
+        self.buffer_size = buffer_size or SPIKE_BUFFER_SIZE
+        if self.sorting == "none":
+            self._file = h5py.File(file_path, 'w')
+        else:
+            self._file = h5py.File(file_path + ".unsorted", 'w')
+        self._spikes = self._file.create_group("spikes")
+
+    def write(self, population, node_ids, timestamps):
+        """
+        Append spikes from the node population named `population`.
+
+        `node_ids` and `timestamps` (in ms) are arrays of the same size.
+        """
+        group = self._spikes.require_group(population)
+        for name, values, dtype in (("node_ids", node_ids, 'u8'),
+                                    ("timestamps", timestamps, 'f8')):
+            if name not in group:
+                group.create_dataset(name, shape=(0,), maxshape=(None,), dtype=dtype,
+                                     chunks=(SPIKE_CHUNK_SIZE,),
+                                     compression="gzip", shuffle=True)
+            dataset = group[name]
+            n = dataset.shape[0]
+            dataset.resize((n + len(values),))
+            dataset[n:] = values
+
+    def write_spiketrains(self, population, spiketrains):
+        """
+        Append the spikes from a list of Neo SpikeTrains, annotated with the
+        index of the neuron that emitted them ("source_index"), from the node
+        population named `population`.
+        """
+        if len(spiketrains) == 0:
+            return
+        timestamps = np.concatenate([st.rescale('ms').magnitude for st in spiketrains])
+        node_ids = np.repeat([st.annotations["source_index"] for st in spiketrains],
+                             [st.size for st in spiketrains])
+        self.write(population, node_ids, timestamps)
+
+    def close(self):
+        """Sort the spikes, if requested, and close the file."""
+        if self.sorting == "none":
+            output = self._file
+        else:
+            output = h5py.File(self.file_path, 'w')
+            output.create_group("spikes")
+            keys = {"by_time": ["timestamps", "node_ids"],
+                    "by_id": ["node_ids", "timestamps"]}[self.sorting]
+            for population, group in self._spikes.items():
+                external_sort(group, output["spikes"].create_group(population),
+                              keys, self.buffer_size,
+                              self._file.create_group("runs/{}".format(population)))
+        for group in output["spikes"].values():
+            group.attrs["sorting"] = self.sorting
+            group["timestamps"].attrs["units"] = "ms"
+        output.close()
+        if self.sorting != "none":
+            self._file.close()
+            os.remove(self.file_path + ".unsorted")
+
+
+class ReportWriter(object):
+    """
+    Write recorded values of a state variable to a SONATA report file incrementally.
+
+    Each node population has its own group in the file. The data for a given
+    population must be written in order of time, with no gaps.
+    """
+
+    def __init__(self, file_path, variable_name):
+        if not HAVE_H5PY:
+            raise Exception("You need to install h5py to use SONATA")
+        self.file_path = file_path
+        self.variable_name = variable_name
+        self._file = h5py.File(file_path, 'w')
+        self._report = self._file.create_group("report")
+
+    def write(self, population, signal, node_ids):
+        """
+        Append the values in the Neo AnalogSignal `signal`, recorded from the
+        nodes `node_ids` of the node population named `population`.
+        """
+        t_start = float(signal.t_start.rescale('ms'))
+        t_stop = float(signal.t_stop.rescale('ms'))
+        sampling_period = float(signal.sampling_period.rescale('ms'))
+        data = signal.magnitude
+        n = data.shape[1]
+        if population not in self._report:
+            population_group = self._report.create_group(population)
+            dataset = population_group.create_dataset(
+                "data", shape=(0, n), maxshape=(None, n), dtype=data.dtype,
+                chunks=(max(1, SPIKE_CHUNK_SIZE // max(n, 1)), max(n, 1)),
+                compression="gzip")
+            dataset.attrs["units"] = signal.units.dimensionality.string
+            dataset.attrs["variable_name"] = self.variable_name
+            mapping_group = population_group.create_group("mapping")
+            mapping_group.create_dataset("node_ids", data=node_ids)
+            # "gids" not in the spec, but expected by some bmtk utils
+            mapping_group.create_dataset("gids", data=node_ids)
+            mapping_group.create_dataset(
+                "index_pointer", data=np.arange(0, n+1))  # ??spec unclear
+            mapping_group.create_dataset("element_ids", data=np.zeros((n,)))
+            mapping_group.create_dataset("element_pos", data=np.zeros((n,)))
+            time_ds = mapping_group.create_dataset("time",
+                                                   data=(t_start, t_start, sampling_period))
+            time_ds.attrs["units"] = "ms"
+        population_group = self._report[population]
+        dataset = population_group["data"]
+        time_ds = population_group["mapping"]["time"]
+        previous_stop, previous_period = time_ds[1], time_ds[2]
+        if dataset.shape[1] != n:
+            raise ValueError("Signal has {} channels, expected {}".format(n, dataset.shape[1]))
+        if not np.isclose(sampling_period, previous_period):
+            raise ValueError("Sampling period {} ms differs from that of earlier data ({} ms)".format(
+                sampling_period, previous_period))
+        if dataset.shape[0] > 0 and not np.isclose(t_start, previous_stop):
+            raise ValueError("Signal starting at {} ms does not follow on from earlier data, "
+                             "which end at {} ms".format(t_start, previous_stop))
+        m = dataset.shape[0]
+        dataset.resize((m + data.shape[0], n))
+        dataset[m:] = data
+        time_ds[1] = t_stop
+
+    def close(self):
+        self._file.close()
+
+
+def lexicographic_leq(columns, keys, threshold):
+    """
+    Return a boolean mask of the elements of `columns` (a dict of arrays)
+    which are less than or equal to `threshold` (a dict of scalars), comparing
+    first the values of `keys[0]`, then those of `keys[1]`, etc.
+    """
+    n = columns[keys[0]].size
+    less = np.zeros((n,), dtype=bool)
+    equal = np.ones((n,), dtype=bool)
+    for key in keys:
+        less |= equal & (columns[key] < threshold[key])
+        equal &= (columns[key] == threshold[key])
+    return less | equal
+
+
+def sorted_columns(columns, keys):
+    """Sort a dict of arrays lexicographically by the arrays named in `keys`."""
+    order = np.lexsort([columns[key] for key in reversed(keys)])
+    return {name: values[order] for name, values in columns.items()}
+
+
+def external_sort(source, target, keys, buffer_size, scratch):
+    """
+    Sort the 1D datasets in the HDF5 group `source` lexicographically by the
+    datasets named in `keys`, and write the results to new datasets in `target`.
+
+    At most `buffer_size` elements of each dataset are held in memory at once.
+    If the datasets are larger than this, sorted runs of `buffer_size` elements
+    are first written to the HDF5 group `scratch`, then merged.
+    """
+    names = list(source.keys())
+    n = source[names[0]].shape[0]
+    kwargs = {}
+    if n > 0:
+        kwargs.update(chunks=(min(n, SPIKE_CHUNK_SIZE),), compression="gzip", shuffle=True)
+    outputs = dict((name, target.create_dataset(name, shape=(n,), dtype=source[name].dtype,
+                                                **kwargs))
+                   for name in names)
+
+    def read(group, start, stop):
+        return dict((name, group[name][start:stop]) for name in names)
+
+    def write(columns, start):
+        for name, values in columns.items():
+            outputs[name][start:start + values.size] = values
+
+    if n <= buffer_size:
+        write(sorted_columns(read(source, 0, n), keys), 0)
+        return
+
+    # create sorted runs
+    runs = []
+    for name in names:
+        scratch.create_dataset(name, shape=(n,), dtype=source[name].dtype)
+    for start in range(0, n, buffer_size):
+        stop = min(start + buffer_size, n)
+        for name, values in sorted_columns(read(source, start, stop), keys).items():
+            scratch[name][start:stop] = values
+        runs.append([start, stop])
+
+    # merge the runs, reading a block at a time from each. In each round, we write
+    # out all the buffered elements that are not greater than the smallest last
+    # element of a buffer whose run has not been completely read
+    block_size = max(1, buffer_size // len(runs))
+    buffers = [read(scratch, 0, 0) for run in runs]
+    position = 0
+    while True:
+        for run, buffer in zip(runs, buffers):
+            if buffer[keys[0]].size == 0 and run[0] < run[1]:
+                stop = min(run[0] + block_size, run[1])
+                buffer.update(read(scratch, run[0], stop))
+                run[0] = stop
+        if all(buffer[keys[0]].size == 0 for buffer in buffers):
+            break
+        last = [dict((key, buffer[key][-1]) for key in keys)
+                for run, buffer in zip(runs, buffers) if run[0] < run[1]]
+        if last:
+            threshold = sorted_columns(
+                dict((key, np.array([item[key] for item in last])) for key in keys), keys)
+            threshold = dict((key, values[0]) for key, values in threshold.items())
+        merged = []
+        for buffer in buffers:
+            if last:
+                count = lexicographic_leq(buffer, keys, threshold).sum()
+            else:
+                count = buffer[keys[0]].size
+            merged.append(dict((name, values[:count]) for name, values in buffer.items()))
+            buffer.update(dict((name, values[count:]) for name, values in buffer.items()))
+        merged = sorted_columns(dict((name, np.concatenate([part[name] for part in merged]))
+                                     for name in names), keys)
+        write(merged, position)
+        position += merged[keys[0]].size
+    assert position == n
 
 
 MAGIC = 0x0a7a
+EDGE_CHUNK_SIZE = 2 ** 20  # number of edges read from or written to an edges file at a time
+SPIKE_CHUNK_SIZE = 2 ** 16  # HDF5 chunk size for spike and report datasets
+SPIKE_BUFFER_SIZE = 2 ** 22  # maximum number of spikes held in memory when sorting a spikes file
 logger = logging.getLogger("pyNN.serialization.sonata")
 
 # ----- utility functions, not intended for use outside this module ----------
@@ -226,6 +487,82 @@ def sonata_id_to_index(population, id):
     return id - offset
 
 
+class PerTypeValues(object):
+    """
+    Base value for a lazy array whose elements are looked up, according to an
+    array of node or edge type ids, in a table of per-type values. Only the
+    elements which are accessed are constructed.
+
+    Arguments
+    ---------
+
+    values - dict
+        Node or edge type ids as keys, parameter values as values.
+    types_array - NumPy array
+        The type id of each node or edge.
+    """
+
+    def __init__(self, values, types_array):
+        self.type_ids = np.array(sorted(values))
+        self.table = np.array([values[type_id] for type_id in self.type_ids])
+        if np.issubdtype(self.table.dtype, np.number):
+            self.table = self.table.astype(float)
+            self.missing_value = np.nan
+        elif np.issubdtype(self.table.dtype, np.str_):
+            self.missing_value = "UNDEFINED"
+        else:
+            raise TypeError("Cannot handle annotations that are neither numbers or strings")
+        self.types_array = types_array
+
+    def __deepcopy__(self, memo):
+        return self  # never modified in place, so no need to copy the arrays
+
+    def lazily_evaluate(self, mask=None, shape=None):
+        types = self.types_array if mask is None else self.types_array[mask]
+        positions = np.searchsorted(self.type_ids, types).clip(0, self.type_ids.size - 1)
+        values = self.table[positions]
+        found = self.type_ids[positions] == types
+        if not np.all(found):
+            values = np.where(found, values, self.missing_value)
+        return values
+
+
+class HDF5Values(object):
+    """
+    Base value for a lazy array whose elements are taken from an HDF5 dataset,
+    at the positions given by `index`. Only the elements which are accessed
+    (e.g. those for the local cells) are read from the file.
+    """
+
+    def __init__(self, dataset, index):
+        self.dataset = dataset
+        self.index = np.asarray(index)
+
+    def __deepcopy__(self, memo):
+        return self  # the file is only read, so copies can share it
+
+    def lazily_evaluate(self, mask=None, shape=None):
+        index = self.index if mask is None else self.index[mask]
+        if np.ndim(index) == 0:
+            return self.dataset[int(index)]
+        return read_dataset(self.dataset, index)
+
+
+def read_dataset(dataset, index):
+    """
+    Return the elements of an HDF5 dataset at the positions given by the
+    integer array `index`, which need not be sorted.
+
+    Reading a contiguous block and indexing it in memory is much faster than
+    HDF5 point selection, and the positions of the nodes or edges of a group
+    are generally close together.
+    """
+    if index.size == 0:
+        return np.array([], dtype=dataset.dtype)
+    first = index.min()
+    return dataset[first:index.max() + 1][index - first]
+
+
 def condense(value, types_array):
     """Transform parameters taken from SONATA CSV and/or HDF5 files
     into a suitable form for PyNN.
@@ -233,22 +570,21 @@ def condense(value, types_array):
     Arguments
     ---------
 
-    value - NumPy array or dict
-        NumPy arrays are returned directly.
+    value - NumPy array, LazyArray or dict
+        Arrays are returned directly.
         Dicts should have node type ids as keys and the parameter values
         for the different types as values. Where all node/edge types have the same
         value, this single value is returned. Where different node/edge types have
-        different values for a given parameter, a NumPy array of size equal
+        different values for a given parameter, a LazyArray of size equal
         to the number of nodes/edges in the SONATA group (cells in the PyNN Population
-        or connections in the PyNN Projection) is constructed to contain the different
-        parameter values.
+        or connections in the PyNN Projection) is returned, which looks up the
+        values for the different types when evaluated.
     types_array - NumPy array
         Subset of the data from "/nodes/<population_name>/node_type_id" or
         from "/edges/<population_name>/edge_type_id" that applies to this group.
         Needed to construct parameter arrays.
     """
-    # todo: use lazyarray
-    if isinstance(value, np.ndarray):
+    if isinstance(value, (np.ndarray, LazyArray)):
         return value
     elif isinstance(value, dict):
         assert len(value) > 0
@@ -256,20 +592,116 @@ def condense(value, types_array):
         if np.all(value_array == value_array[0]):
             return value_array[0]
         else:
-            if np.issubdtype(value_array.dtype, np.number):
-                new_value = np.ones_like(types_array) * np.nan
-            elif np.issubdtype(value_array.dtype, np.str_):
-                new_value = np.array(["UNDEFINED"] * types_array.size)
-            else:
-                raise TypeError("Cannot handle annotations that are neither numbers or strings")
-            for node_type_id, val in value.items():
-                new_value[types_array == node_type_id] = val
-            return new_value
+            lookup = PerTypeValues(value, types_array)
+            return LazyArray(lookup, shape=types_array.shape,
+                             dtype=float if lookup.table.dtype == float else None)
     else:
         raise TypeError(
             "Unexpected type. Expected Numpy array or dict, got {}".format(type(value)))
 
 
+def evaluated(value):
+    """Return `value`, with lazy arrays replaced by their values."""
+    if isinstance(value, LazyArray):
+        return value.evaluate()
+    return value
+
+
+def gather_column(state, values):
+    """
+    Concatenate the arrays `values` from all MPI processes, in order of rank,
+    preserving their dtype (so that integer node ids are not converted to float).
+
+    Returns the concatenated array on the master process, and None on the others.
+    """
+    if state.num_processes > 1:
+        mpi_comm, _ = recording.get_mpi_comm()
+        parts = mpi_comm.gather(np.asarray(values), root=recording.MPI_ROOT)
+        if state.mpi_rank != recording.MPI_ROOT:
+            return None
+        values = np.concatenate(parts)
+    return values
+
+
+def write_column(group, name, values, dtype, size=None):
+    """
+    Write the array `values` to a new chunked, compressed HDF5 dataset, one
+    chunk at a time.
+
+    If `values` is a scalar, a dataset of length `size` is created with
+    `values` as its fill value, so that no data need to be written.
+    """
+    if np.isscalar(values):
+        kwargs = {"fillvalue": values}
+    else:
+        size = values.size
+        kwargs = {}
+    if size > 0:
+        kwargs.update(chunks=(min(size, EDGE_CHUNK_SIZE),), compression="gzip", shuffle=True)
+    dataset = group.create_dataset(name, shape=(size,), dtype=dtype, **kwargs)
+    if not np.isscalar(values):
+        for start in range(0, size, EDGE_CHUNK_SIZE):
+            dataset[start:start + EDGE_CHUNK_SIZE] = values[start:start + EDGE_CHUNK_SIZE]
+    return dataset
+
+
+def write_index(group, node_ids, n_nodes):
+    """
+    Write a SONATA edge index to the HDF5 group `group`.
+
+    `node_ids` contains the source (for a "source_to_target" index) or target
+    (for a "target_to_source" index) node id of each edge, and `n_nodes` is
+    the size of the corresponding node population.
+    """
+    order = np.argsort(node_ids, kind="stable")
+    sorted_ids = node_ids[order]
+    # a new range starts wherever the node id changes or the edge ids are not consecutive
+    breaks = np.flatnonzero((np.diff(sorted_ids) != 0) | (np.diff(order) != 1)) + 1
+    starts = np.hstack(([0], breaks)).astype(int)[:order.size]
+    stops = np.hstack((breaks, [order.size])).astype(int)[:order.size]
+    range_to_edge_id = np.column_stack((order[starts], order[stops - 1] + 1))
+    range_nodes = sorted_ids[starts]
+    nodes = np.arange(n_nodes)
+    node_id_to_ranges = np.column_stack((np.searchsorted(range_nodes, nodes, side="left"),
+                                         np.searchsorted(range_nodes, nodes, side="right")))
+    group.create_dataset("node_id_to_ranges", data=node_id_to_ranges, dtype='u8')
+    group.create_dataset("range_to_edge_id", data=range_to_edge_id.reshape((-1, 2)), dtype='u8')
+
+
+def search_sorted(dataset, value):
+    """
+    Return the index of the first element of the sorted 1D HDF5 dataset
+    `dataset` which is not less than `value`, reading only O(log n) elements.
+    """
+    low, high = 0, dataset.shape[0]
+    while low < high:
+        middle = (low + high) // 2
+        if dataset[middle] < value:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def ragged_spike_times(node_ids, timestamps, index_map, size):
+    """
+    Group spikes by the cell that should emit them.
+
+    `index_map` maps node ids to positions in a population of size `size`
+    (-1 for nodes not in the population); spikes from nodes with ids outside
+    the map are dropped.
+
+    Returns a :class:`~pyNN.parameters.SequenceArray` in which sequence `i`
+    contains the spike times of the cell at position `i`, in increasing order.
+    """
+    node_ids = np.asarray(node_ids, dtype=np.int64)
+    in_map = (node_ids >= 0) & (node_ids < index_map.size)
+    indices = index_map[node_ids[in_map]]
+    times = np.asarray(timestamps)[in_map]
+    in_population = indices >= 0
+    return SequenceArray.from_pairs(indices[in_population], times[in_population], size)
+
+
 def load_config(config_file):
     """Load a SONATA circuit or simulation config file
 
@@ -416,6 +848,18 @@ def export_to_sonata(network, output_path, target="PyNN", overwrite=False):
         group_label = 0  # "default"
         # todo: add "population" column
 
+        # a single get call for all parameters, so that values are gathered only once with MPI
+        parameter_names = [name for name in population.celltype.default_parameters
+                           if name != "spike_times"]
+        if len(parameter_names) < len(population.celltype.default_parameters):
+            warn("spike times should be added manually to simulation_config")
+        if parameter_names:
+            all_values = population.get(parameter_names, gather=True, simplify=True)
+        else:
+            all_values = []
+        if population._simulator.state.mpi_rank != 0:
+            continue
+
         # write HDF5 file
         nodes_file = h5py.File(nodes_path, 'w')
         # ??? unclear what is the required format or the current version!
@@ -424,31 +868,23 @@ def export_to_sonata(network, output_path, target="PyNN", overwrite=False):
         root = nodes_file.create_group("nodes")  # todo: add attribute with network name
         # we use a single node group for the full Population
         default = root.create_group(population_label)
-        # todo: check and fix the dtypes in the following
-        default.create_dataset("node_id", data=population.all_cells.astype('i4'), dtype='i4')
-        default.create_dataset("node_type_id", data=i * np.ones((n,)), dtype='i2')
-        default.create_dataset("node_group_id", data=np.array(
-            [group_label] * n), dtype='i2')  # todo: calculate the max label size
-        # required data type not specified. Optional?
-        default.create_dataset("node_group_index", data=np.arange(n, dtype=int), dtype='i2')
+        # node ids are the indices of the cells within the node population
+        write_column(default, "node_id", np.arange(n), 'u8')
+        write_column(default, "node_type_id", i, 'u4', size=n)
+        write_column(default, "node_group_id", group_label, 'u4', size=n)
+        write_column(default, "node_group_index", np.arange(n), 'u8')
 
         # parameters
         node_group = default.create_group(str(group_label))
         node_params_group = node_group.create_group("dynamics_params")
-        for parameter_name in population.celltype.default_parameters:
-            if parameter_name == "spike_times":
-                warn("spike times should be added manually to simulation_config")
+        for parameter_name, values in zip(parameter_names, all_values):
+            if isinstance(values, np.ndarray):
+                # array, put into the HDF5 file and put 'NONE' in the CSV file
+                node_params_group.create_dataset(parameter_name, data=values)
+                node_type_info[parameter_name] = "NONE"
             else:
-                # we could make a single get call to get all params at once, at the expense
-                # of higher memory usage. To profile...
-                values = population.get(parameter_name, gather=True, simplify=True)
-                if isinstance(values, np.ndarray):
-                    # array, put into the HDF5 file and put 'NONE' in the CSV file
-                    node_params_group.create_dataset(parameter_name, data=values)
-                    node_type_info[parameter_name] = "NONE"
-                else:
-                    # scalar, put into the CSV file
-                    node_type_info[parameter_name] = values
+                # scalar, put into the CSV file
+                node_type_info[parameter_name] = values
 
         # positions in space
         x, y, z = population.positions
@@ -491,7 +927,7 @@ def export_to_sonata(network, output_path, target="PyNN", overwrite=False):
         edges_path = Template(config["networks"]["edges"][i]
                               ["edges_file"]).substitute(NETWORK_DIR=network_dir)
 
-        n = projection.size()
+        is_master = projection._simulator.state.mpi_rank == 0
         csv_rows = []
         edge_type_info = {
             "edge_type_id": i,
@@ -500,47 +936,68 @@ def export_to_sonata(network, output_path, target="PyNN", overwrite=False):
             "receptor_type": projection.receptor_type
         }
         parameter_names = list(projection.synapse_type.default_parameters)
-        values = np.array(
-            projection.get(parameter_names, format="list", gather=True, with_address=True)
-        )
-        source_index = values[:, 0].astype(int)
-        target_index = values[:, 1].astype(int)
-        source_gids = projection.pre.all_cells[source_index].astype('i4')
-        target_gids = projection.post.all_cells[target_index].astype('i4')
+        if isinstance(projection.synapse_type, StandardSynapseType):
+            native_names = projection.synapse_type.get_native_names(*parameter_names)
+        else:
+            native_names = parameter_names
         group_label = 0  # "default"
 
-        # Write HDF5 file
-        edges_file = h5py.File(edges_path, 'w')
-        root = edges_file.create_group("edges")  # todo: add attribute with network name
-
-        default_edge_pop = root.create_group(projection_label)
-        default_edge_pop.create_dataset("source_node_id", data=source_gids, dtype='i4')
-        default_edge_pop.create_dataset("target_node_id", data=target_gids, dtype='i4')
-        default_edge_pop["source_node_id"].attrs["node_population"] = asciify(
-            projection.pre.label)  # todo: handle PopualtionViews
-        default_edge_pop["target_node_id"].attrs["node_population"] = asciify(
-            projection.post.label)
-        default_edge_pop.create_dataset("edge_type_id", data=i * np.ones((n,)), dtype='i2')
-        # S32')  # todo: calculate the max label size
-        default_edge_pop.create_dataset(
-            "edge_group_id", data=np.array([group_label] * n), dtype='i2')
-        default_edge_pop.create_dataset(
-            "edge_group_index", data=np.arange(n, dtype=int), dtype='i2')
-
-        edge_group = default_edge_pop.create_group(str(group_label))
-        edge_params = edge_group.create_group("dynamics_params")
-        for j, parameter_name in zip(range(2, values.shape[1]), parameter_names):
-            if isinstance(values[:, j], np.ndarray):
-                # array, put into the HDF5 file
-                edge_params.create_dataset(parameter_name, data=values[:, j])
+        # The connection data are retrieved, gathered and written one column at a time,
+        # so that only a single column need be held in memory. Edges are written sorted
+        # by target, which keeps the "target_to_source" index compact. The columns are
+        # gathered in order of MPI rank, so the sort order is determined on the master
+        # process, after gathering, and applied to each column as it arrives.
+        source_index, target_index = projection._connection_addresses()
+        source_index = gather_column(projection._simulator.state, source_index)
+        target_index = gather_column(projection._simulator.state, target_index)
+
+        if is_master:
+            order = np.argsort(target_index, kind="stable")
+            source_index = source_index[order]
+            target_index = target_index[order]
+            n = source_index.size
+            # Write HDF5 file
+            edges_file = h5py.File(edges_path, 'w')
+            root = edges_file.create_group("edges")  # todo: add attribute with network name
+
+            default_edge_pop = root.create_group(projection_label)
+            write_column(default_edge_pop, "source_node_id", source_index, 'u8')
+            write_column(default_edge_pop, "target_node_id", target_index, 'u8')
+            default_edge_pop["source_node_id"].attrs["node_population"] = asciify(
+                projection.pre.label)  # todo: handle PopualtionViews
+            default_edge_pop["target_node_id"].attrs["node_population"] = asciify(
+                projection.post.label)
+            write_column(default_edge_pop, "edge_type_id", i, 'u4', size=n)
+            write_column(default_edge_pop, "edge_group_id", group_label, 'u4', size=n)
+            write_column(default_edge_pop, "edge_group_index", np.arange(n), 'u8')
+
+            indices = default_edge_pop.create_group("indices")
+            write_index(indices.create_group("source_to_target"), source_index,
+                        projection.pre.size)
+            write_index(indices.create_group("target_to_source"), target_index,
+                        projection.post.size)
+            del source_index, target_index
+
+            edge_group = default_edge_pop.create_group(str(group_label))
+            edge_params = edge_group.create_group("dynamics_params")
+
+        for parameter_name, native_name in zip(parameter_names, native_names):
+            values, = projection._get_attribute_columns([native_name])
+            values = gather_column(projection._simulator.state, values)
+            if not is_master:
+                continue
+            values = values[order]
+            if values.size > 0 and (values == values[0]).all():
+                # homogeneous, put into the CSV file
+                edge_type_info[parameter_name] = values[0]
             else:
-                # scalar, put into the CSV file
-                # for now, this will never be the case - need to detect homogeneous case
-                edge_type_info[parameter_name] = values[:, j]
+                # array, put into the HDF5 file
+                write_column(edge_params, parameter_name, values, values.dtype)
 
-        csv_rows.append(edge_type_info)
+        if not is_master:
+            continue
 
-        # todo: add receptor_type to csv_rows
+        csv_rows.append(edge_type_info)
 
         edges_file.close()
 
@@ -673,15 +1130,19 @@ class NodePopulation(object):
         obj = cls()
         obj.name = name
         obj.node_groups = []
-        obj.node_ids = h5_data['node_id']
+        # node ids and indices are cast to signed integers, since SONATA files use unsigned
+        # types, and mixing signed and unsigned integers in NumPy arithmetic gives floats
+        obj.first_node_id = int(h5_data['node_id'][()].min())
 
         node_group_ids = h5_data['node_group_id'][()]
+        node_type_ids = h5_data['node_type_id'][()]
+        node_group_indices = h5_data['node_group_index'][()].astype(np.int64)
         for ng_label in np.unique(node_group_ids):
             mask = node_group_ids == ng_label
             logger.info("NODE GROUP {}, size {}".format(ng_label, mask.sum()))
 
-            node_type_array = h5_data['node_type_id'][mask]
-            node_group_index = h5_data['node_group_index'][mask].tolist()
+            node_type_array = node_type_ids[mask]
+            node_group_index = node_group_indices[mask]
             obj.node_groups.append(
                 NodeGroup.from_data(ng_label,
                                     node_type_array,
@@ -702,7 +1163,7 @@ class NodePopulation(object):
         The Assembly will contain one Population for each NodeGroup.
         """
         assembly = sim.Assembly(label=self.name)
-        assembly.annotations["first_sonata_id"] = self.node_ids[()].min()
+        assembly.annotations["first_sonata_id"] = self.first_node_id
         for node_group in self.node_groups:
             pop = node_group.to_population(sim)
             assembly += pop
@@ -731,7 +1192,7 @@ class NodeGroup(object):
         node_types_array : NumPy array
             Subset of the data from "/nodes/<population_name>/node_type_id"
             that applies to this group.
-        index : list
+        index : NumPy array
             Subset of the data from "/nodes/<population_name>/node_group_index"
             that applies to this group.
         h5_data : HDF5 Group
@@ -765,12 +1226,14 @@ class NodeGroup(object):
                 for name, value in dynamics_params.items():
                     parameters[name][node_type_id] = value
 
-        # parameters defined in .h5 files
+        # parameters defined in .h5 files. These are read from the file only
+        # when needed, and only for the local cells
         if 'dynamics_params' in h5_data:
             dynamics_params_group = h5_data['dynamics_params']
             # not sure the next bit is using `index` correctly
             for key in dynamics_params_group.keys():
-                parameters[key] = dynamics_params_group[key][index]
+                parameters[key] = LazyArray(HDF5Values(dynamics_params_group[key], index),
+                                            shape=(len(index),))
 
         obj.parameters = parameters
         obj.config = config
@@ -824,7 +1287,7 @@ class NodeGroup(object):
             if name in cell_type_cls.default_parameters:
                 parameters[name] = condense(value, self.node_types_array)
             else:
-                annotations[name] = condense(value, self.node_types_array)
+                annotations[name] = evaluated(condense(value, self.node_types_array))
         # todo: handle spatial structure - nodes_file["nodes"][np_label][ng_label]['x'], etc.
 
         # temporary hack to work around problem with 300 Intfire cell example
@@ -850,6 +1313,9 @@ class EdgePopulation(object):
     def from_data(cls, name, h5_data, edge_types_map, config):
         """Create an EdgePopulation instance, containing one or more EdgeGroups, from data.
 
+        The edge data themselves are not loaded: they are read from the file
+        a chunk at a time when the projections are created.
+
         Arguments
         ---------
 
@@ -865,29 +1331,29 @@ class EdgePopulation(object):
 
         obj = cls()
         obj.name = name
-        obj.source_node_ids = h5_data["source_node_id"][()]
+        obj.h5_data = h5_data
+        obj.size = h5_data["source_node_id"].shape[0]
         obj.source_node_population = to_string(h5_data["source_node_id"].attrs["node_population"])
-        obj.target_node_ids = h5_data["target_node_id"][()]
         obj.target_node_population = to_string(h5_data["target_node_id"].attrs["node_population"])
 
-        obj.edge_groups = []
-        for eg_label in np.unique(h5_data['edge_group_id'][()]):
-            mask = h5_data['edge_group_id'][()] == eg_label
-            logger.info("EDGE GROUP {}, size {}".format(eg_label, mask.sum()))
-
-            edge_type_array = h5_data['edge_type_id'][mask]
-            edge_group_index = h5_data['edge_group_index'][mask].tolist()
-            source_ids = obj.source_node_ids[mask]
-            target_ids = obj.target_node_ids[mask]
-            # note: it may be more efficient in an MPI context
-            #       to defer the extraction of source_ids, etc.
+        # find the edge groups, and the edge types within each group
+        group_sizes = defaultdict(int)
+        group_edge_types = defaultdict(set)
+        for start, stop in obj.edge_ranges():
+            edge_group_ids = h5_data['edge_group_id'][start:stop]
+            edge_type_ids = h5_data['edge_type_id'][start:stop]
+            for eg_label in np.unique(edge_group_ids):
+                mask = edge_group_ids == eg_label
+                group_sizes[eg_label] += mask.sum()
+                group_edge_types[eg_label].update(np.unique(edge_type_ids[mask]).tolist())
 
+        obj.edge_groups = []
+        for eg_label in sorted(group_sizes):
+            logger.info("EDGE GROUP {}, size {}".format(eg_label, group_sizes[eg_label]))
             obj.edge_groups.append(
                 EdgeGroup.from_data(eg_label,
-                                    edge_type_array,
-                                    edge_group_index,
-                                    source_ids,
-                                    target_ids,
+                                    np.array(sorted(group_edge_types[eg_label])),
+                                    obj,
                                     h5_data[str(eg_label)],
                                     edge_types_map,
                                     config)
@@ -898,6 +1364,37 @@ class EdgePopulation(object):
     def __repr__(self):
         return "EdgePopulation(name='{}', edge_groups={})".format(self.name, self.edge_groups)
 
+    def edge_ranges(self, target_node_ids=None):
+        """Generate (start, stop) ranges of edge ids, each at most EDGE_CHUNK_SIZE long.
+
+        If `target_node_ids` is given and the edge population has a
+        "indices/target_to_source" index, only the ranges containing edges onto
+        those nodes are generated. Otherwise, the ranges cover all the edges.
+        """
+        if target_node_ids is not None and "target_to_source" in self.h5_data.get("indices", {}):
+            index = self.h5_data["indices"]["target_to_source"]
+            node_ranges = index["node_id_to_ranges"][()]
+            target_node_ids = np.asarray(target_node_ids, dtype=int)
+            target_node_ids = target_node_ids[target_node_ids < node_ranges.shape[0]]
+            rows = [np.arange(first, last) for first, last in node_ranges[target_node_ids]]
+            rows = np.unique(np.hstack(rows + [np.array([], dtype=int)]))
+            if rows.size == 0:
+                return
+            edge_ranges = index["range_to_edge_id"][rows.min():rows.max() + 1][rows - rows.min()]
+            edge_ranges = edge_ranges[np.argsort(edge_ranges[:, 0])]
+            # merge contiguous ranges, to reduce the number of reads
+            ranges = []
+            for start, stop in edge_ranges:
+                if ranges and start <= ranges[-1][1]:
+                    ranges[-1][1] = max(ranges[-1][1], stop)
+                elif stop > start:
+                    ranges.append([start, stop])
+        else:
+            ranges = [(0, self.size)]
+        for first, last in ranges:
+            for start in range(first, last, EDGE_CHUNK_SIZE):
+                yield start, min(start + EDGE_CHUNK_SIZE, last)
+
     def to_projections(self, net, sim):
         """Create a list of PyNN Projections from this EdgePopulation."""
         pre = net.get_component(self.source_node_population)
@@ -913,8 +1410,7 @@ class EdgeGroup(object):
     """Representation of a SONATA edge group."""
 
     @classmethod
-    def from_data(cls, id, edge_types_array, index, source_ids, target_ids,
-                  h5_data, edge_types_map, config):
+    def from_data(cls, id, edge_type_ids, edge_population, h5_data, edge_types_map, config):
         """Create an EdgeGroup instance from data.
 
         Arguments
@@ -922,12 +1418,10 @@ class EdgeGroup(object):
 
         id : integer
             Taken from the SONATA edges HDF5 file.
-        node_types_array : NumPy array
-            Subset of the data from "/edges/<population_name>/edge_type_id"
-            that applies to this group.
-        index : list
-            Subset of the data from "/edges/<population_name>/edge_group_index"
-            that applies to this group.
+        edge_type_ids : NumPy array
+            The edge type ids which occur in this group.
+        edge_population : EdgePopulation
+            The edge population containing this group.
         h5_data : HDF5 Group
             The "/edges/<population_name>/<group_id>" group.
         edge_types_map : dict
@@ -937,12 +1431,10 @@ class EdgeGroup(object):
         """
         obj = cls()
         obj.id = id
-        obj.edge_types_array = edge_types_array
-        obj.source_ids = source_ids
-        obj.target_ids = target_ids
+        obj.edge_type_ids = edge_type_ids
+        obj.edge_population = edge_population
 
         parameters = defaultdict(dict)
-        edge_type_ids = np.unique(edge_types_array)
 
         # parameters defined directly in edge_types csv file
         for edge_type_id in edge_type_ids:
@@ -961,16 +1453,16 @@ class EdgeGroup(object):
                 for name, value in dynamics_params.items():
                     parameters[name][edge_type_id] = value
 
-        # parameters defined in .h5 files
+        # parameters defined in .h5 files. These are per-edge values, which are
+        # read when the connections are created
         if 'dynamics_params' in h5_data:
             dynamics_params_group = h5_data['dynamics_params']
-            # not sure the next bit is using `index` correctly
             for key in dynamics_params_group.keys():
-                parameters[key] = dynamics_params_group[key][index]
+                parameters[key] = dynamics_params_group[key]
         if 'nsyns' in h5_data:
-            parameters['nsyns'] = h5_data['nsyns'][index]
+            parameters['nsyns'] = h5_data['nsyns']
         if 'syn_weight' in h5_data:
-            parameters['syn_weight'] = h5_data['syn_weight'][index]
+            parameters['syn_weight'] = h5_data['syn_weight']
 
         obj.parameters = parameters
         obj.config = config
@@ -1027,6 +1519,37 @@ class EdgeGroup(object):
         logger.info("  receptor_type: {}".format(receptor_type))
         return synapse_type_cls, receptor_type
 
+    def read_edges(self, names, target_node_ids=None):
+        """Read the edges of this group from the file, a chunk at a time.
+
+        Generates tuples `(source_ids, target_ids, values)`, where `source_ids`
+        and `target_ids` are integer arrays of SONATA node ids, and `values` is
+        a dict containing, for each parameter in `names`, either a single value
+        (if it is the same for all edges of the chunk) or an array.
+
+        If `target_node_ids` is given, only edges onto those nodes are included.
+        """
+        h5_data = self.edge_population.h5_data
+        for start, stop in self.edge_population.edge_ranges(target_node_ids):
+            mask = h5_data["edge_group_id"][start:stop] == self.id
+            target_ids = h5_data["target_node_id"][start:stop].astype(np.int64)
+            if target_node_ids is not None:
+                mask &= np.isin(target_ids, target_node_ids)
+            if not mask.any():
+                continue
+            source_ids = h5_data["source_node_id"][start:stop][mask].astype(np.int64)
+            target_ids = target_ids[mask]
+            edge_types_array = h5_data["edge_type_id"][start:stop][mask]
+            index = h5_data["edge_group_index"][start:stop][mask].astype(np.int64)
+            values = {}
+            for name in names:
+                value = self.parameters[name]
+                if isinstance(value, h5py.Dataset):
+                    values[name] = read_dataset(value, index)
+                else:
+                    values[name] = evaluated(condense(value, edge_types_array))
+            yield source_ids, target_ids, values
+
     def to_projection(self, pre, post, edge_population_name, sim):
         """Create a PyNN Projection from this EdgeGroup.
 
@@ -1041,45 +1564,36 @@ class EdgeGroup(object):
             Name of the edge population containing this edge group.
         """
         synapse_type_cls, receptor_type = self.get_synapse_and_receptor_type(sim)
-        parameters = {}
+        synapse_type_parameters = {}
+        edge_parameters = {}  # per-edge values, read from the file when connecting
         annotations = {}
 
         for name, value in self.parameters.items():
-            if name in synapse_type_cls.default_parameters:
-                parameters[name] = condense(value, self.edge_types_array)
-            elif name == "syn_weight":
-                parameters["weight"] = condense(value, self.edge_types_array)
-            else:
+            pynn_name = "weight" if name == "syn_weight" else name
+            if pynn_name in synapse_type_cls.default_parameters:
+                if isinstance(value, dict):
+                    value = condense(value, self.edge_type_ids)
+                if isinstance(value, (LazyArray, h5py.Dataset)):
+                    edge_parameters[pynn_name] = name
+                else:
+                    synapse_type_parameters[pynn_name] = value
+            elif not isinstance(value, h5py.Dataset):
                 annotations[name] = value
 
-        if "sign" in annotations:
-            # special case from the 300 IF example, not mentioned in the SONATA spec
-            # nor in the .mod file for IntFire1
-            sign = condense(annotations["sign"], self.edge_types_array)
-            parameters["weight"] *= sign
-
-        if "nsyns" in annotations:
-            # special case (?) from the 300 IF example, not mentioned in the SONATA spec
-            # nor in the .mod file for IntFire1
-            nsyns = condense(annotations["nsyns"], self.edge_types_array)
-            parameters["weight"] *= nsyns
-
-        conn_list_args = [
-            sonata_id_to_index(pre, self.source_ids),
-            sonata_id_to_index(post, self.target_ids)
-        ]
-        column_names = []
-        synapse_type_parameters = {}
-        for name, value in parameters.items():
-            if isinstance(value, (np.ndarray)):
-                column_names.append(name)
-                conn_list_args.append(value)
-            else:
-                synapse_type_parameters[name] = value
-
-        conn_list = np.array(conn_list_args).transpose()
-        connector = sim.FromListConnector(conn_list,
-                                          column_names=column_names)
+        # special cases from the 300 IF example, not mentioned in the SONATA spec
+        # nor in the .mod file for IntFire1: "sign" and "nsyns" multiply the weight
+        weight_factors = [name for name in ("sign", "nsyns") if name in self.parameters]
+        for name in list(weight_factors):
+            factor = self.parameters[name]
+            if isinstance(factor, dict):
+                factor = condense(factor, self.edge_type_ids)
+            if "weight" in synapse_type_parameters and not isinstance(factor, (LazyArray, h5py.Dataset)):
+                synapse_type_parameters["weight"] *= factor
+                weight_factors.remove(name)
+        if weight_factors and "weight" in synapse_type_parameters:
+            edge_parameters["weight"] = synapse_type_parameters.pop("weight")
+
+        connector = EdgeGroupConnector(self, edge_parameters, weight_factors)
         syn = synapse_type_cls(**synapse_type_parameters)
         prj = sim.Projection(pre, post, connector, syn,
                              receptor_type=receptor_type,
@@ -1089,6 +1603,182 @@ class EdgeGroup(object):
         return prj
 
 
+class EdgeGroupConnector(Connector):
+    """
+    Connector that creates the connections of a SONATA edge group, reading the
+    edges from the file a chunk at a time, so that memory use does not grow
+    with the number of edges.
+
+    With MPI, if the edges file contains a "target_to_source" index, each
+    process reads only the edges onto its own neurons.
+
+    Arguments:
+        `edge_group`:
+            the EdgeGroup whose edges are to be connected.
+        `edge_parameters`:
+            a dict mapping the names of synaptic parameters whose values vary
+            between edges to the names of the SONATA parameters giving them,
+            or to a fixed value, to be multiplied by the `weight_factors`.
+        `weight_factors`:
+            names of SONATA parameters by which the weight should be multiplied.
+    """
+    parameter_names = ('edge_group',)
+
+    def __init__(self, edge_group, edge_parameters, weight_factors=(), safe=True, callback=None):
+        Connector.__init__(self, safe=safe, callback=callback)
+        self.edge_group = edge_group
+        self.edge_parameters = edge_parameters
+        self.weight_factors = list(weight_factors)
+
+    def connect(self, projection):
+        """Connect-up a Projection."""
+        pre_offset = projection.pre.annotations["first_sonata_id"]
+        post_offset = projection.post.annotations["first_sonata_id"]
+        mask_local = projection.post._mask_local
+        if mask_local.all():
+            target_node_ids = None
+        else:
+            target_node_ids = np.flatnonzero(mask_local) + post_offset
+        names = set(self.weight_factors).union(
+            name for name in self.edge_parameters.values() if isinstance(name, str))
+        for source_ids, target_ids, values in self.edge_group.read_edges(sorted(names),
+                                                                          target_node_ids):
+            presynaptic_indices = np.asarray(source_ids, dtype=int) - pre_offset
+            postsynaptic_indices = np.asarray(target_ids, dtype=int) - post_offset
+            if np.any((presynaptic_indices < 0) | (presynaptic_indices >= projection.pre.size)):
+                raise errors.ConnectionError("source index out of range")
+            # _bulk_connect() requires connections to the same target to be contiguous
+            order = np.argsort(postsynaptic_indices, kind="stable")
+            connection_parameters = deepcopy(projection.synapse_type.parameter_space)
+            connection_parameters.shape = (order.size,)
+            columns = {}
+            for pynn_name, name in self.edge_parameters.items():
+                value = values[name] if isinstance(name, str) else name
+                if pynn_name == "weight":
+                    for factor in self.weight_factors:
+                        value = value * values[factor]
+                if isinstance(value, np.ndarray):
+                    value = value[order]
+                columns[pynn_name] = value
+            connection_parameters.update(**columns)
+            if isinstance(projection.synapse_type, StandardSynapseType):
+                connection_parameters = projection.synapse_type.translate(connection_parameters)
+            connection_parameters.evaluate(simplify=True)
+            projection._bulk_connect(presynaptic_indices[order],
+                                     postsynaptic_indices[order],
+                                     **connection_parameters.as_dict())
+
+
+class SpikeInput(object):
+    """
+    Replays the spikes in a SONATA spikes file through a PyNN Assembly of spike
+    sources.
+
+    Arguments
+    ---------
+
+    file_path - string
+        The spikes file.
+    assembly - PyNN Assembly, Population or PopulationView
+        The spike sources.
+    index_map - NumPy array
+        Maps the node ids in the spikes file to positions in `assembly`,
+        with -1 for nodes that are not in `assembly`.
+    population - string
+        The name of the node population in the spikes file. If the file
+        contains a single population, it is used whatever its name.
+
+    Spikes can be passed to the spike sources all at once, with
+    :meth:`set_spike_times`, or a time window at a time, with the callback
+    returned by :meth:`callback`, so that only the spikes in the current
+    window need be held in memory. In the latter case, if the spikes file is
+    not sorted by time, a sorted copy is made in a temporary file.
+    """
+
+    def __init__(self, file_path, assembly, index_map, population=None, buffer_size=None):
+        self.assembly = assembly
+        self.index_map = index_map
+        self.buffer_size = buffer_size or SPIKE_BUFFER_SIZE
+        self._file = h5py.File(file_path, 'r')
+        self._sorted_file = None
+        spikes_group = self._file["spikes"]
+        if "gids" in spikes_group:  # older layout, without node populations
+            self.group = spikes_group
+            self.id_name = "gids"
+        else:
+            if population is None or population not in spikes_group:
+                if len(spikes_group) != 1:
+                    raise Exception("Spikes file does not contain a node population named "
+                                    "{}".format(population))
+                population = list(spikes_group)[0]
+            self.group = spikes_group[population]
+            self.id_name = "node_ids"
+        self.sorted_by_time = to_string(self.group.attrs.get("sorting", "none")) == "by_time"
+
+    def _sort_by_time(self):
+        fd, path = tempfile.mkstemp(suffix=".h5")
+        os.close(fd)
+        self._sorted_file = h5py.File(path, 'w')
+        external_sort(self.group, self._sorted_file.create_group("spikes"),
+                      ["timestamps", self.id_name], self.buffer_size,
+                      self._sorted_file.create_group("runs"))
+        self.group = self._sorted_file["spikes"]
+        self.sorted_by_time = True
+
+    def spikes(self, t_start=None, t_stop=None):
+        """
+        Return arrays of node ids and spike times for the spikes with
+        `t_start <= t < t_stop`.
+        """
+        if t_start is None and t_stop is None:
+            return self.group[self.id_name][()], self.group["timestamps"][()]
+        if not self.sorted_by_time:
+            self._sort_by_time()
+        timestamps = self.group["timestamps"]
+        start = 0 if t_start is None else search_sorted(timestamps, t_start)
+        stop = timestamps.shape[0] if t_stop is None else search_sorted(timestamps, t_stop)
+        return self.group[self.id_name][start:stop], timestamps[start:stop]
+
+    def spike_times(self, t_start=None, t_stop=None):
+        """
+        Return the spike times with `t_start <= t < t_stop` for each spike
+        source, as a :class:`~pyNN.parameters.SequenceArray`.
+        """
+        node_ids, timestamps = self.spikes(t_start, t_stop)
+        return ragged_spike_times(node_ids, timestamps, self.index_map, self.assembly.size)
+
+    def set_spike_times(self, t_start=None, t_stop=None):
+        """
+        Set the spike times of the spike sources to those in the file with
+        `t_start <= t < t_stop`.
+        """
+        spike_times = self.spike_times(t_start, t_stop)
+        if not hasattr(self.assembly, "populations"):  # Population or PopulationView
+            self.assembly.set(spike_times=spike_times)
+            return
+        start = 0
+        for population in self.assembly.populations:
+            population.set(spike_times=spike_times[start:start + population.size])
+            start += population.size
+
+    def callback(self, interval):
+        """
+        Return a callback, to be passed to :func:`run()`, which gives the
+        spike sources their spikes one window of `interval` ms at a time.
+        """
+        def set_next_spike_times(t):
+            self.set_spike_times(t, t + interval)
+            return t + interval
+        return set_next_spike_times
+
+    def close(self):
+        self._file.close()
+        if self._sorted_file is not None:
+            path = self._sorted_file.filename
+            self._sorted_file.close()
+            os.remove(path)
+
+
 class SimulationPlan(object):
     """ """
 
@@ -1127,7 +1817,7 @@ class SimulationPlan(object):
             targets = self.node_set_map[config["cells"]]
         return targets
 
-    def _set_input_spikes(self, input_config, net):
+    def _set_input_spikes(self, input_config, net, input_interval=None):
         # determine which assembly the spikes are for
         targets = self._get_target(input_config, net)
         if len(targets) != 1:
@@ -1136,23 +1826,25 @@ class SimulationPlan(object):
         assembly = base_assembly[mask]
         assert isinstance(assembly, self.sim.Assembly)
 
+        # map node ids in the spikes file to positions in the target assembly
+        offset = base_assembly.annotations.get("first_sonata_id", 0)
+        index_map = -np.ones((offset + base_assembly.size,), dtype=np.int64)
+        index_map[offset + np.arange(base_assembly.size)[mask]] = np.arange(assembly.size)
+
         # load spike data from file
         if input_config["module"] != "h5":
             raise NotImplementedError()
-        io = SonataIO(base_dir="",
-                      spikes_file=input_config["input_file"])
-        data = io.read()
-        assert len(data) == 1
         if "trial" in input_config:
             raise NotImplementedError()
             # assuming we can map trials to segments
-        assert len(data[0].segments) == 1
-        spiketrains = data[0].segments[0].spiketrains
-        if len(spiketrains) != assembly.size:
-            raise NotImplementedError()
-        # todo: map cell ids in spikes file to ids/index in the population
-        assembly.set(spike_times=[Sequence(st.times.rescale('ms').magnitude)
-                                  for st in spiketrains])
+        spike_input = SpikeInput(input_config["input_file"], assembly, index_map,
+                                 population=base_assembly.label)
+        if input_interval is None:
+            spike_input.set_spike_times()
+            spike_input.close()
+        else:
+            self.callbacks.append(spike_input.callback(input_interval))
+            self.spike_inputs.append(spike_input)
 
     def _set_input_currents(self, input_config, net):
         # determine which assembly the currents are for
@@ -1215,13 +1907,23 @@ class SimulationPlan(object):
             else:
                 raise TypeError("Expecting node set definition to be a list or dict")
 
-    def execute(self, net):
+    def execute(self, net, input_interval=None):
+        """
+        Set up the inputs and recording for the network `net`, run the
+        simulation and write the output files.
+
+        If `input_interval` (in ms) is given, spikes from input spike files are
+        passed to the spike sources in windows of this length during the
+        simulation, rather than all at once beforehand.
+        """
         self._calculate_node_set_map(net)
+        self.callbacks = []
+        self.spike_inputs = []
 
         # create/configure inputs
         for input_name, input_config in self.inputs.items():
             if input_config["input_type"] == "spikes":
-                self._set_input_spikes(input_config, net)
+                self._set_input_spikes(input_config, net, input_interval)
             elif input_config["input_type"] == "current_clamp":
                 self._set_input_currents(input_config, net)
             else:
@@ -1237,7 +1939,9 @@ class SimulationPlan(object):
                 assembly.record(report_config["variable_name"])
 
         # run simulation
-        self.sim.run(self.run_config["tstop"])
+        self.sim.run(self.run_config["tstop"], callbacks=self.callbacks)
+        for spike_input in self.spike_inputs:
+            spike_input.close()
 
         # write output
         if "overwrite_output_dir" in self.run_config:
@@ -96,11 +96,15 @@ class Space(object):
         self.scale_factor = scale_factor
         self.offset = offset
 
-    def distances(self, A, B, expand=False):
+    def distances(self, A, B, expand=False, paired=False):
         """
         Calculate the distance matrix between two sets of coordinates, given
         the topology of the current space.
         From http://projects.scipy.org/pipermail/numpy-discussion/2007-April/027203.html
+
+        If `paired` is True, `A` and `B` must contain the same number of
+        points, and only the distance between each point in `A` and the
+        corresponding point in `B` is calculated.
         """
         #logger.debug("Calculating distance between A (shape=%s) and B (shape=%s)" % (A.shape, B.shape))
         assert A.ndim <= 2
@@ -111,9 +115,15 @@ class Space(object):
         if len(B.shape) == 1:
             B = B.reshape(1, 3)
         B = self.scale_factor * (B + self.offset)
-        d = np.zeros((len(self.axes), A.shape[0], B.shape[0]), dtype=A.dtype)
+        if paired:
+            d = np.zeros((len(self.axes), A.shape[0]), dtype=A.dtype)
+        else:
+            d = np.zeros((len(self.axes), A.shape[0], B.shape[0]), dtype=A.dtype)
         for i, axis in enumerate(self.axes):
-            diff2 = A[:, None, axis] - B[:, axis]
+            if paired:
+                diff2 = A[:, axis] - B[:, axis]
+            else:
+                diff2 = A[:, None, axis] - B[:, axis]
             if self.periodic_boundaries is not None:
                 boundaries = self.periodic_boundaries[axis]
                 if boundaries is not None:
@@ -136,6 +146,9 @@ class Space(object):
             if isinstance(j, np.ndarray) and j.ndim == 2:
                 j = j[0, :]
                 shape.append(j.size)
+            if not shape and isinstance(i, np.ndarray) and isinstance(j, np.ndarray):
+                # two index arrays of equal length: one distance per (i, j) pair
+                return self.distances(f(i), g(j), paired=True)
             d = self.distances(f(i), g(j))
             if shape:
                 return d.reshape(shape)
@@ -531,6 +531,14 @@ class AssemblyTest(unittest.TestCase):
         # mock backend always produces two spikes per population
         self.assertEqual(a.mean_spike_count(), 2.0)
 
+    def test_get_spike_count_array(self, sim=sim):
+        p1 = sim.Population(3, sim.EIF_cond_exp_isfa_ista())
+        p2 = sim.Population(2, sim.IF_cond_alpha())
+        a = p1 + p2
+        p2.record('spikes')
+        sim.run(100.0)
+        assert_array_equal(a.get_spike_count_array(), np.array([0, 0, 0, 2, 2]))
+
 
 if __name__ == '__main__':
     unittest.main()
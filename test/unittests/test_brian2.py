@@ -0,0 +1,404 @@
+"""
+Tests of the Brian2 backend.
+
+:copyright: Copyright 2006-2022 by the PyNN team, see AUTHORS.
+:license: CeCILL, see LICENSE for details.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+import numpy as np
+from numpy.testing import assert_array_equal, assert_array_almost_equal
+try:
+    import brian2
+    import pyNN.brian2 as sim
+except ImportError:
+    brian2 = False
+from pyNN.connectors import Connector
+from pyNN.random import RandomDistribution, NumpyRNG
+
+
+_codegen_target = None
+
+
+def setUpModule():
+    # the numpy target avoids compiling code, which keeps these tests fast
+    global _codegen_target
+    if brian2:
+        _codegen_target = brian2.prefs.codegen.target
+        brian2.prefs.codegen.target = "numpy"
+
+
+def tearDownModule():
+    if brian2:
+        brian2.prefs.codegen.target = _codegen_target
+
+
+class MockConnector(Connector):
+
+    def connect(self, projection):
+        pass
+
+
+@unittest.skipUnless(brian2, "Requires Brian2")
+class TestProjection(unittest.TestCase):
+
+    def setUp(self):
+        sim.setup(timestep=0.1)
+        self.p1 = sim.Population(10, sim.IF_cond_exp())
+        self.p2 = sim.Population(8, sim.IF_cond_exp())
+
+    def tearDown(self):
+        sim.end()
+
+    def test_fixed_probability_with_random_weights(self):
+        # regression test: per-target parameter arrays must keep their units when
+        # they are concatenated into blocks
+        rng = NumpyRNG(seed=2963)
+        prj = sim.Projection(self.p1, self.p2, sim.FixedProbabilityConnector(0.5, rng=rng),
+                             sim.StaticSynapse(weight=RandomDistribution('uniform', (0.01, 0.02), rng=rng),
+                                               delay=0.5))
+        self.assertGreater(len(prj), 0)
+        weights, delays = np.array(prj.get(["weight", "delay"], format="list", with_address=False)).T
+        self.assertTrue(((0.01 <= weights) & (weights <= 0.02)).all())
+        assert_array_almost_equal(delays, 0.5)
+
+    def _check_from_list_connector(self, post):
+        last = post.size - 1
+        conn_list = [(0, 0, 0.01, 0.5), (1, 0, 0.02, 0.6), (2, last, 0.03, 0.7), (3, last, 0.04, 0.8)]
+        prj = sim.Projection(self.p1, post, sim.FromListConnector(conn_list, column_names=["weight", "delay"]))
+        self.assertEqual(len(prj), 4)
+        weights = np.hstack([syn_obj.weight_[:] for syn_obj in prj._brian2_synapses[0].values()])
+        delays = np.hstack([syn_obj.delay_[:] for syn_obj in prj._brian2_synapses[0].values()])
+        assert_array_almost_equal(weights, [1e-8, 2e-8, 3e-8, 4e-8])  # µS --> S
+        assert_array_almost_equal(delays, [5e-4, 6e-4, 7e-4, 8e-4])  # ms --> s
+
+    def test_from_list_connector(self):
+        self._check_from_list_connector(self.p2)
+
+    def test_from_list_connector_with_postsynaptic_assembly(self):
+        # regression test: the default _bulk_connect(), used for Assemblies,
+        # must keep the units of parameter arrays when splitting them by target
+        self._check_from_list_connector(self.p2 + sim.Population(3, sim.IF_cond_exp()))
+
+    def test_from_list_connector_with_presynaptic_assembly(self):
+        conn_list = [(0, 0, 0.01, 0.5), (12, 0, 0.02, 0.6), (3, 5, 0.03, 0.7)]
+        prj = sim.Projection(self.p1 + self.p2, self.p2,
+                             sim.FromListConnector(conn_list, column_names=["weight", "delay"]))
+        self.assertEqual(len(prj), 3)
+        from_p1, from_p2 = prj._brian2_synapses[0][0], prj._brian2_synapses[1][0]
+        self.assertEqual(list(from_p1.i[:]), [0, 3])
+        self.assertEqual(list(from_p1.j[:]), [0, 5])
+        self.assertEqual(list(from_p2.i[:]), [2])
+        assert_array_almost_equal(from_p2.weight_[:], [2e-8])
+
+    def test_heterogeneous_weights_and_delays(self):
+        weights = np.arange(1, 81).reshape((10, 8)) * 0.001
+        delays = 0.1 + (np.arange(80).reshape((10, 8)) % 7) * 0.2
+        prj = sim.Projection(self.p1, self.p2, sim.AllToAllConnector(),
+                             sim.StaticSynapse(weight=weights, delay=delays))
+        self.assertEqual(len(prj), 80)
+        assert_array_almost_equal(prj.get("weight", format="array"), weights)
+        assert_array_almost_equal(prj.get("delay", format="array"), delays)
+
+    def test_multapses_keep_creation_order(self):
+        # multiple connections between the same pair of neurons can only be
+        # distinguished by their order
+        conn_list = [(0, 1, 0.01, 0.5), (0, 1, 0.02, 0.6), (3, 1, 0.03, 0.7),
+                     (0, 1, 0.04, 0.8), (2, 5, 0.05, 0.9), (2, 5, 0.06, 1.0)]
+        prj = sim.Projection(self.p1, self.p2,
+                             sim.FromListConnector(conn_list, column_names=["weight", "delay"]))
+        self.assertEqual(len(prj), 6)
+        assert_array_almost_equal(np.array(prj.get(["weight", "delay"], format="list")),
+                                  np.array(conn_list))
+        assert_array_almost_equal([c.weight for c in prj.connections],
+                                  [0.01, 0.02, 0.03, 0.04, 0.05, 0.06])
+        # per-connection arrays are in order of (pre, post) address, multiple
+        # connections between the same neurons in creation order
+        prj.set(weight=[0.6, 0.5, 0.4, 0.3, 0.2, 0.1])
+        assert_array_almost_equal([c.weight for c in prj.connections],
+                                  [0.6, 0.5, 0.1, 0.4, 0.3, 0.2])
+
+    def test_connect_population_views(self):
+        prj = sim.Projection(self.p1[2:6], self.p2[::2], sim.OneToOneConnector(),
+                             sim.StaticSynapse(weight=np.diag([0.1, 0.2, 0.3, 0.4]), delay=0.5))
+        syn_obj = prj._brian2_synapses[0][0]
+        self.assertEqual(list(syn_obj.i[:]), [2, 3, 4, 5])
+        self.assertEqual(list(syn_obj.j[:]), [0, 2, 4, 6])
+        assert_array_almost_equal(syn_obj.weight_[:], [1e-7, 2e-7, 3e-7, 4e-7])
+
+    def test_partitioning(self):
+        # ported from test_brian.py, which tests the old pyNN.brian module
+        p1 = sim.Population(5, sim.IF_cond_exp())
+        p2 = sim.Population(7, sim.IF_cond_exp())
+        a = p1 + p2[1:4]
+        # [0 2 3 4 5][x 1 2 3 x x x]
+        prj = sim.Projection(a, a, MockConnector(), synapse_type=sim.StaticSynapse(weight=0.123, delay=0.5))
+        presynaptic_indices = np.array([0, 3, 4, 6, 7])
+        partitions = prj._partition(presynaptic_indices)
+        self.assertEqual(len(partitions), 2)
+        assert_array_equal(partitions[0], np.array([0, 3, 4]))
+        assert_array_equal(partitions[1], np.array([2, 3]))
+        # [0 1 2 3 4][x 1 2 3 x]
+        self.assertEqual(prj._localize_index(0), (0, 0))
+        self.assertEqual(prj._localize_index(3), (0, 3))
+        self.assertEqual(prj._localize_index(5), (1, 1))
+        self.assertEqual(prj._localize_index(7), (1, 3))
+
+
+@unittest.skipUnless(brian2, "Requires Brian2")
+class TestParallelConnect(unittest.TestCase):
+
+    def setUp(self):
+        sim.setup(timestep=0.1, connection_processes=2)
+
+    def tearDown(self):
+        sim.end()
+
+    def test_connect_with_random_weights(self):
+        p1 = sim.Population(10, sim.IF_cond_exp())
+        p2 = sim.Population(8, sim.IF_cond_exp())
+        rng = NumpyRNG(seed=2963)
+        prj = sim.Projection(p1, p2, sim.AllToAllConnector(),
+                             sim.StaticSynapse(weight=RandomDistribution('uniform', (0.01, 0.02), rng=rng),
+                                               delay=0.5))
+        self.assertEqual(len(prj), 80)
+        weights = prj._brian2_synapses[0][0].weight_[:]
+        self.assertTrue(((1e-8 <= weights) & (weights <= 2e-8)).all())
+
+
+@unittest.skipUnless(brian2, "Requires Brian2")
+class TestCachedConnector(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_reload(self):
+        # regression test: parameters reloaded from the cache must have units
+        from pyNN.caching import ConnectionCache
+        cache = ConnectionCache(self.cache_dir)
+
+        def build():
+            sim.setup(timestep=0.1)
+            p1 = sim.Population(10, sim.IF_cond_exp())
+            p2 = sim.Population(8, sim.IF_cond_exp())
+            rng = NumpyRNG(seed=87)
+            connector = sim.CachedConnector(sim.FixedNumberPreConnector(n=3, rng=rng), cache=cache)
+            syn = sim.StaticSynapse(weight=RandomDistribution('uniform', (0.01, 0.02), rng=rng),
+                                    delay=RandomDistribution('uniform', (0.5, 1.0), rng=rng))
+            prj = sim.Projection(p1, p2, connector, syn)
+            connections = prj.get(["weight", "delay"], format="list")
+            sim.end()
+            return connections
+
+        orig_connections = build()
+        self.assertEqual(len(cache.entries()), 1)
+        connections = build()
+        self.assertEqual(len(cache.entries()), 1)  # the second projection was built from the cache
+        self.assertEqual(len(connections), 24)
+        assert_array_almost_equal(np.array(connections), np.array(orig_connections))
+
+
+@unittest.skipUnless(brian2, "Requires Brian2")
+class TestStandalone(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.build_dir = os.path.join(self.tmp_dir, "build")
+        sim.setup(timestep=0.1, brian2_device="cpp_standalone", build_dir=self.build_dir)
+
+    def tearDown(self):
+        sim.setup(timestep=0.1)  # back to runtime mode
+        shutil.rmtree(self.tmp_dir)
+
+    def test_build(self):
+        sources = sim.Population(3, sim.SpikeSourceArray(spike_times=[1.0, 5.0, 9.0]))
+        neurons = sim.Population(2, sim.IF_cond_exp())
+        sim.Projection(sources, neurons, sim.AllToAllConnector(),
+                       sim.StaticSynapse(weight=0.5, delay=1.0))
+        sources.record('spikes')
+        neurons.record('v')
+        sim.run(20.0)
+        self.assertFalse(sim.simulator.state.built)
+        self.assertFalse(os.path.exists(self.build_dir))
+        # retrieving the data compiles and runs the simulation
+        data = sources.get_data().segments[0]
+        self.assertTrue(sim.simulator.state.built)
+        self.assertTrue(os.path.exists(self.build_dir))
+        assert_array_almost_equal(data.spiketrains[0].magnitude, [1.0, 5.0, 9.0])
+        vm = neurons.get_data('v').segments[0].analogsignals[0]
+        self.assertEqual(vm.shape, (201, 2))
+        self.assertRaises(NotImplementedError, sim.run, 10.0)
+
+    def test_reset_not_supported(self):
+        sim.Population(2, sim.IF_cond_exp())
+        sim.run(5.0)
+        self.assertRaises(NotImplementedError, sim.reset)
+
+    def test_current_sources_not_supported(self):
+        self.assertRaises(NotImplementedError, sim.DCSource, amplitude=0.5)
+
+    def test_default_build_dir_depends_only_on_structure(self):
+        def build_dir(size, tau_m):
+            sim.setup(timestep=0.1, brian2_device="cpp_standalone")
+            neurons = sim.Population(size, sim.IF_cond_exp(tau_m=tau_m))
+            neurons.record('v')
+            sim.run(5.0)
+            return sim.simulator.state._default_build_dir()
+
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": self.tmp_dir}):
+            first = build_dir(2, 10.0)
+            self.assertTrue(first.startswith(self.tmp_dir))
+            self.assertEqual(build_dir(2, 20.0), first)
+            self.assertNotEqual(build_dir(3, 10.0), first)
+
+    def test_parameter_changes_reuse_compiled_program(self):
+        def resting_potentials(v_rest):
+            sim.setup(timestep=0.1, brian2_device="cpp_standalone", build_dir=self.build_dir)
+            neurons = sim.Population(2, sim.IF_curr_exp(v_rest=v_rest, v_thresh=0.0))
+            neurons.initialize(v=v_rest)
+            neurons.record('v')
+            sim.run(5.0)
+            return neurons.get_data('v').segments[0].analogsignals[0].magnitude
+
+        assert_array_almost_equal(resting_potentials(-65.0)[-1], [-65.0, -65.0])
+        program = os.path.join(self.build_dir, "main")
+        compiled_at = os.path.getmtime(program)
+        assert_array_almost_equal(resting_potentials(-55.0)[-1], [-55.0, -55.0])
+        self.assertEqual(os.path.getmtime(program), compiled_at)
+
+
+@unittest.skipUnless(brian2, "Requires Brian2")
+class TestSpikeSourceArray(unittest.TestCase):
+
+    def setUp(self):
+        sim.setup(timestep=0.1)
+
+    def tearDown(self):
+        sim.end()
+
+    def test_set_spike_times_on_population_view(self):
+        p = sim.Population(5, sim.SpikeSourceArray(spike_times=[1.0, 2.0]))
+        p[[1, 3]].set(spike_times=[sim.Sequence([5.0, 7.0]), sim.Sequence([9.0])])
+        p[[4]].set(spike_times=sim.Sequence([]))
+        spike_times = p.get("spike_times")
+        assert_array_equal(spike_times[0].value, [1.0, 2.0])
+        assert_array_equal(spike_times[1].value, [5.0, 7.0])
+        assert_array_equal(spike_times[2].value, [1.0, 2.0])
+        assert_array_equal(spike_times[3].value, [9.0])
+        self.assertEqual(spike_times[4].value.size, 0)
+        p.record('spikes')
+        sim.run(10.0)
+        self.assertEqual([st.size for st in p.get_data().segments[0].spiketrains], [2, 2, 2, 1, 0])
+
+
+@unittest.skipUnless(brian2, "Requires Brian2")
+class TestRecorder(unittest.TestCase):
+
+    def setUp(self):
+        sim.setup(timestep=0.1)
+        self.spike_times = [[1.0, 3.0], [2.0], [], [4.0, 5.0, 6.0]]
+
+    def tearDown(self):
+        sim.end()
+
+    def test_retrieve_recorded_subset(self):
+        p = sim.Population(6, sim.IF_cond_exp(i_offset=np.linspace(0.0, 1.0, 6), v_rest=-65.0))
+        p[[1, 2, 4]].record('v')
+        sim.run(10.0)
+        all_signals = p.get_data('v').segments[0].analogsignals[0]
+        self.assertEqual(all_signals.shape, (101, 3))
+        assert_array_equal(all_signals.array_annotations["channel_index"], [1, 2, 4])
+        # only the columns of the requested cells are copied from the monitor
+        subset = p[[2, 4]].get_data('v').segments[0].analogsignals[0]
+        self.assertEqual(subset.shape, (101, 2))
+        assert_array_almost_equal(subset.magnitude, all_signals.magnitude[:, 1:])
+
+    def _record_v(self, sampling_interval, start=None, stop=None):
+        p = sim.Population(2, sim.IF_cond_exp(i_offset=[0.3, 0.6], v_thresh=0.0))
+        p.record('v', sampling_interval=sampling_interval, start=start, stop=stop)
+        return p
+
+    def test_recording_windows_match_full_recording(self):
+        # with sampling intervals longer than the time step, the monitors
+        # record at the ticks of their own clocks
+        cases = [(0.1, None, None), (1.0, None, 20.0), (0.5, 5.0, None),
+                 (1.0, 10.0, 20.0), (0.5, 5.0, 20.0)]
+        reference = self._record_v(0.1)
+        populations = [self._record_v(*case) for case in cases]
+        sim.run(30.0)
+        v_ref = reference.get_data().segments[0].analogsignals[0]
+        for (sampling_interval, start, stop), p in zip(cases, populations):
+            signal = p.get_data().segments[0].analogsignals[0]
+            expected_times = np.arange(0.0, 30.0 + 1e-9, sampling_interval)
+            expected_times = expected_times[(expected_times >= (start or 0.0) - 1e-9)
+                                            & (expected_times <= (stop or 30.0) + 1e-9)]
+            assert_array_almost_equal(signal.times.magnitude, expected_times)
+            assert_array_almost_equal(signal.magnitude,
+                                      v_ref.magnitude[np.rint(expected_times / 0.1).astype(int)])
+
+    def test_reduced_mean_with_sampling_interval(self):
+        p1 = sim.Population(3, sim.IF_cond_exp(i_offset=[0.3, 0.6, 0.9], v_thresh=-55.0))
+        p2 = sim.Population(3, sim.IF_cond_exp(i_offset=[0.3, 0.6, 0.9], v_thresh=-55.0))
+        p1.record('v', sampling_interval=1.0, reduce='mean')
+        p2.record('v', sampling_interval=1.0)
+        sim.run(150.0)  # longer than the interval between reductions
+        sim.run(100.0)
+        mean_v = p1.get_data().segments[0].analogsignals[0]
+        full_v = p2.get_data().segments[0].analogsignals[0]
+        self.assertEqual(mean_v.shape, (251, 1))
+        assert_array_almost_equal(mean_v.magnitude[:, 0], full_v.magnitude.mean(axis=1))
+
+    def test_spike_counts_after_reset(self):
+        p = sim.Population(4, sim.SpikeSourceArray(spike_times=self.spike_times))
+        p.record('spikes')
+        sim.run(10.0)
+        self.assertEqual(p.get_spike_counts(), dict(zip(p.all_cells, [2, 1, 0, 3])))
+        spiketrains = p.get_data().segments[0].spiketrains
+        assert_array_almost_equal(spiketrains[3].magnitude, [4.0, 5.0, 6.0])
+        sim.reset()
+        # after reset(), only the spikes of the new segment are counted
+        sim.run(3.5)
+        self.assertEqual(p.get_spike_counts(), dict(zip(p.all_cells, [2, 1, 0, 0])))
+        self.assertEqual(p.mean_spike_count(), 0.75)
+        segments = p.get_data().segments
+        self.assertEqual(len(segments), 2)
+        self.assertEqual([st.size for st in segments[1].spiketrains], [2, 1, 0, 0])
+        assert_array_almost_equal(segments[0].spiketrains[3].magnitude, [4.0, 5.0, 6.0])
+
+    def test_spike_counts_after_clear_and_reset(self):
+        p = sim.Population(4, sim.SpikeSourceArray(spike_times=self.spike_times))
+        p.record('spikes')
+        sim.run(3.5)
+        self.assertEqual(p.get_spike_counts(), dict(zip(p.all_cells, [2, 1, 0, 0])))
+        # clearing the data does not reset the Brian2 spike counters, so they are offset
+        p.get_data(clear=True)
+        sim.run(6.5)
+        self.assertEqual(p.get_spike_counts(), dict(zip(p.all_cells, [0, 0, 0, 3])))
+        self.assertEqual([st.size for st in p.get_data().segments[0].spiketrains], [0, 0, 0, 3])
+        # reset() empties the counters, so the offset no longer applies
+        sim.reset()
+        sim.run(10.0)
+        self.assertEqual(p.get_spike_counts(), dict(zip(p.all_cells, [2, 1, 0, 3])))
+
+    def test_spike_histogram_matches_spike_recording(self):
+        i_offset = np.linspace(0.0, 1.5, 20)
+        p1 = sim.Population(20, sim.IF_cond_exp(i_offset=i_offset))
+        p2 = sim.Population(20, sim.IF_cond_exp(i_offset=i_offset))
+        p1.record('spikes', reduce='count', bin=10.0)
+        p2.record('spikes')
+        sim.run(250.0)
+        histogram = p1.get_data().segments[0].analogsignals[0]
+        spike_times = np.hstack([st.magnitude for st in p2.get_data().segments[0].spiketrains])
+        expected, _ = np.histogram(spike_times, bins=np.arange(0.0, 250.1, 10.0))
+        assert_array_equal(histogram.magnitude[:, 0], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,9 +12,12 @@ import numpy as np
 from numpy import nan
 import os
 import sys
+import shutil
+import tempfile
 from numpy.testing import assert_array_equal, assert_array_almost_equal
 from .mocks import MockRNG, MockRNG2, MockRNG3
 import pyNN.mock as sim
+from pyNN.caching import ConnectionCache
 
 
 orig_mpi_get_config = random.get_mpi_config
@@ -528,7 +531,8 @@ class TestFromFileConnector(unittest.TestCase):
 
     def tearDown(self, sim=sim):
         sim.end()
-        for path in ("test.connections", "test.connections.1", "test.connections.2"):
+        for path in ("test.connections", "test.connections.1", "test.connections.2",
+                     "test.connections.npy", "test.connections.npy.json"):
             if os.path.exists(path):
                 os.remove(path)
 
@@ -564,6 +568,17 @@ class TestFromFileConnector(unittest.TestCase):
                           (2, 2, 0.4, 0.13, 130.0, 97.0, 88.8),
                           (2, 3, 0.3, 0.12, 120.0, 98.0, 88.8)])
 
+    def test_connect_with_memmap_file_saved_by_projection(self, sim=sim):
+        prj = sim.Projection(self.p1, self.p2,
+                             connectors.FromListConnector(self.connection_list),
+                             sim.StaticSynapse())
+        prj.save("all", recording.files.NumpyMemmapFile("test.connections.npy", "w", chunk_rows=2))
+        C = connectors.FromFileConnector(
+            recording.files.NumpyMemmapFile("test.connections.npy", "r", chunk_rows=2))
+        prj2 = sim.Projection(self.p1, self.p2, C, sim.StaticSynapse())
+        self.assertEqual(prj2.get(["weight", "delay"], format='list'),
+                         prj.get(["weight", "delay"], format='list'))
+
 
 class TestFixedNumberPreConnector(unittest.TestCase):
 
@@ -1061,5 +1076,126 @@ class TestFixedTotalNumberConnector(unittest.TestCase):
         self.assertEqual(len(connections), 12)
 
 
+class TestParallelConnection(unittest.TestCase):
+
+    def _connect(self, connector, n_processes):
+        sim.setup(num_processes=1, rank=0, min_delay=0.123, connection_processes=n_processes)
+        p1 = sim.Population(30, sim.IF_cond_exp(), structure=space.Line())
+        p2 = sim.Population(600, sim.HH_cond_exp(), structure=space.Line())
+        rng = random.NumpyRNG(seed=653)
+        syn = sim.StaticSynapse(weight=random.RandomDistribution('uniform', (0, 1), rng=rng),
+                                delay="0.2 + 0.01*d")
+        prj = sim.Projection(p1, p2, connector, syn)
+        return prj.get(["weight", "delay"], format='list', gather=False)
+
+    def test_independent_of_number_of_processes(self):
+        C = connectors.FixedProbabilityConnector(0.3, rng=random.NumpyRNG(seed=8))
+        connections_2 = self._connect(C, 2)
+        connections_3 = self._connect(C, 3)
+        self.assertEqual(connections_2, connections_3)
+        self.assertTrue(0.25 < len(connections_2) / (30 * 600) < 0.35)
+
+    def test_all_to_all(self):
+        C = connectors.AllToAllConnector()
+        parallel = np.array(self._connect(C, 2))
+        serial = np.array(self._connect(C, 1))
+        assert_array_equal(parallel[:, :2], serial[:, :2])
+        assert_array_almost_equal(parallel[:, 3], serial[:, 3])
+
+
+class TestBulkConnection(unittest.TestCase):
+
+    def setUp(self, sim=sim):
+        sim.setup(num_processes=1, rank=0, min_delay=0.123)
+        self.p1 = sim.Population(9, sim.IF_cond_exp(), structure=space.Line())
+        self.p2 = sim.Population(7, sim.HH_cond_exp(), structure=space.Line())
+        self.orig_block_size = connectors.BULK_CONNECT_SIZE
+
+    def tearDown(self, sim=sim):
+        connectors.BULK_CONNECT_SIZE = self.orig_block_size
+
+    def _connect(self, block_size):
+        connectors.BULK_CONNECT_SIZE = block_size
+        C = connectors.FixedProbabilityConnector(0.5, rng=random.NumpyRNG(seed=92))
+        syn = sim.StaticSynapse(weight=lambda d: 0.1 + d, delay=0.5)
+        prj = sim.Projection(self.p1, self.p2, C, syn)
+        return prj.get(["weight", "delay"], format='list', gather=False)
+
+    def test_connections_independent_of_block_size(self):
+        self.assertEqual(self._connect(1), self._connect(10**6))
+
+    def test_bulk_connect_called_in_blocks(self):
+        calls = []
+        orig_bulk_connect = sim.Projection._bulk_connect
+
+        def bulk_connect(prj, presynaptic_indices, postsynaptic_indices, **parameters):
+            calls.append(presynaptic_indices.size)
+            orig_bulk_connect(prj, presynaptic_indices, postsynaptic_indices, **parameters)
+
+        sim.Projection._bulk_connect = bulk_connect
+        try:
+            connections = self._connect(20)
+        finally:
+            sim.Projection._bulk_connect = orig_bulk_connect
+        self.assertEqual(sum(calls), len(connections))
+        self.assertGreater(len(calls), 1)
+        self.assertTrue(all(n >= 20 for n in calls[:-1]))
+
+
+class TestCachedConnector(unittest.TestCase):
+
+    def setUp(self, sim=sim):
+        sim.setup(num_processes=1, rank=0, min_delay=0.123)
+        self.p1 = sim.Population(9, sim.IF_cond_exp(), structure=space.Line())
+        self.p2 = sim.Population(7, sim.HH_cond_exp(), structure=space.Line())
+        self.cache = ConnectionCache(tempfile.mkdtemp())
+
+    def tearDown(self, sim=sim):
+        shutil.rmtree(self.cache.directory)
+
+    def _connect(self, n=3, seed=87):
+        rng = random.NumpyRNG(seed=seed)
+        C = connectors.CachedConnector(
+            connectors.FixedNumberPreConnector(n=n, rng=rng), cache=self.cache)
+        syn = sim.StaticSynapse(weight=random.RandomDistribution('uniform', (0, 1), rng=rng),
+                                delay=0.5)
+        prj = sim.Projection(self.p1, self.p2, C, syn)
+        return prj.get(["weight", "delay"], format='list', gather=False), rng
+
+    def test_reload_from_cache(self):
+        orig_connections, orig_rng = self._connect()
+        self.assertEqual(len(self.cache.entries()), 1)
+        orig_convergent_connect = sim.Projection._convergent_connect
+        connections, rng = self._connect()
+        self.assertEqual(connections, orig_connections)
+        self.assertEqual(len(connections), 3 * self.p2.size)
+        # the RNG state is restored, so subsequent random numbers are unchanged
+        assert_array_equal(rng.next(5), orig_rng.next(5))
+        self.assertIs(sim.Projection._convergent_connect, orig_convergent_connect)
+
+    def test_different_parameters_give_new_entry(self):
+        self._connect(n=3)
+        self._connect(n=4)
+        self._connect(n=3, seed=88)
+        self.assertEqual(len(self.cache.entries()), 3)
+
+    def test_uncacheable_connector(self):
+        C = connectors.CachedConnector(
+            connectors.FixedProbabilityConnector(0.5, rng=MockRNG(delta=0.1)), cache=self.cache)
+        prj = sim.Projection(self.p1, self.p2, C, sim.StaticSynapse())
+        self.assertGreater(len(prj), 0)
+        self.assertEqual(self.cache.entries(), [])
+
+    def test_lru_eviction(self):
+        self._connect(seed=1)
+        size = self.cache.size
+        self.cache.max_size = int(2.5 * size)
+        self._connect(seed=2)
+        self._connect(seed=1)  # cache hit, marks entry as recently used
+        self._connect(seed=3)
+        keys = [key for _, _, key in self.cache.entries()]
+        self.assertEqual(len(keys), 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -4,6 +4,7 @@ from textwrap import dedent
 
 import numpy as np
 from numpy.testing import assert_array_equal
+import pytest
 
 from pyNN.recording import files
 
@@ -118,3 +119,97 @@ def test_HDF5ArrayFile():
         h5f.close()
 
         os.remove("tmp.h5")
+
+
+def test_NumpyMemmapFile(tmp_path):
+    path = str(tmp_path / "tmp.npy")
+    nmf = files.NumpyMemmapFile(path, "w", chunk_rows=2)
+    data = np.array([(0, 2.3), (1, 3.4), (2, 4.3)])
+    metadata = {'a': 1, 'b': 9.99, 'columns': ['i', 'x']}
+    nmf.write(data[:1], metadata)
+    nmf.append(data[1:])
+    nmf.close()
+
+    nmf = files.NumpyMemmapFile(path, "r", chunk_rows=2)
+    assert nmf.get_metadata() == metadata
+    assert isinstance(nmf.read(), np.memmap)
+    assert_array_equal(nmf.read(), data)
+    assert_array_equal(nmf.read(rows=slice(1, 3)), data[1:])
+    assert_array_equal(nmf.read(rows=[2, 0]), data[[2, 0]])
+    assert [chunk.shape for chunk in nmf.iter_chunks()] == [(2, 2), (1, 2)]
+    nmf.close()
+
+
+def test_NumpyMemmapFile_append_wrong_shape(tmp_path):
+    nmf = files.NumpyMemmapFile(str(tmp_path / "tmp.npy"), "w")
+    nmf.write(np.zeros((3, 2)), {})
+    with pytest.raises(ValueError):
+        nmf.append(np.zeros((3, 4)))
+
+
+def test_StreamingFile_write_columns(tmp_path):
+    nmf = files.NumpyMemmapFile(str(tmp_path / "tmp.npy"), "w", chunk_rows=4)
+    nmf.write_columns([np.arange(10), np.linspace(0, 1, 10)], {'columns': ['i', 'x']})
+    assert_array_equal(nmf.read(), np.column_stack((np.arange(10), np.linspace(0, 1, 10))))
+
+
+def test_HDF5ChunkedFile(tmp_path):
+    if files.have_h5py:
+        path = str(tmp_path / "tmp.h5")
+        h5f = files.HDF5ChunkedFile(path, "w", chunk_rows=2)
+        data = np.array([(0, 2.3), (1, 3.4), (2, 4.3)])
+        metadata = {'a': 1, 'b': 9.99, 'columns': ['i', 'x']}
+        h5f.write(data[:0], metadata)
+        h5f.append(data[:2])
+        h5f.append(data[2:])
+        h5f.close()
+
+        h5f = files.HDF5ChunkedFile(path, "r", chunk_rows=2)
+        assert h5f.get_metadata() == metadata
+        assert h5f.shape == (3, 2)
+        assert_array_equal(h5f.read(), data)
+        assert_array_equal(h5f.read(rows=slice(1, None)), data[1:])
+        assert_array_equal(h5f.read(rows=[2, 0, 2]), data[[2, 0, 2]])
+        assert_array_equal(h5f.read(rows=np.array([True, False, True])), data[[0, 2]])
+        assert [chunk.shape for chunk in h5f.iter_chunks()] == [(2, 2), (1, 2)]
+        h5f.close()
+
+
+def test_StandardTextFile_iter_chunks(tmp_path):
+    path = str(tmp_path / "connections.txt")
+    data = np.column_stack((np.arange(100) % 7, np.arange(100) % 5, np.linspace(0, 1, 100)))
+    stf = files.StandardTextFile(path, "wb")
+    stf.write(data, {'columns': ['i', 'j', 'weight']})
+
+    stf = files.StandardTextFile(path, "r", chunk_bytes=200)
+    chunks = list(stf.iter_chunks())
+    assert len(chunks) > 1
+    assert_array_equal(np.vstack(chunks), data)
+    assert stf.get_metadata() == {'columns': ['i', 'j', 'weight']}
+    stf.close()
+
+    stf = files.StandardTextFile(path, "r", chunk_bytes=200, processes=2)
+    assert_array_equal(np.vstack(list(stf.iter_chunks())), data)
+    stf.close()
+
+
+def test_StandardTextFile_iter_chunks_comma_delimited(tmp_path):
+    path = str(tmp_path / "connections.csv")
+    with open(path, "w") as fp:
+        fp.write("# columns = ['i', 'j', 'weight']\n0, 1, 0.5\n2, 3, 0.25\n\n4, 5, 0.125\n")
+    stf = files.StandardTextFile(path, "r", chunk_bytes=12)
+    assert_array_equal(np.vstack(list(stf.iter_chunks())),
+                       [[0, 1, 0.5], [2, 3, 0.25], [4, 5, 0.125]])
+    stf.close()
+
+
+def test_rename_does_not_delete_file_being_read(tmp_path):
+    path = str(tmp_path / "connections.txt")
+    for name in (path, path + ".0"):
+        with open(name, "w") as fp:
+            fp.write("0 1 0.5 0.1\n")
+    stf = files.StandardTextFile(path, "r")
+    stf.rename(path + ".0")
+    assert os.path.exists(path)
+    assert_array_equal(np.vstack(list(stf.iter_chunks())), [[0, 1, 0.5, 0.1]])
+    stf.close()
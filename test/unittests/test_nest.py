@@ -4,7 +4,9 @@ try:
 except ImportError:
     nest = False
 from pyNN.standardmodels import StandardCellType
+from pyNN.random import RandomDistribution
 import unittest
+from unittest.mock import patch
 import numpy as np
 from numpy.testing import assert_array_equal, assert_array_almost_equal
 
@@ -69,6 +71,20 @@ class TestPopulation(unittest.TestCase):
     def test_set_parameters_scalar(self):
         self.p[0:1].set(tau_m=20.)
 
+    def test_set_and_get_heterogeneous_parameters(self):
+        self.p.set(tau_m=np.array([11., 12., 13., 14.]), v_thresh=-51.0,
+                   tau_refrac=lambda i: 1.0 + i)
+        tau_m, v_thresh, tau_refrac = self.p.get(["tau_m", "v_thresh", "tau_refrac"])
+        assert_array_almost_equal(tau_m, [11., 12., 13., 14.])
+        self.assertEqual(v_thresh, -51.0)
+        assert_array_almost_equal(tau_refrac, [1., 2., 3., 4.])
+
+    def test_get_parameters_single_cell(self):
+        ps = self.p[1:2]._get_parameters('C_m', 'E_ex')
+        ps.evaluate(simplify=True)
+        assert_array_almost_equal(ps['C_m'], 997.0)
+        self.assertEqual(ps['E_ex'], 0.0)
+
 
 @unittest.skipUnless(nest, "Requires NEST")
 class TestProjection(unittest.TestCase):
@@ -184,5 +200,57 @@ class TestProjection(unittest.TestCase):
         self.assertEqual(intended_tau_minus, actual_tau_minus)
 
 
+    def test_connection_table_is_cached(self):
+        prj = sim.Projection(self.p1, self.p2, self.all2all, synapse_type=self.syn_a2a)
+        self.assertEqual(len(prj), self.p1.size * self.p2.size)
+        with patch("nest.GetConnections", wraps=nest.GetConnections) as get_connections:
+            weights1 = prj.get("weight", format="array")
+            weights2 = prj.get("weight", format="list")
+            self.assertEqual(len(prj), self.p1.size * self.p2.size)
+            self.assertEqual(get_connections.call_count, 0)
+            sim.Projection(self.p2, self.p1, self.all2all, synapse_type=self.syn_a2a)
+            get_connections.reset_mock()
+            weights3 = prj.get("weight", format="array")
+            self.assertEqual(get_connections.call_count, 1)
+        assert_array_almost_equal(weights1, 0.456 * np.ones((self.p1.size, self.p2.size)))
+        assert_array_almost_equal(weights3, weights1)
+        self.assertEqual(len(weights2), self.p1.size * self.p2.size)
+        connection = prj[3]
+        self.assertEqual(connection.source, prj.pre[connection.presynaptic_index])
+        self.assertAlmostEqual(connection.weight, 0.456)
+
+    def test_native_fixed_number_pre(self):
+        connector = sim.FixedNumberPreConnector(n=3, rng=sim.NativeRNG())
+        prj = sim.Projection(self.p1, self.p2, connector, synapse_type=self.syn_rnd)
+        self.assertEqual(len(prj), 3 * self.p2.size)
+        weights = prj.get("weight", format="array")
+        assert_array_equal(np.nansum(weights > 0, axis=0), 3 * np.ones(self.p2.size))
+
+    def test_native_fixed_number_post(self):
+        connector = sim.FixedNumberPostConnector(n=2, rng=sim.NativeRNG())
+        prj = sim.Projection(self.p1, self.p2, connector, synapse_type=self.syn_rnd)
+        self.assertEqual(len(prj), 2 * self.p1.size)
+
+    def test_native_fixed_total_number(self):
+        connector = sim.FixedTotalNumberConnector(n=11, rng=sim.NativeRNG())
+        prj = sim.Projection(self.p1, self.p2, connector, synapse_type=self.syn_rnd)
+        self.assertEqual(len(prj), 11)
+
+    def test_native_one_to_one(self):
+        p5 = sim.Population(4, sim.IF_cond_exp())
+        syn = sim.StaticSynapse(weight=RandomDistribution('uniform', (0.1, 0.2),
+                                                          rng=sim.NativeRNG()),
+                                delay=0.5)
+        prj = sim.Projection(self.p2, p5, sim.OneToOneConnector(), synapse_type=syn)
+        connections = prj.get("weight", format="list")
+        self.assertEqual(sorted((int(i), int(j)) for i, j, w in connections),
+                         [(i, i) for i in range(4)])
+
+    def test_native_rule_with_array_parameter(self):
+        connector = sim.FixedNumberPreConnector(n=3, rng=sim.NativeRNG())
+        syn = sim.StaticSynapse(weight=lambda d: 0.1 + 0.01 * d)
+        self.assertRaises(NotImplementedError, sim.Projection, self.p1, self.p2, connector, syn)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -202,6 +202,17 @@ class TestState(unittest.TestCase):
         cell = MockCell()
         simulator.state.register_gid(84568345, cell.source, cell.source_section)
 
+    def test_register_gids(self):
+        sim.setup()
+        p = sim.Population(3, sim.IF_cond_exp())
+        pc = simulator.state.parallel_context
+        for id in p:
+            self.assertTrue(pc.gid_exists(int(id)))
+        self.assertFalse(pc.gid_exists(int(p[-1]) + 1))
+        # cells which know their spike threshold pass it to the ParallelContext
+        p2 = sim.Population(2, sim.Izhikevich())
+        self.assertEqual(pc.threshold(int(p2[1])), p2[1]._cell.get_threshold())
+
     def test_dt_property(self):
         simulator.state.dt = 0.01
         self.assertEqual(h.dt, 0.01)
@@ -255,6 +266,27 @@ class TestPopulation(unittest.TestCase):
                                   decimal=12)
         self.assertEqual(ps['e_e'], 0.0)
 
+    def test__create_cells(self):
+        cm = [0.987, 0.997, 1.007, 1.017]
+        i_offset = [-0.21, -0.20, -0.19, -0.18]
+        for id, expected_cm, expected_i_offset in zip(self.p, cm, i_offset):
+            self.assertIs(id.parent, self.p)
+            self.assertIsInstance(id, simulator.ID)
+            self.assertAlmostEqual(id._cell.c_m, expected_cm, places=12)
+            self.assertAlmostEqual(id._cell.i_offset, expected_i_offset, places=12)
+            self.assertAlmostEqual(id._cell.tau_m, 12.3, places=12)
+        self.assertEqual(simulator.state.gid_counter, self.p.last_id + 1)
+        # injectable cells are initialized through their population
+        self.assertIn(self.p, simulator.initializer.population_list)
+        self.assertEqual(simulator.initializer.cell_list, [])
+
+    def test__create_cells_with_sequences(self):
+        spike_times = [sim.Sequence([1.0, 2.0]), sim.Sequence([3.0]), sim.Sequence([])]
+        p = sim.Population(3, sim.SpikeSourceArray(spike_times=spike_times))
+        for id, expected in zip(p, spike_times):
+            assert_array_equal(np.array(id._cell.spike_times), expected.value)
+        self.assertNotIn(p, simulator.initializer.population_list)
+
 
 @unittest.skipUnless(sim, "Requires NEURON")
 @unittest.skipIf(skip_ci, "Skipping test on CI server")
@@ -339,6 +371,46 @@ class TestProjection(unittest.TestCase):
         prj = sim.Projection(self.p1, self.p2, self.all2all,
                              synapse_type=sim.TsodyksMarkramSynapse())
 
+    def test_connection_addresses(self):
+        prj = sim.Projection(self.p1, self.p2, self.random_connect, self.syn1)
+        pre, post = prj._connection_addresses()
+        self.assertEqual(pre.size, len(prj))
+        assert_array_equal(pre, [c.presynaptic_index for c in prj.connections])
+        assert_array_equal(post, [c.postsynaptic_index for c in prj.connections])
+
+    def test_get_list(self):
+        conn_list = [(0, 1, 0.1, 0.5), (3, 1, 0.2, 0.6), (2, 0, 0.3, 0.7), (3, 1, 0.4, 0.8)]
+        prj = sim.Projection(self.p1, self.p2,
+                             sim.FromListConnector(conn_list, column_names=["weight", "delay"]))
+        actual = np.array(prj.get(["weight", "delay"], format="list"))
+        # connections are created target by target
+        assert_array_almost_equal(actual, np.array(conn_list)[[2, 0, 1, 3]])
+
+    def test_set_array(self):
+        prj = sim.Projection(self.p1, self.p2, self.all2all, self.syn1)
+        weights = np.arange(28.0).reshape((7, 4)) * 0.01
+        delays = 0.1 + np.arange(28.0).reshape((7, 4)) * 0.1
+        prj.set(weight=weights, delay=delays)
+        assert_array_almost_equal(prj.get("weight", format="array"), weights)
+        assert_array_almost_equal(prj.get("delay", format="array"), delays)
+        for c in prj.connections:
+            self.assertAlmostEqual(c.nc.weight[0], weights[c.presynaptic_index, c.postsynaptic_index])
+
+    def test_set_array_with_postsynaptic_view(self):
+        post = self.p3[1::2]
+        prj = sim.Projection(self.p1, post, self.all2all, self.syn1)
+        weights = np.arange(14.0).reshape((7, 2)) * 0.01
+        prj.set(weight=weights)
+        assert_array_almost_equal(prj.get("weight", format="array"), weights)
+
+    def test_set_list(self):
+        prj = sim.Projection(self.p1, self.p2, self.random_connect, self.syn1)
+        values = 0.01 * np.arange(len(prj))
+        prj.set(weight=values)
+        weights = np.array(prj.get("weight", format="list"))
+        order = np.lexsort((weights[:, 1], weights[:, 0]))
+        assert_array_almost_equal(weights[order, 2], values)
+
 
 @unittest.skipUnless(sim, "Requires NEURON")
 class TestCurrentSources(unittest.TestCase):
@@ -421,6 +493,48 @@ class TestRecorder(unittest.TestCase):
         self.assertEqual(self.rec._local_count('spikes', filter_ids=None),
                          {self.cells[0]: 10, self.cells[1]: 20})
 
+    def test_spike_counts_of_spike_sources(self):
+        sim.setup(timestep=0.1, use_cvode=False)
+        p = sim.Population(3, sim.SpikeSourceArray(
+            spike_times=[sim.Sequence([1.0, 5.0, 9.0]), sim.Sequence([2.0]), sim.Sequence([])]))
+        p.record('spikes')
+        sim.run(6.0)
+        assert_array_equal(p.get_spike_count_array(), [2, 1, 0])
+        self.assertAlmostEqual(p.mean_spike_count(), 1.0)
+        self.assertEqual(p.get_spike_counts(), dict(zip(p.all_cells, [2, 1, 0])))
+        sim.end()
+
+    def test_recording_windows_match_full_recording(self):
+        sim.setup(timestep=0.1, use_cvode=False)
+        cases = [(1.0, None, 20.0), (0.5, 5.0, None), (1.0, 10.0, 20.0), (0.5, 5.0, 20.0)]
+        populations = []
+        for sampling_interval, start, stop in [(0.1, None, None)] + cases:
+            p = sim.Population(2, sim.IF_cond_exp(i_offset=[0.3, 0.6], v_thresh=0.0))
+            p.record('v', sampling_interval=sampling_interval, start=start, stop=stop)
+            populations.append(p)
+        sim.run(30.0)
+        v_ref = populations[0].get_data().segments[0].analogsignals[0]
+        for (sampling_interval, start, stop), p in zip(cases, populations[1:]):
+            signal = p.get_data().segments[0].analogsignals[0]
+            expected_times = np.arange(start or 0.0, (stop or 30.0) + 1e-9, sampling_interval)
+            assert_array_almost_equal(signal.times.magnitude, expected_times)
+            assert_array_almost_equal(signal.magnitude,
+                                      v_ref.magnitude[np.rint(expected_times / 0.1).astype(int)])
+        sim.end()
+
+    def test_record_mean_matches_full_recording(self):
+        sim.setup(timestep=0.1, use_cvode=False)
+        p1 = sim.Population(3, sim.IF_cond_exp(i_offset=[0.5, 1.0, 1.5]))
+        p2 = sim.Population(3, sim.IF_cond_exp(i_offset=[0.5, 1.0, 1.5]))
+        p1.record('v', reduce='mean')
+        p2.record('v')
+        sim.run(250.0)
+        mean_v = p1.get_data().segments[0].analogsignals[0]
+        full_v = p2.get_data().segments[0].analogsignals[0]
+        self.assertEqual(mean_v.shape, (full_v.shape[0], 1))
+        assert_array_almost_equal(mean_v.magnitude[:, 0], full_v.magnitude.mean(axis=1))
+        sim.end()
+
 
 @unittest.skipUnless(sim, "Requires NEURON")
 class TestStandardIF(unittest.TestCase):
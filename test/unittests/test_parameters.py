@@ -11,7 +11,7 @@ import numpy as np
 from lazyarray import larray
 from numpy.testing import assert_array_equal
 import pytest
-from pyNN.parameters import LazyArray, ParameterSpace, Sequence
+from pyNN.parameters import LazyArray, ParameterSpace, Sequence, SequenceArray
 from pyNN import random, errors
 from .mocks import MockRNG
 
@@ -303,6 +303,32 @@ def test_getitem_from_constant_array():
         m.__getitem__((2, -4))
 
 
+def test_evaluate_at_functional_array():
+    m = 2 * LazyArray(lambda i, j: 3 * i + j, shape=(4, 3)) + 1
+    assert_array_equal(m.evaluate_at([0, 3, 3, 1], [2, 0, 2, 2]),
+                       np.array([5, 19, 23, 11]))
+
+
+def test_evaluate_at_random_array_parallel_safe():
+    # with a parallel-safe RNG, numbers are drawn column by column, whatever the points requested
+    rd = random.RandomDistribution('uniform', (0, 1), rng=MockRNG(delta=1, parallel_safe=True))
+    m = LazyArray(rd, shape=(4, 3))
+    assert_array_equal(m.evaluate_at([0, 3, 1], [2, 0, 2]),
+                       np.array([8, 3, 9]))
+
+
+def test_evaluate_at_random_array_not_parallel_safe():
+    rd = random.RandomDistribution('uniform', (0, 1), rng=MockRNG(delta=1, parallel_safe=False))
+    m = LazyArray(rd, shape=(400, 300))
+    assert_array_equal(m.evaluate_at([0, 399, 1], [2, 0, 299]),
+                       np.array([0, 1, 2]))
+
+
+def test_evaluate_at_no_points():
+    m = LazyArray(3.0, shape=(4, 3))
+    assert m.evaluate_at([], []).size == 0
+
+
 class ParameterSpaceTest(unittest.TestCase):
 
     def test_evaluate(self):
@@ -336,6 +362,16 @@ class ParameterSpaceTest(unittest.TestCase):
         assert_array_equal(ps2d['a'], np.array([[3, 8, 13], [34, 89, 144]]))
         assert_array_equal(ps2d['c'], np.array([[-2, -6, -8], [1, -3, -5]]))
 
+    def test_evaluate_at(self):
+        ps2d = ParameterSpace({'a': [[2, 3, 5, 8, 13], [21, 34, 55, 89, 144]],
+                               'b': 7,
+                               'c': lambda i, j: 3 * i - 2 * j}, shape=(2, 5))
+        ps2d.evaluate_at(np.array([1, 0, 1]), np.array([0, 4, 4]))
+        assert_array_equal(ps2d['a'], np.array([21, 13, 144]))
+        assert_array_equal(ps2d['b'], np.array([7, 7, 7]))
+        assert_array_equal(ps2d['c'], np.array([3, -8, -5]))
+        self.assertEqual(ps2d.as_dict()['b'].shape, (3,))
+
     def test_iteration(self):
         ps = ParameterSpace({'a': [2, 3, 5, 8, 13], 'b': 7, 'c': lambda i: 3 * i + 2}, shape=(5,))
         ps.evaluate(mask=[1, 3, 4])
@@ -421,6 +457,89 @@ class ParameterSpaceTest(unittest.TestCase):
         assert_array_equal(ps['a'], np.array(
             [Sequence([1, 2, 3]), Sequence([4, 5, 6])], dtype=Sequence))
 
+    def test_create_with_sequence_array(self):
+        schema = {'a': Sequence}
+        ps = ParameterSpace({'a': SequenceArray([1, 2, 3, 4, 5, 6], [0, 3, 3, 6])},
+                            schema,
+                            shape=(3,))
+        ps.evaluate(mask=np.array([True, False, True]))
+        self.assertEqual([D['a'] for D in ps], [Sequence([1, 2, 3]), Sequence([4, 5, 6])])
+
+    def test_create_with_sequence_array_wrong_shape(self):
+        schema = {'a': Sequence}
+        self.assertRaises(errors.InvalidDimensionsError, ParameterSpace,
+                          {'a': SequenceArray([1, 2, 3], [0, 1, 3])}, schema, shape=(3,))
+
+    def test_create_with_sequence_array_wrong_type(self):
+        self.assertRaises(errors.InvalidParameterValueError, ParameterSpace,
+                          {'a': SequenceArray([1, 2, 3], [0, 1, 3])}, {'a': float}, shape=(2,))
+
+
+class SequenceArrayTest(unittest.TestCase):
+
+    def setUp(self):
+        self.sa = SequenceArray.from_pairs([2, 0, 2, 1, 2, 4],
+                                           [5.0, 1.0, 3.0, 2.0, 4.0, 0.5], 5)
+
+    def test_from_pairs(self):
+        assert_array_equal(self.sa.offsets, [0, 1, 2, 5, 5, 6])
+        assert_array_equal(self.sa.values, [1.0, 2.0, 3.0, 4.0, 5.0, 0.5])
+        self.assertEqual(self.sa.shape, (5,))
+        assert_array_equal(self.sa.lengths(), [1, 1, 3, 0, 1])
+
+    def test_from_pairs_index_out_of_range(self):
+        self.assertRaises(IndexError, SequenceArray.from_pairs, [0, 3], [1.0, 2.0], 3)
+
+    def test_from_sequences(self):
+        sa = SequenceArray.from_sequences([Sequence([1.0]), [2.0], Sequence([3.0, 4.0, 5.0]),
+                                           Sequence([]), np.array([0.5])])
+        self.assertEqual(sa, self.sa)
+
+    def test_invalid_offsets(self):
+        self.assertRaises(ValueError, SequenceArray, [1.0, 2.0], [0, 3])
+        self.assertRaises(ValueError, SequenceArray, [1.0, 2.0], [0, 2, 1])
+
+    def test_getitem_int(self):
+        self.assertEqual(self.sa[2], Sequence([3.0, 4.0, 5.0]))
+        self.assertEqual(self.sa[-1], Sequence([0.5]))
+        self.assertEqual(self.sa[3].value.size, 0)
+        self.assertRaises(IndexError, self.sa.__getitem__, 5)
+
+    def test_getitem_slice_shares_values(self):
+        view = self.sa[1:4]
+        self.assertIs(view.values, self.sa.values)
+        self.assertEqual(view.size, 3)
+        self.assertEqual(list(view), [Sequence([2.0]), Sequence([3.0, 4.0, 5.0]), Sequence([])])
+        self.assertEqual(self.sa[4:2].size, 0)
+
+    def test_getitem_array(self):
+        self.assertEqual(self.sa[np.array([4, 2])],
+                         SequenceArray([0.5, 3.0, 4.0, 5.0], [0, 1, 4]))
+        self.assertEqual(self.sa[np.array([True, False, False, True, True])],
+                         SequenceArray([1.0, 0.5], [0, 1, 1, 2]))
+        self.assertEqual(self.sa[::2], self.sa[np.array([0, 2, 4])])
+
+    def test_to_sequences(self):
+        sequences = self.sa.to_sequences()
+        self.assertEqual(sequences.dtype, object)
+        self.assertEqual(sequences[2], Sequence([3.0, 4.0, 5.0]))
+
+    def test_arithmetic(self):
+        view = self.sa[1:3]
+        self.assertEqual(view - 1.0, SequenceArray([1.0, 2.0, 3.0, 4.0], [0, 1, 4]))
+        self.assertEqual(2 * view, SequenceArray([4.0, 6.0, 8.0, 10.0], [0, 1, 4]))
+        self.assertEqual(view + np.array([10.0, 20.0]),
+                         SequenceArray([12.0, 23.0, 24.0, 25.0], [0, 1, 4]))
+
+    def test_is_sorted(self):
+        self.assertTrue(self.sa.is_sorted())
+        self.assertFalse(SequenceArray([1.0, 3.0, 2.0], [0, 3]).is_sorted())
+
+    def test_lazy_array(self):
+        larr = LazyArray(self.sa, shape=(5,))
+        self.assertEqual(larr[1:3], self.sa[1:3])
+        self.assertEqual((larr + 1.0).evaluate(), self.sa + 1.0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -18,7 +18,7 @@ except ImportError:
 from .mocks import MockRNG
 import pyNN.mock as sim
 from pyNN import random, errors, space
-from pyNN.parameters import Sequence
+from pyNN.parameters import Sequence, SequenceArray
 
 
 def setUp():
@@ -312,6 +312,18 @@ class PopulationTest(unittest.TestCase):
         self.assertEqual(spike_times.size, 3)
         assert_array_equal(spike_times[1], Sequence([2, 3, 4, 5]))
 
+    def test_set_sequence_array(self, sim=sim):
+        p = sim.Population(3, sim.SpikeSourceArray())
+        p.set(spike_times=SequenceArray.from_pairs([2, 0, 2, 1], [5.0, 1.0, 3.0, 2.0], 3))
+        spike_times = p.get('spike_times', gather=True)
+        self.assertEqual(spike_times.size, 3)
+        assert_array_equal(spike_times[2], Sequence([3.0, 5.0]))
+        p[1:].set(spike_times=SequenceArray([7.0, 8.0, 9.0], [0, 0, 3]))
+        spike_times = p.get('spike_times', gather=True)
+        assert_array_equal(spike_times[0], Sequence([1.0]))
+        assert_array_equal(spike_times[1].value.size, 0)
+        assert_array_equal(spike_times[2], Sequence([7.0, 8.0, 9.0]))
+
     def test_set_array(self, sim=sim):
         p = sim.Population(5, sim.IF_cond_exp())
         p.set(v_thresh=-50.0 + np.arange(5))
@@ -413,6 +425,68 @@ class PopulationTest(unittest.TestCase):
         for arr in data.analogsignals:
             self.assertEqual(arr.shape, (n_values, p.size))
 
+    def test_record_with_different_sampling_intervals(self, sim=sim):
+        p = sim.Population(3, sim.EIF_cond_exp_isfa_ista())
+        p.record('v', sampling_interval=0.5)
+        p.record('w', sampling_interval=1.0)
+        sim.run(10.0)
+        data = p.get_data(gather=True).segments[0]
+        v = data.filter(name='v')[0]
+        w = data.filter(name='w')[0]
+        self.assertEqual(v.sampling_period, 0.5 * pq.ms)
+        self.assertEqual(v.shape, (21, p.size))
+        self.assertEqual(w.sampling_period, 1.0 * pq.ms)
+        self.assertEqual(w.shape, (11, p.size))
+
+    def test_record_with_conflicting_sampling_intervals(self, sim=sim):
+        p = sim.Population(3, sim.EIF_cond_exp_isfa_ista())
+        p[:2].record('v', sampling_interval=0.5)
+        self.assertRaises(ValueError, p[2:].record, 'v', sampling_interval=1.0)
+
+    def test_record_with_window(self, sim=sim):
+        p = sim.Population(3, sim.EIF_cond_exp_isfa_ista())
+        p.record('v', start=5.0, stop=8.0)
+        p.record('spikes')
+        sim.run(10.0)
+        v = p.get_data(gather=True).segments[0].filter(name='v')[0]
+        n_values = int(round(3.0 / sim.get_time_step())) + 1
+        self.assertEqual(v.shape, (n_values, p.size))
+        self.assertEqual(v.t_start, 5.0 * pq.ms)
+
+    def test_record_spikes_with_window(self, sim=sim):
+        p = sim.Population(3, sim.EIF_cond_exp_isfa_ista())
+        self.assertRaises(ValueError, p.record, 'spikes', start=5.0, stop=8.0)
+
+    def test_record_with_reduction(self, sim=sim):
+        p = sim.Population(3, sim.EIF_cond_exp_isfa_ista())
+        p.record('spikes', reduce='count', bin=2.0)
+        p.record('v', reduce='mean')
+        p.record('w')
+        sim.run(250.0)
+        data = p.get_data(gather=True).segments[0]
+        self.assertEqual(len(data.spiketrains), 0)
+        psth = data.filter(name='spikes')[0]
+        self.assertEqual(psth.shape, (125, 1))
+        self.assertEqual(psth.sampling_period, 2.0 * pq.ms)
+        self.assertEqual(psth.annotations["reduction"], "count")
+        v = data.filter(name='v')[0]
+        self.assertEqual(v.shape, (int(round(250.0 / sim.get_time_step())) + 1, 1))
+        self.assertEqual(v.annotations["reduction"], "mean")
+        self.assertFalse(np.isnan(v.magnitude).any())
+        self.assertEqual(data.filter(name='w')[0].shape[1], p.size)
+
+    def test_record_with_invalid_reduction(self, sim=sim):
+        p = sim.Population(3, sim.EIF_cond_exp_isfa_ista())
+        self.assertRaises(ValueError, p.record, 'spikes', reduce='mean', bin=1.0)
+        self.assertRaises(ValueError, p.record, 'spikes', reduce='count')
+        self.assertRaises(ValueError, p.record, 'v', reduce='count')
+        self.assertRaises(ValueError, p.record, 'v', reduce='mean', start=5.0)
+        p[:2].record('v', reduce='mean')
+        self.assertRaises(ValueError, p[2:].record, 'v')
+        self.assertRaises(ValueError, p.record, 'v', reduce='sum')
+        p.record('w')
+        self.assertRaises(ValueError, p.record, 'w', reduce='mean')
+
     def test_record_v(self, sim=sim):
         p = sim.Population(2, sim.EIF_cond_exp_isfa_ista())
         p.record = Mock()
@@ -565,6 +639,24 @@ class PopulationTest(unittest.TestCase):
         # mock backend always produces two spikes per population
         self.assertEqual(p.mean_spike_count(), 2.0)
 
+    def test_get_spike_count_array(self, sim=sim):
+        p = sim.Population(4, sim.EIF_cond_exp_isfa_ista())
+        p[1:].record('spikes')
+        sim.run(100.0)
+        assert_array_equal(p.get_spike_count_array(), np.array([0, 2, 2, 2]))
+
+    def test_get_spike_count_array_with_window(self, sim=sim):
+        p = sim.Population(4, sim.EIF_cond_exp_isfa_ista())
+        p.record('spikes')
+        sim.run(100.0)
+        # the mock backend produces spikes at times id and id + 5 (modulo t)
+        spike_times = np.array([p.all_cells, p.all_cells + 5], dtype=float) % 100.0
+        t_start = spike_times.min() + 0.5
+        expected = ((spike_times >= t_start) & (spike_times < 100.0)).sum(axis=0)
+        assert_array_equal(p.get_spike_count_array(t_start=t_start), expected)
+        assert_array_equal(p.get_spike_count_array(t_stop=t_start) + expected,
+                           np.array([2, 2, 2, 2]))
+
     # def test_mean_spike_count_on_slave_node():
 
     def test_meanSpikeCount(self, sim=sim):
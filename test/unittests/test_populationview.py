@@ -515,6 +515,13 @@ class PopulationViewTest(unittest.TestCase):
                           p.all_cells[1]: 2,
                           p.all_cells[4]: 2})
 
+    def test_get_spike_count_array(self, sim=sim):
+        p = sim.Population(5, sim.EIF_cond_exp_isfa_ista())
+        p[0, 1, 4].record('spikes')
+        sim.run(100.0)
+        pv = p[4, 2, 1]
+        assert_array_equal(pv.get_spike_count_array(), np.array([2, 0, 2]))
+
     def test_mean_spike_count(self, sim=sim):
         p = sim.Population(14, sim.EIF_cond_exp_isfa_ista())
         pv = p[2::3]
@@ -16,6 +16,11 @@ try:
     from unittest.mock import Mock, patch
 except ImportError:
     from mock import Mock, patch
+try:
+    from scipy import sparse
+    have_scipy = True
+except ImportError:
+    have_scipy = False
 from .mocks import MockRNG
 import pyNN.mock as sim
 
@@ -89,14 +94,53 @@ class ProjectionTest(unittest.TestCase):
         prj = sim.Projection(self.p1, self.p2, connector=self.all2all, synapse_type=self.syn2)
         self.assertEqual(prj.size(gather=True), self.p1.size * self.p2.size)
 
-# Need to extend the mock backend before setting synaptic parameters can be properly tested
+    def test_set_weights(self, sim=sim):
+        prj = sim.Projection(self.p1, self.p2, connector=self.all2all, synapse_type=self.syn2)
+        prj.set(weight=0.789)
+        weights = prj.get("weight", format="array", gather=False)  # use gather False because we are faking the MPI
+        target = 0.789 * np.ones((self.p1.size, self.p2.size))
+        assert_array_equal(weights, target)
 
-    # def test_set_weights(self, sim=sim):
-    #    prj = sim.Projection(self.p1, self.p2, connector=self.all2all, synapse_type=self.syn2)
-    #    prj.set(weight=0.789)
-    #    weights = prj.get("weight", format="array", gather=False)  # use gather False because we are faking the MPI
-    #    target = 0.789*np.ones((self.p1.size, self.p2.size))
-    #    assert_array_equal(weights, target)
+    def test_set_weights_with_list(self, sim=sim):
+        prj = sim.Projection(self.p1, self.p2, connector=self.all2all, synapse_type=self.syn2)
+        values = [0.001 * i for i in range(len(prj))]
+        prj.set(weight=values)
+        # values are given in order of (pre, post) address, i.e. row by row
+        assert_array_equal(prj.get("weight", format="array", gather=False),
+                           np.reshape(values, (self.p1.size, self.p2.size)))
+
+    def test_set_delays_with_1d_array(self, sim=sim):
+        prj = sim.Projection(self.p1, self.p2, connector=self.random_connect, synapse_type=self.syn2)
+        connections = np.array(prj.get("delay", format="list", gather=False))
+        values = 0.1 + np.arange(len(prj)) / 10.0
+        prj.set(delay=values)
+        delays = np.array(prj.get("delay", format="list", gather=False))
+        assert_array_equal(delays[:, :2], connections[:, :2])
+        order = np.lexsort((delays[:, 1], delays[:, 0]))
+        assert_array_equal(delays[order, 2], values)
+
+    def test_set_with_list_of_wrong_length(self, sim=sim):
+        prj = sim.Projection(self.p1, self.p2, connector=self.all2all, synapse_type=self.syn2)
+        self.assertRaises(errors.InvalidDimensionsError, prj.set, weight=[0.1, 0.2, 0.3])
+
+    @unittest.skipUnless(have_scipy, "Requires scipy")
+    def test_set_weights_with_sparse_matrix(self, sim=sim):
+        prj = sim.Projection(self.p1, self.p2, connector=self.all2all, synapse_type=self.syn2)
+        matrix = sparse.coo_matrix(([0.1, 0.2, 0.3], ([0, 3, 6], [1, 2, 3])),
+                                   shape=(self.p1.size, self.p2.size))
+        prj.set(weight=matrix)
+        weights = prj.get("weight", format="array", gather=False)
+        target = 0.007 * np.ones((self.p1.size, self.p2.size))
+        target[0, 1] = 0.1
+        target[3, 2] = 0.2
+        target[6, 3] = 0.3
+        assert_array_equal(weights, target)
+
+    @unittest.skipUnless(have_scipy, "Requires scipy")
+    def test_set_with_sparse_matrix_of_wrong_shape(self, sim=sim):
+        prj = sim.Projection(self.p1, self.p2, connector=self.all2all, synapse_type=self.syn2)
+        matrix = sparse.coo_matrix((self.p2.size, self.p1.size))
+        self.assertRaises(errors.InvalidDimensionsError, prj.set, weight=matrix)
 
     # def test_randomize_weights(self, sim=sim):
     #    orig_len = sim.Projection.__len__
@@ -195,6 +239,22 @@ class ProjectionTest(unittest.TestCase):
         weights = prj.get("weight", format="array", gather=False, multiple_synapses='min')
         assert_array_equal(weights, target)
 
+    def test_get_weights_as_array_with_multapses_first_last(self, sim=sim):
+        C = sim.FromListConnector([(0, 0, 0.1, 0.1), (1, 0, 0.2, 0.1),
+                                   (0, 0, 0.3, 0.1), (1, 2, 0.4, 0.1)],
+                                  column_names=["weight", "delay"])
+        prj = sim.Projection(self.p2, self.p3, C, synapse_type=self.syn1)
+        first = prj.get("weight", format="array", gather=False, multiple_synapses='first')
+        last = prj.get("weight", format="array", gather=False, multiple_synapses='last')
+        maximum = prj.get("weight", format="array", gather=False, multiple_synapses='max')
+        self.assertEqual(first[0, 0], 0.1)
+        self.assertEqual(last[0, 0], 0.3)
+        self.assertEqual(maximum[0, 0], 0.3)
+        for values in (first, last, maximum):
+            self.assertEqual(values[1, 0], 0.2)
+            self.assertEqual(values[1, 2], 0.4)
+            self.assertEqual(np.isnan(values).sum(), values.size - 3)
+
     def test_synapse_with_lambda_parameter(self, sim=sim):
         syn = sim.StaticSynapse(weight=lambda d: 0.01 + 0.001 * d)
         prj = sim.Projection(self.p1, self.p2, self.all2all, synapse_type=syn)
@@ -1,7 +1,12 @@
 
+import os
 from datetime import datetime
 from collections import defaultdict
 from unittest.mock import Mock
+import numpy as np
+import neo
+import quantities as pq
+from numpy.testing import assert_array_equal
 import pytest
 
 from pyNN import recording, errors
@@ -191,6 +196,99 @@ def test_metadata_property():
         'simulator': 'MockSimulator', 'mpi_processes': 9}
 
 
+def test_Reduction_count():
+    r = recording.Reduction("count", 2.0)
+    r.add(np.array([0.5, 1.9, 2.0, 7.5]))
+    r.add(np.array([3.0, 9.9]))
+    assert_array_equal(r.values(4), np.array([2.0, 2.0, 0.0, 1.0]))
+
+
+def test_Reduction_mean():
+    r = recording.Reduction("mean", 0.5)
+    r.add(np.array([0.0, 0.0, 0.5, 0.5]), np.array([1.0, 3.0, -1.0, 2.0]))
+    r.add(np.array([1.5]), np.array([4.0]))
+    assert_array_equal(r.values(4), np.array([2.0, 0.5, np.nan, 4.0]))
+
+
+def test_Reduction_sum_discard():
+    r = recording.Reduction("sum", 1.0)
+    r.add(np.array([0.0, 1.0, 2.0, 2.0]), np.array([1.0, 2.0, 3.0, 4.0]))
+    r.discard(2.0)
+    assert r.first == 2
+    r.add(np.array([1.0, 3.0]), np.array([5.0, 6.0]))  # data before the first index are ignored
+    assert_array_equal(r.values(4), np.array([7.0, 6.0]))
+
+
+def _make_segment(name, n_samples=5):
+    segment = neo.Segment(name=name)
+    segment.spiketrains.append(neo.SpikeTrain([1.0, 2.0] * pq.ms, t_stop=10.0 * pq.ms))
+    for variable in ("v", "gsyn_exc"):
+        segment.analogsignals.append(
+            neo.AnalogSignal(np.arange(n_samples * 2.0).reshape((n_samples, 2)), units="mV",
+                             sampling_period=0.1 * pq.ms, name=variable))
+    segment.annotate(trial=name)
+    return segment
+
+
+def test_DiskDataCache():
+    cache = recording.DiskDataCache(max_in_memory=1)
+    for name in ("a", "b", "c"):
+        segment = _make_segment(name)
+        cache.store(segment)
+        # storing must not remove the data from the live segment
+        assert len(segment.spiketrains) == 1
+        assert len(segment.analogsignals) == 2
+    assert len(cache) == 3
+    assert list(cache._in_memory) == [2]
+    path, entries = cache._index[0]
+    assert [(kind, name) for kind, name, offset in entries] == [
+        ("segment", None), ("spiketrains", "spikes"),
+        ("analogsignals", "v"), ("analogsignals", "gsyn_exc")]
+    segments = cache.get_segments(["v"])
+    assert [seg.name for seg in segments] == ["a", "b", "c"]
+    assert segments[0].annotations["trial"] == "a"
+    for seg in segments:
+        assert len(seg.spiketrains) == 0
+        assert [sig.name for sig in seg.analogsignals] == ["v"]
+        assert_array_equal(seg.analogsignals[0].magnitude,
+                           np.arange(10.0).reshape((5, 2)))
+    segments = list(cache)
+    assert [len(seg.spiketrains) for seg in segments] == [1, 1, 1]
+    assert_array_equal(segments[0].spiketrains[0].magnitude, [1.0, 2.0])
+    assert len(cache._in_memory) == 1
+    directory = cache._tmpdir
+    assert os.path.exists(directory)
+    cache.clear()
+    assert not os.path.exists(directory)
+    assert cache.get_segments('all') == []
+
+
+def test_Recorder_uses_DiskDataCache():
+    state = MockRecorder._simulator.state
+    state.segments_in_memory = 2
+    try:
+        r = MockRecorder(MockPopulation())
+        assert isinstance(r.cache, recording.DiskDataCache)
+        assert r.cache.max_in_memory == 2
+    finally:
+        del state.segments_in_memory
+
+
+def test_count_spikes():
+    indices = np.array([0, 2, 2, 3, 0, 2])
+    times = np.array([1.0, 2.0, 5.0, 7.5, 10.0, 12.0])
+    assert_array_equal(recording.count_spikes(indices, times, 5),
+                       np.array([2, 0, 3, 1, 0]))
+    assert_array_equal(recording.count_spikes(indices, times, 5, t_start=2.0, t_stop=10.0),
+                       np.array([0, 0, 2, 1, 0]))
+
+
+def test_count_array__other():
+    r = MockRecorder(MockPopulation())
+    with pytest.raises(Exception):
+        r.count_array('v')
+
+
 # def test_count__spikes_gather():
 
 # def test_count__spikes_nogather():
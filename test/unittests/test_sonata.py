@@ -0,0 +1,277 @@
+"""
+Tests of the SONATA import/export functions, using the mock backend.
+
+:copyright: Copyright 2006-2022 by the PyNN team, see AUTHORS.
+:license: CeCILL, see LICENSE for details.
+"""
+
+import numpy as np
+from numpy.testing import assert_array_equal, assert_array_almost_equal
+import pytest
+
+from pyNN.random import RandomDistribution as RD, NumpyRNG
+from pyNN.network import Network
+from pyNN.parameters import LazyArray
+from pyNN.serialization import export_to_sonata, import_from_sonata, asciify
+from pyNN.serialization import sonata
+import pyNN.mock as sim
+
+h5py = pytest.importorskip("h5py")
+
+
+def build_network():
+    sim.setup()
+    rng = NumpyRNG(seed=8658764)
+    p1 = sim.Population(10, sim.IF_cond_exp(v_rest=-65, tau_m=lambda i: 10 + 0.1 * i),
+                        label="population_one")
+    p2 = sim.Population(20, sim.IF_curr_alpha(v_rest=-64), label="population_two")
+    prj = sim.Projection(p1, p2, sim.FixedProbabilityConnector(p_connect=0.5, rng=rng),
+                         synapse_type=sim.StaticSynapse(weight=RD('uniform', [0.0, 0.1], rng=rng),
+                                                        delay=0.5),
+                         receptor_type='excitatory')
+    return Network(p1, p2, prj)
+
+
+def imported_projection(net, prj):
+    return net.get_component(asciify(prj.label).decode('utf-8') + "-0")
+
+
+def test_round_trip(tmp_path):
+    net = build_network()
+    export_to_sonata(net, str(tmp_path), overwrite=True)
+    net2 = import_from_sonata(str(tmp_path / "circuit_config.json"), sim)
+    for orig_population in net.populations:
+        imp_population = net2.get_component(orig_population.label)
+        assert orig_population.size == imp_population.size
+    prj = list(net.projections)[0]
+    assert_array_almost_equal(prj.get('weight', format='array'),
+                              imported_projection(net2, prj).get('weight', format='array'), 12)
+
+
+def test_imported_parameters_are_lazy(tmp_path):
+    net = build_network()
+    export_to_sonata(net, str(tmp_path), overwrite=True)
+    net2 = import_from_sonata(str(tmp_path / "circuit_config.json"), sim)
+    population = net2.get_component("population_one").populations[0]
+    tau_m = population.celltype.parameter_space["tau_m"]
+    assert isinstance(tau_m.base_value, sonata.HDF5Values)
+    assert_array_almost_equal(population.get("tau_m"), 10 + 0.1 * np.arange(10), 12)
+
+
+def test_condense_per_type_values():
+    types = np.array([3, 1, 3, 3, 1])
+    value = sonata.condense({1: 0.5, 3: 2.0}, types)
+    assert isinstance(value, LazyArray)
+    assert_array_equal(value.evaluate(), [2.0, 0.5, 2.0, 2.0, 0.5])
+    assert_array_equal(value[np.array([1, 2])], [0.5, 2.0])
+    assert_array_equal(sonata.condense({1: "a", 3: "b"}, types).evaluate(),
+                       ["b", "a", "b", "b", "a"])
+    assert sonata.condense({1: 0.5, 3: 0.5}, types) == 0.5
+
+
+def test_hdf5_values(tmp_path):
+    with h5py.File(str(tmp_path / "data.h5"), "w") as f:
+        f.create_dataset("x", data=1.5 * np.arange(10))
+    f = h5py.File(str(tmp_path / "data.h5"), "r")
+    value = LazyArray(sonata.HDF5Values(f["x"], np.array([4, 2, 8])), shape=(3,))
+    assert_array_equal(value.evaluate(), [6.0, 3.0, 12.0])
+    assert_array_equal(value[np.array([False, True, True])], [3.0, 12.0])
+    assert value[0] == 6.0
+
+
+def test_import_edges_in_chunks(tmp_path, monkeypatch):
+    net = build_network()
+    export_to_sonata(net, str(tmp_path), overwrite=True)
+    monkeypatch.setattr(sonata, "EDGE_CHUNK_SIZE", 7)
+    net2 = import_from_sonata(str(tmp_path / "circuit_config.json"), sim)
+    prj = list(net.projections)[0]
+    prj2 = imported_projection(net2, prj)
+    assert prj2.size() == prj.size()
+    assert_array_almost_equal(prj.get('weight', format='array'),
+                              prj2.get('weight', format='array'), 12)
+
+
+def test_edge_ranges_with_target_to_source_index(tmp_path, monkeypatch):
+    # six edges, sorted by target, onto nodes 0 (edges 0-1), 2 (edges 2-4) and 3 (edge 5)
+    with h5py.File(str(tmp_path / "edges.h5"), "w") as f:
+        edges = f.create_group("edges/test")
+        edges.create_dataset("source_node_id", data=np.array([1, 2, 0, 1, 3, 2]))
+        edges["source_node_id"].attrs["node_population"] = "pre"
+        edges.create_dataset("target_node_id", data=np.array([0, 0, 2, 2, 2, 3]))
+        edges["target_node_id"].attrs["node_population"] = "post"
+        edges.create_dataset("edge_type_id", data=np.zeros(6, dtype=int))
+        edges.create_dataset("edge_group_id", data=np.zeros(6, dtype=int))
+        edges.create_dataset("edge_group_index", data=np.arange(6))
+        edges.create_group("0")
+        index = edges.create_group("indices/target_to_source")
+        index.create_dataset("node_id_to_ranges", data=np.array([[0, 1], [1, 1], [1, 2], [2, 3]]))
+        index.create_dataset("range_to_edge_id", data=np.array([[0, 2], [2, 5], [5, 6]]))
+    f = h5py.File(str(tmp_path / "edges.h5"), "r")
+    edge_population = sonata.EdgePopulation.from_data("test", f["edges/test"],
+                                                      {0: {"edge_type_id": "0"}}, {})
+    assert edge_population.size == 6
+    assert list(edge_population.edge_ranges()) == [(0, 6)]
+    assert list(edge_population.edge_ranges([2, 3])) == [(2, 6)]
+    assert list(edge_population.edge_ranges([0, 3])) == [(0, 2), (5, 6)]
+    assert list(edge_population.edge_ranges([1])) == []
+    monkeypatch.setattr(sonata, "EDGE_CHUNK_SIZE", 2)
+    assert list(edge_population.edge_ranges([2, 3])) == [(2, 4), (4, 6)]
+    chunks = list(edge_population.edge_groups[0].read_edges([], [0, 3]))
+    assert len(chunks) == 2
+    assert_array_equal(np.hstack([chunk[0] for chunk in chunks]), [1, 2, 2])
+    assert_array_equal(np.hstack([chunk[1] for chunk in chunks]), [0, 0, 3])
+
+
+def test_export_writes_indices(tmp_path):
+    net = build_network()
+    export_to_sonata(net, str(tmp_path), overwrite=True)
+    prj = list(net.projections)[0]
+    edges_path, = (tmp_path / "networks").glob("edges_*.h5")
+    f = h5py.File(str(edges_path), "r")
+    edges = f["edges"][list(f["edges"])[0]]
+    sources = edges["source_node_id"][()]
+    targets = edges["target_node_id"][()]
+    assert sources.dtype == np.uint64
+    assert edges["target_node_id"].compression == "gzip"
+    assert sources.size == prj.size()
+    assert np.all(np.diff(targets.astype(int)) >= 0)
+    for name, node_ids, n_nodes in (("source_to_target", sources, prj.pre.size),
+                                    ("target_to_source", targets, prj.post.size)):
+        index = edges["indices"][name]
+        node_id_to_ranges = index["node_id_to_ranges"][()]
+        range_to_edge_id = index["range_to_edge_id"][()]
+        assert node_id_to_ranges.shape == (n_nodes, 2)
+        for node_id, (first, last) in enumerate(node_id_to_ranges):
+            edge_ids = np.hstack([np.arange(start, stop)
+                                  for start, stop in range_to_edge_id[first:last]] + [[]])
+            assert_array_equal(np.sort(edge_ids), np.flatnonzero(node_ids == node_id))
+    assert edges["indices"]["target_to_source"]["range_to_edge_id"].shape[0] == np.unique(targets).size
+
+
+@pytest.mark.parametrize("sort_order, keys", [("time", ("timestamps", "node_ids")),
+                                              ("id", ("node_ids", "timestamps")),
+                                              ("none", None)])
+def test_spike_writer(tmp_path, sort_order, keys):
+    rng = np.random.default_rng(4572)
+    spikes = {"node_ids": rng.integers(0, 20, size=500),
+              "timestamps": np.round(rng.uniform(0, 100, size=500), 1)}
+    # with a small buffer, sorting requires merging several runs
+    writer = sonata.SpikeWriter(str(tmp_path / "spikes.h5"), sort_order=sort_order,
+                                buffer_size=37)
+    for start in range(0, 500, 123):
+        writer.write("pop", spikes["node_ids"][start:start + 123],
+                     spikes["timestamps"][start:start + 123])
+    writer.close()
+    assert [p.name for p in tmp_path.iterdir()] == ["spikes.h5"]
+    with h5py.File(str(tmp_path / "spikes.h5"), "r") as f:
+        group = f["spikes/pop"]
+        assert group.attrs["sorting"] == {"time": "by_time", "id": "by_id"}.get(sort_order, "none")
+        if keys:
+            order = np.lexsort([spikes[key] for key in reversed(keys)])
+        else:
+            order = np.arange(500)
+        assert_array_equal(group["node_ids"][()], spikes["node_ids"][order])
+        assert_array_equal(group["timestamps"][()], spikes["timestamps"][order])
+
+
+def test_spike_writer_invalid_sort_order(tmp_path):
+    with pytest.raises(ValueError):
+        sonata.SpikeWriter(str(tmp_path / "spikes.h5"), sort_order="random")
+
+
+def test_write_and_read_spikes_and_reports(tmp_path):
+    import neo
+    import quantities as pq
+    blocks = []
+    for label, size in (("population_one", 3), ("population_two", 2)):
+        block = neo.Block(name=label)
+        for t_start in (0.0, 50.0):
+            segment = neo.Segment()
+            segment.spiketrains = [
+                neo.SpikeTrain([t_start + i + 1.0], t_start=t_start, t_stop=t_start + 50.0,
+                               units="ms", source_index=i)
+                for i in range(size)]
+            segment.analogsignals = [
+                neo.AnalogSignal(np.ones((500, size)) * t_start, units="mV", name="v",
+                                 sampling_period=0.1 * pq.ms, t_start=t_start * pq.ms)]
+            block.segments.append(segment)
+        blocks.append(block)
+    sim.setup()
+    node_sets = {"all": [(sim.Assembly(sim.Population(size, sim.IF_cond_exp()), label=label),
+                          slice(None))
+                         for label, size in (("population_one", 3), ("population_two", 2))]}
+    io = sonata.SonataIO(str(tmp_path), spikes_sort_order="time",
+                         report_config={"membrane_potential": {"cells": "all",
+                                                               "variable_name": "v"}},
+                         node_sets=node_sets)
+    io.write(blocks)
+
+    with h5py.File(str(tmp_path / "membrane_potential.h5"), "r") as f:
+        for label, size in (("population_one", 3), ("population_two", 2)):
+            assert f["report"][label]["data"].shape == (1000, size)
+            assert_array_equal(f["report"][label]["mapping/time"][()], [0.0, 100.0, 0.1])
+            assert_array_equal(f["report"][label]["mapping/node_ids"][()], np.arange(size))
+
+    spiketrains = io.read()[0].segments[0].spiketrains
+    assert len(spiketrains) == 5
+    population_one = [st for st in spiketrains
+                      if st.annotations["source_population"] == "population_one"]
+    assert_array_equal(population_one[2].magnitude, [3.0, 53.0])
+
+
+def test_ragged_spike_times():
+    # node 5 is not in the population, node 9 is outside the map
+    index_map = np.array([-1, 2, 0, 1, -1, -1])
+    spike_times = sonata.ragged_spike_times(np.array([3, 1, 2, 3, 5, 9, 1]),
+                                            np.array([4.0, 2.0, 3.0, 1.0, 5.0, 6.0, 0.5]),
+                                            index_map, 4)
+    assert_array_equal(spike_times.offsets, [0, 1, 3, 5, 5])
+    assert_array_equal(spike_times.values, [3.0, 1.0, 4.0, 0.5, 2.0])
+
+
+def test_search_sorted(tmp_path):
+    with h5py.File(str(tmp_path / "data.h5"), "w") as f:
+        f.create_dataset("x", data=np.array([0.5, 1.0, 1.0, 2.5, 7.0]))
+        for value in (0.0, 0.5, 1.0, 1.5, 7.0, 8.0):
+            assert sonata.search_sorted(f["x"], value) == np.searchsorted(f["x"][()], value)
+
+
+def test_spike_input(tmp_path):
+    sim.setup()
+    assembly = sim.Assembly(sim.Population(4, sim.SpikeSourceArray()), label="inputs")
+    writer = sonata.SpikeWriter(str(tmp_path / "spikes.h5"))  # not sorted
+    writer.write("inputs", np.array([3, 0, 3, 1, 0, 3]),
+                 np.array([80.0, 60.0, 10.0, 30.0, 5.0, 55.0]))
+    writer.close()
+    # only nodes 0, 1 and 3 are targets
+    index_map = np.array([0, 1, -1, 2])
+    spike_input = sonata.SpikeInput(str(tmp_path / "spikes.h5"), assembly[[0, 1, 3]],
+                                    index_map)
+    spike_input.set_spike_times()
+    spike_times = assembly.get("spike_times")
+    assert_array_equal(spike_times[3].value, [10.0, 55.0, 80.0])
+    assert_array_equal(spike_times[0].value, [5.0, 60.0])
+    assert spike_times[2].value.size == 0
+
+    callback = spike_input.callback(50.0)
+    assert callback(50.0) == 100.0
+    spike_times = assembly.get("spike_times")
+    assert_array_equal(spike_times[3].value, [55.0, 80.0])
+    assert_array_equal(spike_times[1].value, [])
+    spike_input.close()
+
+
+def test_spike_input_with_population_view(tmp_path):
+    sim.setup()
+    population = sim.Population(4, sim.SpikeSourceArray())
+    writer = sonata.SpikeWriter(str(tmp_path / "spikes.h5"))
+    writer.write("inputs", np.array([3, 0, 3, 1]), np.array([80.0, 60.0, 10.0, 30.0]))
+    writer.close()
+    spike_input = sonata.SpikeInput(str(tmp_path / "spikes.h5"), population[[0, 1, 3]],
+                                    np.array([0, 1, -1, 2]))
+    spike_input.set_spike_times()
+    spike_times = population.get("spike_times")
+    assert_array_equal(spike_times[3].value, [10.0, 80.0])
+    assert_array_equal(spike_times[1].value, [30.0])
+    assert spike_times[2].value.size == 0
+    spike_input.close()
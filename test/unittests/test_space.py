@@ -82,6 +82,13 @@ class SpaceTest(unittest.TestCase):
                                          (sqrt(3), sqrt(12), 0.0, sqrt(50.0)),
                                          (sqrt(29), sqrt(14), sqrt(50.0), 0.0)]))
 
+    def test_generator_for_pairs_of_points(self):
+        s = space.Space()
+        def f(i): return self.ABCD[i]
+        def g(j): return self.ABCD[j]
+        assert_array_equal(s.distance_generator(f, g)(np.array([0, 1, 3]), np.array([3, 2, 0])),
+                           np.array([sqrt(29), sqrt(12), sqrt(29)]))
+
     def test_infinite_space_with_collapsed_axes(self):
         s_x = space.Space(axes='x')
         s_xy = space.Space(axes='xy')